@@ -1,51 +1,339 @@
-"""Event bus for publishing domain events."""
+"""Event bus for publishing domain events.
+
+In-process async pub/sub: publishers call `publish()` (sync, safe from any
+thread) and subscribers consume events from a bounded per-subscriber queue via
+`async for event in bus.subscribe("order.*")`.
+
+- Topics are dotted event types ("order.submitted", "order.filled"); subscribers
+  match them with shell-style patterns ("order.*", "*")
+- A slow subscriber never blocks publishers: when its queue is full the oldest
+  queued event is dropped and counted in `Subscription.dropped`
+- Recent events are kept in a replay buffer (and optionally appended to a JSONL
+  file) so late subscribers can catch up from a sequence number
+"""
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
 import json
 import logging
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class Event:
+    """A published domain event."""
+
+    seq: int
+    event_type: str
+    timestamp: str
+    trader_id: Optional[str]
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+
+class Subscription:
+    """
+    A subscriber's view of the bus: a bounded queue of matching events.
+
+    Iterate with `async for` (ends after `close()`) or call `get()`.
+    """
+
+    _CLOSED = object()
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        topics: tuple[str, ...],
+        trader_id: Optional[str],
+        max_queue_size: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """
+        Initialize subscription (use EventBus.subscribe()).
+
+        Args:
+            bus: Owning EventBus
+            topics: Shell-style topic patterns to match
+            trader_id: Only deliver events for this trader (None = all)
+            max_queue_size: Queue bound; oldest events are dropped beyond it
+            loop: Event loop the subscriber consumes on
+        """
+        self.bus = bus
+        self.topics = topics
+        self.trader_id = trader_id
+        self.max_queue_size = max_queue_size
+        self.loop = loop
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def matches(self, event: Event) -> bool:
+        """Check whether an event matches this subscription's filters."""
+        if self.trader_id is not None and event.trader_id != self.trader_id:
+            return False
+        return any(fnmatch.fnmatchcase(event.event_type, topic) for topic in self.topics)
+
+    def qsize(self) -> int:
+        """Number of events waiting to be consumed."""
+        return self._queue.qsize()
+
+    def _deliver(self, event: Any) -> None:
+        """Enqueue an event, dropping the oldest one if the queue is full (loop thread only)."""
+        if self.closed and event is not self._CLOSED:
+            return
+        if event is not self._CLOSED and self._queue.qsize() >= self.max_queue_size:
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self) -> Event:
+        """
+        Wait for the next event.
+
+        Raises:
+            StopAsyncIteration: If the subscription was closed and drained
+        """
+        if self.closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is self._CLOSED:
+            raise StopAsyncIteration
+        return item
+
+    def close(self) -> None:
+        """Unsubscribe; pending iteration ends once queued events are consumed."""
+        if self.closed:
+            return
+        self.closed = True
+        self.bus.unsubscribe(self)
+        self._deliver(self._CLOSED)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        return await self.get()
+
+
 class EventBus:
     """
-    Simple event bus for publishing domain events.
+    In-process async event bus for domain events.
 
-    In production, this would integrate with a message broker (RabbitMQ, Redis, etc.).
-    For MVP, this logs events for audit and can be extended later.
+    Publishing is synchronous and thread-safe; delivery to subscribers on
+    another thread's event loop goes through `call_soon_threadsafe`. Every
+    event is also logged for audit, as before.
+
+    Example:
+        subscription = event_bus.subscribe("order.*", replay=True)
+        async for event in subscription:
+            print(event.event_type, event.payload)
     """
 
-    def __init__(self) -> None:
-        """Initialize EventBus."""
+    def __init__(
+        self,
+        history_size: int = 1000,
+        max_queue_size: int = 1000,
+        persist_path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Initialize EventBus.
+
+        Args:
+            history_size: Number of recent events kept for replay
+            max_queue_size: Default per-subscriber queue bound
+            persist_path: Optional JSONL file events are appended to; existing
+                events are loaded into the replay buffer on startup
+        """
         self.logger = logger
+        self.max_queue_size = max_queue_size
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._history: deque[Event] = deque(maxlen=history_size)
+        self._subscriptions: list[Subscription] = []
+        self._lock = threading.Lock()
+        self._seq = 0
+
+        if self.persist_path is not None and self.persist_path.exists():
+            self._load_history()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recently published event (0 if none)."""
+        return self._seq
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscriptions."""
+        return len(self._subscriptions)
 
     def publish(
         self,
         event_type: str,
         payload: dict[str, Any],
-        trader_id: Optional[UUID] = None,
-    ) -> None:
+        trader_id: Optional[Union[UUID, str]] = None,
+    ) -> Event:
         """
         Publish an event to the event bus.
 
         Args:
             event_type: Type of event (e.g., "order.submitted", "order.filled")
             payload: Event data
-            trader_id: Optional trader ID for filtering/routing
+            trader_id: Optional trader ID for filtering/routing (defaults to
+                payload["trader_id"] when present)
+
+        Returns:
+            The published Event (with its sequence number)
+        """
+        if trader_id is None:
+            trader_id = payload.get("trader_id")
+
+        with self._lock:
+            self._seq += 1
+            event = Event(
+                seq=self._seq,
+                event_type=event_type,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                trader_id=str(trader_id) if trader_id else None,
+                payload=payload,
+            )
+            self._history.append(event)
+            subscriptions = [s for s in self._subscriptions if s.matches(event)]
+            if self.persist_path is not None:
+                self._persist(event)
+
+        self.logger.info(f"Event published: {json.dumps(event.to_dict(), default=str)}")
+
+        for subscription in subscriptions:
+            self._dispatch(subscription, event)
+        return event
+
+    def _dispatch(self, subscription: Subscription, event: Any) -> None:
+        """Hand an event to a subscriber on its own event loop."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is subscription.loop:
+            subscription._deliver(event)
+            return
+        try:
+            subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+        except RuntimeError:
+            # Subscriber's loop is closed; it will never consume again
+            self.unsubscribe(subscription)
+
+    def subscribe(
+        self,
+        topics: Union[str, Iterable[str]] = "*",
+        trader_id: Optional[Union[UUID, str]] = None,
+        max_queue_size: Optional[int] = None,
+        replay: bool = False,
+        since_seq: Optional[int] = None,
+    ) -> Subscription:
         """
-        event = {
-            "event_type": event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "trader_id": str(trader_id) if trader_id else None,
-            "payload": payload,
-        }
+        Subscribe to events on the current event loop.
+
+        Args:
+            topics: Topic pattern or patterns (e.g. "order.*")
+            trader_id: Only receive events for this trader
+            max_queue_size: Queue bound (default: bus default)
+            replay: Queue buffered history before live events
+            since_seq: Replay only events after this sequence number
+                (implies replay)
+
+        Returns:
+            Subscription to iterate with `async for`
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        patterns = (topics,) if isinstance(topics, str) else tuple(topics)
+        subscription = Subscription(
+            bus=self,
+            topics=patterns,
+            trader_id=str(trader_id) if trader_id else None,
+            max_queue_size=max_queue_size or self.max_queue_size,
+            loop=loop,
+        )
+
+        with self._lock:
+            if replay or since_seq is not None:
+                for event in self._history:
+                    if event.seq > (since_seq or 0) and subscription.matches(event):
+                        subscription._deliver(event)
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription (no-op if already removed)."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def replay(
+        self,
+        since_seq: int = 0,
+        topics: Union[str, Iterable[str]] = "*",
+        trader_id: Optional[Union[UUID, str]] = None,
+    ) -> list[Event]:
+        """
+        Get buffered events after a sequence number.
+
+        Args:
+            since_seq: Return events with seq greater than this
+            topics: Topic pattern or patterns
+            trader_id: Only events for this trader
+
+        Returns:
+            Matching events, oldest first
+        """
+        patterns = (topics,) if isinstance(topics, str) else tuple(topics)
+        trader = str(trader_id) if trader_id else None
+        with self._lock:
+            return [
+                event
+                for event in self._history
+                if event.seq > since_seq
+                and (trader is None or event.trader_id == trader)
+                and any(fnmatch.fnmatchcase(event.event_type, p) for p in patterns)
+            ]
+
+    def _persist(self, event: Event) -> None:
+        """Append an event to the JSONL log (caller holds `_lock`)."""
+        try:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.persist_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event.to_dict(), default=str) + "\n")
+        except OSError as e:
+            self.logger.error(f"Failed to persist event {event.seq}: {e}")
 
-        # Log event (in production, send to message broker)
-        self.logger.info(f"Event published: {json.dumps(event)}")
+    def _load_history(self) -> None:
+        """Load persisted events into the replay buffer and resume numbering."""
+        try:
+            with open(self.persist_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = Event(**json.loads(line))
+                    except (json.JSONDecodeError, TypeError):
+                        continue
+                    self._history.append(event)
+                    self._seq = max(self._seq, event.seq)
+        except OSError as e:
+            self.logger.error(f"Failed to load event history: {e}")
 
     def publish_order_submitted(
         self,
@@ -0,0 +1,60 @@
+"""Reverse block reader for the tail of large log files."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List, Union
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+def tail_lines(
+    path: Union[str, Path],
+    max_lines: int,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    encoding: str = "utf-8",
+) -> List[str]:
+    """
+    Read the last `max_lines` lines of a file without reading the whole file.
+
+    Seeks to the end and reads fixed-size blocks backwards until enough line
+    breaks have been seen, so cost is proportional to the tail size rather
+    than the file size.
+
+    Args:
+        path: File to read
+        max_lines: Number of trailing lines to return
+        block_size: Bytes read per backward step
+        encoding: Text encoding (undecodable bytes are replaced)
+
+    Returns:
+        Up to `max_lines` lines in file order, without line terminators
+
+    Example:
+        >>> tail_lines("logs/trading_bot.log", 100)[-1]
+        '2025-10-24 10:30:00 UTC | INFO     | ...'
+    """
+    if max_lines <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunks: List[bytes] = []
+        newlines = 0
+
+        # Need max_lines + 1 breaks to be sure the oldest kept line is complete
+        while pos > 0 and newlines <= max_lines:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    lines = b"".join(reversed(chunks)).decode(encoding, errors="replace").splitlines()
+    if pos > 0:
+        # First line was cut at a block boundary
+        lines = lines[1:]
+    return lines[-max_lines:]
@@ -5,11 +5,11 @@ This module initializes the FastAPI application with:
 - CORS middleware
 - API routers
 - Error handlers
-- WebSocket broadcast loop for real-time streaming
+- Shared state producer for REST snapshots and WebSocket streaming
 """
 
-import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -19,56 +19,32 @@ from datetime import datetime, timezone
 
 from .routes import orders, state, config, metrics, workflows, commands, backtests
 from .core.websocket import manager as ws_manager
-from .services.state_aggregator import StateAggregator
+from .services.state_producer import get_state_producer
 
 logger = logging.getLogger(__name__)
 
 
-# Background task for WebSocket broadcasting
-async def broadcast_state_updates():
-    """Background task that broadcasts bot state every 5 seconds."""
-    aggregator = StateAggregator()
-    while True:
-        try:
-            # Only broadcast if there are active connections
-            if ws_manager.get_active_count() > 0:
-                state = aggregator.get_bot_state()
-                await ws_manager.broadcast({
-                    "type": "state_update",
-                    "state": state.model_dump(),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                })
-                logger.debug(
-                    f"Broadcasted state to {ws_manager.get_active_count()} connections"
-                )
-        except Exception as e:
-            logger.error(f"Error broadcasting state: {e}")
-
-        await asyncio.sleep(5)  # 5-second interval
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup/shutdown events.
 
     Startup:
-    - Start WebSocket broadcast loop
+    - Start shared state producer (refresh + WebSocket delta broadcasts)
 
     Shutdown:
-    - Stop broadcast loop
+    - Stop state producer
     - Close all WebSocket connections
     """
     # Startup
-    broadcast_task = asyncio.create_task(broadcast_state_updates())
-    logger.info("WebSocket broadcast loop started")
+    state_producer = get_state_producer()
+    state_producer.start()
 
     yield
 
     # Shutdown
-    broadcast_task.cancel()
+    await state_producer.stop()
     await ws_manager.close_all()
-    logger.info("WebSocket broadcast loop stopped")
 
 
 app = FastAPI(
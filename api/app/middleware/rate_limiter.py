@@ -2,16 +2,230 @@
 Rate limiting middleware for API protection.
 
 Limits requests per API token to prevent abuse.
+
+Uses a sliding-window counter: each key keeps only the request counts of the
+current and previous fixed windows, and the rate is estimated by weighting the
+previous window by how much of it still overlaps the sliding window. State per
+key is O(1) regardless of the limit, and idle keys are evicted.
+
+Backends:
+- InMemoryRateLimitBackend (default): per-process, bounded number of keys
+- RedisRateLimitBackend (optional): shared across uvicorn workers; enabled by
+  setting RATE_LIMIT_REDIS_URL (requires the `redis` package)
 """
 
+import logging
+import math
+import os
 import time
-from collections import defaultdict
-from typing import Callable, Dict
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+# Optional Redis import
+try:
+    import redis.asyncio as aioredis
+    HAS_REDIS = True
+except ImportError:
+    aioredis = None
+    HAS_REDIS = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    retry_after: int = 0
+
+
+def _sliding_window_decision(
+    previous: int,
+    current: int,
+    elapsed: float,
+    limit: int,
+    window_seconds: float,
+) -> RateLimitDecision:
+    """
+    Decide whether one more request fits in the sliding window.
+
+    Args:
+        previous: Requests counted in the previous fixed window
+        current: Requests counted so far in the current fixed window
+        elapsed: Seconds since the current fixed window started
+        limit: Max requests per window
+        window_seconds: Window length
+
+    Returns:
+        RateLimitDecision (retry_after is seconds until a request would fit)
+    """
+    weight = 1.0 - elapsed / window_seconds
+    if previous * weight + current < limit:
+        return RateLimitDecision(allowed=True)
+
+    if current < limit and previous > 0:
+        # Wait for the previous window's contribution to decay enough
+        wait = window_seconds * (1.0 - (limit - current) / previous) - elapsed
+    else:
+        # Current window is full: wait for it to roll over and decay
+        wait = (window_seconds - elapsed) + window_seconds * (1.0 - limit / max(current, 1))
+    return RateLimitDecision(allowed=False, retry_after=max(1, math.ceil(wait)))
+
+
+class RateLimitBackend(ABC):
+    """Storage backend interface for RateLimiter."""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window_seconds: float) -> RateLimitDecision:
+        """Record a request for `key` if it fits under `limit` per window."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Per-process sliding-window counter store.
+
+    Keys are kept in least-recently-seen order, so idle keys (no request for
+    two windows, when their state is equivalent to empty) are evicted from the
+    front in amortized O(1). `max_keys` hard-caps memory under key floods:
+    when every tracked key is still active, the least recently seen key is
+    evicted so that a flood of made-up keys cannot lock new clients out.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize in-memory backend.
+
+        Args:
+            max_keys: Maximum tracked keys (least recently seen evicted first)
+            clock: Monotonic time source in seconds (injectable for tests)
+        """
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> [window_index, current_count, previous_count, last_seen]
+        self._state: "OrderedDict[str, list]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> RateLimitDecision:
+        """Record a request for `key` if it fits under `limit` per window."""
+        now = self.clock()
+        self._evict_idle(now, window_seconds)
+
+        window_index = int(now // window_seconds)
+        entry = self._state.get(key)
+        if entry is None:
+            if len(self._state) >= self.max_keys:
+                self._state.popitem(last=False)
+            entry = [window_index, 0, 0, now]
+            self._state[key] = entry
+        else:
+            self._state.move_to_end(key)
+            if entry[0] != window_index:
+                # Roll windows: current becomes previous (or zero if a window was skipped)
+                entry[2] = entry[1] if window_index - entry[0] == 1 else 0
+                entry[1] = 0
+                entry[0] = window_index
+            entry[3] = now
+
+        elapsed = now - window_index * window_seconds
+        decision = _sliding_window_decision(entry[2], entry[1], elapsed, limit, window_seconds)
+        if decision.allowed:
+            entry[1] += 1
+        return decision
+
+    def _evict_idle(self, now: float, window_seconds: float) -> None:
+        """Drop keys not seen for two windows (oldest are at the front)."""
+        cutoff = now - 2 * window_seconds
+        state = self._state
+        while state:
+            oldest = next(iter(state.values()))
+            if oldest[3] >= cutoff:
+                break
+            state.popitem(last=False)
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Redis-backed sliding-window counter shared across worker processes.
+
+    Each key uses two counters (`{prefix}{key}:{window_index}`) that expire
+    after two windows, so Redis memory is bounded by active keys.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Optional[Any] = None,
+        prefix: str = "ratelimit:",
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize Redis backend.
+
+        Args:
+            redis_url: Redis connection URL (redis://localhost:6379/0)
+            client: Pre-built async Redis client (overrides redis_url)
+            prefix: Key prefix for counters
+            clock: Wall-clock time source shared by all workers
+        """
+        if client is None:
+            if not HAS_REDIS:
+                raise ImportError(
+                    "redis module not installed. Install with: pip install redis"
+                )
+            client = aioredis.from_url(redis_url, decode_responses=True)
+        self.client = client
+        self.prefix = prefix
+        self.clock = clock
+
+    async def hit(self, key: str, limit: int, window_seconds: float) -> RateLimitDecision:
+        """Record a request for `key` if it fits under `limit` per window."""
+        now = self.clock()
+        window_index = int(now // window_seconds)
+        current_key = f"{self.prefix}{key}:{window_index}"
+        previous_key = f"{self.prefix}{key}:{window_index - 1}"
+
+        pipe = self.client.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, int(math.ceil(2 * window_seconds)))
+        pipe.get(previous_key)
+        current, _, previous = await pipe.execute()
+
+        elapsed = now - window_index * window_seconds
+        decision = _sliding_window_decision(
+            int(previous or 0), int(current) - 1, elapsed, limit, window_seconds
+        )
+        if not decision.allowed:
+            # Rejected requests do not count against the window
+            await self.client.decr(current_key)
+        return decision
+
+
+def _default_backend() -> RateLimitBackend:
+    """Pick Redis when RATE_LIMIT_REDIS_URL is set, otherwise in-memory."""
+    redis_url = os.getenv("RATE_LIMIT_REDIS_URL")
+    if redis_url:
+        if HAS_REDIS:
+            logger.info("Rate limiter using shared Redis backend")
+            return RedisRateLimitBackend(redis_url=redis_url)
+        logger.warning(
+            "RATE_LIMIT_REDIS_URL set but redis module not installed. "
+            "Using in-memory rate limiting."
+        )
+    return InMemoryRateLimitBackend()
+
 
 class RateLimiter(BaseHTTPMiddleware):
     """
@@ -23,17 +237,25 @@ class RateLimiter(BaseHTTPMiddleware):
     - Includes Retry-After header
     """
 
-    def __init__(self, app, requests_per_minute: int = 100):
+    WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        app,
+        requests_per_minute: int = 100,
+        backend: Optional[RateLimitBackend] = None,
+    ):
         """
         Initialize rate limiter.
 
         Args:
             app: FastAPI application
             requests_per_minute: Max requests allowed per minute per token
+            backend: Counter store (default: Redis if RATE_LIMIT_REDIS_URL, else in-memory)
         """
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
-        self.request_counts: Dict[str, list] = defaultdict(list)
+        self.backend = backend if backend is not None else _default_backend()
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -49,33 +271,26 @@ class RateLimiter(BaseHTTPMiddleware):
         # Get API key from header
         api_key = request.headers.get("X-API-Key", "anonymous")
 
-        # Clean old timestamps (older than 1 minute)
-        current_time = time.time()
-        self.request_counts[api_key] = [
-            timestamp
-            for timestamp in self.request_counts[api_key]
-            if current_time - timestamp < 60
-        ]
-
-        # Check rate limit
-        if len(self.request_counts[api_key]) >= self.requests_per_minute:
-            # Calculate retry-after (time until oldest request expires)
-            oldest_timestamp = self.request_counts[api_key][0]
-            retry_after = int(60 - (current_time - oldest_timestamp))
+        try:
+            decision = await self.backend.hit(
+                api_key, self.requests_per_minute, self.WINDOW_SECONDS
+            )
+        except Exception as e:
+            # Fail open: a broken shared backend must not take the API down
+            logger.warning(f"Rate limit backend error, allowing request: {e}")
+            decision = RateLimitDecision(allowed=True)
 
+        if not decision.allowed:
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "RATE_LIMIT_EXCEEDED",
                     "message": f"Rate limit exceeded. Max {self.requests_per_minute} requests per minute.",
-                    "retry_after": retry_after,
+                    "retry_after": decision.retry_after,
                 },
-                headers={"Retry-After": str(retry_after)},
+                headers={"Retry-After": str(decision.retry_after)},
             )
 
-        # Add current request timestamp
-        self.request_counts[api_key].append(current_time)
-
         # Continue to next middleware/route
         response = await call_next(request)
         return response
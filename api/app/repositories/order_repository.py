@@ -7,12 +7,29 @@ from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import event, select, and_
 from sqlalchemy.orm import Session
 
+from ..core.events import EventBus, event_bus as default_event_bus
 from ..models.order import Order, OrderStatus, OrderType
 from ..models.execution_log import ExecutionLog, ExecutionAction
 
+# Session.info key holding (event_bus, publish kwargs) queued until commit
+PENDING_EVENTS_KEY = "pending_order_events"
+
+
+@event.listens_for(Session, "after_commit")
+def publish_pending_events(session: Session) -> None:
+    """Publish order events queued by OrderRepository once the transaction commits."""
+    for bus, kwargs in session.info.pop(PENDING_EVENTS_KEY, []):
+        bus.publish(**kwargs)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_pending_events(session: Session) -> None:
+    """Drop queued order events when the transaction rolls back."""
+    session.info.pop(PENDING_EVENTS_KEY, None)
+
 
 class OrderRepository:
     """
@@ -25,14 +42,16 @@ class OrderRepository:
     between traders (multi-tenant security).
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, event_bus: Optional[EventBus] = None):
         """
         Initialize OrderRepository.
 
         Args:
             session: SQLAlchemy database session
+            event_bus: Bus for order status events (default: global event_bus)
         """
         self.session = session
+        self.event_bus = event_bus if event_bus is not None else default_event_bus
 
     def create(
         self,
@@ -144,7 +163,9 @@ class OrderRepository:
         Update order status with state transition validation and audit logging.
 
         Validates state transition using Order.update_status() method, then
-        creates an execution log entry for compliance.
+        creates an execution log entry for compliance and queues an
+        "order.<status>" event (e.g. "order.filled"). The event is published
+        when the caller commits the session and discarded on rollback.
 
         Valid transitions:
         - PENDING → FILLED, PARTIAL, REJECTED, CANCELLED
@@ -185,6 +206,21 @@ class OrderRepository:
         self.session.add(log_entry)
         self.session.flush()
 
+        self.session.info.setdefault(PENDING_EVENTS_KEY, []).append((
+            self.event_bus,
+            {
+                "event_type": f"order.{new_status.value.lower()}",
+                "payload": {
+                    "order_id": str(order_id),
+                    "symbol": order.symbol,
+                    "status": new_status.value,
+                    "previous_status": old_status.value,
+                    "filled_quantity": order.filled_quantity,
+                },
+                "trader_id": order.trader_id,
+            },
+        ))
+
         return order
 
     def get_unfilled_orders(self, trader_id: UUID) -> List[Order]:
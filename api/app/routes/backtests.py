@@ -1,7 +1,7 @@
 """FastAPI routes for backtest API endpoints."""
 
 from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from typing import Literal, Optional
 
 from ..schemas.backtest import BacktestListResponse, BacktestDetailResponse
 from ..services.backtest_loader import BacktestLoader
@@ -14,6 +14,11 @@ router = APIRouter(
 # Initialize loader (shared instance)
 loader = BacktestLoader()
 
+# Sortable fields (keys of BacktestCatalog's SORTABLE_COLUMNS)
+SortField = Literal[
+    "created_at", "total_return", "win_rate", "total_trades", "start_date", "end_date", "strategy"
+]
+
 
 @router.get("", response_model=BacktestListResponse)
 async def list_backtests(
@@ -21,21 +26,36 @@ async def list_backtests(
     start_date: Optional[str] = Query(None, description="Filter by start date (ISO format)"),
     end_date: Optional[str] = Query(None, description="Filter by end date (ISO format)"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    sort_by: SortField = Query("created_at", description="Sort field"),
+    order: Literal["asc", "desc"] = Query("desc", description="Sort direction"),
 ) -> BacktestListResponse:
     """
     List all backtests with optional filtering.
 
     Returns summary metadata for each backtest (strategy, date range, key metrics).
-    Results are sorted by completion date (newest first).
+    Results are sorted by completion date (newest first) unless sort_by/order are given.
+    Filtering, sorting and pagination run against the backtest catalog index;
+    `total` counts every backtest matching the filters, not just this page.
     """
-    summaries = loader.list_backtests(strategy=strategy, start_date=start_date, end_date=end_date)
-
-    # Apply pagination
-    summaries = summaries[:limit]
+    summaries = loader.list_backtests(
+        strategy=strategy,
+        start_date=start_date,
+        end_date=end_date,
+        sort_by=sort_by,
+        descending=order == "desc",
+        limit=limit,
+        offset=offset,
+    )
 
     return BacktestListResponse(
         data=summaries,
-        total=len(summaries),
+        total=loader.count_backtests(
+            strategy=strategy,
+            start_date=start_date,
+            end_date=end_date,
+            sync=False,  # Catalog was just synced by list_backtests
+        ),
     )
 
 
@@ -11,17 +11,12 @@ from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from ..core.auth import verify_api_key
 from ..core.websocket import manager
 from ..schemas.state import BotStateResponse
-from ..services.state_aggregator import StateAggregator
+from ..services.state_producer import StateProducer, get_state_producer
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 logger = logging.getLogger(__name__)
 
 
-def get_state_aggregator() -> StateAggregator:
-    """Dependency injection for StateAggregator."""
-    return StateAggregator()
-
-
 @router.get(
     "",
     response_model=BotStateResponse,
@@ -30,7 +25,7 @@ def get_state_aggregator() -> StateAggregator:
 )
 async def get_metrics(
     _: bool = Depends(verify_api_key),
-    aggregator: StateAggregator = Depends(get_state_aggregator),
+    producer: StateProducer = Depends(get_state_producer),
 ) -> BotStateResponse:
     """
     Get current bot metrics snapshot.
@@ -38,7 +33,7 @@ async def get_metrics(
     Returns:
         BotStateResponse with current state and metrics
     """
-    return aggregator.get_bot_state()
+    return await producer.get_state()
 
 
 @router.websocket("/stream")
@@ -46,18 +41,28 @@ async def stream_metrics(websocket: WebSocket) -> None:
     """
     WebSocket endpoint for real-time bot state streaming.
 
-    Broadcasts bot state every 5 seconds to connected clients.
+    Streams the shared bot state produced by the background StateProducer.
     Clients should handle reconnection on disconnect.
 
     Connection protocol:
     1. Client connects to ws://host/api/v1/metrics/stream
-    2. Server sends state updates every 5s as JSON
-    3. Client receives: {"state": {...}, "timestamp": "...", "broadcast_at": "..."}
-    4. On error, server disconnects and client should retry
+    2. Server sends the full state once:
+       {"type": "state_snapshot", "version": N, "state": {...}, "timestamp": "..."}
+    3. Every refresh (5s) that changes state, server sends a JSON-patch delta:
+       {"type": "state_delta", "version": N+1, "base_version": N, "patch": [...]}
+    4. If a delta's base_version does not match the client's version, the client
+       should reconnect to receive a fresh snapshot
+    5. When any order changes, server sends {"type": "orders_changed"} (no order
+       data); clients refetch their orders through the authenticated REST API
+    6. On error, server disconnects and client should retry
     """
     await manager.connect(websocket)
 
     try:
+        producer = get_state_producer()
+        await producer.get_state()
+        await manager.send_personal_message(producer.snapshot_message(), websocket)
+
         # Keep connection alive and let broadcast loop handle updates
         while True:
             # Wait for client messages (heartbeat/ping)
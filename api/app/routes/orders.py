@@ -190,15 +190,8 @@ async def cancel_order(
             detail={"error": "INVALID_TRANSITION", "message": str(e)},
         )
 
-    # Step 5: Commit transaction
+    # Step 5: Commit transaction (publishes the order.cancelled event queued by the repository)
     db.commit()
 
-    # Step 6: Publish event for real-time updates
-    event_bus.publish_order_cancelled(
-        order_id=order.id,
-        trader_id=trader_id,
-        symbol=order.symbol,
-    )
-
-    # Step 7: Return response
+    # Step 6: Return response
     return OrderResponse.model_validate(order)
@@ -9,6 +9,7 @@ from typing import Annotated
 from api.app.core.auth import verify_api_key
 from api.app.schemas.state import BotStateResponse, BotSummaryResponse, HealthStatus
 from api.app.services.state_aggregator import StateAggregator
+from api.app.services.state_producer import StateProducer, get_state_producer
 
 
 router = APIRouter(
@@ -19,10 +20,8 @@ router = APIRouter(
 
 # Dependency: State aggregator instance
 def get_state_aggregator() -> StateAggregator:
-    """Get StateAggregator instance (singleton pattern)."""
-    # In production, this would be managed by FastAPI dependency injection
-    # or application lifespan context
-    return StateAggregator()
+    """Get the shared StateAggregator owned by the background state producer."""
+    return get_state_producer().aggregator
 
 
 @router.get(
@@ -35,7 +34,8 @@ def get_state_aggregator() -> StateAggregator:
 
     **Authentication**: Requires X-API-Key header
 
-    **Caching**: State is cached for 60 seconds by default (configurable via BOT_STATE_CACHE_TTL)
+    **Caching**: Served from a shared snapshot refreshed in the background every 5 seconds
+    (BOT_STATE_REFRESH_INTERVAL); never older than 60 seconds (BOT_STATE_CACHE_TTL)
 
     **Response time**: <200ms P95
 
@@ -46,14 +46,14 @@ def get_state_aggregator() -> StateAggregator:
     """,
 )
 async def get_state(
-    aggregator: Annotated[StateAggregator, Depends(get_state_aggregator)],
+    producer: Annotated[StateProducer, Depends(get_state_producer)],
     cache_control: str = Header(None),
 ) -> BotStateResponse:
     """
     Get complete bot state.
 
     Args:
-        aggregator: StateAggregator dependency
+        producer: Shared StateProducer dependency
         cache_control: Optional Cache-Control header (no-cache to bypass cache)
 
     Returns:
@@ -62,7 +62,9 @@ async def get_state(
     # Check if client requested cache bypass
     use_cache = cache_control != "no-cache" if cache_control else True
 
-    return await aggregator.get_bot_state(use_cache=use_cache)
+    if not use_cache:
+        await producer.refresh()
+    return await producer.get_state()
 
 
 @router.get(
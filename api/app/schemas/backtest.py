@@ -22,7 +22,7 @@ class BacktestListResponse(BaseModel):
     """Response for GET /api/v1/backtests."""
 
     data: list[BacktestSummary]
-    total: int = Field(..., description="Total number of backtests")
+    total: int = Field(..., description="Number of backtests matching the filters (all pages)")
 
 
 class TradeDetail(BaseModel):
@@ -0,0 +1,337 @@
+"""SQLite catalog index for backtest result files.
+
+The catalog mirrors `backtest_results/*.json` into a small SQLite table holding
+the fields used for listing (config, headline metrics, completion time), so
+list queries filter, sort and paginate in SQL instead of parsing every file.
+
+Equity curves and trades are written to a compact gzip'd columnar sidecar per
+backtest and only loaded when a detail view is requested.
+
+Files are re-indexed when their mtime or size changes, so results written by
+other processes are picked up on the next query.
+"""
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DIRNAME = ".catalog"
+INDEX_FILENAME = "index.sqlite3"
+SIDECAR_SUFFIX = ".series.json.gz"
+
+# Columns clients may sort by (maps API name -> SQL column)
+SORTABLE_COLUMNS = {
+    "created_at": "created_at",
+    "total_return": "total_return",
+    "win_rate": "win_rate",
+    "total_trades": "total_trades",
+    "start_date": "start_date",
+    "end_date": "end_date",
+    "strategy": "strategy",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backtests (
+    id TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    valid INTEGER NOT NULL,
+    strategy TEXT,
+    symbols TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    total_return REAL,
+    win_rate REAL,
+    total_trades INTEGER,
+    created_at TEXT,
+    config TEXT,
+    metrics TEXT,
+    data_warnings TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_backtests_strategy ON backtests (strategy, created_at);
+CREATE INDEX IF NOT EXISTS idx_backtests_created_at ON backtests (created_at);
+"""
+
+
+def _to_columns(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """Convert a list of row dicts to a dict of column lists."""
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def _from_columns(columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Inverse of `_to_columns`."""
+    if not columns:
+        return []
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*(columns[k] for k in keys))]
+
+
+class BacktestCatalog:
+    """SQLite index plus lazy sidecar store for a backtest results directory."""
+
+    def __init__(self, backtest_dir: Path):
+        """Initialize catalog for a results directory.
+
+        Args:
+            backtest_dir: Directory containing `<id>.json` backtest results
+        """
+        self.backtest_dir = Path(backtest_dir)
+        self.catalog_dir = self.backtest_dir / CATALOG_DIRNAME
+        self.index_path = self.catalog_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the index (creating it if needed) and commit on success."""
+        self.catalog_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.executescript(_SCHEMA)
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def sidecar_path(self, backtest_id: str) -> Path:
+        """Path of the equity-curve/trades sidecar for a backtest."""
+        return self.catalog_dir / f"{backtest_id}{SIDECAR_SUFFIX}"
+
+    def sync(self) -> None:
+        """Bring the index up to date with the results directory.
+
+        Only files whose (mtime, size) differ from the index are parsed;
+        rows for deleted files are dropped.
+        """
+        if not self.backtest_dir.exists():
+            return
+
+        on_disk: dict[str, tuple[int, int]] = {}
+        with os.scandir(self.backtest_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    st = entry.stat()
+                    on_disk[entry.name[: -len(".json")]] = (st.st_mtime_ns, st.st_size)
+
+        with self._lock, self._connect() as conn:
+            indexed = {
+                row["id"]: (row["mtime_ns"], row["size"])
+                for row in conn.execute("SELECT id, mtime_ns, size FROM backtests")
+            }
+
+            for backtest_id in indexed.keys() - on_disk.keys():
+                conn.execute("DELETE FROM backtests WHERE id = ?", (backtest_id,))
+                self.sidecar_path(backtest_id).unlink(missing_ok=True)
+
+            for backtest_id, stat in on_disk.items():
+                if indexed.get(backtest_id) != stat:
+                    self._index_file(conn, backtest_id, stat)
+
+    def index(self, backtest_id: str) -> None:
+        """Re-index a single backtest if its file changed (or drop it if deleted)."""
+        file_path = self.backtest_dir / f"{backtest_id}.json"
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT mtime_ns, size FROM backtests WHERE id = ?", (backtest_id,)
+            ).fetchone()
+            try:
+                st = file_path.stat()
+            except FileNotFoundError:
+                if row is not None:
+                    conn.execute("DELETE FROM backtests WHERE id = ?", (backtest_id,))
+                    self.sidecar_path(backtest_id).unlink(missing_ok=True)
+                return
+
+            stat = (st.st_mtime_ns, st.st_size)
+            if row is None or (row["mtime_ns"], row["size"]) != stat:
+                self._index_file(conn, backtest_id, stat)
+
+    def _index_file(
+        self, conn: sqlite3.Connection, backtest_id: str, stat: tuple[int, int]
+    ) -> None:
+        """Parse one result file and upsert its index row and sidecar."""
+        file_path = self.backtest_dir / f"{backtest_id}.json"
+        mtime_ns, size = stat
+        try:
+            data = json.loads(file_path.read_text())
+            config = data["config"]
+            metrics = data["metrics"]
+            row = (
+                backtest_id,
+                mtime_ns,
+                size,
+                1,
+                config["strategy"],
+                json.dumps(config["symbols"]),
+                config["start_date"],
+                config["end_date"],
+                metrics["total_return"],
+                metrics["win_rate"],
+                metrics["total_trades"],
+                data["metadata"]["completed_at"],
+                json.dumps(config),
+                json.dumps(metrics),
+                json.dumps(data.get("data_warnings", [])),
+            )
+            self._write_sidecar(
+                backtest_id, data.get("equity_curve", []), data.get("trades", [])
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, OSError) as e:
+            # Record malformed files so they are not re-parsed until they change
+            logger.warning(f"Skipping {file_path.name}: {e}")
+            row = (backtest_id, mtime_ns, size, 0) + (None,) * 11
+            self.sidecar_path(backtest_id).unlink(missing_ok=True)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO backtests VALUES "
+            "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            row,
+        )
+
+    def _write_sidecar(
+        self,
+        backtest_id: str,
+        equity_curve: list[dict[str, Any]],
+        trades: list[dict[str, Any]],
+    ) -> None:
+        """Write equity curve and trades as gzip'd column-oriented JSON."""
+        payload = {
+            "equity_curve": _to_columns(equity_curve),
+            "trades": _to_columns(trades),
+        }
+        path = self.sidecar_path(backtest_id)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def query(
+        self,
+        strategy: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Filter, sort and paginate indexed backtests.
+
+        Args:
+            strategy: Exact strategy name
+            start_date: Keep backtests starting on/after this date (ISO)
+            end_date: Keep backtests ending on/before this date (ISO)
+            sort_by: One of SORTABLE_COLUMNS
+            descending: Sort direction
+            limit: Maximum rows (None = all)
+            offset: Rows to skip
+
+        Returns:
+            Summary rows as dicts (id, strategy, symbols, dates, metrics, created_at)
+
+        Raises:
+            ValueError: If sort_by is not a sortable column
+        """
+        if sort_by not in SORTABLE_COLUMNS:
+            raise ValueError(
+                f"Invalid sort field '{sort_by}'. "
+                f"Must be one of: {', '.join(sorted(SORTABLE_COLUMNS))}"
+            )
+
+        where, params = self._where(strategy, start_date, end_date)
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            "SELECT id, strategy, symbols, start_date, end_date, total_return, "
+            f"win_rate, total_trades, created_at FROM backtests WHERE {where} "
+            f"ORDER BY {SORTABLE_COLUMNS[sort_by]} {direction}, id {direction}"
+        )
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(offset)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [
+            {**dict(row), "symbols": json.loads(row["symbols"])}
+            for row in rows
+        ]
+
+    def count(
+        self,
+        strategy: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> int:
+        """Count indexed backtests matching the filters."""
+        where, params = self._where(strategy, start_date, end_date)
+        with self._connect() as conn:
+            return int(
+                conn.execute(f"SELECT COUNT(*) FROM backtests WHERE {where}", params)
+                .fetchone()[0]
+            )
+
+    @staticmethod
+    def _where(
+        strategy: Optional[str], start_date: Optional[str], end_date: Optional[str]
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause shared by query() and count()."""
+        clauses = ["valid = 1"]
+        params: list[Any] = []
+        if strategy:
+            clauses.append("strategy = ?")
+            params.append(strategy)
+        if start_date:
+            clauses.append("start_date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("end_date <= ?")
+            params.append(end_date)
+        return " AND ".join(clauses), params
+
+    def get_header(self, backtest_id: str) -> Optional[dict[str, Any]]:
+        """Get indexed config, metrics and warnings for one backtest.
+
+        Returns:
+            Dict with config, metrics, data_warnings, mtime_ns; None if the
+            backtest is unknown or malformed
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT mtime_ns, config, metrics, data_warnings FROM backtests "
+                "WHERE id = ? AND valid = 1",
+                (backtest_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "mtime_ns": row["mtime_ns"],
+            "config": json.loads(row["config"]),
+            "metrics": json.loads(row["metrics"]),
+            "data_warnings": json.loads(row["data_warnings"]),
+        }
+
+    def load_series(self, backtest_id: str) -> dict[str, list[dict[str, Any]]]:
+        """Load equity curve and trades from the sidecar.
+
+        Returns:
+            Dict with "equity_curve" and "trades" as lists of row dicts
+        """
+        with gzip.open(self.sidecar_path(backtest_id), "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        return {
+            "equity_curve": _from_columns(payload["equity_curve"]),
+            "trades": _from_columns(payload["trades"]),
+        }
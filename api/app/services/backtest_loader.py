@@ -1,25 +1,49 @@
 """Service for loading backtest results from filesystem."""
 
 import json
-from functools import lru_cache
+import logging
+import os
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from ..schemas.backtest import BacktestSummary, BacktestDetailResponse
+from .backtest_catalog import BacktestCatalog
+
+logger = logging.getLogger(__name__)
 
 
 class BacktestLoader:
-    """Load backtest JSON files from filesystem."""
+    """Load backtest JSON files from filesystem.
+
+    Listing is served from a SQLite catalog index (see BacktestCatalog) that is
+    refreshed incrementally from file mtimes, so only new or changed result
+    files are parsed. Detail views load equity curves and trades lazily from a
+    compact sidecar and are cached per file version.
+    """
 
-    def __init__(self, backtest_dir: str = "backtest_results"):
-        """Initialize loader with backtest directory path."""
+    def __init__(self, backtest_dir: str = "backtest_results", detail_cache_size: int = 128):
+        """Initialize loader with backtest directory path.
+
+        Args:
+            backtest_dir: Directory containing `<id>.json` backtest results
+            detail_cache_size: Number of detail responses kept in memory
+        """
         self.backtest_dir = Path(backtest_dir)
+        self.catalog = BacktestCatalog(self.backtest_dir)
+        self.detail_cache_size = detail_cache_size
+        self._detail_cache: OrderedDict[str, tuple[int, BacktestDetailResponse]] = OrderedDict()
 
     def list_backtests(
         self,
         strategy: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        sort_by: str = "created_at",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> list[BacktestSummary]:
         """
         List all backtests with optional filtering.
@@ -28,54 +52,58 @@ class BacktestLoader:
             strategy: Filter by strategy name
             start_date: Filter by start date (ISO format)
             end_date: Filter by end date (ISO format)
+            sort_by: Sort field (created_at, total_return, win_rate, total_trades,
+                start_date, end_date, strategy)
+            descending: Sort direction (default: newest/highest first)
+            limit: Maximum results to return (None = all)
+            offset: Number of results to skip
 
         Returns:
-            List of backtest summaries sorted by created_at (newest first)
+            List of backtest summaries sorted by created_at (newest first) by default
+
+        Raises:
+            ValueError: If sort_by is not a sortable field
         """
-        results = []
+        if not self.backtest_dir.exists():
+            return []
+
+        self.catalog.sync()
+        rows = self.catalog.query(
+            strategy=strategy,
+            start_date=start_date,
+            end_date=end_date,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
+        return [BacktestSummary(**row) for row in rows]
+
+    def count_backtests(
+        self,
+        strategy: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        sync: bool = True,
+    ) -> int:
+        """Count backtests matching the filters (ignores pagination).
 
+        Pass sync=False right after list_backtests, which already refreshed
+        the catalog, to avoid scanning the directory twice.
+        """
         if not self.backtest_dir.exists():
-            return results
-
-        for file in self.backtest_dir.glob("*.json"):
-            try:
-                data = json.loads(file.read_text())
-
-                # Apply filters
-                if strategy and data["config"]["strategy"] != strategy:
-                    continue
-                if start_date and data["config"]["start_date"] < start_date:
-                    continue
-                if end_date and data["config"]["end_date"] > end_date:
-                    continue
-
-                summary = BacktestSummary(
-                    id=file.stem,
-                    strategy=data["config"]["strategy"],
-                    symbols=data["config"]["symbols"],
-                    start_date=data["config"]["start_date"],
-                    end_date=data["config"]["end_date"],
-                    total_return=data["metrics"]["total_return"],
-                    win_rate=data["metrics"]["win_rate"],
-                    total_trades=data["metrics"]["total_trades"],
-                    created_at=data["metadata"]["completed_at"],
-                )
-                results.append(summary)
-
-            except (json.JSONDecodeError, KeyError) as e:
-                # Skip malformed files
-                print(f"Warning: Skipping {file.name}: {e}")
-                continue
-
-        # Sort by created_at (newest first)
-        results.sort(key=lambda x: x.created_at, reverse=True)
-        return results
-
-    @lru_cache(maxsize=128)  # 10-minute cache (TTL handled by LRU eviction)
+            return 0
+
+        if sync:
+            self.catalog.sync()
+        return self.catalog.count(strategy=strategy, start_date=start_date, end_date=end_date)
+
     def get_backtest(self, backtest_id: str) -> Optional[BacktestDetailResponse]:
         """
         Get full backtest details by ID.
 
+        Cached responses are reused until the underlying file changes.
+
         Args:
             backtest_id: Backtest identifier (filename without extension)
 
@@ -84,12 +112,73 @@ class BacktestLoader:
         """
         file_path = self.backtest_dir / f"{backtest_id}.json"
 
-        if not file_path.exists():
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._detail_cache.pop(backtest_id, None)
             return None
 
+        cached = self._detail_cache.get(backtest_id)
+        if cached is not None and cached[0] == mtime_ns:
+            self._detail_cache.move_to_end(backtest_id)
+            return cached[1]
+
         try:
-            data = json.loads(file_path.read_text())
-            return BacktestDetailResponse(**data)
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Error loading {backtest_id}: {e}")
+            self.catalog.index(backtest_id)
+            header = self.catalog.get_header(backtest_id)
+            if header is None:
+                return None
+
+            series = self.catalog.load_series(backtest_id)
+            result = BacktestDetailResponse(
+                config=header["config"],
+                metrics=header["metrics"],
+                trades=series["trades"],
+                equity_curve=series["equity_curve"],
+                data_warnings=header["data_warnings"],
+            )
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Error loading {backtest_id}: {e}")
             return None
+
+        self._detail_cache[backtest_id] = (header["mtime_ns"], result)
+        self._detail_cache.move_to_end(backtest_id)
+        while len(self._detail_cache) > self.detail_cache_size:
+            self._detail_cache.popitem(last=False)
+        return result
+
+    def save_backtest(self, backtest_id: str, data: dict[str, Any]) -> Path:
+        """
+        Write a backtest result file and index it immediately.
+
+        Args:
+            backtest_id: Backtest identifier (becomes `<backtest_id>.json`)
+            data: Backtest result dict (config, metrics, trades, equity_curve,
+                data_warnings, metadata.completed_at)
+
+        Returns:
+            Path of the written result file
+
+        Raises:
+            ValueError: If data does not match BacktestDetailResponse or lacks
+                metadata.completed_at
+        """
+        BacktestDetailResponse(**data)
+        if "completed_at" not in data.get("metadata", {}):
+            raise ValueError("Backtest data must include metadata.completed_at")
+
+        self.backtest_dir.mkdir(parents=True, exist_ok=True)
+        file_path = self.backtest_dir / f"{backtest_id}.json"
+
+        # Atomic write so concurrent readers never index a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=self.backtest_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self.catalog.index(backtest_id)
+        return file_path
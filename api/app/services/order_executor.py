@@ -188,7 +188,7 @@ class OrderExecutor:
 
         # Log execution attempt
         self.event_bus.publish(
-            "orders.events",
+            "order.execution_started",
             {
                 "event": "order.execution_started",
                 "trader_id": trader_id,
@@ -203,7 +203,7 @@ class OrderExecutor:
         # Log execution result
         event_type = "order.executed" if result.success else "order.execution_failed"
         self.event_bus.publish(
-            "orders.events",
+            event_type,
             {
                 "event": event_type,
                 "trader_id": trader_id,
@@ -247,7 +247,7 @@ class OrderExecutor:
                 # Success - publish recovery event if this was a retry
                 if attempt > 1:
                     self.event_bus.publish(
-                        "orders.events",
+                        "order.recovered",
                         {
                             "event": "order.recovered",
                             "idempotent_key": idempotent_key,
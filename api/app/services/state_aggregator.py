@@ -7,11 +7,13 @@ state response for LLM consumption.
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 from decimal import Decimal
+import asyncio
 import os
 import logging
 from pathlib import Path
 import json
 
+from api.app.core.log_tail import tail_lines
 from api.app.schemas.state import (
     BotStateResponse,
     BotSummaryResponse,
@@ -36,6 +38,13 @@ except ImportError:
     circuit_breaker = None
     HAS_CIRCUIT_BREAKER = False
 
+try:
+    from trading_bot.logging.error_buffer import install_error_buffer
+    HAS_ERROR_BUFFER = True
+except ImportError:
+    install_error_buffer = None
+    HAS_ERROR_BUFFER = False
+
 try:
     from alpaca.trading.client import TradingClient
     HAS_ALPACA = True
@@ -55,8 +64,18 @@ class StateAggregator:
     - Performance tracker (metrics, P&L)
     - Health monitor (circuit breaker, API status)
     - Configuration (risk limits, paper trading mode)
+    - Log-file tail (recent ERROR/CRITICAL lines, including the bot process),
+      merged with this process's error ring buffer
     """
 
+    # Standard log locations scanned for recent errors
+    ERROR_LOG_PATHS = (
+        Path("logs/trading_bot.log"),
+        Path("logs/error.log"),
+        Path("logs/health_check.log"),
+    )
+    ERROR_LOG_TAIL_LINES = 100
+
     def __init__(
         self,
         trading_client: Optional[Any] = None,
@@ -75,6 +94,7 @@ class StateAggregator:
         # Optional dependencies
         self.trading_client = trading_client
         self.health_monitor = health_monitor
+        self.error_buffer = install_error_buffer() if HAS_ERROR_BUFFER else None
 
         logger.info(
             f"StateAggregator initialized with trading_client={trading_client is not None}, "
@@ -194,8 +214,8 @@ class StateAggregator:
         # Calculate daily P&L (simplified)
         daily_pnl = state.performance.total_unrealized_pl
 
-        # Get recent errors from log files
-        recent_errors = self._get_recent_errors(max_errors=3)
+        # Get recent errors from log files (file I/O kept off the event loop)
+        recent_errors = await asyncio.to_thread(self._get_recent_errors, 3)
 
         return BotSummaryResponse(
             health_status=state.health.status,
@@ -227,7 +247,12 @@ class StateAggregator:
         return age < self.cache_ttl
 
     def _get_recent_errors(self, max_errors: int = 3) -> List[Dict[str, Any]]:
-        """Get recent errors from log files.
+        """Get recent errors, newest first.
+
+        The log files (last blocks of each file) are the main source, since
+        the bot and other API workers run in separate processes. Errors held
+        in this process's ring buffer that do not appear in the tail are
+        appended after the log-file errors.
 
         Args:
             max_errors: Maximum number of errors to return
@@ -235,23 +260,35 @@ class StateAggregator:
         Returns:
             List of recent error dictionaries
         """
-        errors = []
-        try:
-            # Check for error logs in standard locations
-            log_paths = [
-                Path("logs/trading_bot.log"),
-                Path("logs/error.log"),
-                Path("logs/health_check.log")
-            ]
+        errors = self._get_log_file_errors(max_errors)
+        if self.error_buffer is None:
+            return errors
+
+        for entry in self.error_buffer.recent(max_errors):
+            if len(errors) >= max_errors:
+                break
+            # Plain-text log lines contain the formatted message
+            if any(entry['message'] in error['message'] for error in errors):
+                continue
+            errors.append({
+                'timestamp': entry['timestamp'],
+                'level': entry['level'],
+                'message': entry['message'],
+            })
+
+        return errors
+
+    def _get_log_file_errors(self, max_errors: int) -> List[Dict[str, Any]]:
+        """Get recent errors from the tails of ERROR_LOG_PATHS, newest first."""
+        errors: List[Dict[str, Any]] = []
 
-            for log_path in log_paths:
+        try:
+            for log_path in self.ERROR_LOG_PATHS:
                 if not log_path.exists():
                     continue
 
                 try:
-                    # Read last 100 lines of log file
-                    with open(log_path, 'r') as f:
-                        lines = f.readlines()[-100:]
+                    lines = tail_lines(log_path, self.ERROR_LOG_TAIL_LINES)
 
                     # Parse error lines (look for ERROR, CRITICAL, or exception traces)
                     for line in reversed(lines):
@@ -322,6 +359,33 @@ class StateAggregator:
             logger.warning(f"Failed to get market status from Alpaca: {e}")
             return "UNKNOWN"
 
+    async def _fetch_broker_data(self) -> tuple[Any, Any, Any, str]:
+        """Fetch positions, orders, account and market status off the event loop.
+
+        The Alpaca SDK performs blocking HTTP calls, so each call runs in a
+        worker thread and the four requests are issued concurrently.
+
+        Returns:
+            Tuple of (positions, orders, account, market_status). Broker
+            results are exceptions instead of values when the call failed,
+            and None when no trading client is configured.
+        """
+        if not self.trading_client or not HAS_ALPACA:
+            market_status = await asyncio.to_thread(self._get_market_status)
+            return None, None, None, market_status
+
+        positions, orders, account, market_status = await asyncio.gather(
+            asyncio.to_thread(self.trading_client.get_all_positions),
+            asyncio.to_thread(self.trading_client.get_orders),
+            asyncio.to_thread(self.trading_client.get_account),
+            asyncio.to_thread(self._get_market_status),
+            return_exceptions=True,
+        )
+        if isinstance(market_status, BaseException):
+            logger.warning(f"Failed to get market status: {market_status}")
+            market_status = "UNKNOWN"
+        return positions, orders, account, market_status
+
     async def _aggregate_state(self) -> BotStateResponse:
         """
         Aggregate state from all sources.
@@ -338,11 +402,17 @@ class StateAggregator:
         """
         now = datetime.now(timezone.utc)
 
+        # Fetch broker data concurrently in worker threads (Alpaca SDK is blocking)
+        alpaca_positions, alpaca_orders, alpaca_account, market_status = (
+            await self._fetch_broker_data()
+        )
+
         # Get positions from Alpaca
         positions = []
         if self.trading_client and HAS_ALPACA:
             try:
-                alpaca_positions = self.trading_client.get_all_positions()
+                if isinstance(alpaca_positions, BaseException):
+                    raise alpaca_positions
                 for pos in alpaca_positions:
                     positions.append(PositionResponse(
                         symbol=pos.symbol,
@@ -376,7 +446,8 @@ class StateAggregator:
         orders = []
         if self.trading_client and HAS_ALPACA:
             try:
-                alpaca_orders = self.trading_client.get_orders()
+                if isinstance(alpaca_orders, BaseException):
+                    raise alpaca_orders
                 logger.info(f"Loaded {len(alpaca_orders)} orders from Alpaca")
                 # orders list populated (schema conversion needed)
             except Exception as e:
@@ -385,7 +456,8 @@ class StateAggregator:
         # Get account from Alpaca
         if self.trading_client and HAS_ALPACA:
             try:
-                alpaca_account = self.trading_client.get_account()
+                if isinstance(alpaca_account, BaseException):
+                    raise alpaca_account
                 account = AccountStatusResponse(
                     buying_power=Decimal(str(alpaca_account.buying_power)),
                     account_balance=Decimal(str(alpaca_account.equity)),
@@ -438,9 +510,6 @@ class StateAggregator:
             "paper_trading": os.getenv("PAPER_TRADING", "true").lower() == "true",
         }
 
-        # Get market status from Alpaca
-        market_status = self._get_market_status()
-
         # Get warnings/alerts
         warnings = []
         if health.circuit_breaker_active:
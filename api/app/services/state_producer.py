@@ -0,0 +1,332 @@
+"""Shared background producer for bot state snapshots.
+
+A single producer loop refreshes bot state on a fixed schedule so that REST
+handlers and `/metrics/stream` WebSocket clients read one shared snapshot
+instead of each building their own StateAggregator and hitting the broker.
+
+Stream clients receive a full snapshot when they connect and JSON-patch style
+deltas (RFC 6902 subset: add/remove/replace) whenever a refresh changes the
+state, whether it came from the schedule or a REST request, so every delta's
+base_version is the version the client already holds.
+
+When wired to an EventBus, order events trigger an immediate refresh instead
+of waiting for the next scheduled tick. Stream clients are not tied to a
+trader, so they only receive a payload-free "orders_changed" notice; order
+details stay behind the per-trader order endpoints.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from api.app.core.events import EventBus
+from api.app.schemas.state import BotStateResponse
+from api.app.services.state_aggregator import StateAggregator
+
+logger = logging.getLogger(__name__)
+
+
+def _escape_pointer_token(token: str) -> str:
+    """Escape a key for use in a JSON pointer (RFC 6901)."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def make_json_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute a JSON-patch style delta transforming `old` into `new`.
+
+    Dicts are diffed key by key and lists element by element, with trailing
+    elements appended via "/-" or removed from the end backwards, so the ops
+    can be applied in order by any RFC 6902 client.
+
+    Args:
+        old: Previous JSON-compatible document
+        new: Current JSON-compatible document
+        path: JSON pointer prefix for the current node
+
+    Returns:
+        List of patch operations (empty when documents are equal)
+
+    Example:
+        >>> make_json_patch({"a": 1, "b": 2}, {"a": 1, "b": 3})
+        [{'op': 'replace', 'path': '/b', 'value': 3}]
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer_token(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape_pointer_token(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_json_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(make_json_patch(old[i], new[i], f"{path}/{i}"))
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for value in new[common:]:
+            ops.append({"op": "add", "path": f"{path}/-", "value": value})
+        return ops
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class StateProducer:
+    """
+    Background producer that owns the shared bot state snapshot.
+
+    The producer refreshes state every `interval_seconds` through a single
+    StateAggregator (whose broker calls run in worker threads), keeps the
+    latest snapshot plus a monotonically increasing version, and broadcasts
+    deltas to WebSocket clients.
+
+    Concurrent on-demand refreshes are coalesced so only one aggregation runs
+    at a time.
+    """
+
+    def __init__(
+        self,
+        aggregator: Optional[StateAggregator] = None,
+        interval_seconds: Optional[float] = None,
+        connection_manager: Optional[Any] = None,
+        event_bus: Optional[EventBus] = None,
+    ):
+        """Initialize state producer.
+
+        Args:
+            aggregator: StateAggregator to refresh from (default: new instance)
+            interval_seconds: Refresh interval (default: BOT_STATE_REFRESH_INTERVAL or 5s)
+            connection_manager: Optional WebSocket ConnectionManager for delta broadcasts
+            event_bus: Optional EventBus whose order events trigger an early
+                refresh and an "orders_changed" notice to stream clients
+        """
+        self.aggregator = aggregator or StateAggregator()
+        self.interval_seconds = (
+            interval_seconds
+            if interval_seconds is not None
+            else float(os.getenv("BOT_STATE_REFRESH_INTERVAL", "5"))
+        )
+        self.connection_manager = connection_manager
+        self.event_bus = event_bus
+
+        self._snapshot: Optional[BotStateResponse] = None
+        self._snapshot_doc: Optional[Dict[str, Any]] = None
+        self._snapshot_at: Optional[datetime] = None
+        self._version = 0
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._event_task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+
+    @property
+    def snapshot(self) -> Optional[BotStateResponse]:
+        """Latest produced state, or None before the first refresh."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Version of the latest snapshot (0 before the first refresh)."""
+        return self._version
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop is active."""
+        return self._task is not None and not self._task.done()
+
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since the latest snapshot was produced, or None if none exists."""
+        if self._snapshot_at is None:
+            return None
+        return (datetime.now(timezone.utc) - self._snapshot_at).total_seconds()
+
+    async def refresh(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate fresh state and replace the shared snapshot.
+
+        The version only advances when the state changed, and every new
+        version is broadcast to stream clients (a snapshot for the first one,
+        a delta afterwards).
+
+        Returns:
+            Patch operations from the previous snapshot to the new one. The
+            first refresh returns an empty list (there is no base to diff).
+        """
+        async with self._refresh_lock:
+            return await self._refresh_locked()
+
+    async def _refresh_locked(self) -> List[Dict[str, Any]]:
+        """Refresh and broadcast the snapshot; caller must hold `_refresh_lock`."""
+        state = await self.aggregator.get_bot_state(use_cache=False)
+        doc = state.model_dump(mode="json")
+
+        first = self._snapshot_doc is None
+        patch = [] if first else make_json_patch(self._snapshot_doc, doc)
+
+        self._snapshot = state
+        self._snapshot_at = datetime.now(timezone.utc)
+        if first or patch:
+            self._snapshot_doc = doc
+            self._version += 1
+            # Broadcast under the lock so clients see versions in order
+            await self._broadcast(first, patch)
+        return patch
+
+    async def _broadcast(self, first: bool, patch: List[Dict[str, Any]]) -> None:
+        """Send the new version to stream clients (snapshot if first, else delta)."""
+        manager = self.connection_manager
+        if manager is None or manager.get_active_count() == 0:
+            return
+
+        if first:
+            await manager.broadcast(self.snapshot_message())
+        else:
+            await manager.broadcast(self.delta_message(patch))
+            logger.debug(
+                f"Broadcasted {len(patch)} state ops to "
+                f"{manager.get_active_count()} connections"
+            )
+
+    def _is_stale(self, max_age_seconds: float) -> bool:
+        """Check whether the snapshot is missing or older than `max_age_seconds`."""
+        age = self.snapshot_age()
+        return self._snapshot is None or age is None or age >= max_age_seconds
+
+    async def get_state(self, max_age_seconds: Optional[float] = None) -> BotStateResponse:
+        """
+        Get the shared snapshot, refreshing it if missing or too old.
+
+        Concurrent callers that find the snapshot stale share one refresh.
+
+        Args:
+            max_age_seconds: Maximum acceptable snapshot age
+                (default: aggregator cache TTL)
+
+        Returns:
+            BotStateResponse from the shared snapshot
+        """
+        max_age = (
+            max_age_seconds if max_age_seconds is not None else self.aggregator.cache_ttl
+        )
+        if self._is_stale(max_age):
+            async with self._refresh_lock:
+                # Another caller may have refreshed while we waited for the lock
+                if self._is_stale(max_age):
+                    await self._refresh_locked()
+        return self._snapshot  # type: ignore[return-value]
+
+    def snapshot_message(self) -> Dict[str, Any]:
+        """Build the full-state message sent to newly connected stream clients."""
+        return {
+            "type": "state_snapshot",
+            "version": self._version,
+            "state": self._snapshot_doc,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def delta_message(self, patch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the delta message broadcast to stream clients after a refresh."""
+        return {
+            "type": "state_delta",
+            "version": self._version,
+            "base_version": self._version - 1,
+            "patch": patch,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def tick(self) -> None:
+        """Run one producer iteration: refresh and broadcast the delta if any."""
+        await self.refresh()
+
+    async def _run(self) -> None:
+        """Producer loop: refresh on schedule until cancelled."""
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error producing bot state: {e}")
+
+            # Sleep until the next scheduled tick or an order event, whichever is first
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def orders_changed_message(self) -> Dict[str, Any]:
+        """
+        Build the notice sent to stream clients when any order changes.
+
+        Carries no order data: stream connections are shared across traders,
+        so clients refetch their own orders through the authenticated API.
+        """
+        return {
+            "type": "orders_changed",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def _forward_events(self) -> None:
+        """Notify stream clients of order changes and wake the producer loop."""
+        subscription = self.event_bus.subscribe("order.*")
+        try:
+            async for _event in subscription:
+                self._wake.set()
+                manager = self.connection_manager
+                if manager is not None and manager.get_active_count() > 0:
+                    await manager.broadcast(self.orders_changed_message())
+        finally:
+            subscription.close()
+
+    def start(self) -> None:
+        """Start the background producer loop (no-op if already running)."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+        if self.event_bus is not None:
+            self._event_task = asyncio.create_task(self._forward_events())
+        logger.info(f"State producer started (interval={self.interval_seconds}s)")
+
+    async def stop(self) -> None:
+        """Stop the background producer loop."""
+        if self._task is None:
+            return
+        for task in (self._task, self._event_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._event_task = None
+        logger.info("State producer stopped")
+
+
+_state_producer: Optional[StateProducer] = None
+
+
+def get_state_producer() -> StateProducer:
+    """Get the process-wide StateProducer (created on first use)."""
+    global _state_producer
+    if _state_producer is None:
+        from api.app.core.events import event_bus
+        from api.app.core.websocket import manager
+
+        _state_producer = StateProducer(connection_manager=manager, event_bus=event_bus)
+    return _state_producer
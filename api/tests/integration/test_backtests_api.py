@@ -173,7 +173,15 @@ class TestListBacktests:
         data = response.json()
 
         assert len(data["data"]) == 2
-        assert data["total"] == 2  # Total returned, not total available
+        # total counts every match, independent of the page size
+        assert data["total"] == 3
+        assert test_client.get("/api/v1/backtests?limit=1").json()["total"] == data["total"]
+
+    def test_invalid_sort_field_rejected(self, test_client: TestClient) -> None:
+        """Test an unknown sort_by value is a validation error, not a server error."""
+        response = test_client.get("/api/v1/backtests?sort_by=id; DROP TABLE backtests")
+
+        assert response.status_code == 422
 
     def test_response_schema(self, test_client: TestClient) -> None:
         """Test response schema matches BacktestListResponse."""
@@ -0,0 +1,120 @@
+"""Unit tests for the in-process async EventBus."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.events import EventBus
+
+
+class TestEventBusSubscribe:
+    """Test topic subscriptions and delivery."""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_matching_topics_only(self):
+        """Test pattern subscriptions filter by event type."""
+        bus = EventBus()
+        subscription = bus.subscribe("order.*")
+
+        bus.publish("order.filled", {"order_id": "1"})
+        bus.publish("account.updated", {"cash": 100})
+        bus.publish("order.cancelled", {"order_id": "2"})
+
+        first = await asyncio.wait_for(subscription.get(), timeout=1)
+        second = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert [first.event_type, second.event_type] == ["order.filled", "order.cancelled"]
+        assert subscription.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_trader_filter_uses_payload_trader_id(self):
+        """Test trader_id defaults to the payload's trader_id for routing."""
+        bus = EventBus()
+        subscription = bus.subscribe("*", trader_id="trader-a")
+
+        bus.publish("order.executed", {"trader_id": "trader-b"})
+        bus.publish("order.executed", {"trader_id": "trader-a"})
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert event.trader_id == "trader-a"
+        assert subscription.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_events(self):
+        """Test a slow subscriber keeps the newest events and counts drops."""
+        bus = EventBus()
+        subscription = bus.subscribe("order.*", max_queue_size=2)
+
+        for i in range(5):
+            bus.publish("order.filled", {"n": i})
+
+        assert subscription.dropped == 3
+        events = [await subscription.get(), await subscription.get()]
+        assert [e.payload["n"] for e in events] == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_close_ends_iteration_and_unsubscribes(self):
+        """Test async iteration stops after close() once the queue drains."""
+        bus = EventBus()
+        subscription = bus.subscribe("order.*")
+        bus.publish("order.filled", {"n": 1})
+        subscription.close()
+        bus.publish("order.filled", {"n": 2})
+
+        received = [event.payload["n"] async for event in subscription]
+        assert received == [1]
+        assert bus.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        """Test events published off-loop are delivered thread-safely."""
+        bus = EventBus()
+        subscription = bus.subscribe("order.*")
+
+        thread = threading.Thread(
+            target=bus.publish, args=("order.filled", {"order_id": "1"})
+        )
+        thread.start()
+        thread.join()
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert event.payload == {"order_id": "1"}
+
+
+class TestEventBusReplay:
+    """Test replay buffer and persistence."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_with_since_seq_replays_missed_events(self):
+        """Test late subscribers catch up from a sequence number."""
+        bus = EventBus()
+        first = bus.publish("order.submitted", {"n": 1})
+        bus.publish("order.filled", {"n": 2})
+
+        subscription = bus.subscribe("order.*", since_seq=first.seq)
+        bus.publish("order.cancelled", {"n": 3})
+
+        events = [await subscription.get(), await subscription.get()]
+        assert [e.payload["n"] for e in events] == [2, 3]
+
+    def test_replay_respects_history_size(self):
+        """Test the replay buffer keeps only the most recent events."""
+        bus = EventBus(history_size=2)
+        for i in range(4):
+            bus.publish("order.filled", {"n": i})
+
+        assert [e.payload["n"] for e in bus.replay()] == [2, 3]
+        assert bus.last_seq == 4
+
+    def test_persisted_events_reload_and_resume_sequence(self, tmp_path):
+        """Test JSONL persistence survives a restart."""
+        path = tmp_path / "events.jsonl"
+        bus = EventBus(persist_path=path)
+        bus.publish("order.filled", {"n": 1})
+        bus.publish("order.cancelled", {"n": 2})
+
+        restarted = EventBus(persist_path=path)
+        assert [e.event_type for e in restarted.replay(topics="order.cancelled")] == [
+            "order.cancelled"
+        ]
+        assert restarted.publish("order.filled", {"n": 3}).seq == 3
@@ -0,0 +1,199 @@
+"""Unit tests for RateLimiter middleware and backends."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.app.middleware.rate_limiter import (
+    InMemoryRateLimitBackend,
+    RateLimiter,
+    RedisRateLimitBackend,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.ops = []
+
+    def incr(self, key):
+        self.ops.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.ops.append(("expire", key))
+
+    def get(self, key):
+        self.ops.append(("get", key))
+
+    async def execute(self):
+        results = []
+        for op, key in self.ops:
+            if op == "incr":
+                self.client.store[key] = self.client.store.get(key, 0) + 1
+                results.append(self.client.store[key])
+            elif op == "expire":
+                results.append(True)
+            else:
+                value = self.client.store.get(key)
+                results.append(None if value is None else str(value))
+        return results
+
+
+class FakeRedis:
+    """Minimal async Redis client shared by several 'workers'."""
+
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def decr(self, key):
+        self.store[key] -= 1
+        return self.store[key]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def hits(backend, key, n, limit=5, window=60.0):
+    return [await backend.hit(key, limit, window) for _ in range(n)]
+
+
+def test_in_memory_allows_up_to_limit_then_rejects():
+    backend = InMemoryRateLimitBackend(clock=FakeClock(0.0))
+
+    decisions = run(hits(backend, "k", 6))
+
+    assert [d.allowed for d in decisions] == [True] * 5 + [False]
+    assert decisions[-1].retry_after >= 1
+
+
+def test_in_memory_previous_window_is_weighted():
+    clock = FakeClock(0.0)
+    backend = InMemoryRateLimitBackend(clock=clock)
+    run(hits(backend, "k", 5, limit=5))
+
+    # 30s into the next window half of the previous window still counts (2.5)
+    clock.now = 90.0
+    decisions = run(hits(backend, "k", 4, limit=5))
+    assert [d.allowed for d in decisions] == [True, True, True, False]
+
+    # Two windows later the key starts fresh
+    clock.now = 240.0
+    assert all(d.allowed for d in run(hits(backend, "k", 5, limit=5)))
+
+
+def test_in_memory_retry_after_is_accurate():
+    clock = FakeClock(0.0)
+    backend = InMemoryRateLimitBackend(clock=clock)
+    run(hits(backend, "k", 5, limit=5))
+
+    clock.now = 60.0
+    rejected = run(backend.hit("k", 5, 60.0))
+    assert not rejected.allowed
+
+    clock.now = 60.0 + rejected.retry_after
+    assert run(backend.hit("k", 5, 60.0)).allowed
+
+
+def test_in_memory_evicts_idle_keys():
+    clock = FakeClock(0.0)
+    backend = InMemoryRateLimitBackend(clock=clock)
+    for i in range(1000):
+        run(backend.hit(f"anon-{i}", 5, 60.0))
+    assert len(backend) == 1000
+
+    clock.now = 121.0
+    run(backend.hit("active", 5, 60.0))
+
+    assert len(backend) == 1
+
+
+def test_in_memory_caps_tracked_keys():
+    clock = FakeClock(0.0)
+    backend = InMemoryRateLimitBackend(max_keys=100, clock=clock)
+    run(hits(backend, "key-0", 5))
+
+    decisions = [run(backend.hit(f"key-{i}", 5, 60.0)) for i in range(1, 100)]
+    assert all(d.allowed for d in decisions)
+    assert len(backend) == 100
+
+    # Full of active keys: a new client is admitted, evicting the least recently seen key
+    run(backend.hit("key-1", 5, 60.0))
+    assert run(backend.hit("client", 5, 60.0)).allowed
+    assert len(backend) == 100
+    assert "key-0" not in backend._state
+    assert "key-1" in backend._state
+
+    # A flood of made-up keys never locks new clients out
+    flood = [run(backend.hit(f"flood-{i}", 5, 60.0)) for i in range(1000)]
+    assert all(d.allowed for d in flood)
+    assert run(backend.hit("late-client", 5, 60.0)).allowed
+    assert len(backend) == 100
+
+
+def test_backend_interface_is_abstract():
+    from api.app.middleware.rate_limiter import RateLimitBackend
+
+    with pytest.raises(TypeError):
+        RateLimitBackend()
+
+
+def test_redis_backend_shares_limit_across_workers():
+    client = FakeRedis()
+    clock = FakeClock(1_000_000.0)
+    worker_a = RedisRateLimitBackend(client=client, clock=clock)
+    worker_b = RedisRateLimitBackend(client=client, clock=clock)
+
+    decisions = run(hits(worker_a, "k", 3)) + run(hits(worker_b, "k", 3))
+
+    assert [d.allowed for d in decisions] == [True] * 5 + [False]
+    # Rejected request is not counted
+    assert sum(client.store.values()) == 5
+
+
+def _app(backend, limit=3):
+    app = FastAPI()
+    app.add_middleware(RateLimiter, requests_per_minute=limit, backend=backend)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def test_middleware_returns_429_with_retry_after():
+    client = TestClient(_app(InMemoryRateLimitBackend(clock=FakeClock(0.0))))
+
+    statuses = [client.get("/ping", headers={"X-API-Key": "a"}).status_code for _ in range(4)]
+    limited = client.get("/ping", headers={"X-API-Key": "a"})
+
+    assert statuses == [200, 200, 200, 429]
+    assert limited.json()["error"] == "RATE_LIMIT_EXCEEDED"
+    assert int(limited.headers["Retry-After"]) >= 1
+    assert client.get("/ping", headers={"X-API-Key": "b"}).status_code == 200
+
+
+def test_middleware_fails_open_on_backend_error():
+    class BrokenBackend(InMemoryRateLimitBackend):
+        async def hit(self, key, limit, window_seconds):
+            raise ConnectionError("redis down")
+
+    client = TestClient(_app(BrokenBackend()))
+
+    assert client.get("/ping").status_code == 200
@@ -6,7 +6,11 @@ from uuid import uuid4
 from datetime import datetime, timezone
 from unittest.mock import Mock, MagicMock, call
 
-from app.repositories.order_repository import OrderRepository
+from app.repositories.order_repository import (
+    OrderRepository,
+    discard_pending_events,
+    publish_pending_events,
+)
 from app.models.order import Order, OrderType, OrderStatus
 from app.models.execution_log import ExecutionLog, ExecutionAction
 
@@ -477,6 +481,86 @@ class TestOrderRepositoryUpdateStatus:
         log_call_args = mock_session.add.call_args_list[0][0][0]
         assert log_call_args.action == ExecutionAction.REJECTED.value
 
+    def test_update_status_publishes_order_event_after_commit(self):
+        """Test status change is published as order.<status> once the session commits."""
+        # Arrange
+        mock_session = Mock()
+        mock_session.info = {}
+        mock_event_bus = Mock()
+        order_id = uuid4()
+        trader_id = uuid4()
+
+        order = Order(
+            id=order_id,
+            trader_id=trader_id,
+            symbol="AAPL",
+            quantity=100,
+            order_type=OrderType.MARKET,
+            status=OrderStatus.PENDING,
+        )
+        mock_session.get.return_value = order
+        repository = OrderRepository(session=mock_session, event_bus=mock_event_bus)
+
+        # Act
+        repository.update_status(order_id, OrderStatus.FILLED)
+        mock_event_bus.publish.assert_not_called()
+        publish_pending_events(mock_session)
+
+        # Assert
+        mock_event_bus.publish.assert_called_once()
+        kwargs = mock_event_bus.publish.call_args.kwargs
+        assert kwargs["event_type"] == "order.filled"
+        assert kwargs["trader_id"] == trader_id
+        assert kwargs["payload"]["order_id"] == str(order_id)
+        assert kwargs["payload"]["status"] == "FILLED"
+        assert kwargs["payload"]["previous_status"] == "PENDING"
+
+    def test_update_status_invalid_transition_publishes_nothing(self):
+        """Test no event is published when the transition is rejected."""
+        # Arrange
+        mock_session = Mock()
+        mock_event_bus = Mock()
+        order = Order(
+            id=uuid4(),
+            trader_id=uuid4(),
+            symbol="AAPL",
+            quantity=100,
+            order_type=OrderType.MARKET,
+            status=OrderStatus.FILLED,
+        )
+        mock_session.get.return_value = order
+        repository = OrderRepository(session=mock_session, event_bus=mock_event_bus)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            repository.update_status(order.id, OrderStatus.CANCELLED)
+        mock_event_bus.publish.assert_not_called()
+
+    def test_update_status_rolled_back_publishes_nothing(self):
+        """Test a rolled-back status change never reaches the event bus."""
+        # Arrange
+        mock_session = Mock()
+        mock_session.info = {}
+        mock_event_bus = Mock()
+        order = Order(
+            id=uuid4(),
+            trader_id=uuid4(),
+            symbol="AAPL",
+            quantity=100,
+            order_type=OrderType.MARKET,
+            status=OrderStatus.PENDING,
+        )
+        mock_session.get.return_value = order
+        repository = OrderRepository(session=mock_session, event_bus=mock_event_bus)
+
+        # Act
+        repository.update_status(order.id, OrderStatus.CANCELLED)
+        discard_pending_events(mock_session)
+        publish_pending_events(mock_session)
+
+        # Assert
+        mock_event_bus.publish.assert_not_called()
+
 
 class TestOrderRepositoryGetUnfilledOrders:
     """Test fetching unfilled orders."""
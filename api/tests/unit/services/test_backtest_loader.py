@@ -0,0 +1,202 @@
+"""Unit tests for BacktestLoader catalog index."""
+
+import copy
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from api.app.services.backtest_loader import BacktestLoader
+
+
+def make_backtest(strategy: str, start: str, end: str, total_return: float, completed_at: str) -> dict:
+    """Build a valid backtest result dict."""
+    return {
+        "config": {
+            "strategy": strategy,
+            "symbols": ["AAPL", "MSFT"],
+            "start_date": start,
+            "end_date": end,
+            "initial_capital": 100000.0,
+            "commission": 0.001,
+            "slippage_pct": 0.001,
+        },
+        "metrics": {
+            "total_return": total_return,
+            "annualized_return": 10.0,
+            "cagr": 9.5,
+            "win_rate": 0.6,
+            "profit_factor": 1.8,
+            "average_win": 400.0,
+            "average_loss": -200.0,
+            "max_drawdown": -5.0,
+            "max_drawdown_duration_days": 7,
+            "sharpe_ratio": 1.4,
+            "total_trades": 12,
+            "winning_trades": 7,
+            "losing_trades": 5,
+        },
+        "trades": [
+            {
+                "symbol": "AAPL",
+                "entry_date": "2024-01-05",
+                "entry_price": 150.0,
+                "exit_date": "2024-01-15",
+                "exit_price": 155.0,
+                "shares": 100,
+                "pnl": 500.0,
+                "pnl_pct": 3.33,
+                "duration_days": 10,
+                "exit_reason": "target",
+                "commission": 0.15,
+                "slippage": 0.15,
+            }
+        ],
+        "equity_curve": [
+            {"timestamp": f"2024-01-{day:02d}", "equity": 100000.0 + day}
+            for day in range(1, 21)
+        ],
+        "data_warnings": ["gap on 2024-01-10"],
+        "metadata": {"completed_at": completed_at},
+    }
+
+
+@pytest.fixture
+def backtest_dir(tmp_path) -> Path:
+    """Results directory with three backtests."""
+    fixtures = {
+        "bt_001": make_backtest("MeanReversion", "2024-01-01", "2024-03-31", 15.5, "2024-10-28T12:00:00Z"),
+        "bt_002": make_backtest("Momentum", "2024-04-01", "2024-06-30", 22.3, "2024-10-27T10:00:00Z"),
+        "bt_003": make_backtest("MeanReversion", "2024-07-01", "2024-09-30", 8.7, "2024-10-26T08:00:00Z"),
+    }
+    for backtest_id, data in fixtures.items():
+        (tmp_path / f"{backtest_id}.json").write_text(json.dumps(data))
+    return tmp_path
+
+
+@pytest.fixture
+def loader(backtest_dir) -> BacktestLoader:
+    return BacktestLoader(backtest_dir=str(backtest_dir))
+
+
+def test_list_filters_and_sorts_newest_first(loader):
+    summaries = loader.list_backtests(strategy="MeanReversion")
+
+    assert [s.id for s in summaries] == ["bt_001", "bt_003"]
+    assert summaries[0].symbols == ["AAPL", "MSFT"]
+
+
+def test_list_date_range_filter(loader):
+    summaries = loader.list_backtests(start_date="2024-04-01", end_date="2024-06-30")
+
+    assert [s.id for s in summaries] == ["bt_002"]
+
+
+def test_list_sort_and_paginate_in_query(loader):
+    page1 = loader.list_backtests(sort_by="total_return", descending=True, limit=2)
+    page2 = loader.list_backtests(sort_by="total_return", descending=True, limit=2, offset=2)
+
+    assert [s.id for s in page1] == ["bt_002", "bt_001"]
+    assert [s.id for s in page2] == ["bt_003"]
+    assert loader.count_backtests() == 3
+    assert loader.count_backtests(strategy="Momentum") == 1
+
+
+def test_count_can_reuse_list_sync(loader, monkeypatch):
+    syncs = []
+    real_sync = loader.catalog.sync
+    monkeypatch.setattr(loader.catalog, "sync", lambda: syncs.append(1) or real_sync())
+
+    loader.list_backtests(limit=1)
+    total = loader.count_backtests(sync=False)
+
+    assert total == 3
+    assert len(syncs) == 1
+
+
+def test_list_rejects_unknown_sort_field(loader):
+    with pytest.raises(ValueError, match="Invalid sort field"):
+        loader.list_backtests(sort_by="id; DROP TABLE backtests")
+
+
+def test_unchanged_files_are_not_reparsed(loader, backtest_dir):
+    loader.list_backtests()
+
+    with patch.object(Path, "read_text", side_effect=AssertionError("re-parsed")):
+        assert len(loader.list_backtests()) == 3
+
+
+def test_changed_and_deleted_files_refresh_index(loader, backtest_dir):
+    loader.list_backtests()
+
+    path = backtest_dir / "bt_003.json"
+    data = json.loads(path.read_text())
+    data["config"]["strategy"] = "Breakout"
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    (backtest_dir / "bt_002.json").unlink()
+
+    summaries = loader.list_backtests()
+
+    assert [s.id for s in summaries] == ["bt_001", "bt_003"]
+    assert summaries[1].strategy == "Breakout"
+    assert not loader.catalog.sidecar_path("bt_002").exists()
+
+
+def test_malformed_files_are_skipped(loader, backtest_dir):
+    (backtest_dir / "broken.json").write_text("{ invalid json")
+    (backtest_dir / "partial.json").write_text(json.dumps({"config": {}}))
+
+    assert len(loader.list_backtests()) == 3
+    assert loader.get_backtest("broken") is None
+
+
+def test_get_backtest_loads_series_from_sidecar(loader, backtest_dir):
+    original = json.loads((backtest_dir / "bt_001.json").read_text())
+
+    result = loader.get_backtest("bt_001")
+
+    assert result.model_dump() == {
+        key: original[key]
+        for key in ("config", "metrics", "trades", "equity_curve", "data_warnings")
+    }
+    assert loader.catalog.sidecar_path("bt_001").stat().st_size < len(
+        json.dumps(original["equity_curve"] + original["trades"])
+    )
+    assert loader.get_backtest("missing") is None
+
+
+def test_get_backtest_cache_invalidated_on_file_change(loader, backtest_dir):
+    first = loader.get_backtest("bt_001")
+    assert loader.get_backtest("bt_001") is first
+
+    path = backtest_dir / "bt_001.json"
+    data = json.loads(path.read_text())
+    data["metrics"]["sharpe_ratio"] = 2.5
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+    assert loader.get_backtest("bt_001").metrics.sharpe_ratio == 2.5
+
+
+def test_save_backtest_indexes_immediately(tmp_path):
+    loader = BacktestLoader(backtest_dir=str(tmp_path / "results"))
+    data = make_backtest("Momentum", "2025-01-01", "2025-02-01", 4.2, "2025-02-02T00:00:00Z")
+
+    path = loader.save_backtest("bt_new", copy.deepcopy(data))
+
+    assert json.loads(path.read_text()) == data
+    assert loader.catalog.count() == 1
+    assert loader.list_backtests()[0].total_return == 4.2
+
+
+def test_save_backtest_validates_payload(tmp_path):
+    loader = BacktestLoader(backtest_dir=str(tmp_path))
+    data = make_backtest("Momentum", "2025-01-01", "2025-02-01", 4.2, "2025-02-02T00:00:00Z")
+    del data["metadata"]
+
+    with pytest.raises(ValueError):
+        loader.save_backtest("bt_bad", data)
+    assert not (tmp_path / "bt_bad.json").exists()
@@ -0,0 +1,87 @@
+"""Unit tests for the shared background StateProducer."""
+
+import asyncio
+
+import pytest
+
+from api.app.core.events import EventBus
+from api.app.services.state_producer import StateProducer
+
+
+class FakeState:
+    """Stand-in for BotStateResponse."""
+
+    def __init__(self, doc):
+        self.doc = doc
+
+    def model_dump(self, mode="python"):
+        return dict(self.doc)
+
+
+class FakeAggregator:
+    """Aggregator returning a mutable state document."""
+
+    cache_ttl = 60
+
+    def __init__(self):
+        self.doc = {"cash": 100}
+
+    async def get_bot_state(self, use_cache=True):
+        return FakeState(self.doc)
+
+
+class FakeManager:
+    """Connection manager recording broadcast messages."""
+
+    def __init__(self):
+        self.messages = []
+
+    def get_active_count(self):
+        return 1
+
+    async def broadcast(self, message):
+        self.messages.append(message)
+
+
+class TestVersioning:
+    """Test stream clients see every snapshot version."""
+
+    @pytest.mark.asyncio
+    async def test_rest_refresh_broadcasts_delta_chain(self):
+        """Test REST-triggered refreshes broadcast deltas that chain from the previous version."""
+        aggregator = FakeAggregator()
+        manager = FakeManager()
+        producer = StateProducer(aggregator=aggregator, connection_manager=manager)
+
+        await producer.tick()
+        aggregator.doc = {"cash": 90}
+        await producer.refresh()  # Cache-Control: no-cache
+        await producer.refresh()  # Unchanged: no new version
+        aggregator.doc = {"cash": 80}
+        await producer.get_state(max_age_seconds=0)
+
+        assert [m["type"] for m in manager.messages] == ["state_snapshot", "state_delta", "state_delta"]
+        assert [(m["base_version"], m["version"]) for m in manager.messages[1:]] == [(1, 2), (2, 3)]
+        assert producer.version == 3
+
+
+class TestOrderEventForwarding:
+    """Test order events reaching /metrics/stream clients."""
+
+    @pytest.mark.asyncio
+    async def test_order_events_broadcast_without_order_data(self):
+        """Test stream clients get a payload-free notice, not another trader's order."""
+        bus = EventBus()
+        manager = FakeManager()
+        producer = StateProducer(aggregator=object(), connection_manager=manager, event_bus=bus)
+        task = asyncio.create_task(producer._forward_events())
+        await asyncio.sleep(0)
+
+        bus.publish("order.filled", {"order_id": "1", "symbol": "AAPL", "trader_id": "trader-a"})
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+
+        assert [message["type"] for message in manager.messages] == ["orders_changed"]
+        assert set(manager.messages[0]) == {"type", "timestamp"}
+        assert producer._wake.is_set()
@@ -3,6 +3,10 @@ Account Data Service
 
 Fetches and caches account data from the Alpaca Trading API.
 
+Buying power, balance and day-trade count are derived from one account
+request. Concurrent cache misses share a single in-flight fetch, and an
+optional background refresher renews entries shortly before they expire.
+
 Constitution v1.0.0:
 - §Security: Never log account numbers, mask sensitive values
 - §Audit_Everything: All API calls and cache events logged
@@ -12,6 +16,7 @@ Constitution v1.0.0:
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -111,8 +116,43 @@ class AccountDataError(Exception):
     """Custom exception for account data errors."""
 
 
+class _InFlightFetch:
+    """Fetch shared by every caller that missed the cache while it runs."""
+
+    __slots__ = ("generation", "done", "result", "error")
+
+    def __init__(self, generation: int) -> None:
+        self.generation = generation
+        self.done = threading.Event()
+        self.result: dict[str, Any] | None = None
+        self.error: BaseException | None = None
+
+
+# Cache keys filled by each fetch group (one API request per group)
+ACCOUNT_GROUP = "account"
+POSITIONS_GROUP = "positions"
+_GROUP_KEYS: dict[str, tuple[str, ...]] = {
+    ACCOUNT_GROUP: ("buying_power", "account_balance", "day_trade_count"),
+    POSITIONS_GROUP: ("positions",),
+}
+_KEY_GROUP = {key: group for group, keys in _GROUP_KEYS.items() for key in keys}
+
+
 class AccountData:
-    """Account data service with TTL-based caching (Alpaca-backed)."""
+    """
+    Account data service with TTL-based caching (Alpaca-backed).
+
+    Thread-safe: concurrent misses on the same fetch group coalesce into a
+    single API request whose result every waiting caller receives.
+    """
+
+    CACHE_TTL_SECONDS: dict[str, int] = {
+        "buying_power": 30,
+        "positions": 30,
+        "account_balance": 30,
+        "day_trade_count": 300,
+    }
+    REFRESH_MAX_BACKOFF_SECONDS = 60.0
 
     def __init__(self, auth: Any | None = None):
         """
@@ -126,6 +166,15 @@ class AccountData:
         self._owned_auth: AlpacaAuth | None = None
         self._trading_client: TradingClient | None = None
         self._cache: dict[str, CacheEntry] = {}
+        self.cache_ttl_seconds = dict(self.CACHE_TTL_SECONDS)
+
+        self._lock = threading.Lock()
+        self._client_lock = threading.Lock()
+        self._inflight: dict[str, _InFlightFetch] = {}
+        self._generation = 0  # Bumped on invalidation so in-flight results are not cached
+
+        self._refresh_thread: threading.Thread | None = None
+        self._refresh_stop = threading.Event()
         logger.info("AccountData service initialized (provider=Alpaca)")
 
     # ------------------------------------------------------------------ #
@@ -151,57 +200,154 @@ class AccountData:
 
     def invalidate_cache(self, cache_type: str | None = None) -> None:
         """Invalidate cache (all or specific type)."""
-        if cache_type is None:
-            self._cache.clear()
-            logger.info("All account data caches invalidated")
+        with self._lock:
+            self._generation += 1
+            if cache_type is None:
+                self._cache.clear()
+                logger.info("All account data caches invalidated")
+                return
+
+            if cache_type in self._cache:
+                del self._cache[cache_type]
+                logger.info("Cache invalidated: %s", cache_type)
+
+    def _get_cached(self, key: str, use_cache: bool) -> Any:
+        """
+        Return a cached value, fetching its group on a miss.
+
+        Concurrent misses for the same group wait on the fetch already in
+        flight instead of issuing their own request. use_cache=False skips
+        the cache but still joins an in-flight fetch; fetches started before
+        invalidate_cache() are never joined or cached.
+        """
+        group = _KEY_GROUP[key]
+        with self._lock:
+            if use_cache and self._is_cache_valid(key):
+                return self._cache[key].value
+
+            call = self._inflight.get(group)
+            leader = call is None or call.generation != self._generation
+            if leader:
+                call = _InFlightFetch(self._generation)
+                self._inflight[group] = call
+
+        if not leader:
+            logger.debug("Joining in-flight %s fetch for %s", group, key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result[key]
+
+        try:
+            call.result = self._fetch_group(group)
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if call.result is not None and call.generation == self._generation:
+                    for result_key, value in call.result.items():
+                        self._update_cache(result_key, value, self.cache_ttl_seconds[result_key])
+                if self._inflight.get(group) is call:
+                    del self._inflight[group]
+            call.done.set()
+
+        return call.result[key]
+
+    def _fetch_group(self, group: str) -> dict[str, Any]:
+        """Fetch every cache key in group with one API request."""
+        if group == ACCOUNT_GROUP:
+            return self._fetch_account()
+        return {"positions": self._fetch_positions()}
+
+    # ------------------------------------------------------------------ #
+    # Background refresh
+    # ------------------------------------------------------------------ #
+    def start_background_refresh(self, refresh_ahead_seconds: float = 5.0, interval: float = 1.0) -> None:
+        """
+        Renew cached entries shortly before they expire.
+
+        Only entries that have been requested at least once are refreshed.
+        Refreshes go through the same single-flight path as callers, so a
+        caller missing at the same moment shares the refresh request. A group
+        whose refresh fails is retried after an exponential backoff (doubling
+        from interval, capped at REFRESH_MAX_BACKOFF_SECONDS).
+
+        Args:
+            refresh_ahead_seconds: Refresh entries with less TTL than this left
+            interval: Seconds between expiry checks
+        """
+        if self._refresh_thread and self._refresh_thread.is_alive():
             return
 
-        if cache_type in self._cache:
-            del self._cache[cache_type]
-            logger.info("Cache invalidated: %s", cache_type)
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(refresh_ahead_seconds, interval),
+            name="account-data-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+        logger.info("Account data background refresh started (refresh_ahead=%.1fs)", refresh_ahead_seconds)
+
+    def stop_background_refresh(self, timeout: float | None = 5.0) -> None:
+        """Stop the background refresher (no-op if not running)."""
+        thread = self._refresh_thread
+        if thread is None:
+            return
+        self._refresh_stop.set()
+        thread.join(timeout)
+        self._refresh_thread = None
+        logger.info("Account data background refresh stopped")
+
+    def _groups_due_for_refresh(self, refresh_ahead_seconds: float) -> list[str]:
+        """Fetch groups with an entry expiring within refresh_ahead_seconds."""
+        now = datetime.now(UTC)
+        due: list[str] = []
+        with self._lock:
+            for key, entry in self._cache.items():
+                remaining = entry.ttl_seconds - (now - entry.cached_at).total_seconds()
+                group = _KEY_GROUP.get(key)
+                if group and remaining <= refresh_ahead_seconds and group not in due:
+                    due.append(group)
+        return due
+
+    def _refresh_loop(self, refresh_ahead_seconds: float, interval: float) -> None:
+        failures: dict[str, int] = {}
+        retry_at: dict[str, float] = {}
+        while not self._refresh_stop.wait(interval):
+            for group in self._groups_due_for_refresh(refresh_ahead_seconds):
+                if time.monotonic() < retry_at.get(group, 0.0):
+                    continue
+                try:
+                    self._get_cached(_GROUP_KEYS[group][0], use_cache=False)
+                    logger.debug("Background refresh: %s", group)
+                    failures.pop(group, None)
+                    retry_at.pop(group, None)
+                except Exception as exc:
+                    failures[group] = failures.get(group, 0) + 1
+                    delay = min(interval * 2 ** failures[group], self.REFRESH_MAX_BACKOFF_SECONDS)
+                    retry_at[group] = time.monotonic() + delay
+                    logger.warning("Background refresh of %s failed: %s (retrying in %.1fs)", group, exc, delay)
 
     # ------------------------------------------------------------------ #
     # Public APIs
     # ------------------------------------------------------------------ #
     def get_buying_power(self, use_cache: bool = True) -> float:
         """Return current buying power."""
-        cache_key = "buying_power"
-        if use_cache and self._is_cache_valid(cache_key):
-            return float(self._cache[cache_key].value)
-
-        value = self._fetch_buying_power()
-        self._update_cache(cache_key, value, ttl_seconds=30)
-        return value
+        return float(self._get_cached("buying_power", use_cache))
 
     def get_positions(self, use_cache: bool = True) -> list[Position]:
         """Return open positions."""
-        cache_key = "positions"
-        if use_cache and self._is_cache_valid(cache_key):
-            return self._cache[cache_key].value
-
-        value = self._fetch_positions()
-        self._update_cache(cache_key, value, ttl_seconds=30)
-        return value
+        return self._get_cached("positions", use_cache)
 
     def get_account_balance(self, use_cache: bool = True) -> AccountBalance:
         """Return account balance summary."""
-        cache_key = "account_balance"
-        if use_cache and self._is_cache_valid(cache_key):
-            return self._cache[cache_key].value
-
-        value = self._fetch_account_balance()
-        self._update_cache(cache_key, value, ttl_seconds=30)
-        return value
+        return self._get_cached("account_balance", use_cache)
 
     def get_day_trade_count(self, use_cache: bool = True) -> int:
         """Return pattern day trade count."""
-        cache_key = "day_trade_count"
-        if use_cache and self._is_cache_valid(cache_key):
-            return int(self._cache[cache_key].value)
-
-        value = self._fetch_day_trade_count()
-        self._update_cache(cache_key, value, ttl_seconds=300)
-        return value
+        return int(self._get_cached("day_trade_count", use_cache))
 
     # ------------------------------------------------------------------ #
     # Fetch implementations
@@ -211,27 +357,52 @@ class AccountData:
         if self._trading_client:
             return self._trading_client
 
-        if self.auth and hasattr(self.auth, "get_trading_client"):
-            self._trading_client = self.auth.get_trading_client()
-            return self._trading_client
+        with self._client_lock:
+            if self._trading_client:
+                return self._trading_client
 
-        from trading_bot.auth import AlpacaAuth  # Local import to avoid cycles
+            if self.auth and hasattr(self.auth, "get_trading_client"):
+                self._trading_client = self.auth.get_trading_client()
+                return self._trading_client
 
-        self._owned_auth = AlpacaAuth(None)
-        self._owned_auth.login()
-        self._trading_client = self._owned_auth.get_trading_client()
-        return self._trading_client
+            from trading_bot.auth import AlpacaAuth  # Local import to avoid cycles
 
-    def _fetch_buying_power(self) -> float:
-        """Fetch buying power via Alpaca account endpoint."""
+            self._owned_auth = AlpacaAuth(None)
+            self._owned_auth.login()
+            self._trading_client = self._owned_auth.get_trading_client()
+            return self._trading_client
 
-        def _fetch() -> float:
+    def _fetch_account(self) -> dict[str, Any]:
+        """
+        Fetch buying power, balance and day trade count via one account request.
+
+        Returns:
+            Values keyed by cache key ("buying_power", "account_balance",
+            "day_trade_count")
+        """
+
+        def _fetch() -> dict[str, Any]:
             client = self._ensure_trading_client()
             account = client.get_account()
             buying_power = getattr(account, "buying_power", None)
             if buying_power is None:
                 raise AccountDataError("Alpaca response missing buying_power")
-            return float(buying_power)
+
+            count = getattr(account, "daytrade_count", None)
+            if count is None:
+                logger.debug("daytrade_count missing from Alpaca account payload, defaulting to 0")
+                count = 0
+
+            return {
+                "buying_power": float(buying_power),
+                "account_balance": AccountBalance(
+                    cash=_safe_decimal(getattr(account, "cash", "0")),
+                    equity=_safe_decimal(getattr(account, "equity", "0")),
+                    buying_power=_safe_decimal(buying_power),
+                    last_updated=datetime.now(UTC),
+                ),
+                "day_trade_count": int(count),
+            }
 
         return self._retry_with_backoff(_fetch)
 
@@ -270,35 +441,6 @@ class AccountData:
 
         return self._retry_with_backoff(_fetch)
 
-    def _fetch_account_balance(self) -> AccountBalance:
-        """Fetch account summary from Alpaca account endpoint."""
-
-        def _fetch() -> AccountBalance:
-            client = self._ensure_trading_client()
-            account = client.get_account()
-            return AccountBalance(
-                cash=_safe_decimal(getattr(account, "cash", "0")),
-                equity=_safe_decimal(getattr(account, "equity", "0")),
-                buying_power=_safe_decimal(getattr(account, "buying_power", "0")),
-                last_updated=datetime.now(UTC),
-            )
-
-        return self._retry_with_backoff(_fetch)
-
-    def _fetch_day_trade_count(self) -> int:
-        """Fetch PDT day trade count."""
-
-        def _fetch() -> int:
-            client = self._ensure_trading_client()
-            account = client.get_account()
-            count = getattr(account, "daytrade_count", None)
-            if count is None:
-                logger.debug("daytrade_count missing from Alpaca account payload, defaulting to 0")
-                return 0
-            return int(count)
-
-        return self._retry_with_backoff(_fetch)
-
     # ------------------------------------------------------------------ #
     # Retry helper
     # ------------------------------------------------------------------ #
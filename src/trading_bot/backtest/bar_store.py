@@ -0,0 +1,234 @@
+"""
+Partitioned Bar Store
+
+Parquet store of historical bars for HistoricalDataManager, partitioned per
+symbol and timeframe by UTC year/month:
+
+    {root}/{symbol}/{timeframe}/year=YYYY/month=MM/bars.parquet
+    {root}/{symbol}/{timeframe}/_coverage.json
+
+The coverage file lists the merged time intervals that have been fetched, so
+a request only needs to download the parts of its range that are not yet
+covered. New bars are merged into the affected month partitions (a bar with
+the same timestamp replaces the stored one). Reads open only the partitions
+overlapping the requested range and push the timestamp filter down to the
+parquet scan.
+
+Constitution v1.0.0:
+- §Data_Integrity: Coverage is only recorded after the bars are written
+"""
+
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+Interval = tuple[datetime, datetime]
+
+BAR_SCHEMA = pa.schema([
+    ("symbol", pa.string()),
+    ("timestamp", pa.timestamp("us", tz="UTC")),
+    ("open", pa.float64()),
+    ("high", pa.float64()),
+    ("low", pa.float64()),
+    ("close", pa.float64()),
+    ("volume", pa.int64()),
+    ("split_adjusted", pa.bool_()),
+    ("dividend_adjusted", pa.bool_()),
+])
+
+COVERAGE_FILE = "_coverage.json"
+PARTITION_FILE = "bars.parquet"
+
+
+def merge_intervals(intervals: list[Interval]) -> list[Interval]:
+    """Sort intervals and merge overlapping or touching ones."""
+    merged: list[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_intervals(covered: list[Interval], start: datetime, end: datetime) -> list[Interval]:
+    """
+    Parts of [start, end] not inside any covered interval.
+
+    Args:
+        covered: Merged, sorted intervals
+        start: Range start
+        end: Range end
+
+    Returns:
+        Sorted gaps (empty when the range is fully covered)
+    """
+    gaps: list[Interval] = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+        if cursor >= end:
+            return gaps
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _months(start: datetime, end: datetime) -> list[tuple[int, int]]:
+    """(year, month) pairs overlapping [start, end] in UTC."""
+    start, end = start.astimezone(UTC), end.astimezone(UTC)
+    first, last = start.year * 12 + start.month - 1, end.year * 12 + end.month - 1
+    return [(index // 12, index % 12 + 1) for index in range(first, last + 1)]
+
+
+def _write_atomic(table: pa.Table, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    pq.write_table(table, tmp_path, compression="snappy")
+    os.replace(tmp_path, path)
+
+
+class PartitionedBarStore:
+    """
+    Per-symbol, per-timeframe parquet store with interval coverage tracking.
+
+    Example:
+        store = PartitionedBarStore(".backtest_cache")
+        for gap_start, gap_end in store.missing("AAPL", "1Day", start, end):
+            store.write("AAPL", "1Day", fetch(gap_start, gap_end), gap_start, gap_end)
+        table = store.read("AAPL", "1Day", start, end)
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """
+        Initialize store.
+
+        Args:
+            root: Store directory (created on first write)
+        """
+        self.root = Path(root)
+
+    def _series_dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol.replace("/", "_") / timeframe
+
+    def _partition_path(self, symbol: str, timeframe: str, year: int, month: int) -> Path:
+        return self._series_dir(symbol, timeframe) / f"year={year:04d}" / f"month={month:02d}" / PARTITION_FILE
+
+    def coverage(self, symbol: str, timeframe: str) -> list[Interval]:
+        """Merged intervals already fetched for symbol/timeframe."""
+        path = self._series_dir(symbol, timeframe) / COVERAGE_FILE
+        if not path.exists():
+            return []
+        intervals = json.loads(path.read_text())["intervals"]
+        return [(datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in intervals]
+
+    def missing(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> list[Interval]:
+        """Gaps of [start, end] that still have to be fetched."""
+        return missing_intervals(self.coverage(symbol, timeframe), start, end)
+
+    def mark_covered(self, symbol: str, timeframe: str, start: datetime, end: datetime) -> None:
+        """Record [start, end] as fetched (merged with existing coverage)."""
+        intervals = merge_intervals(self.coverage(symbol, timeframe) + [(start, end)])
+        path = self._series_dir(symbol, timeframe) / COVERAGE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps({
+            "intervals": [[s.isoformat(), e.isoformat()] for s, e in intervals]
+        }))
+        os.replace(tmp_path, path)
+
+    def write(
+        self,
+        symbol: str,
+        timeframe: str,
+        bars: pd.DataFrame,
+        start: datetime,
+        end: datetime,
+        covered_end: datetime | None = None
+    ) -> int:
+        """
+        Merge bars fetched for [start, end] into the store and mark it covered.
+
+        Bars outside [start, end] are dropped. Coverage stops at covered_end
+        when given, so bars after it (e.g. a session still in progress) are
+        stored but fetched again, replacing them, on the next request.
+
+        Args:
+            symbol: Symbol
+            timeframe: Bar timeframe (e.g. "1Day")
+            bars: Frame with BAR_SCHEMA columns (may be empty)
+            start: Start of the fetched range
+            end: End of the fetched range
+            covered_end: End of the range to mark covered (default: end)
+
+        Returns:
+            Number of bars written
+        """
+        frame = bars.reindex(columns=BAR_SCHEMA.names)
+        if not frame.empty:
+            timestamps = pd.to_datetime(frame["timestamp"], utc=True)
+            frame = frame.assign(timestamp=timestamps)
+            frame = frame[(timestamps >= pd.Timestamp(start)) & (timestamps <= pd.Timestamp(end))]
+
+        if not frame.empty:
+            keys = frame["timestamp"].dt.year * 100 + frame["timestamp"].dt.month
+            for key, month_bars in frame.groupby(keys):
+                path = self._partition_path(symbol, timeframe, key // 100, key % 100)
+                if path.exists():
+                    month_bars = pd.concat([pq.read_table(path).to_pandas(), month_bars], ignore_index=True)
+                month_bars = (
+                    month_bars.drop_duplicates("timestamp", keep="last")
+                    .sort_values("timestamp", kind="stable")
+                )
+                _write_atomic(pa.Table.from_pandas(month_bars, schema=BAR_SCHEMA, preserve_index=False), path)
+
+        covered_end = end if covered_end is None else min(end, covered_end)
+        if covered_end > start:
+            self.mark_covered(symbol, timeframe, start, covered_end)
+        return len(frame)
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+        columns: list[str] | None = None
+    ) -> pa.Table:
+        """
+        Bars with start <= timestamp <= end, sorted by timestamp.
+
+        Only month partitions overlapping the range are opened; the timestamp
+        predicate is pushed down to the parquet scan.
+        """
+        files = [
+            str(path)
+            for year, month in _months(start, end)
+            if (path := self._partition_path(symbol, timeframe, year, month)).exists()
+        ]
+        if not files:
+            return BAR_SCHEMA.empty_table().select(columns or BAR_SCHEMA.names)
+
+        timestamp_type = BAR_SCHEMA.field("timestamp").type
+        predicate = (
+            (ds.field("timestamp") >= pa.scalar(start, type=timestamp_type))
+            & (ds.field("timestamp") <= pa.scalar(end, type=timestamp_type))
+        )
+        read_columns = None if columns is None else list(dict.fromkeys(["timestamp", *columns]))
+        table = ds.dataset(files, schema=BAR_SCHEMA, format="parquet").to_table(
+            columns=read_columns, filter=predicate
+        )
+        table = table.sort_by("timestamp")
+        return table if columns is None else table.select(columns)
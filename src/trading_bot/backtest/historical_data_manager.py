@@ -5,6 +5,10 @@ Manages fetching and caching of historical market data for backtesting.
 Supports multiple data sources (Alpaca, Yahoo Finance) with automatic fallback,
 data validation, and parquet caching for performance.
 
+Cached bars live in a PartitionedBarStore (per symbol/timeframe, partitioned by
+year/month) that tracks which time ranges have been fetched. Overlapping or
+extended date ranges only download the missing gaps.
+
 Constitution v1.0.0:
 - §Data_Integrity: All data validated before use
 - §Audit_Everything: All API calls logged
@@ -12,18 +16,32 @@ Constitution v1.0.0:
 """
 
 import logging
-from datetime import UTC, datetime
+import re
+from datetime import UTC, datetime, time, timedelta
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from trading_bot.backtest.bar_store import BAR_SCHEMA, PartitionedBarStore
 from trading_bot.backtest.exceptions import DataQualityError, InsufficientDataError
 from trading_bot.backtest.models import HistoricalDataBar
+from trading_bot.backtest.utils import trading_calendar
 from trading_bot.error_handling.policies import DEFAULT_POLICY
 from trading_bot.error_handling.retry import with_retry
 from trading_bot.logger import TradingLogger
 
+# Timeframe of the bars fetched by _fetch_alpaca_data/_fetch_yahoo_data
+DAILY_TIMEFRAME = "1Day"
+
+# Daily bars are stamped at midnight UTC (Yahoo) or midnight ET (Alpaca,
+# 04:00/05:00 UTC), so a session's bar falls within this window of its date
+DAILY_BAR_STAMP_WINDOW = timedelta(hours=5)
+
+# Pre-store cache files: {symbol}_{start_YYYY-MM-DD}_{end_YYYY-MM-DD}.parquet
+_LEGACY_CACHE_FILE = re.compile(r"^(?P<symbol>.+)_(?P<start>\d{4}-\d{2}-\d{2})_(?P<end>\d{4}-\d{2}-\d{2})\.parquet$")
+
 
 class HistoricalDataManager:
     """
@@ -32,7 +50,7 @@ class HistoricalDataManager:
     Provides:
     - Multi-source data fetching (Alpaca primary, Yahoo Finance fallback)
     - Automatic retry with exponential backoff
-    - Parquet-based caching for performance
+    - Parquet-based caching that only fetches uncovered date ranges
     - Comprehensive data validation
     - Logging of all operations
 
@@ -68,7 +86,9 @@ class HistoricalDataManager:
         Args:
             api_key: Alpaca API key (optional, can use env vars)
             api_secret: Alpaca API secret (optional, can use env vars)
-            cache_dir: Directory for parquet cache files
+            cache_dir: Directory for the partitioned parquet store. Legacy
+                cache files found there are imported on init (see
+                migrate_legacy_cache)
             cache_enabled: Whether to use caching (default: True)
             logger: Optional custom logger
         """
@@ -77,11 +97,13 @@ class HistoricalDataManager:
         self.cache_dir = Path(cache_dir)
         self.cache_enabled = cache_enabled
         self.logger = logger if logger is not None else TradingLogger.get_logger(__name__)
+        self.store = PartitionedBarStore(self.cache_dir)
 
         # Create cache directory if enabled
         if self.cache_enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"Cache enabled at: {self.cache_dir.absolute()}")
+            self.migrate_legacy_cache()
 
     def fetch_data(
         self,
@@ -94,12 +116,18 @@ class HistoricalDataManager:
 
         Flow:
         1. Validate inputs (symbol, date range, timezone)
-        2. Check cache if enabled (load and return if exists)
-        3. Try Alpaca API (primary source)
-        4. On Alpaca failure, fallback to Yahoo Finance
-        5. Validate fetched data
-        6. Save to cache if enabled
-        7. Return validated data
+        2. If caching is disabled, fetch the whole range (steps 4-6) and return it
+        3. Find the parts of the range not yet covered by the store; gaps
+           that cannot contain a trading day's bar are marked covered
+           without fetching
+        4. Try Alpaca API (primary source) for each remaining gap
+        5. On Alpaca failure, fallback to Yahoo Finance
+        6. Validate fetched data
+        7. Merge fetched bars into the store; coverage stops before today's
+           (possibly unfinished) session so recent bars are fetched again later.
+           A gap both sources return no bars for (e.g. before the listing
+           date) is stored as covered and empty
+        8. Load the full range from the store
 
         Args:
             symbol: Stock ticker symbol (e.g., "AAPL")
@@ -111,19 +139,87 @@ class HistoricalDataManager:
 
         Raises:
             ValueError: If inputs are invalid (empty symbol, bad dates, naive timezone)
-            InsufficientDataError: If both Alpaca and Yahoo fail or return no data
+            InsufficientDataError: If both Alpaca and Yahoo fail for a settled
+                gap, or the range has no data at all
             DataQualityError: If data validation fails
         """
         # Validate inputs
         self._validate_inputs(symbol, start_date, end_date)
 
-        # Check cache first
-        if self.cache_enabled:
-            cache_path = self._get_cache_path(symbol, start_date, end_date)
-            if cache_path.exists():
-                self.logger.info(f"Loading {symbol} from cache: {cache_path}")
-                return self._load_from_cache(cache_path)
+        if not self.cache_enabled:
+            return self._fetch_from_sources(symbol, start_date, end_date)
+
+        gaps = self.store.missing(symbol, DAILY_TIMEFRAME, start_date, end_date)
+        if not gaps:
+            self.logger.info(f"Loading {symbol} from cache ({start_date.date()} to {end_date.date()})")
+
+        settled_until = self._settled_until()
+        for gap_start, gap_end in gaps:
+            if not self._gap_has_trading_day(gap_start, gap_end):
+                self.store.mark_covered(symbol, DAILY_TIMEFRAME, gap_start, gap_end)
+                continue
+
+            try:
+                bars = self._fetch_from_sources(symbol, gap_start, gap_end, allow_empty=True)
+            except InsufficientDataError:
+                # A gap of only today/future sessions may have no bars yet
+                if self._gap_has_trading_day(gap_start, min(gap_end, settled_until)):
+                    raise
+                continue
+
+            written = self.store.write(
+                symbol, DAILY_TIMEFRAME, self._bars_to_frame(bars), gap_start, gap_end,
+                covered_end=settled_until
+            )
+            self.logger.info(
+                f"Cached {written} bars for {symbol} ({gap_start.date()} to {gap_end.date()})"
+            )
+
+        bars = self._load_from_store(symbol, start_date, end_date)
+        if not bars:
+            raise InsufficientDataError(
+                f"No data available for {symbol} in range {start_date.date()} to {end_date.date()}"
+            )
+        return bars
+
+    @staticmethod
+    def _settled_until() -> datetime:
+        """
+        Latest time whose daily bars are final: the end of the previous UTC day.
+
+        Today's bar (stamped from 00:00 UTC) may belong to a session still in
+        progress, and later dates have no bars yet.
+        """
+        today = datetime.combine(datetime.now(UTC).date(), time(), tzinfo=UTC)
+        return today - timedelta(microseconds=1)
+
+    @staticmethod
+    def _gap_has_trading_day(gap_start: datetime, gap_end: datetime) -> bool:
+        """Whether a daily bar of some trading day can fall inside [gap_start, gap_end]."""
+        days = trading_calendar(gap_start.astimezone(UTC), gap_end.astimezone(UTC))
+        stamps = days.astype("datetime64[us]")
+        start = np.datetime64(gap_start.astimezone(UTC).replace(tzinfo=None), "us")
+        end = np.datetime64(gap_end.astimezone(UTC).replace(tzinfo=None), "us")
+        return bool(np.any((stamps <= end) & (stamps + np.timedelta64(DAILY_BAR_STAMP_WINDOW) >= start)))
+
+    def _fetch_from_sources(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        allow_empty: bool = False
+    ) -> list[HistoricalDataBar]:
+        """
+        Fetch and validate a date range from Alpaca, falling back to Yahoo Finance.
+
+        Args:
+            allow_empty: Return [] instead of raising when neither source
+                failed but both returned no bars
 
+        Raises:
+            InsufficientDataError: If both sources fail or return no data
+            DataQualityError: If data validation fails
+        """
         # Try Alpaca API first
         bars = None
         alpaca_error = None
@@ -149,6 +245,8 @@ class HistoricalDataManager:
 
         # Validate we got data
         if not bars or len(bars) == 0:
+            if allow_empty and alpaca_error is None:
+                return []
             raise InsufficientDataError(
                 f"No data available for {symbol} in range {start_date.date()} to {end_date.date()}"
             )
@@ -156,12 +254,6 @@ class HistoricalDataManager:
         # Validate data quality
         self.validate_data(bars, symbol=symbol)
 
-        # Save to cache if enabled
-        if self.cache_enabled:
-            cache_path = self._get_cache_path(symbol, start_date, end_date)
-            self._save_to_cache(bars, cache_path)
-            self.logger.info(f"Saved {len(bars)} bars to cache: {cache_path}")
-
         return bars
 
     def validate_data(
@@ -283,44 +375,46 @@ class HistoricalDataManager:
                 f"start_date ({start_date}) must be < end_date ({end_date})"
             )
 
-    def _get_cache_path(
-        self,
-        symbol: str,
-        start_date: datetime,
-        end_date: datetime
-    ) -> Path:
+    def migrate_legacy_cache(self) -> int:
         """
-        Generate cache file path for given parameters.
-
-        Format: {cache_dir}/{symbol}_{start_YYYY-MM-DD}_{end_YYYY-MM-DD}.parquet
+        Import pre-store cache files into the partitioned store.
 
-        Args:
-            symbol: Stock symbol
-            start_date: Start date
-            end_date: End date
+        Files named {symbol}_{start_YYYY-MM-DD}_{end_YYYY-MM-DD}.parquet are
+        merged in with coverage from start to end (midnight UTC). Files whose
+        range is already covered are skipped, and legacy files are never
+        modified or deleted.
 
         Returns:
-            Path to cache file
+            Number of files imported
         """
-        start_str = start_date.date().isoformat()
-        end_str = end_date.date().isoformat()
-        filename = f"{symbol}_{start_str}_{end_str}.parquet"
-        return self.cache_dir / filename
+        migrated = 0
+        for path in sorted(self.cache_dir.glob("*.parquet")):
+            match = _LEGACY_CACHE_FILE.match(path.name)
+            if not match:
+                continue
+
+            symbol = match["symbol"]
+            start = datetime.fromisoformat(match["start"]).replace(tzinfo=UTC)
+            end = datetime.fromisoformat(match["end"]).replace(tzinfo=UTC)
+            if start >= end or not self.store.missing(symbol, DAILY_TIMEFRAME, start, end):
+                continue
 
-    def _save_to_cache(
-        self,
-        bars: list[HistoricalDataBar],
-        cache_path: Path
-    ) -> None:
-        """
-        Save historical bars to parquet cache.
+            try:
+                self.store.write(symbol, DAILY_TIMEFRAME, pd.read_parquet(path, engine='pyarrow'), start, end)
+            except Exception as e:
+                self.logger.warning(f"Could not migrate legacy cache file {path.name}: {e}")
+                continue
 
-        Args:
-            bars: List of HistoricalDataBar objects
-            cache_path: Path to save cache file
-        """
-        # Convert to DataFrame
-        data = {
+            migrated += 1
+
+        if migrated:
+            self.logger.info(f"Imported {migrated} legacy cache files into {self.cache_dir}")
+        return migrated
+
+    @staticmethod
+    def _bars_to_frame(bars: list[HistoricalDataBar]) -> pd.DataFrame:
+        """Convert bars to a frame with the store's columns (prices as float)."""
+        return pd.DataFrame({
             'symbol': [bar.symbol for bar in bars],
             'timestamp': [bar.timestamp for bar in bars],
             'open': [float(bar.open) for bar in bars],
@@ -330,45 +424,45 @@ class HistoricalDataManager:
             'volume': [bar.volume for bar in bars],
             'split_adjusted': [bar.split_adjusted for bar in bars],
             'dividend_adjusted': [bar.dividend_adjusted for bar in bars]
-        }
-        df = pd.DataFrame(data)
-
-        # Save as parquet
-        df.to_parquet(cache_path, engine='pyarrow', compression='snappy')
+        })
 
-    def _load_from_cache(
+    def _load_from_store(
         self,
-        cache_path: Path
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime
     ) -> list[HistoricalDataBar]:
         """
-        Load historical bars from parquet cache.
+        Load cached bars in [start_date, end_date] as HistoricalDataBar objects.
 
-        Args:
-            cache_path: Path to cache file
-
-        Returns:
-            List of HistoricalDataBar objects
+        Reads whole columns from the store and builds bars from plain Python
+        lists (no per-row DataFrame access).
         """
-        # Load parquet file
-        df = pd.read_parquet(cache_path, engine='pyarrow')
+        table = self.store.read(symbol, DAILY_TIMEFRAME, start_date, end_date)
+        columns = {name: table.column(name).to_pylist() for name in BAR_SCHEMA.names}
+        prices = {
+            name: list(map(Decimal, map(str, columns[name])))
+            for name in ('open', 'high', 'low', 'close')
+        }
 
-        # Convert to HistoricalDataBar objects
-        bars = []
-        for _, row in df.iterrows():
-            bar = HistoricalDataBar(
-                symbol=row['symbol'],
-                timestamp=pd.Timestamp(row['timestamp']).to_pydatetime(),
-                open=Decimal(str(row['open'])),
-                high=Decimal(str(row['high'])),
-                low=Decimal(str(row['low'])),
-                close=Decimal(str(row['close'])),
-                volume=int(row['volume']),
-                split_adjusted=bool(row.get('split_adjusted', True)),
-                dividend_adjusted=bool(row.get('dividend_adjusted', True))
+        return [
+            HistoricalDataBar(
+                symbol=bar_symbol,
+                timestamp=timestamp,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                split_adjusted=split_adjusted,
+                dividend_adjusted=dividend_adjusted
             )
-            bars.append(bar)
-
-        return bars
+            for bar_symbol, timestamp, open_, high, low, close, volume, split_adjusted, dividend_adjusted in zip(
+                columns['symbol'], columns['timestamp'],
+                prices['open'], prices['high'], prices['low'], prices['close'],
+                columns['volume'], columns['split_adjusted'], columns['dividend_adjusted']
+            )
+        ]
 
     @with_retry(policy=DEFAULT_POLICY)
     def _fetch_alpaca_data(
@@ -12,6 +12,8 @@ Constitution v1.0.0:
 
 from datetime import datetime, timedelta
 
+import numpy as np
+
 # US Market Holidays (major holidays that close markets)
 # Source: NYSE holiday calendar
 # Note: This is a simplified list for 2024-2025. For production use,
@@ -137,6 +139,35 @@ def trading_days_between(start_date: datetime, end_date: datetime) -> int:
     return count
 
 
+def trading_calendar(start_date: datetime, end_date: datetime) -> np.ndarray:
+    """
+    List trading days between two dates (inclusive) as a datetime64[D] array.
+
+    Same calendar as is_market_day(), computed in one vectorized pass so long
+    backtests can iterate trading days directly instead of testing every
+    calendar day.
+
+    Args:
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+
+    Returns:
+        Sorted datetime64[D] array of trading days (empty if start_date > end_date)
+
+    Examples:
+        >>> from datetime import datetime
+        >>> trading_calendar(datetime(2024, 1, 12), datetime(2024, 1, 16)).tolist()
+        [datetime.date(2024, 1, 12), datetime.date(2024, 1, 16)]
+    """
+    days = np.arange(
+        np.datetime64(start_date.date(), "D"),
+        np.datetime64(end_date.date(), "D") + 1,
+        dtype="datetime64[D]",
+    )
+    holidays = np.array(sorted(US_MARKET_HOLIDAYS), dtype="datetime64[D]")
+    return days[np.is_busday(days, holidays=holidays)]
+
+
 def validate_date_range(start_date: datetime, end_date: datetime) -> None:
     """
     Validate a date range for backtesting.
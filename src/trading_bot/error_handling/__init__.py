@@ -9,7 +9,7 @@ Constitution v1.0.0:
 - §Audit_Everything: All retry attempts logged
 """
 
-from .circuit_breaker import circuit_breaker
+from .circuit_breaker import CircuitBreaker, CircuitState, circuit_breaker
 from .exceptions import NonRetriableError, RateLimitError, RetriableError
 from .policies import AGGRESSIVE_POLICY, CONSERVATIVE_POLICY, DEFAULT_POLICY, RetryPolicy
 from .retry import with_retry
@@ -24,4 +24,6 @@ __all__ = [
     "CONSERVATIVE_POLICY",
     "with_retry",
     "circuit_breaker",
+    "CircuitBreaker",
+    "CircuitState",
 ]
@@ -8,12 +8,31 @@ Configuration:
 - Threshold: 5 errors
 - Window: 60 seconds (sliding)
 
+States:
+- CLOSED: Requests flow; failures are counted in the window
+- OPEN: Threshold reached; requests are rejected until reset_timeout elapses
+- HALF_OPEN: A limited number of probe requests test the upstream; a probe
+  success closes the breaker, a probe failure re-opens it. A probe that ends
+  without a verdict (e.g. cancelled) must call release_probe(); if no probe
+  completes within reset_timeout the breaker re-opens
+
 Constitution v1.0.0:
 - §Safety_First: Circuit breaker prevents cascade failures
 """
 
+import threading
 import time
 from collections import deque
+from collections.abc import Callable
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
 
 
 class CircuitBreaker:
@@ -23,7 +42,9 @@ class CircuitBreaker:
     Tracks consecutive errors in a sliding 60-second window.
     Triggers graceful shutdown when >= 5 errors occur within window.
 
-    Thread-safe for single-threaded bot (no locks needed).
+    Thread-safe: all state changes happen under a lock, so a shared instance
+    can be used from worker threads and asyncio tasks alike (the lock is never
+    held across an await).
 
     Example:
         from trading_bot.error_handling import circuit_breaker
@@ -39,35 +60,137 @@ class CircuitBreaker:
                     logger.critical("Circuit breaker tripped - shutting down")
                     sys.exit(1)
                 raise
+
+        # Fail fast while the upstream is down
+        if not breaker.allow_request():
+            raise CircuitBreakerTripped("upstream unavailable")
     """
 
-    def __init__(self, threshold: int = 5, window_seconds: int = 60):
+    def __init__(
+        self,
+        threshold: int = 5,
+        window_seconds: int = 60,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Initialize circuit breaker.
 
         Args:
             threshold: Number of errors to trigger shutdown (default: 5)
             window_seconds: Time window in seconds (default: 60)
+            reset_timeout: Seconds to stay OPEN before probing (default: 30)
+            half_open_max_calls: Concurrent probe requests allowed in HALF_OPEN (default: 1)
+            clock: Time source in seconds (injectable for tests)
         """
         self.threshold = threshold
         self.window_seconds = window_seconds
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
         self._failures: deque[float] = deque()
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (OPEN becomes HALF_OPEN on the next allow_request())."""
+        with self._lock:
+            return self._state
+
+    def _prune(self, now: float) -> None:
+        """Remove failures older than the window (caller holds the lock)."""
+        cutoff_time = now - self.window_seconds
+        while self._failures and self._failures[0] < cutoff_time:
+            self._failures.popleft()
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._probes_in_flight = 0
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may proceed.
+
+        Returns:
+            True in CLOSED; in OPEN only once reset_timeout has elapsed (the
+            caller becomes a HALF_OPEN probe); in HALF_OPEN while fewer than
+            half_open_max_calls probes are in flight
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+
+            now = self._clock()
+            if self._state is CircuitState.OPEN:
+                if now - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._probes_in_flight = 0
+
+            if self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                self._probe_started_at = now
+                return True
+
+            # Probes that never reported back must not hold HALF_OPEN forever
+            if now - self._probe_started_at >= self.reset_timeout:
+                self._open(now)
+            return False
+
+    def release_probe(self) -> None:
+        """
+        Free a HALF_OPEN probe slot without a success/failure verdict.
+
+        Call when an admitted request ends without reaching the upstream's
+        answer (cancellation, timeout from the caller's side).
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
 
     def record_failure(self) -> None:
         """
         Record an API failure with current timestamp.
 
-        Adds timestamp to sliding window for tracking.
+        Adds timestamp to sliding window for tracking. Opens the breaker when
+        the threshold is reached, or immediately if a HALF_OPEN probe failed.
         """
-        self._failures.append(time.time())
+        with self._lock:
+            now = self._clock()
+            self._failures.append(now)
+            self._prune(now)
+
+            if self._state is CircuitState.HALF_OPEN:
+                self._open(now)
+            elif self._state is CircuitState.CLOSED and len(self._failures) >= self.threshold:
+                self._open(now)
 
     def record_success(self) -> None:
         """
         Record an API success.
 
         Clears all failures (resets circuit breaker on successful operation).
+        A HALF_OPEN probe success closes the breaker; while OPEN, late
+        successes from requests started before it opened do not close it.
         """
-        self._failures.clear()
+        with self._lock:
+            self._failures.clear()
+            if self._state is CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._probes_in_flight = 0
+
+    def reset(self) -> None:
+        """Force the breaker back to CLOSED with no recorded failures."""
+        with self._lock:
+            self._failures.clear()
+            self._state = CircuitState.CLOSED
+            self._probes_in_flight = 0
 
     def should_trip(self) -> bool:
         """
@@ -81,18 +204,9 @@ class CircuitBreaker:
             - Count remaining failures
             - Trip if count >= threshold
         """
-        # Get current time
-        now = time.time()
-
-        # Filter out expired failures (older than window)
-        cutoff_time = now - self.window_seconds
-
-        # Remove old failures from left side of deque
-        while self._failures and self._failures[0] < cutoff_time:
-            self._failures.popleft()
-
-        # Check if remaining failures >= threshold
-        return len(self._failures) >= self.threshold
+        with self._lock:
+            self._prune(self._clock())
+            return len(self._failures) >= self.threshold
 
 
 # Singleton instance (module-level)
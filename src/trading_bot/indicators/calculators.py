@@ -1,12 +1,184 @@
-"""Technical indicator calculators: VWAP, EMA, MACD."""
+"""Technical indicator calculators: VWAP, EMA, MACD.
+
+Each calculator has two arithmetic paths, selected with `precision`:
+- "decimal" (default): per-bar Decimal arithmetic, exact to the cent, for
+  callers where exactness matters (order sizing, audit values)
+- "float": NumPy float64 over whole arrays, for strategy evaluation and
+  backtests; results are rounded to cents and returned as Decimal, and
+  agree with the Decimal path to within a cent
+
+The module-level *_series functions compute an indicator for every bar of
+a series in one vectorized pass (what a stateful TechnicalIndicatorsService
+would produce when fed the bars one at a time), for backtests.
+"""
 
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional, List
+from typing import Optional, List, Sequence, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from .exceptions import InsufficientDataError
 
+PRECISIONS = ("decimal", "float")
+
+# Largest decay exponent kept inside one ema_series block (e**300 << float max)
+_MAX_LOG_SCALE = 300.0
+
+
+def _validate_precision(precision: str) -> str:
+    """Check a precision name against PRECISIONS."""
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision must be one of {PRECISIONS}, got {precision!r}")
+    return precision
+
+
+def bars_to_array(bars: Sequence[dict], key: str) -> np.ndarray:
+    """Extract one OHLCV field from a list of bars as a float64 array."""
+    return np.fromiter((bar[key] for bar in bars), dtype=np.float64, count=len(bars))
+
+
+def round_cents(values):
+    """Round to 0.01 with halves away from zero (float analogue of ROUND_HALF_UP)."""
+    return np.copysign(np.floor(np.abs(values) * 100.0 + 0.5) / 100.0, values)
+
+
+def _cents(value: float) -> Decimal:
+    """Convert a float rounded to cents into a 2-place Decimal."""
+    return Decimal(f"{round_cents(value):.2f}")
+
+
+def vwap_series(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray
+) -> np.ndarray:
+    """
+    Cumulative VWAP at every bar (NaN until some volume has traded).
+
+    Args:
+        high, low, close, volume: Equal-length float arrays
+
+    Returns:
+        Array where element i is the VWAP of bars[:i + 1] (unrounded)
+    """
+    typical_price = (high + low + close) / 3.0
+    pv = np.cumsum(typical_price * volume)
+    cumulative_volume = np.cumsum(volume)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(cumulative_volume > 0, pv / cumulative_volume, np.nan)
+
+
+def _ema_recurrence(x: np.ndarray, alpha: float, prev: float) -> np.ndarray:
+    """
+    Evaluate y[t] = alpha * x[t] + (1 - alpha) * y[t - 1] with y[-1] = prev.
+
+    The recurrence is unrolled as y[k] = d**(k+1) * (prev + alpha *
+    cumsum(x[j] / d**(j+1))) with d = 1 - alpha, in blocks short enough
+    that d**-k cannot overflow.
+    """
+    decay = 1.0 - alpha
+    out = np.empty(len(x))
+    if decay == 0.0:
+        out[:] = x
+        return out
+
+    block = max(1, int(_MAX_LOG_SCALE / -np.log(decay)))
+    for begin in range(0, len(x), block):
+        segment = x[begin:begin + block]
+        powers = decay ** np.arange(1, len(segment) + 1)
+        y = powers * (prev + alpha * np.cumsum(segment / powers))
+        out[begin:begin + len(segment)] = y
+        prev = y[-1]
+    return out
+
+
+def ema_series(
+    values: np.ndarray,
+    period: int,
+    seed: Optional[float] = None,
+    start: Optional[int] = None
+) -> np.ndarray:
+    """
+    EMA recurrence over a whole series without a Python loop per bar.
+
+    Matches chaining EMACalculator calls that pass the previous EMA back in:
+    the first value (index `start`) is one EMA step from the SMA of the
+    first `period` values (or `seed`), then ema[t] = a * x[t] + (1 - a) *
+    ema[t - 1] with a = 2 / (period + 1).
+
+    Args:
+        values: Float array
+        period: EMA period
+        seed: Starting value (default: SMA of the first `period` values)
+        start: Index of the first chained call (default: period - 1)
+
+    Returns:
+        Array of EMA values (NaN before `start`), unrounded
+    """
+    x = np.asarray(values, dtype=np.float64)
+    out = np.full(len(x), np.nan)
+    start = period - 1 if start is None else max(start, period - 1)
+    if len(x) <= start:
+        return out
+
+    prev = float(x[:period].mean()) if seed is None else float(seed)
+    out[start:] = _ema_recurrence(x[start:], 2.0 / (period + 1), prev)
+    return out
+
+
+def macd_series(
+    close: np.ndarray,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line, signal line and histogram at every bar.
+
+    Matches a stateful TechnicalIndicatorsService fed one bar at a time:
+    the MACD line is each bar's close stepped once from the fixed fast/slow
+    SMA seeds (as MACDCalculator does), the signal line is the running mean
+    of the MACD line until `signal` values exist and an EMA of it after.
+
+    Args:
+        close: Float array of closes
+        fast: Fast EMA period
+        slow: Slow EMA period
+        signal: Signal EMA period
+
+    Returns:
+        (macd, signal_line, histogram) arrays, NaN before index slow - 1,
+        unrounded
+    """
+    x = np.asarray(close, dtype=np.float64)
+    n = len(x)
+    macd = np.full(n, np.nan)
+    signal_line = np.full(n, np.nan)
+    if n < slow:
+        return macd, signal_line, macd - signal_line
+
+    fast_alpha = 2.0 / (fast + 1)
+    slow_alpha = 2.0 / (slow + 1)
+    tail = x[slow - 1:]
+    macd[slow - 1:] = (
+        (tail * fast_alpha + x[:fast].mean() * (1.0 - fast_alpha))
+        - (tail * slow_alpha + x[:slow].mean() * (1.0 - slow_alpha))
+    )
+
+    # Running mean while fewer than `signal` MACD values exist, then an EMA
+    # continuing from the last running mean
+    line = macd[slow - 1:]
+    signal_out = signal_line[slow - 1:]
+    warmup = min(signal - 1, len(line))
+    signal_out[:warmup] = np.cumsum(line[:warmup]) / np.arange(1, warmup + 1)
+    if len(line) > warmup:
+        prev = signal_out[warmup - 1] if warmup else line[0]
+        signal_out[warmup:] = _ema_recurrence(line[warmup:], 2.0 / (signal + 1), prev)
+    return macd, signal_line, macd - signal_line
+
 
 @dataclass
 class VWAPResult:
@@ -60,9 +232,14 @@ class ExitSignal:
 class VWAPCalculator:
     """Volume Weighted Average Price calculator."""
 
-    def __init__(self):
-        """Initialize VWAP calculator."""
-        pass
+    def __init__(self, precision: str = "decimal"):
+        """
+        Initialize VWAP calculator.
+
+        Args:
+            precision: "decimal" (exact) or "float" (vectorized float64)
+        """
+        self.precision = _validate_precision(precision)
 
     def calculate(self, bars: List[dict]) -> VWAPResult:
         """
@@ -80,6 +257,24 @@ class VWAPCalculator:
         if not bars:
             raise InsufficientDataError(symbol="UNKNOWN", required_bars=1, available_bars=0)
 
+        if self.precision == "float":
+            vwap = self._calculate_float(bars)
+        else:
+            vwap = self._calculate_decimal(bars)
+
+        current_price = Decimal(str(bars[-1]["close"]))
+        above_vwap = current_price > vwap
+
+        return VWAPResult(
+            symbol="UNKNOWN",
+            vwap=vwap,
+            price=current_price,
+            above_vwap=above_vwap,
+            timestamp=datetime.utcnow()
+        )
+
+    def _calculate_decimal(self, bars: List[dict]) -> Decimal:
+        """VWAP with per-bar Decimal arithmetic."""
         typical_price_volume_sum = Decimal("0")
         volume_sum = Decimal("0")
 
@@ -96,29 +291,38 @@ class VWAPCalculator:
         if volume_sum == 0:
             raise InsufficientDataError(symbol="UNKNOWN", required_bars=1, available_bars=len(bars))
 
-        vwap = (typical_price_volume_sum / volume_sum).quantize(
+        return (typical_price_volume_sum / volume_sum).quantize(
             Decimal("0.01"), rounding=ROUND_HALF_UP
         )
 
-        current_price = Decimal(str(bars[-1]["close"]))
-        above_vwap = current_price > vwap
+    def _calculate_float(self, bars: List[dict]) -> Decimal:
+        """VWAP over float64 arrays."""
+        volume = bars_to_array(bars, "volume")
+        volume_sum = volume.sum()
+        if volume_sum == 0:
+            raise InsufficientDataError(symbol="UNKNOWN", required_bars=1, available_bars=len(bars))
 
-        return VWAPResult(
-            symbol="UNKNOWN",
-            vwap=vwap,
-            price=current_price,
-            above_vwap=above_vwap,
-            timestamp=datetime.utcnow()
-        )
+        typical_price = (
+            bars_to_array(bars, "high") + bars_to_array(bars, "low") + bars_to_array(bars, "close")
+        ) / 3.0
+        return _cents(np.dot(typical_price, volume) / volume_sum)
 
 
 class EMACalculator:
     """Exponential Moving Average calculator (9 and 20 period)."""
 
-    def __init__(self, period_9: int = 9, period_20: int = 20):
-        """Initialize EMA calculator."""
+    def __init__(self, period_9: int = 9, period_20: int = 20, precision: str = "decimal"):
+        """
+        Initialize EMA calculator.
+
+        Args:
+            period_9: Fast EMA period
+            period_20: Slow EMA period
+            precision: "decimal" (exact) or "float" (vectorized float64)
+        """
         self.period_9 = period_9
         self.period_20 = period_20
+        self.precision = _validate_precision(precision)
         self._multiplier_9 = Decimal("2") / (Decimal(str(period_9)) + Decimal("1"))
         self._multiplier_20 = Decimal("2") / (Decimal(str(period_20)) + Decimal("1"))
 
@@ -149,6 +353,20 @@ class EMACalculator:
         ema = (current_close * multiplier) + (prev_ema * (Decimal("1") - multiplier))
         return ema.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
+    @staticmethod
+    def _ema_float(
+        closes: np.ndarray,
+        period: int,
+        prev_ema: Optional[Decimal] = None
+    ) -> float:
+        """Float64 counterpart of _calculate_ema (rounded to cents)."""
+        if len(closes) < period:
+            raise InsufficientDataError(symbol="UNKNOWN", required_bars=period, available_bars=len(closes))
+
+        alpha = 2.0 / (period + 1)
+        prev = float(prev_ema) if prev_ema is not None else round_cents(closes[:period].mean())
+        return round_cents(closes[-1] * alpha + prev * (1.0 - alpha))
+
     def calculate(self, bars: List[dict], prev_ema_9: Optional[Decimal] = None,
                   prev_ema_20: Optional[Decimal] = None) -> EMAResult:
         """
@@ -173,14 +391,19 @@ class EMACalculator:
                 symbol="UNKNOWN", required_bars=self.period_20, available_bars=len(bars)
             )
 
-        closes = [Decimal(str(bar["close"])) for bar in bars]
-
         # Calculate EMAs
-        ema_9 = self._calculate_ema(closes, self.period_9, self._multiplier_9, prev_ema_9)
-        ema_20 = self._calculate_ema(closes, self.period_20, self._multiplier_20, prev_ema_20)
+        if self.precision == "float":
+            closes_array = bars_to_array(bars, "close")
+            ema_9 = _cents(self._ema_float(closes_array, self.period_9, prev_ema_9))
+            ema_20 = _cents(self._ema_float(closes_array, self.period_20, prev_ema_20))
+            current_price = Decimal(str(bars[-1]["close"]))
+        else:
+            closes = [Decimal(str(bar["close"])) for bar in bars]
+            ema_9 = self._calculate_ema(closes, self.period_9, self._multiplier_9, prev_ema_9)
+            ema_20 = self._calculate_ema(closes, self.period_20, self._multiplier_20, prev_ema_20)
+            current_price = closes[-1]
 
         # Check if price is near 9 EMA (within 1%)
-        current_price = closes[-1]
         threshold = ema_9 * Decimal("0.01")
         near_9ema = abs(current_price - ema_9) <= threshold
 
@@ -209,11 +432,20 @@ class EMACalculator:
 class MACDCalculator:
     """MACD (Moving Average Convergence Divergence) calculator."""
 
-    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
-        """Initialize MACD calculator."""
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, precision: str = "decimal"):
+        """
+        Initialize MACD calculator.
+
+        Args:
+            fast: Fast EMA period
+            slow: Slow EMA period
+            signal: Signal line EMA period
+            precision: "decimal" (exact) or "float" (vectorized float64)
+        """
         self.fast = fast
         self.slow = slow
         self.signal = signal
+        self.precision = _validate_precision(precision)
         self.ema_calc_fast = EMACalculator(period_9=fast, period_20=fast)
         self.ema_calc_slow = EMACalculator(period_9=slow, period_20=slow)
         self.ema_calc_signal = EMACalculator(period_9=signal, period_20=signal)
@@ -246,6 +478,56 @@ class MACDCalculator:
                 symbol="UNKNOWN", required_bars=self.slow, available_bars=len(bars)
             )
 
+        if self.precision == "float":
+            macd_line, signal_line, histogram = self._lines_float(bars, prev_signal)
+        else:
+            macd_line, signal_line, histogram = self._lines_decimal(bars, prev_signal)
+
+        # Check if MACD is positive
+        positive = macd_line > Decimal("0")
+
+        # Detect divergence and crosses
+        divergence = None
+        cross = None
+
+        if prev_macd is not None and prev_signal is not None:
+            was_positive = prev_macd > Decimal("0")
+            is_positive = macd_line > Decimal("0")
+
+            # Detect divergence (lines moving apart)
+            prev_histogram = prev_macd - prev_signal
+            if abs(histogram) > abs(prev_histogram):
+                if is_positive:
+                    divergence = "bullish"
+                else:
+                    divergence = "bearish"
+
+            # Detect crosses
+            was_above_signal = prev_macd > prev_signal
+            is_above_signal = macd_line > signal_line
+
+            if not was_above_signal and is_above_signal:
+                cross = "bullish"
+            elif was_above_signal and not is_above_signal:
+                cross = "bearish"
+
+        return MACDResult(
+            symbol="UNKNOWN",
+            macd_line=macd_line,
+            signal_line=signal_line,
+            histogram=histogram,
+            positive=positive,
+            divergence=divergence,
+            cross=cross,
+            timestamp=datetime.utcnow()
+        )
+
+    def _lines_decimal(
+        self,
+        bars: List[dict],
+        prev_signal: Optional[Decimal]
+    ) -> Tuple[Decimal, Decimal, Decimal]:
+        """MACD line, signal line and histogram with per-bar Decimal arithmetic."""
         closes = [Decimal(str(bar["close"])) for bar in bars]
 
         # Calculate MACD values for all bars to build signal line
@@ -283,42 +565,39 @@ class MACDCalculator:
         histogram = (macd_line - signal_line).quantize(
             Decimal("0.01"), rounding=ROUND_HALF_UP
         )
+        return macd_line, signal_line, histogram
 
-        # Check if MACD is positive
-        positive = macd_line > Decimal("0")
-
-        # Detect divergence and crosses
-        divergence = None
-        cross = None
-
-        if prev_macd is not None and prev_signal is not None:
-            was_positive = prev_macd > Decimal("0")
-            is_positive = macd_line > Decimal("0")
-
-            # Detect divergence (lines moving apart)
-            prev_histogram = prev_macd - prev_signal
-            if abs(histogram) > abs(prev_histogram):
-                if is_positive:
-                    divergence = "bullish"
-                else:
-                    divergence = "bearish"
+    def _lines_float(
+        self,
+        bars: List[dict],
+        prev_signal: Optional[Decimal]
+    ) -> Tuple[Decimal, Decimal, Decimal]:
+        """MACD line, signal line and histogram over float64 arrays.
 
-            # Detect crosses
-            was_above_signal = prev_macd > prev_signal
-            is_above_signal = macd_line > signal_line
+        Same per-bar formulas as _lines_decimal (each bar's close stepped once
+        from the SMA seeds, rounded to cents), evaluated for all bars at once.
+        """
+        closes = bars_to_array(bars, "close")
+        fast_alpha = 2.0 / (self.fast + 1)
+        slow_alpha = 2.0 / (self.slow + 1)
+        fast_seed = round_cents(closes[:self.fast].mean())
+        slow_seed = round_cents(closes[:self.slow].mean())
+
+        tail = closes[self.slow - 1:]
+        fast_ema = round_cents(tail * fast_alpha + fast_seed * (1.0 - fast_alpha))
+        slow_ema = round_cents(tail * slow_alpha + slow_seed * (1.0 - slow_alpha))
+        macd_values = round_cents(fast_ema - slow_ema)
+        macd_line = macd_values[-1]
 
-            if not was_above_signal and is_above_signal:
-                cross = "bullish"
-            elif was_above_signal and not is_above_signal:
-                cross = "bearish"
+        if len(macd_values) >= self.signal:
+            signal_alpha = 2.0 / (self.signal + 1)
+            prev = (
+                float(prev_signal) if prev_signal is not None
+                else round_cents(macd_values[:self.signal].mean())
+            )
+            signal_line = round_cents(macd_line * signal_alpha + prev * (1.0 - signal_alpha))
+        else:
+            signal_line = round_cents(macd_values.mean())
 
-        return MACDResult(
-            symbol="UNKNOWN",
-            macd_line=macd_line,
-            signal_line=signal_line,
-            histogram=histogram,
-            positive=positive,
-            divergence=divergence,
-            cross=cross,
-            timestamp=datetime.utcnow()
-        )
+        histogram = round_cents(macd_line - signal_line)
+        return _cents(macd_line), _cents(signal_line), _cents(histogram)
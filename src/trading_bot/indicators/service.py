@@ -12,11 +12,18 @@ from .exceptions import InsufficientDataError
 class TechnicalIndicatorsService:
     """Facade service for technical indicators (VWAP, EMA, MACD)."""
 
-    def __init__(self) -> None:
-        """Initialize technical indicators service."""
-        self.vwap_calc = VWAPCalculator()
-        self.ema_calc = EMACalculator(period_9=9, period_20=20)
-        self.macd_calc = MACDCalculator(fast=12, slow=26, signal=9)
+    def __init__(self, precision: str = "float") -> None:
+        """
+        Initialize technical indicators service.
+
+        Args:
+            precision: Calculator arithmetic, "float" (vectorized float64,
+                default for strategy evaluation) or "decimal" (exact)
+        """
+        self.precision = precision
+        self.vwap_calc = VWAPCalculator(precision=precision)
+        self.ema_calc = EMACalculator(period_9=9, period_20=20, precision=precision)
+        self.macd_calc = MACDCalculator(fast=12, slow=26, signal=9, precision=precision)
 
         # State tracking for sequential calculations
         self._last_ema_9: Optional[Decimal] = None
@@ -63,6 +63,12 @@ from .claude_manager import (
     LLMModel,
     BudgetExceededError
 )
+from .decision_replay import (
+    DecisionReplayStore,
+    ReplayClient,
+    ReplayMissError,
+    ReplayMode,
+)
 
 __all__ = [
     # OpenAI (legacy)
@@ -76,4 +82,9 @@ __all__ = [
     "LLMResponse",
     "LLMModel",
     "BudgetExceededError",
+    # Backtest decision replay
+    "DecisionReplayStore",
+    "ReplayClient",
+    "ReplayMissError",
+    "ReplayMode",
 ]
@@ -0,0 +1,312 @@
+"""
+Decision Replay Cache
+
+Records agent workflow inputs/outputs so backtests can run the real decision
+pipeline at data-replay speed.
+
+Entries are keyed by a SHA256 content hash of the call context (prompt, model
+and sampling parameters for LLM calls; symbol, price, portfolio and indicators
+for workflow decisions). In RECORD mode misses call through and are stored; in
+REPLAY mode misses raise ReplayMissError and are reported via report() instead
+of silently calling out.
+
+Storage is a single gzip-compressed JSONL file, loaded into memory on open and
+rewritten atomically on save().
+
+Usage:
+    store = DecisionReplayStore("logs/replay/decisions.jsonl.gz", mode=ReplayMode.REPLAY)
+    agent.client = ReplayClient(store, agent.client)
+    ...
+    print(store.report())
+"""
+
+import copy
+import dataclasses
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+LLM_NAMESPACE = "llm.messages"
+
+
+class ReplayMode(Enum):
+    """How cache misses are handled."""
+    RECORD = "record"  # Call through and store the result
+    REPLAY = "replay"  # Raise ReplayMissError, never call out
+
+
+class ReplayMissError(Exception):
+    """Raised in REPLAY mode when no recorded decision matches the context."""
+
+    def __init__(self, namespace: str, key: str):
+        self.namespace = namespace
+        self.key = key
+        super().__init__(f"No recorded decision for {namespace} (key {key[:16]}...)")
+
+
+def _json_default(value: Any) -> Any:
+    """Canonical JSON form for non-JSON types found in prompt contexts."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "item"):  # NumPy scalars
+        return value.item()
+    if hasattr(value, "tolist"):  # NumPy arrays
+        return value.tolist()
+    return str(value)
+
+
+def _normalize(value: Any) -> Any:
+    """Round-trip through JSON so replayed values match what save()/load() produce."""
+    return json.loads(json.dumps(value, default=_json_default))
+
+
+def content_hash(payload: Any) -> str:
+    """
+    SHA256 of the canonical JSON encoding of payload.
+
+    Dict key order does not affect the hash.
+    """
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class DecisionReplayStore:
+    """
+    On-disk store of recorded agent decisions.
+
+    Thread-safe; entries are grouped by namespace so different workflows with
+    identical inputs never collide.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        mode: ReplayMode = ReplayMode.REPLAY,
+        store_inputs: bool = True,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            path: Store file (gzip JSONL), created on first save()
+            mode: RECORD to call through on misses, REPLAY to raise instead
+            store_inputs: Keep the call context next to each output (for audits)
+        """
+        self.path = Path(path)
+        self.mode = mode
+        self.store_inputs = store_inputs
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self.hits = 0
+        self.recorded = 0
+        self.misses: List[Dict[str, str]] = []
+
+        if self.path.exists():
+            self._load()
+
+        logger.info(
+            f"Decision replay store: {self.path} ({len(self._entries)} entries, mode={mode.value})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.save()
+
+    @staticmethod
+    def _entry_id(namespace: str, key: str) -> str:
+        return f"{namespace}:{key}"
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries[self._entry_id(entry["namespace"], entry["key"])] = entry
+
+    def get(self, namespace: str, inputs: Any) -> Optional[Any]:
+        """Recorded output for inputs, or None (does not count hits/misses)."""
+        entry = self._entries.get(self._entry_id(namespace, content_hash(inputs)))
+        return copy.deepcopy(entry["output"]) if entry else None
+
+    def put(self, namespace: str, inputs: Any, output: Any) -> str:
+        """
+        Record an output.
+
+        Returns:
+            Content hash key of inputs
+        """
+        snapshot = _normalize(inputs) if self.store_inputs else None
+        return self._put(namespace, content_hash(inputs), snapshot, output)
+
+    def _put(self, namespace: str, key: str, inputs: Any, output: Any) -> str:
+        entry = {"namespace": namespace, "key": key, "output": _normalize(output)}
+        if self.store_inputs:
+            entry["inputs"] = inputs
+        with self._lock:
+            self._entries[self._entry_id(namespace, key)] = entry
+            self._dirty = True
+            self.recorded += 1
+        return key
+
+    def fetch(
+        self,
+        namespace: str,
+        inputs: Any,
+        compute: Callable[[], Any],
+        offline_compute: bool = False,
+    ) -> Any:
+        """
+        Serve a recorded output, or handle the miss according to mode.
+
+        Args:
+            namespace: Workflow identifier (e.g. "evaluate_trade_with_agents")
+            inputs: Full call context; its content hash is the cache key
+            compute: Runs the real workflow
+            offline_compute: compute only makes replayed LLM calls, so it may
+                also run on REPLAY-mode misses (its result is not recorded)
+
+        Returns:
+            Recorded (or freshly computed) output
+
+        Raises:
+            ReplayMissError: REPLAY mode, no recorded output and compute not offline
+        """
+        key = content_hash(inputs)
+        entry_id = self._entry_id(namespace, key)
+        with self._lock:
+            entry = self._entries.get(entry_id)
+            if entry is not None:
+                self.hits += 1
+                return copy.deepcopy(entry["output"])
+            self.misses.append({"namespace": namespace, "key": key})
+
+        if self.mode is ReplayMode.REPLAY:
+            if offline_compute:
+                logger.debug(f"Replay miss: {namespace} (key {key[:16]}...) - running offline")
+                return compute()
+            logger.warning(f"Replay miss: {namespace} (key {key[:16]}...)")
+            raise ReplayMissError(namespace, key)
+
+        # Snapshot inputs first: the workflow may mutate them
+        snapshot = _normalize(inputs) if self.store_inputs else None
+        output = compute()
+        self._put(namespace, key, snapshot, output)
+        return output
+
+    def report(self) -> Dict[str, Any]:
+        """Hit/miss summary for the current session."""
+        with self._lock:
+            lookups = self.hits + len(self.misses)
+            by_namespace: Dict[str, int] = {}
+            for miss in self.misses:
+                by_namespace[miss["namespace"]] = by_namespace.get(miss["namespace"], 0) + 1
+            return {
+                "mode": self.mode.value,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": len(self.misses),
+                "recorded": self.recorded,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "misses_by_namespace": by_namespace,
+            }
+
+    def save(self) -> None:
+        """Write all entries atomically (no-op if nothing was recorded)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = list(self._entries.values())
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, separators=(",", ":")))
+                f.write("\n")
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved {len(entries)} recorded decisions to {self.path}")
+
+
+class _ReplayMessages:
+    """messages.create() served from the replay store."""
+
+    def __init__(self, store: DecisionReplayStore, client: Optional[Any]):
+        self._store = store
+        self._client = client
+
+    def create(self, **kwargs) -> SimpleNamespace:
+        def call_llm() -> Dict[str, Any]:
+            if self._client is None:
+                raise RuntimeError("ReplayClient has no LLM client to record from")
+            response = self._client.messages.create(**kwargs)
+            return {
+                "content": [block.text for block in response.content],
+                "stop_reason": response.stop_reason,
+                "usage": {
+                    "input_tokens": response.usage.input_tokens,
+                    "output_tokens": response.usage.output_tokens,
+                },
+            }
+
+        recorded = self._store.fetch(LLM_NAMESPACE, kwargs, call_llm)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text) for text in recorded["content"]],
+            stop_reason=recorded["stop_reason"],
+            usage=SimpleNamespace(**recorded["usage"]),
+        )
+
+
+class ReplayClient:
+    """
+    Anthropic-compatible client that records/replays messages.create() calls.
+
+    Drop-in replacement for BaseAgent.client; usage (and therefore cost
+    tracking) is replayed from the recorded response.
+    """
+
+    def __init__(self, store: DecisionReplayStore, client: Optional[Any] = None):
+        """
+        Initialize client.
+
+        Args:
+            store: Replay store
+            client: Real client used for RECORD-mode misses (optional in REPLAY mode)
+        """
+        self.store = store
+        self.messages = _ReplayMessages(store, client)
+
+
+def install_replay_client(agents: List[Any], store: DecisionReplayStore) -> None:
+    """Route the LLM calls of each agent through a ReplayClient."""
+    for agent in agents:
+        if not isinstance(agent.client, ReplayClient):
+            agent.client = ReplayClient(store, agent.client)
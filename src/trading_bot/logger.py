@@ -20,6 +20,8 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Optional
 
+from .logging.error_buffer import install_error_buffer
+
 
 class UTCFormatter(logging.Formatter):
     """
@@ -139,6 +141,9 @@ class TradingLogger:
         file_handler.setFormatter(file_formatter)
         root_logger.addHandler(file_handler)
 
+        # In-memory ring buffer of recent errors (read by status endpoints)
+        install_error_buffer(root_logger)
+
     @classmethod
     def _configure_trades_logger(cls) -> None:
         """
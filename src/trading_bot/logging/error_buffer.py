@@ -0,0 +1,100 @@
+"""In-memory ring buffer of recent error log records.
+
+Keeps the last N ERROR/CRITICAL records emitted in this process so that
+status endpoints can report recent errors without scanning log files.
+"""
+
+import logging
+import os
+from collections import deque
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
+
+
+class ErrorRingBufferHandler(logging.Handler):
+    """Logging handler that retains the most recent error records.
+
+    Records are stored as small dicts (timestamp, level, message, logger) in a
+    bounded deque, so memory stays constant and appends/reads never touch disk.
+    """
+
+    MAX_MESSAGE_LENGTH = 200
+
+    def __init__(self, capacity: int = 100, level: int = logging.ERROR) -> None:
+        """Initialize handler.
+
+        Args:
+            capacity: Number of records to retain (oldest dropped first)
+            level: Minimum level captured (default: ERROR)
+        """
+        super().__init__(level)
+        self.capacity = capacity
+        self._records: deque[dict[str, Any]] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Append record to the ring buffer (called with handler lock held)."""
+        try:
+            entry = {
+                "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+                "level": record.levelname,
+                "message": record.getMessage()[: self.MAX_MESSAGE_LENGTH],
+                "logger": record.name,
+            }
+        except Exception:
+            self.handleError(record)
+            return
+        self._records.append(entry)
+
+    def recent(self, max_errors: int = 3) -> list[dict[str, Any]]:
+        """Get most recent error records, newest first.
+
+        Args:
+            max_errors: Maximum number of records to return
+
+        Returns:
+            List of error dicts with timestamp, level, message, logger
+        """
+        if max_errors <= 0:
+            return []
+        with self.lock:  # type: ignore[union-attr]
+            return [dict(entry) for entry in islice(reversed(self._records), max_errors)]
+
+    def clear(self) -> None:
+        """Drop all buffered records."""
+        with self.lock:  # type: ignore[union-attr]
+            self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+_error_buffer: ErrorRingBufferHandler | None = None
+
+
+def get_error_buffer() -> ErrorRingBufferHandler:
+    """Get the process-wide error ring buffer (created on first use).
+
+    Capacity defaults to 100 records and can be set via ERROR_BUFFER_CAPACITY.
+    """
+    global _error_buffer
+    if _error_buffer is None:
+        capacity = int(os.getenv("ERROR_BUFFER_CAPACITY", "100"))
+        _error_buffer = ErrorRingBufferHandler(capacity=capacity)
+    return _error_buffer
+
+
+def install_error_buffer(logger: logging.Logger | None = None) -> ErrorRingBufferHandler:
+    """Attach the process-wide error buffer to a logger (idempotent).
+
+    Args:
+        logger: Logger to attach to (default: root logger)
+
+    Returns:
+        The process-wide ErrorRingBufferHandler
+    """
+    target = logger or logging.getLogger()
+    handler = get_error_buffer()
+    if handler not in target.handlers:
+        target.addHandler(handler)
+    return handler
@@ -22,11 +22,13 @@ Example usage:
 """
 
 # T062: Package exports - complete market_data module public API
+from trading_bot.market_data.bar_cache import BarBuffer, BarCache
 from trading_bot.market_data.data_models import MarketDataConfig, MarketStatus, Quote
 from trading_bot.market_data.exceptions import DataValidationError, TradingHoursError
 from trading_bot.market_data.market_data_service import MarketDataService
 from trading_bot.market_data.fmp_client import FMPClient, FMPRateLimitExceeded
 from trading_bot.market_data.validators import (
+    validate_bar_values,
     validate_historical_data,
     validate_price,
     validate_quote,
@@ -42,11 +44,14 @@ __all__ = [
     'Quote',
     'MarketStatus',
     'MarketDataConfig',
+    'BarBuffer',
+    'BarCache',
     # Validators
     'validate_quote',
     'validate_price',
     'validate_timestamp',
     'validate_historical_data',
+    'validate_bar_values',
     'validate_trade_time',
     # Exceptions
     'DataValidationError',
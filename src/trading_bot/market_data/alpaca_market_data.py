@@ -11,7 +11,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Literal
 
 from alpaca.data.enums import Adjustment
-from alpaca.data.requests import StockBarsRequest
+from alpaca.data.requests import StockBarsRequest, StockLatestTradeRequest
 from alpaca.data.timeframe import TimeFrame
 
 from trading_bot.auth import AlpacaAuth
@@ -28,11 +28,22 @@ class AlpacaMarketData:
             self.auth.login()
         self._client = self.auth.get_stock_data_client()
 
-    def get_dataframe(self, *, symbol: str, timeframe: TimeframeStr, limit: int):
-        """Fetch market data and return as pandas DataFrame sorted by timestamp."""
+    def get_dataframe(
+        self,
+        *,
+        symbol: str,
+        timeframe: TimeframeStr,
+        limit: int | None,
+        start: datetime | None = None,
+    ):
+        """Fetch market data and return as pandas DataFrame sorted by timestamp.
+
+        With ``start``, bars from that time onward are returned (all of them when
+        ``limit`` is None) and an empty frame means there are no newer bars.
+        """
         import pandas as pd
 
-        bars = self._fetch_bars(symbol=symbol, timeframe=timeframe, limit=limit)
+        bars = self._fetch_bars(symbol=symbol, timeframe=timeframe, limit=limit, start=start)
 
         data = [
             {
@@ -52,10 +63,29 @@ class AlpacaMarketData:
             df.reset_index(drop=True, inplace=True)
         return df
 
-    def _fetch_bars(self, *, symbol: str, timeframe: TimeframeStr, limit: int):
+    def get_latest_trades(self, symbols: list[str]) -> dict:
+        """Fetch the latest trade for many symbols in a single request.
+
+        Returns a dict of symbol -> trade (with ``price`` and ``timestamp``);
+        symbols Alpaca has no trade for are absent from the result.
+        """
+        request = StockLatestTradeRequest(symbol_or_symbols=list(symbols))
+        trades = self._client.get_stock_latest_trade(request)
+        return dict(trades or {})
+
+    def _fetch_bars(
+        self,
+        *,
+        symbol: str,
+        timeframe: TimeframeStr,
+        limit: int | None,
+        start: datetime | None = None,
+    ):
         timeframe_enum = self._map_timeframe(timeframe)
         end = datetime.now(UTC)
-        start = end - timedelta(days=max(limit // 2, 1))
+        incremental = start is not None
+        if not incremental:
+            start = end - timedelta(days=max(limit // 2, 1))
 
         request = StockBarsRequest(
             symbol_or_symbols=symbol,
@@ -69,6 +99,8 @@ class AlpacaMarketData:
         response = self._client.get_stock_bars(request)
         data = getattr(response, "data", None)
         if not data or symbol not in data:
+            if incremental:
+                return []
             raise RuntimeError(f"Alpaca returned no bars for {symbol} ({timeframe})")
         return data[symbol]
 
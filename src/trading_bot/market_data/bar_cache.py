@@ -0,0 +1,198 @@
+"""
+Bar Cache
+
+Per-(symbol, timeframe) OHLCV cache backed by preallocated NumPy buffers.
+
+Each BarBuffer keeps the most recent `capacity` bars in contiguous arrays, so
+DataFrame and array views are zero-copy slices. New bars are appended into
+spare room at the end of the buffer; when it runs out, the retained window is
+copied once into a fresh allocation (amortized O(1) per bar). Views handed
+out earlier keep referencing the old allocation, so eviction and compaction
+never change them. The one exception is the newest bar, which is updated in
+place while it is still forming.
+
+BarCache holds the buffers under a memory budget with LRU eviction.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+OHLCV_COLUMNS = ("date",) + PRICE_COLUMNS + ("volume",)
+
+_UTC = pd.DatetimeTZDtype(tz="UTC")
+
+
+def _utc_dates(values: np.ndarray):
+    """Wrap datetime64[ns] values as a UTC-aware array without copying."""
+    try:
+        return pd.arrays.DatetimeArray._simple_new(values, dtype=_UTC)
+    except (AttributeError, TypeError):  # pragma: no cover - pandas internals moved
+        return pd.DatetimeIndex(values).tz_localize("UTC").array
+
+
+class BarBuffer:
+    """Most recent `capacity` OHLCV bars for one symbol and timeframe."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be > 0, got {capacity}")
+        self.capacity = capacity
+        self._start = 0
+        self._end = 0
+        self._allocate(capacity * 2)
+
+    def _allocate(self, size: int) -> None:
+        self._dates = np.empty(size, dtype="M8[ns]")
+        self._prices = {col: np.empty(size, dtype=np.float64) for col in PRICE_COLUMNS}
+        self._volume = np.empty(size, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the underlying allocation."""
+        return self._dates.nbytes * (len(PRICE_COLUMNS) + 2)
+
+    @property
+    def last_timestamp(self) -> pd.Timestamp | None:
+        """Timestamp of the newest cached bar (UTC), or None when empty."""
+        if self._end == self._start:
+            return None
+        return pd.Timestamp(self._dates[self._end - 1]).tz_localize("UTC")
+
+    def extend(self, df: pd.DataFrame) -> int:
+        """
+        Merge bars from a prepared OHLCV frame (sorted by `date`).
+
+        Bars older than the newest cached bar are ignored, a bar with the same
+        timestamp replaces it, and newer bars are appended (dropping the oldest
+        beyond `capacity`).
+
+        Returns:
+            Number of bars appended or replaced
+        """
+        if df.empty:
+            return 0
+
+        dates = df["date"].dt.as_unit("ns").array.asi8.view("M8[ns]")
+        prices = {col: df[col].to_numpy(dtype=np.float64) for col in PRICE_COLUMNS}
+        volume = df["volume"].to_numpy(dtype=np.int64)
+
+        first = 0
+        changed = 0
+        if self._end > self._start:
+            last = self._dates[self._end - 1]
+            first = int(np.searchsorted(dates, last, side="left"))
+            if first < len(dates) and dates[first] == last:
+                row = self._end - 1
+                for col in PRICE_COLUMNS:
+                    self._prices[col][row] = prices[col][first]
+                self._volume[row] = volume[first]
+                first += 1
+                changed = 1
+
+        new = len(dates) - first
+        if new <= 0:
+            return changed
+        if new > self.capacity:
+            first += new - self.capacity
+            new = self.capacity
+
+        keep = min(len(self), self.capacity - new)
+        if self._end + new > len(self._dates):
+            # Out of spare room: move the retained window into a fresh allocation
+            old_dates, old_prices, old_volume = self._dates, self._prices, self._volume
+            lo, hi = self._end - keep, self._end
+            self._allocate(len(old_dates))
+            self._dates[:keep] = old_dates[lo:hi]
+            for col in PRICE_COLUMNS:
+                self._prices[col][:keep] = old_prices[col][lo:hi]
+            self._volume[:keep] = old_volume[lo:hi]
+            self._start, self._end = 0, keep
+
+        end = self._end + new
+        self._dates[self._end:end] = dates[first:]
+        for col in PRICE_COLUMNS:
+            self._prices[col][self._end:end] = prices[col][first:]
+        self._volume[self._end:end] = volume[first:]
+        self._end = end
+        self._start = end - keep - new
+        return changed + new
+
+    def arrays(self, limit: int | None = None) -> dict[str, np.ndarray]:
+        """Read-only views of the newest `limit` bars (all bars if None)."""
+        start = self._start if limit is None else max(self._start, self._end - limit)
+        views = {"date": self._dates[start:self._end]}
+        views.update({col: self._prices[col][start:self._end] for col in PRICE_COLUMNS})
+        views["volume"] = self._volume[start:self._end]
+        for view in views.values():
+            view.flags.writeable = False
+        return views
+
+    def frame(self, limit: int | None = None) -> pd.DataFrame:
+        """
+        Zero-copy DataFrame (date, open, high, low, close, volume) of the newest bars.
+
+        The frame is backed by read-only views; copy it before modifying values
+        in place.
+        """
+        views = self.arrays(limit)
+        views["date"] = _utc_dates(views["date"])
+        return pd.DataFrame(views, columns=list(OHLCV_COLUMNS), copy=False)
+
+
+class BarCache:
+    """LRU cache of BarBuffers bounded by total buffer bytes."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._buffers: OrderedDict[Hashable, BarBuffer] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._buffers
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by all cached buffers."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def get(self, key: Hashable) -> BarBuffer | None:
+        """Get a buffer and mark it most recently used."""
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._buffers.move_to_end(key)
+        return buffer
+
+    def put(self, key: Hashable, buffer: BarBuffer) -> None:
+        """Store a buffer, evicting least recently used ones over the budget."""
+        self._buffers.pop(key, None)
+        if buffer.nbytes > self.max_bytes:
+            return
+        self._buffers[key] = buffer
+        total = self.nbytes
+        while total > self.max_bytes:
+            _, evicted = self._buffers.popitem(last=False)
+            total -= evicted.nbytes
+
+    def discard(self, key: Hashable) -> None:
+        """Drop one buffer if cached."""
+        self._buffers.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all buffers."""
+        self._buffers.clear()
@@ -24,6 +24,16 @@ from alpaca.data.enums import Adjustment
 
 logger = logging.getLogger(__name__)
 
+# Bar timeframe strings accepted by get_bars()/get_multi_symbol_bars()
+TIMEFRAME_MAP = {
+    "1m": TimeFrame.Minute,
+    "5m": TimeFrame(5, "Min"),
+    "15m": TimeFrame(15, "Min"),
+    "1h": TimeFrame.Hour,
+    "4h": TimeFrame(4, "Hour"),
+    "1d": TimeFrame.Day,
+}
+
 
 @dataclass
 class CryptoQuote:
@@ -133,52 +143,15 @@ class CryptoDataService:
             List of CryptoBar objects
         """
         try:
-            # Map timeframe string to Alpaca TimeFrame
-            timeframe_map = {
-                "1m": TimeFrame.Minute,
-                "5m": TimeFrame(5, "Min"),
-                "15m": TimeFrame(15, "Min"),
-                "1h": TimeFrame.Hour,
-                "4h": TimeFrame(4, "Hour"),
-                "1d": TimeFrame.Day,
-            }
-
-            if timeframe not in timeframe_map:
-                raise ValueError(f"Invalid timeframe: {timeframe}. Use: {list(timeframe_map.keys())}")
-
-            tf = timeframe_map[timeframe]
-
-            # Calculate start/end if not provided
-            if not end:
-                end = datetime.now()
-            if not start:
-                start = end - timedelta(days=days)
-
-            request = CryptoBarsRequest(
-                symbol_or_symbols=symbol,
-                timeframe=tf,
-                start=start,
-                end=end
+            bars_data = self.client.get_crypto_bars(
+                self._bars_request(symbol, timeframe, days, start, end)
             )
 
-            bars_data = self.client.get_crypto_bars(request)
-
             if symbol not in bars_data:
                 logger.warning(f"No bar data for {symbol}")
                 return []
 
-            bars = []
-            for bar in bars_data[symbol]:
-                bars.append(CryptoBar(
-                    symbol=symbol,
-                    timestamp=bar.timestamp,
-                    open=float(bar.open),
-                    high=float(bar.high),
-                    low=float(bar.low),
-                    close=float(bar.close),
-                    volume=float(bar.volume),
-                    vwap=float(bar.vwap) if bar.vwap else 0.0
-                ))
+            bars = [self._to_crypto_bar(symbol, bar) for bar in bars_data[symbol]]
 
             logger.info(f"Fetched {len(bars)} bars for {symbol} ({timeframe})")
             return bars
@@ -187,6 +160,87 @@ class CryptoDataService:
             logger.error(f"Error fetching bars for {symbol}: {e}")
             return []
 
+    def get_multi_symbol_bars(
+        self,
+        symbols: List[str],
+        timeframe: str = "1h",
+        days: int = 30,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, List[CryptoBar]]:
+        """
+        Get historical bar data for multiple crypto symbols in one request.
+
+        Args:
+            symbols: List of crypto symbols
+            timeframe: Bar timeframe ("1m", "5m", "15m", "1h", "4h", "1d")
+            days: Number of days of history (if start/end not provided)
+            start: Start datetime (optional)
+            end: End datetime (optional)
+
+        Returns:
+            Dict mapping symbol to CryptoBar list (empty if no data or failed)
+        """
+        bars: Dict[str, List[CryptoBar]] = {symbol: [] for symbol in symbols}
+        if not symbols:
+            return bars
+
+        try:
+            bars_data = self.client.get_crypto_bars(
+                self._bars_request(symbols, timeframe, days, start, end)
+            )
+
+            for symbol in symbols:
+                if symbol in bars_data:
+                    bars[symbol] = [self._to_crypto_bar(symbol, bar) for bar in bars_data[symbol]]
+
+            logger.info(
+                f"Fetched {sum(len(b) for b in bars.values())} bars for {len(symbols)} symbols ({timeframe})"
+            )
+
+        except Exception as e:
+            logger.error(f"Error fetching multi-symbol bars: {e}")
+
+        return bars
+
+    @staticmethod
+    def _bars_request(
+        symbol_or_symbols,
+        timeframe: str,
+        days: int,
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> CryptoBarsRequest:
+        """Build a bars request, defaulting the window to the last `days` days."""
+        if timeframe not in TIMEFRAME_MAP:
+            raise ValueError(f"Invalid timeframe: {timeframe}. Use: {list(TIMEFRAME_MAP.keys())}")
+
+        # Calculate start/end if not provided
+        if not end:
+            end = datetime.now()
+        if not start:
+            start = end - timedelta(days=days)
+
+        return CryptoBarsRequest(
+            symbol_or_symbols=symbol_or_symbols,
+            timeframe=TIMEFRAME_MAP[timeframe],
+            start=start,
+            end=end
+        )
+
+    @staticmethod
+    def _to_crypto_bar(symbol: str, bar) -> CryptoBar:
+        return CryptoBar(
+            symbol=symbol,
+            timestamp=bar.timestamp,
+            open=float(bar.open),
+            high=float(bar.high),
+            low=float(bar.low),
+            close=float(bar.close),
+            volume=float(bar.volume),
+            vwap=float(bar.vwap) if bar.vwap else 0.0
+        )
+
     def get_current_price(self, symbol: str) -> Optional[float]:
         """
         Get current price for a crypto symbol (mid-point of bid/ask).
@@ -117,6 +117,8 @@ class MarketDataConfig:
         trading_window_start: Trading window start hour in EST, 24-hour format (default: 7 for 7am)
         trading_window_end: Trading window end hour in EST, 24-hour format (default: 10 for 10am)
         trading_timezone: Timezone for trading hours enforcement (default: 'America/New_York')
+        quote_batch_size: Maximum symbols per multi-symbol quote request (default: 200)
+        bar_cache_max_bytes: Memory budget for cached historical bars, 0 disables the cache (default: 64 MiB)
     """
     rate_limit_retries: int = 3
     rate_limit_backoff_base: float = 1.0
@@ -124,3 +126,5 @@ class MarketDataConfig:
     trading_window_start: int = 7
     trading_window_end: int = 10
     trading_timezone: str = "America/New_York"
+    quote_batch_size: int = 200
+    bar_cache_max_bytes: int = 64 * 1024 * 1024
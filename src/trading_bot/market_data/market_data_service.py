@@ -23,8 +23,10 @@ from trading_bot.error_handling.policies import DEFAULT_POLICY
 from trading_bot.error_handling.retry import with_retry
 from trading_bot.logger import TradingLogger
 from trading_bot.market_data.alpaca_market_data import AlpacaMarketData
+from trading_bot.market_data.bar_cache import BarBuffer, BarCache
 from trading_bot.market_data.data_models import MarketDataConfig, MarketStatus, Quote
 from trading_bot.market_data.validators import (
+    validate_bar_values,
     validate_historical_data,
     validate_quote,
     validate_trade_time,
@@ -69,6 +71,9 @@ class MarketDataService:
         self.logger = logger if logger is not None else TradingLogger.get_logger(__name__)
         self._data_helper = AlpacaMarketData(auth)
         self._trading_client = auth.get_trading_client()
+        self.bar_cache: BarCache | None = (
+            BarCache(self.config.bar_cache_max_bytes) if self.config.bar_cache_max_bytes > 0 else None
+        )
 
     # ------------------------------------------------------------------
     # Quotes
@@ -117,11 +122,7 @@ class MarketDataService:
         timeframe = self._map_timeframe(interval)
         limit = self._span_to_limit(span)
         self._log_request("get_historical_data", {"symbol": symbol, "interval": interval, "span": span})
-
-        df = self._data_helper.get_dataframe(symbol=symbol, timeframe=timeframe, limit=limit)
-        df = self._prepare_ohlcv_dataframe(df)
-        validate_historical_data(df)
-        return df
+        return self._get_bars(symbol, timeframe, limit)
 
     @with_retry(policy=DEFAULT_POLICY)
     def get_multi_timeframe_data(
@@ -139,10 +140,7 @@ class MarketDataService:
         for tf in timeframes:
             timeframe = self._map_timeframe(tf)
             limit = self._span_to_limit(span)
-            df = self._data_helper.get_dataframe(symbol=symbol, timeframe=timeframe, limit=limit)
-            tf_df = self._prepare_ohlcv_dataframe(df)
-            validate_historical_data(tf_df)
-            data[tf] = tf_df
+            data[tf] = self._get_bars(symbol, timeframe, limit)
 
         return data
 
@@ -162,18 +160,118 @@ class MarketDataService:
         )
 
     def get_quotes_batch(self, symbols: list[str]) -> dict[str, Quote]:
+        """Fetch quotes for many symbols with one latest-trade request per chunk.
+
+        Trading time and market state are evaluated once for the whole batch,
+        and symbols are requested ``config.quote_batch_size`` at a time.
+        Symbols that fail (missing from the response, failed chunk, invalid
+        price or stale timestamp) are logged and left out of the result.
+        """
         self._log_request("get_quotes_batch", {"symbols": symbols, "count": len(symbols)})
         quotes: dict[str, Quote] = {}
-        for symbol in symbols:
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return quotes
+
+        try:
+            validate_trade_time()
+        except Exception as exc:
+            for symbol in symbols:
+                self._log_quote_failure(symbol, exc)
+            return quotes
+
+        market_state = self._determine_market_state()
+        chunk_size = max(1, self.config.quote_batch_size)
+        for start in range(0, len(symbols), chunk_size):
+            chunk = symbols[start:start + chunk_size]
             try:
-                quotes[symbol] = self.get_quote(symbol)
+                trades = self._fetch_latest_trades(chunk)
             except Exception as exc:
-                self.logger.warning(f"Failed to get quote for {symbol}: {exc}")
+                for symbol in chunk:
+                    self._log_quote_failure(symbol, exc)
+                continue
+
+            for symbol in chunk:
+                try:
+                    quotes[symbol] = self._quote_from_trade(symbol, trades.get(symbol), market_state)
+                except Exception as exc:
+                    self._log_quote_failure(symbol, exc)
         return quotes
 
+    @with_retry(policy=DEFAULT_POLICY)
+    def _fetch_latest_trades(self, symbols: list[str]) -> dict:
+        return self._data_helper.get_latest_trades(symbols)
+
+    @staticmethod
+    def _quote_from_trade(symbol: str, trade, market_state: str) -> Quote:
+        if trade is None:
+            raise ValueError(f"No quote data returned for {symbol}")
+
+        timestamp = trade.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=UTC)
+        elif timestamp.tzinfo is not UTC:
+            timestamp = timestamp.astimezone(UTC)
+
+        price = float(trade.price)
+        validate_quote(
+            {
+                "symbol": symbol,
+                "price": price,
+                "timestamp": timestamp,
+                "market_state": market_state,
+            }
+        )
+        return Quote(
+            symbol=symbol,
+            current_price=Decimal(str(price)),
+            timestamp_utc=timestamp,
+            market_state=market_state,
+        )
+
+    def _log_quote_failure(self, symbol: str, exc: Exception) -> None:
+        self.logger.warning(f"Failed to get quote for {symbol}: {exc}")
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _get_bars(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        """Validated OHLCV bars, served from the bar cache when enabled.
+
+        The first request for a (symbol, timeframe) pulls the full history into a
+        BarBuffer; later requests fetch only bars from the newest cached
+        timestamp onward (refreshing a still-forming last bar) and validate just
+        those. Cached frames are zero-copy, read-only views.
+        """
+        if self.bar_cache is None:
+            df = self._data_helper.get_dataframe(symbol=symbol, timeframe=timeframe, limit=limit)
+            df = self._prepare_ohlcv_dataframe(df)
+            validate_historical_data(df)
+            return df
+
+        key = (symbol, timeframe)
+        buffer = self.bar_cache.get(key)
+        if buffer is None or limit > buffer.capacity:
+            df = self._data_helper.get_dataframe(symbol=symbol, timeframe=timeframe, limit=limit)
+            df = self._prepare_ohlcv_dataframe(df)
+            validate_historical_data(df)
+            buffer = BarBuffer(limit)
+            buffer.extend(df)
+            self.bar_cache.put(key, buffer)
+            return buffer.frame(limit)
+
+        last = buffer.last_timestamp
+        df = self._data_helper.get_dataframe(
+            symbol=symbol, timeframe=timeframe, limit=None, start=last.to_pydatetime()
+        )
+        if not df.empty:
+            df = self._prepare_ohlcv_dataframe(df)
+            df = df[df["date"] >= last]
+            if not df.empty:
+                validate_bar_values(df)
+                buffer.extend(df)
+        return buffer.frame(limit)
+
     def _prepare_ohlcv_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         result = df.copy()
         if "timestamp" in result.columns:
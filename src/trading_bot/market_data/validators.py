@@ -135,6 +135,25 @@ def validate_historical_data(df: pd.DataFrame) -> None:
     """
     Validate historical OHLCV data.
 
+    Args:
+        df: DataFrame with date, open, high, low, close, volume columns
+
+    Raises:
+        DataValidationError: If data is incomplete or invalid
+    """
+    validate_bar_values(df)
+
+    # Check for date continuity using helper (T028)
+    _check_date_continuity(df, date_column='date', max_gap_ratio=0.1)
+
+
+def validate_bar_values(df: pd.DataFrame) -> None:
+    """
+    Validate OHLCV columns, prices and volume without the date continuity check.
+
+    Used for bars appended to an already validated history, where a short
+    chunk spanning a holiday would fail the continuity ratio.
+
     Args:
         df: DataFrame with date, open, high, low, close, volume columns
 
@@ -163,9 +182,6 @@ def validate_historical_data(df: pd.DataFrame) -> None:
     if (df['volume'] < 0).any():
         raise DataValidationError("Volume cannot be negative")
 
-    # Check for date continuity using helper (T028)
-    _check_date_continuity(df, date_column='date', max_gap_ratio=0.1)
-
 
 # T045-T051: Trading hours validation
 def validate_trade_time(current_time: datetime | None = None) -> None:
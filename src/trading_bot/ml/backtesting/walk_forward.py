@@ -1,6 +1,12 @@
 """Walk-forward optimization for strategy validation.
 
 Prevents overfitting by testing strategies on unseen data using rolling windows.
+
+Windows are evaluated with an array-based path: features are computed as
+whole columns, a strategy produces a signal vector for the full window, and
+positions, returns, costs and metrics are derived with NumPy in one pass.
+The original bar-by-bar simulation is kept as
+`WalkForwardOptimizer.backtest_strategy_reference` for equivalence testing.
 """
 
 from __future__ import annotations
@@ -19,6 +25,21 @@ from trading_bot.ml.models import MLStrategy, StrategyMetrics
 
 logger = logging.getLogger(__name__)
 
+# Signal values above this are "long", at or below are "flat"
+SIGNAL_THRESHOLD = 0.5
+
+
+def _empty_metrics() -> StrategyMetrics:
+    """Metrics for a strategy that produced no trades."""
+    return StrategyMetrics(
+        sharpe_ratio=0.0,
+        max_drawdown=0.0,
+        win_rate=0.0,
+        profit_factor=0.0,
+        num_trades=0,
+        total_return=0.0,
+    )
+
 
 @dataclass
 class WalkForwardWindow:
@@ -131,12 +152,198 @@ class WalkForwardOptimizer:
         logger.info(f"Created {len(windows)} walk-forward windows ({window_type})")
         return windows
 
+    def feature_matrix(self, data: pd.DataFrame) -> dict[str, NDArray[np.float64]]:
+        """Compute strategy terminals as whole columns.
+
+        Same values the per-bar path puts in each bar's feature dict, without
+        building a FeatureSet per bar (or the unused S/R and pattern features).
+
+        Args:
+            data: OHLCV data (price columns are coerced to numeric in place,
+                as FeatureExtractor.extract does)
+
+        Returns:
+            Dict of terminal name -> array with one value per bar
+        """
+        from trading_bot.ml.features import FeatureExtractor
+
+        extractor = FeatureExtractor()
+        price = extractor.calculate_price_features(data)
+        technical = extractor.technical_calc.calculate_all(data)
+
+        return {
+            "close": data["close"].to_numpy(dtype=np.float64),
+            "volume": data["volume"].to_numpy(dtype=np.float64),
+            "rsi": np.asarray(technical["rsi_14"], dtype=np.float64),
+            "macd": np.asarray(technical["macd"], dtype=np.float64),
+            "ema_12": np.asarray(price["returns_5d"], dtype=np.float64),  # Proxy
+            "ema_26": np.asarray(price["returns_20d"], dtype=np.float64),  # Proxy
+            "sma_20": np.asarray(price["price_to_sma20"], dtype=np.float64),
+            "sma_50": np.asarray(price["price_to_sma50"], dtype=np.float64),
+            "atr": np.asarray(technical["atr_14"], dtype=np.float64),
+            "const": np.ones(len(data)),
+        }
+
+    def signal_vector(
+        self,
+        strategy: MLStrategy,
+        features: dict[str, NDArray[np.float64]],
+    ) -> NDArray[np.bool_]:
+        """Evaluate a strategy over a whole feature matrix.
+
+        A callable `strategy.entry_logic` is called once with the feature
+        matrix and must return one signal value per bar. A string
+        `entry_logic` is not parsed; like the per-bar path, the signal is then
+        the mean of RSI, MACD and 1.0 (long when above SIGNAL_THRESHOLD).
+
+        Args:
+            strategy: Strategy to evaluate
+            features: Output of `feature_matrix`
+
+        Returns:
+            Boolean array, True where the strategy wants to be long
+        """
+        if callable(strategy.entry_logic):
+            values = np.asarray(strategy.entry_logic(features), dtype=np.float64)
+        else:
+            values = (features["rsi"] + features["macd"] + 1.0) / 3.0
+        return values > SIGNAL_THRESHOLD
+
     def backtest_strategy(
         self,
         strategy: MLStrategy,
         data: pd.DataFrame,
+        include_costs: bool = False,
+    ) -> StrategyMetrics:
+        """Run backtest on strategy using array operations.
+
+        Produces the same metrics as `backtest_strategy_reference` (when
+        `include_costs` is False) without any per-bar Python work.
+
+        Args:
+            strategy: Strategy to test
+            data: OHLCV data
+            include_costs: Deduct slippage and commission from each round trip
+
+        Returns:
+            Performance metrics
+        """
+        try:
+            # Skip if insufficient data
+            if len(data) < 50:
+                return _empty_metrics()
+
+            features = self.feature_matrix(data)
+            signals = self.signal_vector(strategy, features)
+
+            cost_per_side = 0.0
+            if include_costs:
+                cost_per_side = (
+                    self.config.slippage_bps / 10_000
+                    + self.config.commission_per_trade / self.config.initial_capital
+                )
+
+            return self.simulate_signals(features["close"], signals, cost_per_side)
+
+        except Exception as e:
+            logger.warning(f"Backtest failed: {e}")
+            return _empty_metrics()
+
+    @staticmethod
+    def simulate_signals(
+        close: NDArray[np.float64],
+        signals: NDArray[np.bool_],
+        cost_per_side: float = 0.0,
+    ) -> StrategyMetrics:
+        """Simulate long/flat trading on a signal vector.
+
+        Vectorized equivalent of the reference loop: enter on a flat->long
+        signal edge, exit on long->flat, mark held bars to market, and compound
+        equity on held and exit bars (as the reference does).
+
+        Args:
+            close: Close prices, one per bar
+            signals: True where long is wanted, one per bar
+            cost_per_side: Fractional cost charged on entry and on exit
+
+        Returns:
+            Performance metrics
+        """
+        close = np.asarray(close, dtype=np.float64)
+        signals = np.asarray(signals, dtype=bool)
+        n = len(signals)
+        if n < 2:
+            return _empty_metrics()
+
+        bars = np.arange(n)
+
+        # A position exists only in long runs that start with an entry edge
+        # (a run already long at bar 0 is never entered)
+        first_flat = int(np.argmax(~signals)) if not signals.all() else n
+        in_position = signals & (bars >= first_flat)
+
+        cur, prev = signals[1:], signals[:-1]
+        was_in_position = in_position[:-1]
+        exits = ~cur & prev & was_in_position
+        holds = cur & was_in_position
+
+        # Entry bar of the position each exit closes
+        entries = np.zeros(n, dtype=bool)
+        entries[1:] = cur & ~prev
+        last_entry = np.maximum.accumulate(np.where(entries, bars, 0))[:-1]
+
+        price, prev_price = close[1:], close[:-1]
+        entry_price = close[last_entry]
+
+        returns = np.zeros(n - 1)
+        returns[holds] = (price[holds] - prev_price[holds]) / prev_price[holds]
+        trades = (price[exits] - entry_price[exits]) / entry_price[exits]
+        if cost_per_side:
+            trades = trades - 2.0 * cost_per_side
+        returns[exits] = trades
+
+        num_trades = len(trades)
+        if num_trades == 0:
+            return _empty_metrics()
+
+        equity_curve = np.cumprod(np.where(holds | exits, 1.0 + returns, 1.0))
+        peaks = np.maximum.accumulate(np.maximum(equity_curve, 1.0))
+        max_drawdown = max(float(((peaks - equity_curve) / peaks).max()), 0.0)
+
+        mean_return = returns.mean()
+        std_return = returns.std()
+
+        sharpe = 0.0
+        if std_return > 0:
+            sharpe = (mean_return / std_return) * np.sqrt(252)
+
+        # Trade statistics
+        winners = (trades > 0).sum()
+        win_rate = winners / num_trades
+
+        gross_wins = trades[trades > 0].sum()
+        gross_losses = abs(trades[trades < 0].sum())
+        profit_factor = gross_wins / gross_losses if gross_losses > 0 else 0.0
+
+        return StrategyMetrics(
+            sharpe_ratio=float(sharpe),
+            max_drawdown=float(max_drawdown),
+            win_rate=float(win_rate),
+            profit_factor=float(profit_factor),
+            num_trades=int(num_trades),
+            total_return=float(equity_curve[-1] - 1.0),
+        )
+
+    def backtest_strategy_reference(
+        self,
+        strategy: MLStrategy,
+        data: pd.DataFrame,
     ) -> StrategyMetrics:
-        """Run backtest on strategy.
+        """Run backtest on strategy one bar at a time.
+
+        Reference implementation for `backtest_strategy`: builds a FeatureSet
+        and feature dict per bar and simulates trades in a Python loop. Kept
+        for equivalence tests; use `backtest_strategy` for research runs.
 
         Uses same evaluation logic as GP fitness function but returns full metrics.
 
@@ -6,6 +6,7 @@ using XGBoost meta-learning for 15-25% additional performance improvement.
 
 from trading_bot.ml.ensemble.base_models import (
     BaseModel,
+    StackedBaseModels,
     LSTMModel,
     GRUModel,
     TransformerModel,
@@ -15,6 +16,7 @@ from trading_bot.ml.ensemble.training import EnsembleTrainer
 
 __all__ = [
     "BaseModel",
+    "StackedBaseModels",
     "LSTMModel",
     "GRUModel",
     "TransformerModel",
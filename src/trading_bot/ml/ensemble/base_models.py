@@ -68,6 +68,44 @@ class BaseModel(nn.Module, ABC):
             return probs.cpu().numpy()
 
 
+class StackedBaseModels(nn.Module):
+    """All base models as one module producing the meta-learner's features.
+
+    forward() returns the concatenated class probabilities of every base
+    model, so meta-features come from a single call (and a single traced
+    graph when exported for inference) instead of one forward pass and
+    tensor conversion per model.
+    """
+
+    def __init__(self, base_models: list[BaseModel]):
+        """Initialize stacked base models.
+
+        Args:
+            base_models: Trained base models (shared, not copied)
+        """
+        super().__init__()
+        self.base_models = nn.ModuleList(base_models)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Concatenated probabilities of shape (batch, n_models * output_dim)."""
+        return torch.cat(
+            [torch.softmax(model(x), dim=-1) for model in self.base_models], dim=-1
+        )
+
+    def meta_features(self, x: NDArray[np.float64]) -> NDArray[np.float32]:
+        """Meta-features for NumPy inputs (eager PyTorch, no autograd).
+
+        Args:
+            x: Input features of shape (n_samples, input_dim)
+
+        Returns:
+            Meta-features of shape (n_samples, n_models * output_dim)
+        """
+        self.eval()
+        with torch.inference_mode():
+            return self.forward(torch.FloatTensor(x)).cpu().numpy()
+
+
 class LSTMModel(BaseModel):
     """LSTM-based model for temporal pattern recognition.
 
@@ -8,10 +8,12 @@ where base models form Layer 1 and XGBoost forms Layer 2.
 from typing import Optional
 
 import numpy as np
+import torch
 import xgboost as xgb
 from numpy.typing import NDArray
 
-from trading_bot.ml.ensemble.base_models import BaseModel
+from trading_bot.ml.ensemble.base_models import BaseModel, StackedBaseModels
+from trading_bot.ml.neural_models.export import InferenceModel, load_inference_model
 
 
 class MetaLearner:
@@ -168,6 +170,9 @@ class StackingEnsemble:
     2. Generate out-of-fold predictions on validation data
     3. Train meta-learner on validation predictions
     4. Final ensemble: base models → meta-learner → prediction
+
+    For live scoring, call `compile_base_models()` once to run Layer 1 as a
+    single compiled graph (TorchScript or ONNX Runtime).
     """
 
     def __init__(
@@ -183,6 +188,28 @@ class StackingEnsemble:
         """
         self.base_models = base_models
         self.meta_learner = meta_learner
+        self.stacked_base_models = StackedBaseModels(base_models)
+        self.compiled_base_models: Optional[InferenceModel] = None
+
+    def compile_base_models(
+        self, example_input: NDArray[np.float64], **kwargs
+    ) -> InferenceModel:
+        """Compile all base models into one inference graph.
+
+        Call again after retraining the base models.
+
+        Args:
+            example_input: Representative input of shape (batch_size, 52)
+            **kwargs: Passed to load_inference_model (backends, quantize,
+                max_drift, ...)
+
+        Returns:
+            The compiled Layer 1 model (also used by predict/predict_proba)
+        """
+        self.compiled_base_models = load_inference_model(
+            self.stacked_base_models, torch.FloatTensor(example_input), **kwargs
+        )
+        return self.compiled_base_models
 
     def predict(self, X: NDArray[np.float64]) -> NDArray[np.int64]:
         """Predict class labels using full ensemble.
@@ -224,17 +251,11 @@ class StackingEnsemble:
             Meta-features of shape (n_samples, 12)
             Concatenated predictions: [LSTM_probs, GRU_probs, Transformer_probs, HTF_probs]
         """
-        predictions = []
-
-        for model in self.base_models:
-            # Get probability predictions from each base model
-            probs = model.predict_proba(X)  # (n_samples, 3)
-            predictions.append(probs)
-
-        # Concatenate all predictions: (n_samples, 4 * 3) = (n_samples, 12)
-        meta_features = np.hstack(predictions)
+        if self.compiled_base_models is not None:
+            return self.compiled_base_models.run(X)
 
-        return meta_features
+        # All base models in one pass: (n_samples, 4 * 3) = (n_samples, 12)
+        return self.stacked_base_models.meta_features(X)
 
     def get_base_model_predictions(
         self, X: NDArray[np.float64]
@@ -21,7 +21,7 @@ import torch.nn as nn
 import torch.optim as optim
 from numpy.typing import NDArray
 
-from trading_bot.ml.ensemble.base_models import BaseModel
+from trading_bot.ml.ensemble.base_models import BaseModel, StackedBaseModels
 from trading_bot.ml.ensemble.meta_learner import MetaLearner, StackingEnsemble
 
 logger = logging.getLogger(__name__)
@@ -315,17 +315,8 @@ class EnsembleTrainer:
         Returns:
             Meta-features of shape (n_samples, 12)
         """
-        predictions = []
-
-        for model in self.base_models:
-            model.eval()
-            probs = model.predict_proba(X)
-            predictions.append(probs)
-
-        # Concatenate: (n_samples, 4 * 3) = (n_samples, 12)
-        meta_features = np.hstack(predictions)
-
-        return meta_features
+        # All base models in one pass: (n_samples, 4 * 3) = (n_samples, 12)
+        return StackedBaseModels(self.base_models).meta_features(X)
 
     def save_ensemble(self, ensemble: StackingEnsemble, save_dir: str) -> None:
         """Save trained ensemble to disk.
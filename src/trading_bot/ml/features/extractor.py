@@ -226,30 +226,9 @@ class FeatureExtractor:
         low = df["low"]
         n = len(df)
 
-        # Support/Resistance features using enhanced detector
-        sr_features_arrays = {
-            "distance_to_nearest_support": np.full(n, -0.05),
-            "distance_to_nearest_resistance": np.full(n, 0.05),
-            "support_strength": np.zeros(n),
-            "resistance_strength": np.zeros(n),
-            "between_levels": np.zeros(n),
-            "num_supports_below": np.zeros(n),
-            "num_resistances_above": np.zeros(n),
-            "avg_support_distance": np.full(n, -0.05),
-            "avg_resistance_distance": np.full(n, 0.05),
-        }
-
-        # Calculate S/R for each bar (rolling window approach)
-        for i in range(min(100, n), n):  # Start after minimum window
-            lookback_df = df.iloc[:i+1]
-            current_price = float(close.iloc[i])
-
-            # Get S/R features for current price
-            sr_features = self.sr_detector.get_features(lookback_df, current_price, lookback=100)
-
-            # Store in arrays
-            for key, value in sr_features.items():
-                sr_features_arrays[key][i] = value
+        # Support/Resistance features for each bar (rolling 100-bar window,
+        # starting after the minimum window), computed in one pass
+        sr_features_arrays = self.sr_detector.rolling_features(df, lookback=100)
 
         # Trend detection (using SMA slopes)
         sma50 = close.rolling(window=50).mean()
@@ -8,14 +8,407 @@ The goal is to improve prediction accuracy from 59.65% to 60-61% by
 incorporating multi-scale temporal patterns.
 """
 
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
-import alpaca_trade_api as tradeapi
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Tuple, Optional, Protocol
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional Alpaca import (only needed for live fetching)
+try:
+    import alpaca_trade_api as tradeapi
+    HAS_ALPACA = True
+except ImportError:
+    tradeapi = None
+    HAS_ALPACA = False
+
+logger = logging.getLogger(__name__)
+
+BAR_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# How OHLCV(+Alpaca extras) columns combine when resampling to a coarser bar
+_RESAMPLE_AGG = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum',
+    'trade_count': 'sum',
+}
+
+
+def timeframe_to_timedelta(timeframe: str) -> pd.Timedelta:
+    """
+    Convert an Alpaca timeframe string to its bar duration.
+
+    Args:
+        timeframe: e.g. '1Min', '15Min', '1Hour', '4Hour', '1Day'
+
+    Returns:
+        Bar duration
+
+    Raises:
+        ValueError: If the unit is not Min, Hour or Day
+    """
+    for unit, freq in (('Min', 'min'), ('Hour', 'h'), ('Day', 'D')):
+        if timeframe.endswith(unit) and timeframe[:-len(unit)].isdigit():
+            return pd.Timedelta(int(timeframe[:-len(unit)]), unit=freq)
+    raise ValueError(f"Unsupported timeframe '{timeframe}'")
+
+
+def add_bar_features(bars: pd.DataFrame) -> pd.DataFrame:
+    """Add returns, volatility and volume ratio columns (20-bar windows)."""
+    bars['returns'] = bars['close'].pct_change()
+    bars['volatility'] = bars['returns'].rolling(window=20).std()
+    bars['volume_ma'] = bars['volume'].rolling(window=20).mean()
+    bars['volume_ratio'] = bars['volume'] / bars['volume_ma']
+    return bars
+
+
+def resample_bars(bars: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Aggregate bars to a coarser intraday timeframe.
+
+    Buckets are left-closed and labelled by their start, aligned to midnight
+    UTC, matching how Alpaca builds minute/hour bars. Empty buckets (no
+    trades) are dropped, as the provider would not return them either.
+
+    Args:
+        bars: Bars with a tz-aware `timestamp` column, sorted ascending
+        timeframe: Target timeframe (e.g. '15Min', '1Hour')
+
+    Returns:
+        Resampled OHLCV bars (plus trade_count/vwap when present)
+    """
+    rule = timeframe_to_timedelta(timeframe)
+    indexed = bars.set_index('timestamp')
+    agg = {col: how for col, how in _RESAMPLE_AGG.items() if col in indexed.columns}
+    grouped = indexed.resample(rule, label='left', closed='left')
+    out = grouped.agg(agg)
+
+    if 'vwap' in indexed.columns:
+        notional = (indexed['vwap'] * indexed['volume']).resample(
+            rule, label='left', closed='left'
+        ).sum()
+        out['vwap'] = notional / out['volume'].where(out['volume'] > 0)
+
+    out = out.dropna(subset=['close']).reset_index()
+    return out[[col for col in bars.columns if col in out.columns]]
+
+
+class BarProvider(Protocol):
+    """Source of historical bars for MultiTimeframeLoader.
+
+    `resample_equivalent` declares that the provider's coarser intraday bars
+    equal its finer bars aggregated on clock-aligned buckets, so the loader
+    may derive them locally instead of fetching.
+    """
+
+    resample_equivalent: bool
+
+    def get_bars(
+        self, symbol: str, timeframe: str, start: datetime, end: datetime
+    ) -> pd.DataFrame:
+        """Bars in [start, end] with BAR_COLUMNS (tz-aware UTC timestamps)."""
+        ...
+
+
+class AlpacaBarProvider:
+    """BarProvider backed by one reusable Alpaca REST client."""
+
+    resample_equivalent = True
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        base_url: str = "https://paper-api.alpaca.markets",
+    ):
+        if not HAS_ALPACA:
+            raise ImportError(
+                "alpaca_trade_api module not installed. Install with: pip install alpaca-trade-api"
+            )
+        self.api = tradeapi.REST(api_key, api_secret, base_url, api_version='v2')
+
+    def get_bars(
+        self, symbol: str, timeframe: str, start: datetime, end: datetime
+    ) -> pd.DataFrame:
+        """Fetch all bars in the range (the client paginates)."""
+        bars = self.api.get_bars(
+            symbol,
+            timeframe,
+            start=start.isoformat(),
+            end=end.isoformat(),
+            limit=None,
+        ).df
+        if bars.empty:
+            return pd.DataFrame(columns=BAR_COLUMNS)
+        return bars.reset_index()
+
+
+@lru_cache(maxsize=8)
+def _alpaca_provider(api_key: str, api_secret: str, base_url: str) -> AlpacaBarProvider:
+    """Shared provider per credential set (one REST client per process)."""
+    return AlpacaBarProvider(api_key, api_secret, base_url)
+
+
+class BarCache:
+    """
+    Local parquet bar store partitioned by symbol and timeframe.
+
+    Layout: {cache_dir}/{symbol}/{timeframe}.parquet, one sorted,
+    de-duplicated series per file, replaced atomically on write.
+    """
+
+    def __init__(self, cache_dir: str = ".mtf_cache"):
+        self.cache_dir = Path(cache_dir)
+
+    def path(self, symbol: str, timeframe: str) -> Path:
+        """Parquet file for one symbol/timeframe."""
+        return self.cache_dir / symbol.upper() / f"{timeframe}.parquet"
+
+    def load(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+        """Cached bars, or None if nothing is cached."""
+        path = self.path(symbol, timeframe)
+        if not path.exists():
+            return None
+        return pd.read_parquet(path, engine='pyarrow')
+
+    def merge(self, symbol: str, timeframe: str, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge new bars into the cache (new rows win on equal timestamps).
+
+        Returns:
+            The full cached series after the merge
+        """
+        cached = self.load(symbol, timeframe)
+        if cached is not None and not cached.empty:
+            bars = pd.concat([cached, bars], ignore_index=True)
+        bars = (
+            bars.drop_duplicates(subset='timestamp', keep='last')
+            .sort_values('timestamp')
+            .reset_index(drop=True)
+        )
+
+        path = self.path(symbol, timeframe)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        bars.to_parquet(tmp_path, engine='pyarrow', compression='snappy', index=False)
+        os.replace(tmp_path, path)
+        return bars
+
+
+class MultiTimeframeLoader:
+    """
+    Cached, concurrent multi-timeframe bar loader.
+
+    - Timeframes (and symbols, via load_universe) are fetched in a thread pool
+    - Fetched bars are kept in a BarCache; later calls only request the range
+      not already cached (normally just the tail since the last cached bar,
+      which is re-fetched in case it was still forming)
+    - When the provider's bars are resample-equivalent, coarser intraday
+      timeframes are derived from the finest requested one instead of fetched
+
+    Example:
+        loader = MultiTimeframeLoader(AlpacaBarProvider(key, secret))
+        data = loader.load('SPY', ['5Min', '15Min', '1Hour'], days=60)
+    """
+
+    def __init__(
+        self,
+        provider: BarProvider,
+        cache_dir: Optional[str] = ".mtf_cache",
+        max_workers: int = 4,
+        resample: bool = True,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        """
+        Initialize loader.
+
+        Args:
+            provider: Bar source
+            cache_dir: Bar cache directory (None disables caching)
+            max_workers: Concurrent provider requests
+            resample: Derive coarser timeframes locally when equivalent
+            clock: Current time source (UTC, injectable for tests)
+        """
+        self.provider = provider
+        self.cache = BarCache(cache_dir) if cache_dir is not None else None
+        self.max_workers = max_workers
+        self.resample = resample
+        self.clock = clock
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, symbol: str, timeframe: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault((symbol.upper(), timeframe), threading.Lock())
+
+    def plan(self, timeframes: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Decide how each timeframe is obtained.
+
+        Returns:
+            Mapping timeframe -> source timeframe to resample from, or None
+            to fetch it from the provider
+        """
+        sources: Dict[str, Optional[str]] = {tf: None for tf in timeframes}
+        if not (self.resample and getattr(self.provider, 'resample_equivalent', False)):
+            return sources
+
+        # Daily bars cover the regular session only, so never derive them
+        intraday = sorted(
+            (tf for tf in timeframes if timeframe_to_timedelta(tf) < pd.Timedelta(days=1)),
+            key=timeframe_to_timedelta,
+        )
+        if not intraday:
+            return sources
+
+        finest = intraday[0]
+        finest_delta = timeframe_to_timedelta(finest)
+        for tf in intraday[1:]:
+            delta = timeframe_to_timedelta(tf)
+            if delta > finest_delta and delta % finest_delta == pd.Timedelta(0):
+                sources[tf] = finest
+        return sources
+
+    def fetch(
+        self, symbol: str, timeframe: str, start: datetime, end: datetime
+    ) -> pd.DataFrame:
+        """
+        Bars for [start, end], fetching only the range missing from the cache.
+
+        Returns:
+            Raw bars (no derived features), possibly empty
+        """
+        if self.cache is None:
+            return self._normalize(self.provider.get_bars(symbol, timeframe, start, end))
+
+        with self._lock(symbol, timeframe):
+            cached = self.cache.load(symbol, timeframe)
+            if cached is None or cached.empty:
+                ranges = [(start, end)]
+            else:
+                first, last = cached['timestamp'].iloc[0], cached['timestamp'].iloc[-1]
+                ranges = [(last.to_pydatetime(), end)]
+                if start < first:
+                    ranges.insert(0, (start, first.to_pydatetime()))
+
+            new = [
+                self._normalize(self.provider.get_bars(symbol, timeframe, s, e))
+                for s, e in ranges
+            ]
+            new = [bars for bars in new if not bars.empty]
+            if new:
+                cached = self.cache.merge(symbol, timeframe, pd.concat(new, ignore_index=True))
+            logger.debug(f"{symbol} {timeframe}: fetched {len(ranges)} range(s)")
+
+        if cached is None:
+            return pd.DataFrame(columns=BAR_COLUMNS)
+        window = (cached['timestamp'] >= start) & (cached['timestamp'] <= end)
+        return cached.loc[window].reset_index(drop=True)
+
+    @staticmethod
+    def _normalize(bars: pd.DataFrame) -> pd.DataFrame:
+        """Ensure a sorted frame with tz-aware UTC timestamps."""
+        if bars.empty:
+            return pd.DataFrame(columns=BAR_COLUMNS)
+        bars = bars.copy()
+        bars['timestamp'] = pd.to_datetime(bars['timestamp'], utc=True)
+        return bars.sort_values('timestamp').reset_index(drop=True)
+
+    def load(
+        self,
+        symbol: str,
+        timeframes: List[str],
+        days: int,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Load bars with returns/volatility/volume features for each timeframe.
+
+        Timeframes that fail to load or have no bars are left out (and
+        logged), as in fetch_aligned_multi_timeframe.
+
+        Args:
+            symbol: Stock ticker
+            timeframes: Timeframes to load (e.g. ['5Min', '15Min', '1Hour'])
+            days: Days of history ending now
+            executor: Pool to share across calls (default: a private pool)
+
+        Returns:
+            Dictionary mapping timeframe names to DataFrames
+        """
+        end = self.clock()
+        start = end - timedelta(days=days)
+        sources = self.plan(timeframes)
+        fetched_tfs = [tf for tf, source in sources.items() if source is None]
+
+        own_pool = executor is None
+        pool = executor or ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {
+                tf: pool.submit(self.fetch, symbol, tf, start, end) for tf in fetched_tfs
+            }
+            raw: Dict[str, pd.DataFrame] = {}
+            for tf, future in futures.items():
+                try:
+                    raw[tf] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {symbol} {tf}: {e}")
+        finally:
+            if own_pool:
+                pool.shutdown()
+
+        for tf, source in sources.items():
+            if source is None:
+                continue
+            if source in raw and not raw[source].empty:
+                derived = resample_bars(raw[source], tf)
+                # First bucket is partial when `start` is not on a bar boundary
+                raw[tf] = derived.loc[derived['timestamp'] >= start].reset_index(drop=True)
+            else:
+                # Finest series unavailable: fall back to fetching directly
+                try:
+                    raw[tf] = self.fetch(symbol, tf, start, end)
+                except Exception as e:
+                    logger.error(f"Failed to fetch {symbol} {tf}: {e}")
+
+        result = {}
+        for tf in timeframes:
+            bars = raw.get(tf)
+            if bars is None or bars.empty:
+                logger.warning(f"No data for {symbol} {tf}")
+                continue
+            result[tf] = add_bar_features(bars.copy())
+        return result
+
+    def load_universe(
+        self, symbols: List[str], timeframes: List[str], days: int
+    ) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """
+        Load several symbols, sharing one pool across symbols and timeframes.
+
+        Returns:
+            Mapping symbol -> (timeframe -> DataFrame)
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # Symbols are driven from an outer pool; their fetches share `pool`
+            with ThreadPoolExecutor(max_workers=max(1, min(len(symbols), self.max_workers))) as outer:
+                futures = {
+                    symbol: outer.submit(self.load, symbol, timeframes, days, pool)
+                    for symbol in symbols
+                }
+                return {symbol: future.result() for symbol, future in futures.items()}
+
 
 def fetch_aligned_multi_timeframe(
     symbol: str,
@@ -24,11 +417,16 @@ def fetch_aligned_multi_timeframe(
     days: int,
     api_key: str,
     api_secret: str,
-    base_url: str = "https://paper-api.alpaca.markets"
+    base_url: str = "https://paper-api.alpaca.markets",
+    loader: Optional[MultiTimeframeLoader] = None,
+    cache_dir: Optional[str] = ".mtf_cache",
 ) -> Dict[str, pd.DataFrame]:
     """
     Fetch multiple timeframes and align them to the primary timeframe.
 
+    Timeframes are fetched concurrently through a MultiTimeframeLoader, so
+    repeated calls only download bars newer than the local cache.
+
     Args:
         symbol: Stock ticker
         primary_timeframe: Main timeframe for predictions (e.g., '5Min')
@@ -37,53 +435,26 @@ def fetch_aligned_multi_timeframe(
         api_key: Alpaca API key
         api_secret: Alpaca API secret
         base_url: Alpaca API base URL
+        loader: Loader to use (default: Alpaca-backed loader for these credentials)
+        cache_dir: Bar cache directory for the default loader (None disables)
 
     Returns:
         Dictionary mapping timeframe names to aligned DataFrames
     """
-    api = tradeapi.REST(api_key, api_secret, base_url, api_version='v2')
-
-    # Calculate date range
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
+    if loader is None:
+        loader = MultiTimeframeLoader(
+            _alpaca_provider(api_key, api_secret, base_url), cache_dir=cache_dir
+        )
 
-    # Fetch all timeframes
-    all_data = {}
     timeframes_to_fetch = [primary_timeframe] + additional_timeframes
-
     print(f"Fetching {len(timeframes_to_fetch)} timeframes for {symbol}...")
 
+    all_data = loader.load(symbol, timeframes_to_fetch, days)
     for tf in timeframes_to_fetch:
-        print(f"  Fetching {tf}...", end=" ")
-        try:
-            bars = api.get_bars(
-                symbol,
-                tf,
-                start=start_date.strftime('%Y-%m-%d'),
-                end=end_date.strftime('%Y-%m-%d'),
-                limit=10000
-            ).df
-
-            if bars.empty:
-                print(f"WARNING: No data for {tf}")
-                continue
-
-            # Reset index to make timestamp a column
-            bars = bars.reset_index()
-            bars['timestamp'] = pd.to_datetime(bars['timestamp'])
-
-            # Calculate returns and volatility
-            bars['returns'] = bars['close'].pct_change()
-            bars['volatility'] = bars['returns'].rolling(window=20).std()
-            bars['volume_ma'] = bars['volume'].rolling(window=20).mean()
-            bars['volume_ratio'] = bars['volume'] / bars['volume_ma']
-
-            all_data[tf] = bars
-            print(f"OK ({len(bars)} bars)")
-
-        except Exception as e:
-            print(f"ERROR: {str(e)}")
-            continue
+        if tf in all_data:
+            print(f"  {tf}: OK ({len(all_data[tf])} bars)")
+        else:
+            print(f"  {tf}: WARNING: No data")
 
     if primary_timeframe not in all_data:
         raise ValueError(f"Failed to fetch primary timeframe {primary_timeframe}")
@@ -23,20 +23,39 @@ Usage:
 
     # Get features for ML
     features = detector.get_features(df, current_price)
+
+    # Per-bar features for a whole series (same values as calling
+    # get_features on every prefix, in one pass)
+    feature_arrays = detector.rolling_features(df, lookback=100)
 """
 
 from __future__ import annotations
 
 import logging
+import warnings
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 from scipy.signal import argrelextrema
 
 logger = logging.getLogger(__name__)
 
+# get_features() values when no level is found on that side
+FEATURE_DEFAULTS = {
+    'distance_to_nearest_support': -0.05,
+    'distance_to_nearest_resistance': 0.05,
+    'support_strength': 0.0,
+    'resistance_strength': 0.0,
+    'between_levels': 0.0,
+    'num_supports_below': 0,
+    'num_resistances_above': 0,
+    'avg_support_distance': -0.05,
+    'avg_resistance_distance': 0.05,
+}
+
 
 @dataclass
 class PriceLevel:
@@ -218,26 +237,47 @@ class SupportResistanceDetector:
         Returns:
             Tuple of (touch_count, bars_since_last_touch)
         """
-        touches = 0
-        last_touch_bar = len(df)
-
-        for i in range(len(df)):
-            high = df['high'].iloc[i]
-            low = df['low'].iloc[i]
-
-            # Check if price touched level within threshold
-            if level_type == 'resistance':
-                # Resistance: high should touch level
-                if abs(high - level) / level < self.touch_threshold:
-                    touches += 1
-                    last_touch_bar = len(df) - i
-            else:
-                # Support: low should touch level
-                if abs(low - level) / level < self.touch_threshold:
-                    touches += 1
-                    last_touch_bar = len(df) - i
-
-        return touches, last_touch_bar
+        # Resistance is touched by highs, support by lows
+        prices = df['high' if level_type == 'resistance' else 'low'].to_numpy(dtype=np.float64)
+        hits = self._touches(prices, np.array([level]))
+        touches, last_touch_bar = self._touch_stats(hits)
+        return int(touches[0]), int(last_touch_bar[0])
+
+    def _touches(self, prices: NDArray[np.float64], levels: NDArray[np.float64]) -> NDArray[np.bool_]:
+        """Touch matrix: [k, j] is True if bar j came within threshold of level k."""
+        return np.abs(prices[None, :] - levels[:, None]) / levels[:, None] < self.touch_threshold
+
+    @staticmethod
+    def _touch_stats(hits: NDArray[np.bool_]) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Touch count and bars since last touch (window length if never) per level."""
+        n_bars = hits.shape[1]
+        touches = hits.sum(axis=1)
+        last_index = n_bars - 1 - np.argmax(hits[:, ::-1], axis=1)
+        last_touch = np.where(touches > 0, n_bars - last_index, n_bars)
+        return touches, last_touch
+
+    def _strengths(
+        self,
+        hits: NDArray[np.bool_],
+        touches: NDArray[np.int64],
+        last_touch: NDArray[np.int64],
+        volume: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """Vectorized `_calculate_strength` for all levels of one window."""
+        touch_score = np.minimum(touches / 5.0, 1.0)
+        recency_score = np.exp(-last_touch / 50.0)
+
+        with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            avg_total_volume = np.nanmean(volume)
+            avg_level_volume = np.where(hits, volume[None, :], 0.0).sum(axis=1) / touches
+            volume_score = np.where(
+                touches > 0,
+                np.minimum(avg_level_volume / (avg_total_volume + 1e-10), 2.0) / 2.0,
+                0.5,
+            )
+
+        return touch_score * 0.4 + recency_score * 0.3 + volume_score * 0.3
 
     def _calculate_strength(
         self,
@@ -254,45 +294,15 @@ class SupportResistanceDetector:
         - Recency of last touch (recent = stronger)
         - Volume at level (high volume = stronger)
         """
-        # Touch strength (0-1)
-        touch_score = min(touches / 5.0, 1.0)
-
-        # Recency strength (0-1) - exponential decay
-        recency_score = np.exp(-last_touch_bars / 50.0)
-
-        # Volume strength (0-1)
-        # Find bars near this level and check volume
-        volume_scores = []
-        for i in range(len(df)):
-            high = df['high'].iloc[i]
-            low = df['low'].iloc[i]
-
-            # Check if this bar touched the level
-            level_touched = False
-            if level_type == 'resistance' and abs(high - level) / level < self.touch_threshold:
-                level_touched = True
-            elif level_type == 'support' and abs(low - level) / level < self.touch_threshold:
-                level_touched = True
-
-            if level_touched:
-                volume = df['volume'].iloc[i]
-                volume_scores.append(volume)
-
-        if volume_scores:
-            avg_level_volume = np.mean(volume_scores)
-            avg_total_volume = df['volume'].mean()
-            volume_score = min(avg_level_volume / (avg_total_volume + 1e-10), 2.0) / 2.0
-        else:
-            volume_score = 0.5
-
-        # Weighted combination
-        strength = (
-            touch_score * 0.4 +
-            recency_score * 0.3 +
-            volume_score * 0.3
+        prices = df['high' if level_type == 'resistance' else 'low'].to_numpy(dtype=np.float64)
+        hits = self._touches(prices, np.array([level]))
+        strength = self._strengths(
+            hits,
+            np.array([touches]),
+            np.array([last_touch_bars]),
+            df['volume'].to_numpy(dtype=np.float64),
         )
-
-        return float(strength)
+        return float(strength[0])
 
     def get_features(
         self,
@@ -319,18 +329,8 @@ class SupportResistanceDetector:
         supports = [l for l in levels if l.level_type == 'support' and l.price < current_price]
         resistances = [l for l in levels if l.level_type == 'resistance' and l.price > current_price]
 
-        # Initialize features with defaults
-        features = {
-            'distance_to_nearest_support': -0.05,  # Default 5% below
-            'distance_to_nearest_resistance': 0.05,  # Default 5% above
-            'support_strength': 0.0,
-            'resistance_strength': 0.0,
-            'between_levels': 0.0,
-            'num_supports_below': 0,
-            'num_resistances_above': 0,
-            'avg_support_distance': -0.05,
-            'avg_resistance_distance': 0.05,
-        }
+        # Initialize features with defaults (5% below / above)
+        features = dict(FEATURE_DEFAULTS)
 
         # Nearest support
         if supports:
@@ -388,3 +388,162 @@ class SupportResistanceDetector:
         resistances.sort(key=lambda x: x.price)
 
         return supports[:max_levels], resistances[:max_levels]
+
+    def rolling_features(
+        self,
+        df: pd.DataFrame,
+        lookback: int = 100,
+        min_bars: int | None = None,
+    ) -> Dict[str, NDArray[np.float64]]:
+        """Support/resistance features for every bar in one pass.
+
+        Bar i gets the same values as
+        `get_features(df.iloc[:i + 1], close[i], lookback)`, but:
+        - Swing points come from left/right "run lengths" computed once for
+          the whole series, so each window's pivots are a mask, not a
+          fresh argrelextrema scan
+        - Touches, recency and volume scores for all levels of a window are
+          computed at once by broadcasting levels against bars
+
+        Args:
+            df: OHLCV DataFrame
+            lookback: Bars per window (as in get_features)
+            min_bars: First bar to compute (earlier bars keep defaults);
+                default min(lookback, len(df))
+
+        Returns:
+            Dict of feature name -> array of shape (len(df),)
+        """
+        n = len(df)
+        features = {
+            key: np.full(n, default, dtype=np.float64)
+            for key, default in FEATURE_DEFAULTS.items()
+        }
+        if n == 0:
+            return features
+        if min_bars is None:
+            min_bars = min(lookback, n)
+
+        high, low, close, volume = (
+            pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+            for col in ('high', 'low', 'close', 'volume')
+        )
+        high_runs = self._pivot_runs(high, np.greater)
+        low_runs = self._pivot_runs(low, np.less)
+
+        for i in range(min_bars, n):
+            start = max(0, i + 1 - lookback)
+            price = close[i]
+            window_volume = volume[start:i + 1]
+
+            resistances = self._window_levels(high, high_runs, start, i, price, window_volume)
+            supports = self._window_levels(low, low_runs, start, i, price, window_volume)
+
+            support_prices, support_strengths = supports
+            below = support_prices < price
+            support_prices, support_strengths = support_prices[below], support_strengths[below]
+
+            resistance_prices, resistance_strengths = resistances
+            above = resistance_prices > price
+            resistance_prices, resistance_strengths = resistance_prices[above], resistance_strengths[above]
+
+            if len(support_prices):
+                nearest = np.argmax(support_prices)
+                features['distance_to_nearest_support'][i] = (support_prices[nearest] - price) / price
+                features['support_strength'][i] = support_strengths[nearest]
+                features['num_supports_below'][i] = len(support_prices)
+                features['avg_support_distance'][i] = np.mean((support_prices - price) / price)
+
+            if len(resistance_prices):
+                nearest = np.argmin(resistance_prices)
+                features['distance_to_nearest_resistance'][i] = (resistance_prices[nearest] - price) / price
+                features['resistance_strength'][i] = resistance_strengths[nearest]
+                features['num_resistances_above'][i] = len(resistance_prices)
+                features['avg_resistance_distance'][i] = np.mean((resistance_prices - price) / price)
+
+            if (
+                len(support_prices) and len(resistance_prices)
+                and features['support_strength'][i] > 0.6
+                and features['resistance_strength'][i] > 0.6
+            ):
+                features['between_levels'][i] = 1.0
+
+        return features
+
+    def _pivot_runs(
+        self,
+        values: NDArray[np.float64],
+        comparator: Callable[[NDArray, NDArray], NDArray[np.bool_]],
+    ) -> Tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """How many consecutive neighbours (up to swing_order) each bar beats.
+
+        Bar j is a swing point of window [a, b] (as argrelextrema with
+        order=swing_order reports it) iff a < j < b,
+        left[j] >= min(order, j - a) and right[j] >= min(order, b - j).
+
+        Returns:
+            Tuple of (left_runs, right_runs)
+        """
+        n = len(values)
+        order = self.swing_order
+        left = np.zeros((order, n), dtype=bool)
+        right = np.zeros((order, n), dtype=bool)
+        for shift in range(1, order + 1):
+            if shift >= n:
+                break
+            left[shift - 1, shift:] = comparator(values[shift:], values[:-shift])
+            right[shift - 1, :-shift] = comparator(values[:-shift], values[shift:])
+        # Run length = number of leading True values along the shift axis
+        left_runs = np.cumprod(left, axis=0).sum(axis=0)
+        right_runs = np.cumprod(right, axis=0).sum(axis=0)
+        return left_runs, right_runs
+
+    def _window_levels(
+        self,
+        prices: NDArray[np.float64],
+        runs: Tuple[NDArray[np.int64], NDArray[np.int64]],
+        start: int,
+        end: int,
+        current_price: float,
+        window_volume: NDArray[np.float64],
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Clustered levels with at least min_touches touches, and their strengths.
+
+        Args:
+            prices: Highs (resistance) or lows (support) for the whole series
+            runs: `_pivot_runs` output for `prices`
+            start: First bar of the window
+            end: Last bar of the window (inclusive)
+            current_price: Close of the last bar (clustering scale)
+            window_volume: Volume of the window bars
+
+        Returns:
+            Tuple of (level_prices, strengths)
+        """
+        left_runs, right_runs = runs
+        inner = np.arange(start + 1, end)
+        is_swing = (
+            (left_runs[inner] >= np.minimum(self.swing_order, inner - start))
+            & (right_runs[inner] >= np.minimum(self.swing_order, end - inner))
+        )
+        swings = np.sort(prices[inner[is_swing]])
+        if len(swings) == 0:
+            return np.empty(0), np.empty(0)
+
+        # Same clustering as _cluster_levels: split where consecutive sorted
+        # swings are not within cluster_threshold of the current price
+        with np.errstate(invalid='ignore', divide='ignore'):
+            same_cluster = np.abs(np.diff(swings)) / current_price < self.cluster_threshold
+        cluster_starts = np.concatenate(([0], np.flatnonzero(~same_cluster) + 1))
+        sizes = np.diff(np.append(cluster_starts, len(swings)))
+        levels = np.add.reduceat(swings, cluster_starts) / sizes
+
+        window_prices = prices[start:end + 1]
+        hits = self._touches(window_prices, levels)
+        touches, last_touch = self._touch_stats(hits)
+        keep = touches >= self.min_touches
+        if not keep.any():
+            return np.empty(0), np.empty(0)
+
+        strengths = self._strengths(hits[keep], touches[keep], last_touch[keep], window_volume)
+        return levels[keep], strengths
@@ -38,6 +38,7 @@ from __future__ import annotations
 
 import copy
 import logging
+import warnings
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
@@ -47,6 +48,7 @@ import pandas as pd
 import torch
 import torch.nn as nn
 import torch.optim as optim
+from torch.func import functional_call, grad, vmap
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +64,19 @@ class RegimeType(Enum):
     UNKNOWN = "unknown"
 
 
+# Regime code table used by the vectorized labeller
+_REGIME_CODES = (
+    RegimeType.BULL_HIGH_VOL,
+    RegimeType.BULL_LOW_VOL,
+    RegimeType.BEAR_HIGH_VOL,
+    RegimeType.BEAR_LOW_VOL,
+    RegimeType.SIDEWAYS_HIGH_VOL,
+    RegimeType.SIDEWAYS_LOW_VOL,
+    RegimeType.UNKNOWN,
+)
+_UNKNOWN_CODE = len(_REGIME_CODES) - 1
+
+
 @dataclass
 class MAMLConfig:
     """Configuration for MAML meta-learning.
@@ -74,6 +89,8 @@ class MAMLConfig:
         support_size: Samples per task for adaptation (K-shot)
         query_size: Samples per task for meta-loss evaluation
         first_order: Use first-order MAML (faster, less accurate)
+        functional_inner_loop: Adapt all tasks of a meta-batch at once with
+            torch.func instead of cloning the model per task
         device: cpu or cuda
     """
     inner_lr: float = 0.01
@@ -83,6 +100,7 @@ class MAMLConfig:
     support_size: int = 32  # K=32 for 32-shot learning
     query_size: int = 16
     first_order: bool = False  # Set True for FOMAML (faster)
+    functional_inner_loop: bool = True
     device: str = "cpu"
 
 
@@ -174,6 +192,149 @@ class MarketRegimeDetector:
         except ValueError:
             return RegimeType.UNKNOWN
 
+    def label_regimes(
+        self,
+        df: pd.DataFrame,
+        window: int = 20
+    ) -> List[RegimeType]:
+        """Label every bar with the regime `detect_regime` gives its lookback.
+
+        Single pass over the whole series: bar i gets the label that
+        `detect_regime(df.iloc[i-window:i+1], window)` returns, but SMA, true
+        range, ATR and the ATR median are computed once with rolling windows
+        instead of once per bar.
+
+        The per-slice definition has two quirks that are reproduced exactly:
+        - The slope reference `sma.iloc[-window]` sits one bar into the slice,
+          so it is only defined for window <= 2 (otherwise the slope is NaN and
+          the trend is "sideways").
+        - The slice's first true range has no previous close, so it is just
+          high - low; this only matters for the first ATR in the slice.
+
+        Args:
+            df: OHLCV DataFrame
+            window: Lookback window for regime detection
+
+        Returns:
+            One RegimeType per bar (UNKNOWN for the first `window` bars)
+        """
+        return [_REGIME_CODES[code] for code in self._regime_codes(df, window)]
+
+    def _regime_codes(self, df: pd.DataFrame, window: int) -> np.ndarray:
+        """Per-bar regime codes (indices into _REGIME_CODES); see `label_regimes`."""
+        n = len(df)
+        codes = np.full(n, _UNKNOWN_CODE, dtype=np.int8)
+        if n <= window:
+            return codes
+
+        close = pd.to_numeric(df['close'], errors='coerce')
+        high = pd.to_numeric(df['high'], errors='coerce')
+        low = pd.to_numeric(df['low'], errors='coerce')
+
+        # Trend: slope between the last SMA and the one `window - 1` bars in
+        sma = close.rolling(window).mean()
+        if window <= 2:
+            sma_ref = sma.shift(window - 1)
+        else:
+            sma_ref = pd.Series(np.nan, index=close.index)
+        slope = ((sma - sma_ref) / sma_ref / window).to_numpy()
+
+        # Volatility: true range (NaN-skipping max, as DataFrame.max does)
+        high_low = (high - low).to_numpy()
+        close_prev = close.shift(1)
+        tr = np.fmax(
+            high_low,
+            np.fmax(
+                (high - close_prev).abs().to_numpy(),
+                (low - close_prev).abs().to_numpy(),
+            ),
+        )
+        atr = pd.Series(tr).rolling(14).mean().to_numpy()
+        # First ATR inside a slice, whose oldest true range is high - low
+        atr_first = (
+            (pd.Series(high_low).shift(13) + pd.Series(tr).rolling(13).sum()) / 14
+        ).to_numpy()
+
+        idx = np.arange(window, n)
+        if window > 13:
+            current_atr = atr[idx]
+            median_atr = self._slice_atr_median(atr, atr_first, window, idx)
+        elif window == 13:
+            # The only ATR in the slice is the first one
+            current_atr = atr_first[idx]
+            median_atr = current_atr
+        else:
+            current_atr = np.full(len(idx), np.nan)
+            median_atr = current_atr
+
+        bull = slope[idx] > self.trend_threshold
+        bear = slope[idx] < -self.trend_threshold
+        high_vol = current_atr > median_atr * self.vol_multiplier
+
+        # Code = 2 * trend (bull, bear, sideways) + vol (high, low)
+        trend = np.where(bull, 0, np.where(bear, 1, 2))
+        codes[idx] = 2 * trend + np.where(high_vol, 0, 1)
+        return codes
+
+    @staticmethod
+    def _slice_atr_median(
+        atr: np.ndarray,
+        atr_first: np.ndarray,
+        window: int,
+        idx: np.ndarray,
+        chunk_size: int = 65536
+    ) -> np.ndarray:
+        """Median of the ATR values inside each bar's lookback slice.
+
+        For bar i the slice holds the adjusted first ATR (at i - window + 13)
+        followed by the regular ATRs at i - window + 14 .. i. Computed over
+        sliding-window views in chunks to bound memory.
+        """
+        width = window - 13  # regular ATRs per slice
+        views = np.lib.stride_tricks.sliding_window_view(atr, width)
+        medians = np.empty(len(idx))
+        for start in range(0, len(idx), chunk_size):
+            block = idx[start:start + chunk_size]
+            values = np.column_stack([
+                atr_first[block - window + 13],
+                views[block - width + 1],
+            ])
+            with np.errstate(all='ignore'), warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                medians[start:start + len(block)] = np.nanmedian(values, axis=1)
+        return medians
+
+    def regime_boundaries(
+        self,
+        df: pd.DataFrame,
+        window: int = 20,
+        min_segment_size: int = 50
+    ) -> List[Tuple[RegimeType, int, int]]:
+        """Find regime segments as row positions.
+
+        Args:
+            df: OHLCV DataFrame
+            window: Window for regime detection
+            min_segment_size: Minimum bars per segment
+
+        Returns:
+            List of (regime_type, start, end) with `df.iloc[start:end]` the segment
+        """
+        n = len(df)
+        if n <= window:
+            return []
+
+        codes = self._regime_codes(df, window)
+        changes = np.flatnonzero(codes[window + 1:] != codes[window:-1]) + window + 1
+        starts = np.concatenate(([window], changes))
+        ends = np.concatenate((changes, [n]))
+
+        return [
+            (_REGIME_CODES[codes[start]], int(start), int(end))
+            for start, end in zip(starts, ends)
+            if end - start >= min_segment_size
+        ]
+
     def segment_by_regime(
         self,
         df: pd.DataFrame,
@@ -182,6 +343,37 @@ class MarketRegimeDetector:
     ) -> List[Tuple[RegimeType, pd.DataFrame]]:
         """Segment historical data by regime changes.
 
+        Labels all bars in one pass (see `label_regimes`) and cuts segments at
+        label changes; equivalent to `segment_by_regime_reference`.
+
+        Args:
+            df: OHLCV DataFrame
+            window: Window for regime detection
+            min_segment_size: Minimum bars per segment
+
+        Returns:
+            List of (regime_type, data_segment) tuples
+        """
+        segments = [
+            (regime, df.iloc[start:end].copy())
+            for regime, start, end in self.regime_boundaries(df, window, min_segment_size)
+        ]
+
+        logger.info(f"Segmented data into {len(segments)} regime periods")
+
+        return segments
+
+    def segment_by_regime_reference(
+        self,
+        df: pd.DataFrame,
+        window: int = 20,
+        min_segment_size: int = 50
+    ) -> List[Tuple[RegimeType, pd.DataFrame]]:
+        """Segment historical data by regime changes, one slice per bar.
+
+        Reference implementation for `segment_by_regime` (O(n * window));
+        kept for equivalence tests.
+
         Args:
             df: OHLCV DataFrame
             window: Window for regime detection
@@ -384,6 +576,62 @@ class MAML:
 
         return adapted_model
 
+    def _task_loss(
+        self,
+        params: Dict[str, torch.Tensor],
+        buffers: Dict[str, torch.Tensor],
+        X: torch.Tensor,
+        y: torch.Tensor
+    ) -> torch.Tensor:
+        """Loss of the model evaluated with the given (per-task) parameters."""
+        logits = functional_call(self.model, (params, buffers), (X,))
+        return self.loss_fn(logits, y)
+
+    def functional_inner_loop(
+        self,
+        params: Dict[str, torch.Tensor],
+        buffers: Dict[str, torch.Tensor],
+        X_support: torch.Tensor,
+        y_support: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:
+        """Inner loop for a whole meta-batch of tasks at once.
+
+        Starts every task from the shared meta-parameters and takes
+        `inner_steps` SGD steps, vectorized over tasks with `vmap(grad(...))`.
+        The adapted parameters stay in the autograd graph of `params`: in
+        second-order mode gradients flow through the inner updates, in
+        first-order mode the inner gradients are detached (FOMAML).
+
+        Args:
+            params: Shared meta-parameters (name -> tensor)
+            buffers: Model buffers (shared by all tasks)
+            X_support: Support features stacked per task (tasks, K, features)
+            y_support: Support labels stacked per task (tasks, K)
+
+        Returns:
+            Adapted parameters with a leading task dimension
+        """
+        num_tasks = X_support.shape[0]
+        task_grad = vmap(
+            grad(self._task_loss),
+            in_dims=(0, None, 0, 0),
+            randomness="different",
+        )
+
+        adapted = {
+            name: p.unsqueeze(0).expand(num_tasks, *p.shape)
+            for name, p in params.items()
+        }
+        for _ in range(self.config.inner_steps):
+            grads = task_grad(adapted, buffers, X_support, y_support)
+            if self.config.first_order:
+                grads = {name: g.detach() for name, g in grads.items()}
+            adapted = {
+                name: adapted[name] - self.config.inner_lr * grads[name]
+                for name in adapted
+            }
+        return adapted
+
     def outer_loop(
         self,
         task_batch: List[Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]]
@@ -396,6 +644,52 @@ class MAML:
         Returns:
             Meta-loss
         """
+        if self.config.functional_inner_loop:
+            return self._outer_loop_functional(task_batch)
+        return self._outer_loop_cloned(task_batch)
+
+    def _outer_loop_functional(
+        self,
+        task_batch: List[Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]]
+    ) -> float:
+        """Outer loop with all tasks adapted in one batched functional pass.
+
+        Tasks must share support and query sizes (as TaskSampler produces).
+        """
+        X_support, y_support, X_query, y_query = (
+            torch.stack(tensors).to(self.device) for tensors in zip(*task_batch)
+        )
+
+        params = dict(self.model.named_parameters())
+        buffers = dict(self.model.named_buffers())
+
+        self.meta_optimizer.zero_grad()
+
+        adapted = self.functional_inner_loop(params, buffers, X_support, y_support)
+
+        # Evaluate each adapted task model on its query set
+        query_losses = vmap(
+            self._task_loss,
+            in_dims=(0, None, 0, 0),
+            randomness="different",
+        )(adapted, buffers, X_query, y_query)
+        meta_loss = query_losses.mean()
+
+        # Meta-optimization step
+        meta_loss.backward()
+        self.meta_optimizer.step()
+
+        return meta_loss.item()
+
+    def _outer_loop_cloned(
+        self,
+        task_batch: List[Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]]
+    ) -> float:
+        """Outer loop that deep-copies the model per task (original path).
+
+        Kept for benchmarking. Because the inner SGD steps act on cloned leaf
+        tensors, no gradient reaches the meta-parameters from this path.
+        """
         meta_loss = 0.0
 
         self.meta_optimizer.zero_grad()
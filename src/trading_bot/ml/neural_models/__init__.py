@@ -5,9 +5,21 @@ from trading_bot.ml.neural_models.hierarchical_net import (
     TimeframeEncoder,
     MultiHeadAttention,
 )
+from trading_bot.ml.neural_models.export import (
+    InferenceModel,
+    export_onnx,
+    export_torchscript,
+    load_exported,
+    load_inference_model,
+)
 
 __all__ = [
     "HierarchicalTimeframeNet",
     "TimeframeEncoder",
     "MultiHeadAttention",
+    "InferenceModel",
+    "export_onnx",
+    "export_torchscript",
+    "load_exported",
+    "load_inference_model",
 ]
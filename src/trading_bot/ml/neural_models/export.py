@@ -0,0 +1,429 @@
+"""Compiled CPU inference for trained PyTorch models.
+
+Live scoring runs every model on every bar for every watched symbol, mostly
+with batch size 1, where eager PyTorch spends more time in Python dispatch
+than in arithmetic. This module exports a trained model to a compiled graph
+and wraps it in a NumPy-in/NumPy-out predictor:
+
+- TorchScript: traced, frozen and optimized for inference (always available)
+- ONNX Runtime: CPU execution provider (requires `onnx` and `onnxruntime`)
+- Optional dynamic int8 quantization of Linear/LSTM/GRU weights
+
+`load_inference_model` exports to every available backend, rejects any whose
+outputs drift from eager PyTorch beyond a tolerance, and keeps the fastest.
+
+Usage:
+    from trading_bot.ml.neural_models import HierarchicalTimeframeNet
+    from trading_bot.ml.neural_models.export import load_inference_model
+
+    model = HierarchicalTimeframeNet()
+    model.load_state_dict(torch.load("htf.pt"))
+
+    predictor = load_inference_model(model, torch.zeros(1, 338))
+    actions, confidences = predictor.predict(features)  # features: (batch, 338)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import logging
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+import torch.nn as nn
+from numpy.typing import NDArray
+
+# Optional ONNX Runtime import
+try:
+    import onnxruntime as ort
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    ort = None
+    HAS_ONNXRUNTIME = False
+
+logger = logging.getLogger(__name__)
+
+# Backends in order of preference when not benchmarking
+BACKENDS = ("onnxruntime", "torchscript", "eager")
+
+# Default max absolute output (logit) drift vs eager PyTorch. int8 weights
+# typically move logits by ~0.1 while leaving >98% of argmax decisions intact.
+FLOAT_TOLERANCE = 1e-4
+INT8_TOLERANCE = 0.25
+
+
+class InferenceModel:
+    """NumPy-in/NumPy-out predictor backed by one inference backend.
+
+    Args:
+        backend: Backend name ("onnxruntime", "torchscript" or "eager")
+        run: Function mapping float32 inputs (batch, ...) to raw model outputs
+        quantized: Whether weights were quantized to int8
+        latency_us: Measured per-call latency on the example input (if benchmarked)
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        run: Callable[[NDArray[np.float32]], NDArray[np.float32]],
+        quantized: bool = False,
+        latency_us: Optional[float] = None,
+    ):
+        self.backend = backend
+        self._run = run
+        self.quantized = quantized
+        self.latency_us = latency_us
+
+    def __repr__(self) -> str:
+        latency = f", latency_us={self.latency_us:.0f}" if self.latency_us is not None else ""
+        return f"InferenceModel(backend={self.backend!r}, quantized={self.quantized}{latency})"
+
+    def run(self, x: Union[NDArray, torch.Tensor]) -> NDArray[np.float32]:
+        """Run the model and return its raw outputs (logits for classifiers).
+
+        Args:
+            x: Input features of shape (batch_size, ...)
+
+        Returns:
+            Model outputs of shape (batch_size, ...)
+        """
+        if isinstance(x, torch.Tensor):
+            x = x.detach().cpu().numpy()
+        return self._run(np.ascontiguousarray(x, dtype=np.float32))
+
+    __call__ = run
+
+    def predict_proba(self, x: Union[NDArray, torch.Tensor]) -> NDArray[np.float32]:
+        """Class probabilities (softmax over the last axis of the outputs).
+
+        Args:
+            x: Input features of shape (batch_size, ...)
+
+        Returns:
+            Probabilities of shape (batch_size, num_classes)
+        """
+        logits = self.run(x)
+        exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+    def predict(
+        self, x: Union[NDArray, torch.Tensor]
+    ) -> Tuple[NDArray[np.int64], NDArray[np.float32]]:
+        """Predicted class and its probability, like HierarchicalTimeframeNet.predict.
+
+        Args:
+            x: Input features of shape (batch_size, ...)
+
+        Returns:
+            Tuple of:
+            - Predicted actions of shape (batch_size,)
+            - Confidence scores of shape (batch_size,) in range [0, 1]
+        """
+        probabilities = self.predict_proba(x)
+        actions = probabilities.argmax(axis=-1)
+        confidences = np.take_along_axis(probabilities, actions[:, None], axis=-1)[:, 0]
+        return actions, confidences
+
+
+def quantize_dynamic_int8(model: nn.Module) -> nn.Module:
+    """Copy of `model` with Linear/LSTM/GRU weights dynamically quantized to int8.
+
+    Activations stay float32 and are quantized per call, so no calibration
+    data is needed. The original model is left untouched.
+
+    Args:
+        model: Trained model
+
+    Returns:
+        Quantized model in eval mode
+    """
+    with warnings.catch_warnings():
+        # Eager-mode quantization is deprecated upstream but still supported
+        warnings.simplefilter("ignore")
+        quantized = torch.ao.quantization.quantize_dynamic(
+            copy.deepcopy(model).eval(),
+            {nn.Linear, nn.LSTM, nn.GRU},
+            dtype=torch.qint8,
+        )
+    return quantized.eval()
+
+
+def export_torchscript(
+    model: nn.Module,
+    example_input: torch.Tensor,
+    path: Optional[Union[str, Path]] = None,
+    quantize: bool = False,
+) -> torch.jit.ScriptModule:
+    """Trace, freeze and optimize a model for CPU inference.
+
+    Tracing records the eval-mode graph (dropout off, batch norm using
+    running stats). The batch dimension stays dynamic; other input dimensions
+    must match `example_input`.
+
+    Args:
+        model: Trained model
+        example_input: Representative input of shape (batch_size, ...)
+        path: Optional file to save the compiled module to
+        quantize: Quantize Linear/LSTM/GRU weights to int8 first
+
+    Returns:
+        Frozen TorchScript module
+    """
+    model = quantize_dynamic_int8(model) if quantize else model.eval()
+
+    with torch.no_grad(), warnings.catch_warnings():
+        # Tracer warnings flag Python-side shape arithmetic, which is intended
+        # here; TorchScript deprecation notices are not actionable per call
+        warnings.simplefilter("ignore", torch.jit.TracerWarning)
+        warnings.simplefilter("ignore", FutureWarning)
+        traced = torch.jit.trace(model, example_input, check_trace=False)
+        compiled = torch.jit.freeze(traced)
+        if not quantize:
+            compiled = torch.jit.optimize_for_inference(compiled)
+        if path is not None:
+            torch.jit.save(compiled, str(path))
+            logger.info(f"Saved TorchScript model to {path}")
+
+    return compiled
+
+
+def export_onnx(
+    model: nn.Module,
+    example_input: torch.Tensor,
+    path: Union[str, Path],
+    quantize: bool = False,
+    opset_version: int = 17,
+) -> Path:
+    """Export a model to ONNX with a dynamic batch dimension.
+
+    Args:
+        model: Trained model
+        example_input: Representative input of shape (batch_size, ...)
+        path: Output .onnx file
+        quantize: Also write an int8 dynamically quantized copy
+            (`<name>.int8.onnx`) and return its path
+        opset_version: ONNX opset
+
+    Returns:
+        Path of the exported (or quantized) model
+
+    Raises:
+        ImportError: If onnx/onnxruntime are not installed
+    """
+    if not HAS_ONNXRUNTIME:
+        raise ImportError(
+            "onnxruntime module not installed. Install with: pip install onnx onnxruntime"
+        )
+
+    path = Path(path)
+    with torch.no_grad(), warnings.catch_warnings():
+        warnings.simplefilter("ignore", torch.jit.TracerWarning)
+        torch.onnx.export(
+            model.eval(),
+            (example_input,),
+            str(path),
+            input_names=["features"],
+            output_names=["outputs"],
+            dynamic_axes={"features": {0: "batch"}, "outputs": {0: "batch"}},
+            opset_version=opset_version,
+            dynamo=False,
+        )
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantized_path = path.with_suffix(".int8.onnx")
+        quantize_dynamic(str(path), str(quantized_path), weight_type=QuantType.QInt8)
+        path = quantized_path
+
+    logger.info(f"Exported ONNX model to {path}")
+    return path
+
+
+def _torch_runner(module: Callable[[torch.Tensor], torch.Tensor]) -> Callable:
+    """Wrap a (compiled or eager) torch module as a NumPy function."""
+
+    def run(x: NDArray[np.float32]) -> NDArray[np.float32]:
+        with torch.inference_mode():
+            return module(torch.from_numpy(x)).numpy()
+
+    return run
+
+
+def _onnx_runner(path: Union[str, Path], num_threads: Optional[int] = None) -> Callable:
+    """Open an ONNX Runtime CPU session as a NumPy function."""
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if num_threads is not None:
+        options.intra_op_num_threads = num_threads
+    session = ort.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+    input_name = session.get_inputs()[0].name
+
+    def run(x: NDArray[np.float32]) -> NDArray[np.float32]:
+        return session.run(None, {input_name: x})[0]
+
+    return run
+
+
+def load_exported(
+    path: Union[str, Path], num_threads: Optional[int] = None
+) -> InferenceModel:
+    """Load a model saved by `export_torchscript` (.pt) or `export_onnx` (.onnx).
+
+    Args:
+        path: Saved model file
+        num_threads: ONNX Runtime intra-op threads (default: runtime default)
+
+    Returns:
+        InferenceModel for the saved backend
+
+    Raises:
+        ImportError: If an .onnx file is given and onnxruntime is not installed
+    """
+    path = Path(path)
+    quantized = ".int8" in path.suffixes
+    if path.suffix == ".onnx":
+        if not HAS_ONNXRUNTIME:
+            raise ImportError(
+                "onnxruntime module not installed. Install with: pip install onnx onnxruntime"
+            )
+        return InferenceModel("onnxruntime", _onnx_runner(path, num_threads), quantized)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        module = torch.jit.load(str(path), map_location="cpu")
+    return InferenceModel("torchscript", _torch_runner(module), quantized)
+
+
+def output_drift(
+    reference: Callable[[NDArray[np.float32]], NDArray[np.float32]],
+    candidate: Callable[[NDArray[np.float32]], NDArray[np.float32]],
+    inputs: NDArray[np.float32],
+) -> float:
+    """Max absolute difference between two backends' outputs on the same inputs."""
+    return float(np.max(np.abs(reference(inputs) - candidate(inputs))))
+
+
+def _latency_us(run: Callable, x: NDArray[np.float32], runs: int) -> float:
+    """Median per-call latency in microseconds (after a short warm-up)."""
+    for _ in range(3):
+        run(x)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run(x)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings) * 1e6)
+
+
+def load_inference_model(
+    model: nn.Module,
+    example_input: torch.Tensor,
+    backends: Sequence[str] = BACKENDS,
+    quantize: bool = False,
+    max_drift: Optional[float] = None,
+    benchmark: bool = True,
+    benchmark_runs: int = 20,
+    export_dir: Optional[Union[str, Path]] = None,
+    num_threads: Optional[int] = None,
+) -> InferenceModel:
+    """Compile a model for every available backend and return the fastest.
+
+    Each candidate is checked against eager PyTorch on `example_input`;
+    backends that fail to export or drift beyond `max_drift` are skipped with
+    a warning. Eager PyTorch is always a valid fallback.
+
+    Args:
+        model: Trained model (switched to eval mode)
+        example_input: Representative input of shape (batch_size, ...); use
+            the live batch size so the benchmark reflects production calls
+        backends: Backends to consider, in order of preference
+        quantize: Quantize weights to int8 (compiled backends only)
+        max_drift: Max absolute output drift vs eager (default: 1e-4, or 0.25
+            when quantizing)
+        benchmark: Time each candidate and keep the fastest; otherwise keep
+            the first valid backend in `backends` order
+        benchmark_runs: Timed calls per backend
+        export_dir: Directory for exported files (default: a temporary
+            directory removed once the session is loaded; only needed by
+            ONNX Runtime)
+        num_threads: ONNX Runtime intra-op threads
+
+    Returns:
+        InferenceModel for the selected backend
+
+    Raises:
+        ValueError: If a backend name is unknown or no requested backend
+            produced a valid model
+    """
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        raise ValueError(f"Unknown backend(s) {sorted(unknown)}. Must be one of: {BACKENDS}")
+
+    model.eval()
+    if max_drift is None:
+        max_drift = INT8_TOLERANCE if quantize else FLOAT_TOLERANCE
+
+    x = example_input.detach().cpu().float().numpy()
+    eager_run = _torch_runner(model)
+
+    candidates: list[InferenceModel] = []
+    for backend in backends:
+        try:
+            if backend == "eager":
+                candidate = InferenceModel("eager", eager_run)
+            elif backend == "torchscript":
+                compiled = export_torchscript(model, example_input, quantize=quantize)
+                candidate = InferenceModel("torchscript", _torch_runner(compiled), quantize)
+            else:
+                if not HAS_ONNXRUNTIME:
+                    logger.debug("onnxruntime not installed, skipping ONNX backend")
+                    continue
+                # The session reads the model into memory, so a temporary
+                # directory can be removed as soon as it is created
+                output_dir = (
+                    contextlib.nullcontext(export_dir) if export_dir
+                    else tempfile.TemporaryDirectory(prefix="onnx_export_")
+                )
+                with output_dir as directory:
+                    directory = Path(directory)
+                    directory.mkdir(parents=True, exist_ok=True)
+                    onnx_path = export_onnx(
+                        model, example_input, directory / f"{type(model).__name__}.onnx", quantize
+                    )
+                    candidate = InferenceModel(
+                        "onnxruntime", _onnx_runner(onnx_path, num_threads), quantize
+                    )
+        except Exception as e:
+            logger.warning(f"Could not build {backend} backend: {e}")
+            continue
+
+        drift = output_drift(eager_run, candidate.run, x)
+        if drift > max_drift:
+            logger.warning(
+                f"Rejecting {backend} backend: output drift {drift:.2e} exceeds {max_drift:.2e}"
+            )
+            continue
+
+        if not benchmark:
+            logger.info(f"Using {backend} backend (drift={drift:.2e})")
+            return candidate
+
+        candidate.latency_us = _latency_us(candidate.run, x, benchmark_runs)
+        logger.info(
+            f"  {backend}: {candidate.latency_us:.0f}us/call, drift={drift:.2e}"
+        )
+        candidates.append(candidate)
+
+    if not candidates:
+        raise ValueError(f"No valid inference backend among {tuple(backends)}")
+
+    best = min(candidates, key=lambda c: c.latency_us)
+    logger.info(f"Using {best.backend} backend for {type(model).__name__}")
+    return best
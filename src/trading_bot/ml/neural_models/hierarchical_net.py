@@ -42,13 +42,16 @@ Usage:
 from __future__ import annotations
 
 import logging
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import numpy as np
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 
+if TYPE_CHECKING:
+    from trading_bot.ml.neural_models.export import InferenceModel
+
 logger = logging.getLogger(__name__)
 
 
@@ -471,6 +474,29 @@ class HierarchicalTimeframeNet(nn.Module):
 
         return actions, confidences
 
+    def compile_for_inference(
+        self,
+        batch_size: int = 1,
+        **kwargs,
+    ) -> "InferenceModel":
+        """Export to the fastest available CPU inference backend.
+
+        See `trading_bot.ml.neural_models.export.load_inference_model`.
+
+        Args:
+            batch_size: Typical live batch size (used for the parity check
+                and backend benchmark)
+            **kwargs: Passed to load_inference_model (backends, quantize,
+                max_drift, ...)
+
+        Returns:
+            InferenceModel with predict()/predict_proba() on NumPy arrays
+        """
+        from trading_bot.ml.neural_models.export import load_inference_model
+
+        example_input = torch.randn(batch_size, self.total_features)
+        return load_inference_model(self, example_input, **kwargs)
+
     def get_attention_weights(self, x: torch.Tensor) -> torch.Tensor:
         """Get attention weights for interpretability.
 
@@ -14,11 +14,17 @@ Usage:
 
     # Select diverse strategies for ensemble
     ensemble_set = selector.select_for_ensemble(ranked, n=5, diversity_threshold=0.3)
+
+    # ...using realized signal returns (keyed by str(strategy.id)) as well
+    ensemble_set = selector.select_for_ensemble(
+        ranked, n=5, diversity_threshold=0.3, signal_returns=returns_by_id
+    )
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -516,12 +522,128 @@ class StrategySelector:
 
         return correlation
 
+    def structural_similarity_matrix(
+        self,
+        strategies: list[MLStrategy],
+    ) -> NDArray[np.float64]:
+        """Pairwise structural correlation for a set of strategies.
+
+        Vectorized form of `calculate_strategy_correlation`: feature Jaccard
+        comes from one incidence-matrix product, and depth/complexity are
+        computed once per strategy. Off-diagonal entries equal the pairwise
+        function; strategies without gene or feature data get 0.5.
+
+        Args:
+            strategies: Strategies to compare
+
+        Returns:
+            Symmetric (n, n) matrix of correlation estimates (0-1)
+        """
+        n = len(strategies)
+        similarity = np.full((n, n), 0.5)
+
+        known = [
+            i for i, s in enumerate(strategies)
+            if s.gene is not None and s.gene.features_used
+        ]
+        if not known:
+            return similarity
+
+        genes = [strategies[i].gene for i in known]
+        vocabulary = {
+            name: j
+            for j, name in enumerate(sorted(set().union(*(g.features_used for g in genes))))
+        }
+        incidence = np.zeros((len(genes), len(vocabulary)))
+        for row, gene in enumerate(genes):
+            incidence[row, [vocabulary[f] for f in gene.features_used]] = 1.0
+
+        intersection = incidence @ incidence.T
+        sizes = incidence.sum(axis=1)
+        union = sizes[:, None] + sizes[None, :] - intersection
+        feature_similarity = intersection / union
+
+        depths = np.array([g.depth for g in genes], dtype=np.float64)
+        complexity = np.array([g.complexity_score() for g in genes])
+        depth_diff = np.abs(depths[:, None] - depths[None, :])
+        complexity_diff = np.abs(complexity[:, None] - complexity[None, :])
+        structure_similarity = 1.0 - np.minimum((depth_diff / 10.0 + complexity_diff) / 2.0, 1.0)
+
+        similarity[np.ix_(known, known)] = feature_similarity * 0.6 + structure_similarity * 0.4
+        return similarity
+
+    @staticmethod
+    def return_correlation_matrix(
+        strategies: list[MLStrategy],
+        signal_returns: Mapping[str, Any],
+    ) -> NDArray[np.float64]:
+        """Pairwise correlation of realized signal returns.
+
+        Return series are aligned on their index (missing bars count as a
+        flat, zero-return position) and correlated with a single
+        `np.corrcoef`. Negative correlation is clipped to 0 (fully diverse).
+
+        Args:
+            strategies: Strategies to compare
+            signal_returns: Return series keyed by str(strategy.id)
+
+        Returns:
+            (n, n) matrix in [0, 1]; NaN where a strategy has no series or a
+            constant one
+        """
+        n = len(strategies)
+        correlation = np.full((n, n), np.nan)
+
+        rows = [i for i, s in enumerate(strategies) if str(s.id) in signal_returns]
+        if not rows:
+            return correlation
+
+        aligned = pd.DataFrame(
+            {i: pd.Series(signal_returns[str(strategies[i].id)]) for i in rows}
+        ).fillna(0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.corrcoef(aligned.to_numpy().T)
+
+        correlation[np.ix_(rows, rows)] = np.clip(np.atleast_2d(corr), 0.0, 1.0)
+        return correlation
+
+    def similarity_matrix(
+        self,
+        strategies: list[MLStrategy],
+        signal_returns: Mapping[str, Any] | None = None,
+        return_weight: float = 0.5,
+    ) -> NDArray[np.float64]:
+        """Build the pairwise similarity matrix for one selection run.
+
+        Args:
+            strategies: Strategies to compare
+            signal_returns: Optional return series keyed by str(strategy.id)
+            return_weight: Weight of return correlation vs structural
+                similarity where both are available (0-1)
+
+        Returns:
+            Symmetric (n, n) similarity matrix (0-1)
+        """
+        similarity = self.structural_similarity_matrix(strategies)
+        if not signal_returns:
+            return similarity
+
+        returns_corr = self.return_correlation_matrix(strategies, signal_returns)
+        has_returns = ~np.isnan(returns_corr)
+        similarity[has_returns] = (
+            return_weight * returns_corr[has_returns]
+            + (1.0 - return_weight) * similarity[has_returns]
+        )
+        return similarity
+
     def select_for_ensemble(
         self,
         ranked_scores: list[StrategyScore],
         n: int = 5,
         min_score: float = 50.0,
         diversity_threshold: float = 0.5,
+        signal_returns: Mapping[str, Any] | None = None,
+        return_weight: float = 0.5,
     ) -> list[StrategyScore]:
         """Select diverse strategies for ensemble.
 
@@ -530,11 +652,17 @@ class StrategySelector:
         2. Iteratively add strategies that are least correlated with selected set
         3. Stop when N strategies selected or diversity threshold not met
 
+        Pairwise similarities are computed once (see `similarity_matrix`) and
+        each greedy step updates a running sum, so a step is O(n).
+
         Args:
             ranked_scores: Ranked strategy scores
             n: Number to select
             min_score: Minimum composite score
             diversity_threshold: Maximum average correlation allowed (0-1)
+            signal_returns: Optional realized return series keyed by
+                str(strategy.id), blended into the similarity
+            return_weight: Weight of return correlation (0-1)
 
         Returns:
             Selected diverse strategies
@@ -550,38 +678,23 @@ class StrategySelector:
             logger.info(f"Only {len(qualified)} qualified strategies, selecting all")
             return qualified
 
+        similarity = self.similarity_matrix(
+            [score.strategy for score in qualified], signal_returns, return_weight
+        )
+
         # Greedy diversity selection
-        selected = [qualified[0]]  # Start with best strategy
+        chosen = [0]  # Start with best strategy
+        similarity_sum = similarity[0].copy()
+        available = np.ones(len(qualified), dtype=bool)
+        available[0] = False
 
         logger.info(f"Starting ensemble selection: {qualified[0].strategy.name} (score={qualified[0].composite_score:.1f})")
 
-        while len(selected) < n:
-            best_candidate = None
-            best_diversity = -1.0
-
-            for candidate in qualified:
-                if candidate in selected:
-                    continue
-
-                # Calculate average correlation with selected set
-                correlations = []
-                for selected_score in selected:
-                    corr = self.calculate_strategy_correlation(
-                        candidate.strategy,
-                        selected_score.strategy
-                    )
-                    correlations.append(corr)
-
-                avg_correlation = np.mean(correlations)
-                diversity = 1.0 - avg_correlation
-
-                # Select candidate with highest diversity
-                if diversity > best_diversity:
-                    best_diversity = diversity
-                    best_candidate = candidate
-
-            if best_candidate is None:
-                break
+        while len(chosen) < n and available.any():
+            # Average correlation of each candidate with the selected set
+            diversity = np.where(available, 1.0 - similarity_sum / len(chosen), -np.inf)
+            best = int(np.argmax(diversity))
+            best_diversity = float(diversity[best])
 
             # Check diversity threshold
             if best_diversity < (1.0 - diversity_threshold):
@@ -591,13 +704,17 @@ class StrategySelector:
                 )
                 break
 
-            selected.append(best_candidate)
+            chosen.append(best)
+            available[best] = False
+            similarity_sum += similarity[best]
             logger.info(
-                f"  Added {best_candidate.strategy.name}: "
-                f"score={best_candidate.composite_score:.1f}, "
+                f"  Added {qualified[best].strategy.name}: "
+                f"score={qualified[best].composite_score:.1f}, "
                 f"diversity={best_diversity:.2f}"
             )
 
+        selected = [qualified[i] for i in chosen]
+
         logger.info(f"Selected {len(selected)} diverse strategies for ensemble")
 
         return selected
@@ -34,13 +34,21 @@ Usage:
     print(f"Average Sharpe: {results.mean_sharpe:.2f}")
     print(f"Sharpe Std: {results.sharpe_std:.2f}")
     print(f"Consistency: {results.consistency_score:.1%}")
+
+    # Train folds in 4 worker processes (seeded: identical to serial results)
+    config = WalkForwardConfig(n_workers=4, seed=42)
 """
 
 from __future__ import annotations
 
+import copy
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from multiprocessing import shared_memory
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -67,6 +75,12 @@ class WalkForwardConfig:
         early_stopping_patience: Early stopping patience in epochs (default: 5)
         early_stopping_metric: Metric to monitor ('loss' or 'sharpe', default: 'sharpe')
         device: torch device ('cpu' or 'cuda', default: 'cpu')
+        n_workers: Worker processes for fold training (default: 1 = serial)
+        torch_threads_per_worker: torch intra-op threads per worker
+            (default: CPU count divided by n_workers)
+        seed: Base random seed; per-fold seeds are spawned from
+            SeedSequence(seed) so parallel and serial runs give identical
+            results (default: None = fresh entropy, still independent per fold)
     """
 
     train_days: int = 252  # 1 year
@@ -79,6 +93,9 @@ class WalkForwardConfig:
     early_stopping_patience: int = 5
     early_stopping_metric: str = "sharpe"
     device: str = "cpu"
+    n_workers: int = 1
+    torch_threads_per_worker: Optional[int] = None
+    seed: Optional[int] = None
 
 
 @dataclass
@@ -250,9 +267,26 @@ class WalkForwardValidator:
         if not isinstance(data.index, pd.DatetimeIndex):
             raise ValueError("Data must have DatetimeIndex or date column")
 
+        return [
+            (data.iloc[train_idx], data.iloc[test_idx])
+            for train_idx, test_idx in self._split_positions(data.index)
+        ]
+
+    def _split_positions(
+        self,
+        index: pd.DatetimeIndex
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Compute walk-forward splits as row positions into `index`.
+
+        Args:
+            index: Datetime index of the data
+
+        Returns:
+            List of (train_positions, test_positions) integer arrays
+        """
         splits = []
-        start_date = data.index[0]
-        end_date = data.index[-1]
+        start_date = index[0]
+        end_date = index[-1]
 
         current_train_start = start_date
 
@@ -268,32 +302,32 @@ class WalkForwardValidator:
                 break
 
             # Extract train and test windows
-            train_data = data[
-                (data.index >= current_train_start) & (data.index <= train_end)
-            ]
-            test_data = data[
-                (data.index >= test_start) & (data.index <= test_end)
-            ]
+            train_idx = np.flatnonzero(
+                (index >= current_train_start) & (index <= train_end)
+            )
+            test_idx = np.flatnonzero(
+                (index >= test_start) & (index <= test_end)
+            )
 
             # Validate minimum size
-            if len(train_data) < self.config.min_train_days:
+            if len(train_idx) < self.config.min_train_days:
                 logger.warning(
-                    f"Insufficient training data ({len(train_data)} < {self.config.min_train_days}), "
+                    f"Insufficient training data ({len(train_idx)} < {self.config.min_train_days}), "
                     f"skipping fold"
                 )
                 current_train_start += timedelta(days=self.config.step_days)
                 continue
 
-            if len(test_data) == 0:
+            if len(test_idx) == 0:
                 logger.warning("No test data available, stopping")
                 break
 
-            splits.append((train_data, test_data))
+            splits.append((train_idx, test_idx))
 
             logger.debug(
                 f"Split {len(splits)}: Train {current_train_start.date()} to {train_end.date()} "
-                f"({len(train_data)} samples), Test {test_start.date()} to {test_end.date()} "
-                f"({len(test_data)} samples)"
+                f"({len(train_idx)} samples), Test {test_start.date()} to {test_end.date()} "
+                f"({len(test_idx)} samples)"
             )
 
             # Step forward
@@ -310,6 +344,10 @@ class WalkForwardValidator:
     ) -> WalkForwardResults:
         """Run walk-forward validation.
 
+        Features and targets are converted to NumPy arrays once; folds only
+        carry row positions. With `config.n_workers > 1` on CPU, folds are
+        trained in a process pool that reads the arrays from shared memory.
+
         Args:
             model: PyTorch model (will be cloned for each fold)
             X: Feature DataFrame
@@ -319,31 +357,62 @@ class WalkForwardValidator:
         Returns:
             WalkForwardResults with aggregated metrics
         """
-        # Combine X and y for splitting
-        data = X.copy()
-        data["__target__"] = y
+        # Align targets with feature rows, then drop to arrays (no frame copy)
+        targets = y.reindex(X.index) if isinstance(y, pd.Series) else y
+        targets = np.asarray(targets, dtype=np.int64)
+
+        if date_column in X.columns:
+            index = pd.DatetimeIndex(X[date_column])
+            features = X.drop(columns=[date_column]).to_numpy(dtype=np.float32)
+        else:
+            if not isinstance(X.index, pd.DatetimeIndex):
+                raise ValueError("Data must have DatetimeIndex or date column")
+            index = X.index
+            features = X.to_numpy(dtype=np.float32)
 
         # Generate splits
-        splits = self.generate_splits(data, date_column)
+        splits = self._split_positions(index)
 
         if len(splits) == 0:
             raise ValueError("No valid splits generated. Check data size and config.")
 
-        logger.info(f"Running walk-forward validation with {len(splits)} folds")
-
-        fold_results = []
+        n_workers = self._resolve_workers(len(splits))
+        logger.info(
+            f"Running walk-forward validation with {len(splits)} folds "
+            f"({n_workers} worker{'s' if n_workers > 1 else ''})"
+        )
 
-        for fold_idx, (train_data, test_data) in enumerate(splits):
-            logger.info(f"Processing fold {fold_idx + 1}/{len(splits)}")
+        if n_workers > 1:
+            fold_metrics = self._run_folds_parallel(model, features, targets, splits, n_workers)
+        else:
+            fold_seeds = self._fold_seeds(len(splits))
+            fold_metrics = []
+            for fold_idx, (train_idx, test_idx) in enumerate(splits):
+                logger.info(f"Processing fold {fold_idx + 1}/{len(splits)}")
+                fold_metrics.append(
+                    _train_and_evaluate_fold(
+                        self.config,
+                        model,
+                        features[train_idx],
+                        targets[train_idx],
+                        features[test_idx],
+                        targets[test_idx],
+                        fold_seeds[fold_idx],
+                    )
+                )
 
-            # Train fold
-            fold_result = self._train_and_evaluate_fold(
+        fold_results = []
+        for fold_idx, ((train_idx, test_idx), metrics) in enumerate(zip(splits, fold_metrics)):
+            fold_result = FoldResult(
                 fold_idx=fold_idx,
-                model=model,
-                train_data=train_data,
-                test_data=test_data
+                train_start=index[train_idx[0]],
+                train_end=index[train_idx[-1]],
+                test_start=index[test_idx[0]],
+                test_end=index[test_idx[-1]],
+                train_samples=len(train_idx),
+                test_samples=len(test_idx),
+                **metrics,
             )
-
             fold_results.append(fold_result)
 
             logger.info(
@@ -358,140 +427,84 @@ class WalkForwardValidator:
 
         return results
 
-    def _train_and_evaluate_fold(
+    def _fold_seeds(self, num_folds: int) -> List[np.random.SeedSequence]:
+        """
+        Independent seed per fold, spawned from the configured seed.
+
+        Unseeded runs draw fresh entropy, so forked workers never share the
+        inherited global RNG state.
+        """
+        return np.random.SeedSequence(self.config.seed).spawn(num_folds)
+
+    def _resolve_workers(self, num_folds: int) -> int:
+        """Number of worker processes to use (1 = run serially in-process)."""
+        if self.config.n_workers <= 1 or num_folds <= 1:
+            return 1
+        if self.device.type != "cpu":
+            logger.warning("Parallel folds are CPU-only; running folds serially on %s", self.device)
+            return 1
+        return min(self.config.n_workers, num_folds)
+
+    def _run_folds_parallel(
         self,
-        fold_idx: int,
         model: nn.Module,
-        train_data: pd.DataFrame,
-        test_data: pd.DataFrame
-    ) -> FoldResult:
-        """Train and evaluate a single fold.
+        features: np.ndarray,
+        targets: np.ndarray,
+        splits: List[Tuple[np.ndarray, np.ndarray]],
+        n_workers: int
+    ) -> List[Dict[str, Any]]:
+        """Train folds in a process pool over shared-memory arrays.
 
-        Args:
-            fold_idx: Fold index
-            model: Model to train (will be cloned)
-            train_data: Training data
-            test_data: Test data
+        Features and targets are copied into shared memory once; each worker
+        attaches to them read-only and receives only the model (once, at
+        startup) and per-fold row positions.
 
         Returns:
-            FoldResult with metrics
+            Fold metric dicts in fold order
         """
-        import time
-        start_time = time.time()
-
-        # Extract features and targets
-        y_train = train_data["__target__"].values
-        X_train = train_data.drop(columns=["__target__"]).values
-
-        y_test = test_data["__target__"].values
-        X_test = test_data.drop(columns=["__target__"]).values
-
-        # Convert to tensors
-        X_train_tensor = torch.FloatTensor(X_train).to(self.device)
-        y_train_tensor = torch.LongTensor(y_train).to(self.device)
-        X_test_tensor = torch.FloatTensor(X_test).to(self.device)
-        y_test_tensor = torch.LongTensor(y_test).to(self.device)
-
-        # Clone model for this fold
-        import copy
-        fold_model = copy.deepcopy(model).to(self.device)
-
-        # Create data loaders
-        train_dataset = TensorDataset(X_train_tensor, y_train_tensor)
-        train_loader = DataLoader(
-            train_dataset,
-            batch_size=self.config.batch_size,
-            shuffle=True
-        )
-
-        # Optimizer and loss
-        optimizer = torch.optim.Adam(fold_model.parameters(), lr=self.config.learning_rate)
-        criterion = nn.CrossEntropyLoss()
-
-        # Training loop with early stopping
-        best_metric = -np.inf
-        patience_counter = 0
-        train_loss = 0.0
-
-        for epoch in range(self.config.epochs):
-            fold_model.train()
-            epoch_loss = 0.0
-
-            for batch_X, batch_y in train_loader:
-                optimizer.zero_grad()
-                outputs = fold_model(batch_X)
-                loss = criterion(outputs, batch_y)
-                loss.backward()
-                optimizer.step()
-
-                epoch_loss += loss.item()
-
-            train_loss = epoch_loss / len(train_loader)
-
-            # Early stopping check (simplified - could use validation set)
-            if self.config.early_stopping_metric == "loss":
-                metric = -train_loss  # Negate so higher is better
-            else:
-                metric = best_metric  # Simplified - use best so far
-
-            if metric > best_metric:
-                best_metric = metric
-                patience_counter = 0
-            else:
-                patience_counter += 1
-
-            if patience_counter >= self.config.early_stopping_patience:
-                logger.debug(f"Early stopping at epoch {epoch + 1}")
-                break
-
-        # Evaluate on test set
-        fold_model.eval()
-        with torch.no_grad():
-            test_outputs = fold_model(X_test_tensor)
-            test_loss = criterion(test_outputs, y_test_tensor).item()
-            test_predictions = torch.argmax(test_outputs, dim=1).cpu().numpy()
-
-        # Calculate trading metrics
-        sharpe, max_dd, total_return, win_rate, num_trades = self._calculate_trading_metrics(
-            test_predictions,
-            y_test
+        threads = self.config.torch_threads_per_worker or max(
+            1, (os.cpu_count() or 1) // n_workers
         )
-
-        training_time = time.time() - start_time
-
-        return FoldResult(
-            fold_idx=fold_idx,
-            train_start=train_data.index[0],
-            train_end=train_data.index[-1],
-            test_start=test_data.index[0],
-            test_end=test_data.index[-1],
-            train_samples=len(train_data),
-            test_samples=len(test_data),
-            train_loss=train_loss,
-            test_loss=test_loss,
-            sharpe_ratio=sharpe,
-            max_drawdown=max_dd,
-            total_return=total_return,
-            win_rate=win_rate,
-            num_trades=num_trades,
-            training_time=training_time
-        )
-
+        shared, specs = _share_arrays({"features": features, "targets": targets})
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_fold_worker,
+                initargs=(self.config, model, specs, threads),
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        _run_fold_in_worker,
+                        train_idx,
+                        test_idx,
+                        fold_seed,
+                    )
+                    for (train_idx, test_idx), fold_seed in zip(splits, self._fold_seeds(len(splits)))
+                ]
+                return [future.result() for future in futures]
+        finally:
+            for shm in shared:
+                shm.close()
+                shm.unlink()
+
+    @staticmethod
     def _calculate_trading_metrics(
-        self,
         predictions: np.ndarray,
-        actuals: np.ndarray
+        actuals: np.ndarray,
+        rng: Optional[np.random.Generator] = None
     ) -> Tuple[float, float, float, float, int]:
         """Calculate trading performance metrics.
 
         Args:
             predictions: Model predictions (0=Buy, 1=Hold, 2=Sell)
             actuals: Actual labels (same encoding)
+            rng: Random generator for simulated trade returns (default: global)
 
         Returns:
             Tuple of (sharpe_ratio, max_drawdown, total_return, win_rate, num_trades)
         """
         # Simulate trades based on predictions
+        rng = rng if rng is not None else np.random
         returns = []
         trades = []
         position = 0  # 0=flat, 1=long
@@ -508,7 +521,7 @@ class WalkForwardValidator:
             # Exit: Sell signal and have position
             elif pred == 2 and position == 1:
                 # Calculate return (simplified - assume constant returns)
-                trade_return = np.random.normal(0.01, 0.02)  # Placeholder - should use actual price data
+                trade_return = rng.normal(0.01, 0.02)  # Placeholder - should use actual price data
                 returns.append(trade_return)
                 trades.append(trade_return)
                 position = 0
@@ -537,3 +550,190 @@ class WalkForwardValidator:
         win_rate = wins / len(returns_array) if len(returns_array) > 0 else 0.0
 
         return float(sharpe), float(max_dd), float(total_return), float(win_rate), len(trades)
+
+
+def _train_and_evaluate_fold(
+    config: WalkForwardConfig,
+    model: nn.Module,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    seed: Optional[np.random.SeedSequence] = None
+) -> Dict[str, Any]:
+    """Train and evaluate a single fold.
+
+    Module-level so it runs identically in-process and in pool workers.
+
+    Args:
+        config: Validation configuration
+        model: Model to train (will be cloned)
+        X_train: Training features
+        y_train: Training labels
+        X_test: Test features
+        y_test: Test labels
+        seed: Fold seed for batch shuffling and simulated returns (None =
+            fresh entropy). Only local generators are seeded, so the caller's
+            global torch/numpy RNG state is left untouched (dropout, if the
+            model uses it, still draws from the global torch RNG).
+
+    Returns:
+        Dict of FoldResult metric fields (losses, trading metrics, training_time)
+    """
+    start_time = time.time()
+    device = torch.device(config.device)
+
+    seed = seed if seed is not None else np.random.SeedSequence()
+    generator = torch.Generator().manual_seed(int(seed.generate_state(1, dtype=np.uint64)[0]))
+    rng = np.random.default_rng(seed)
+
+    # Convert to tensors
+    X_train_tensor = torch.from_numpy(np.ascontiguousarray(X_train, dtype=np.float32)).to(device)
+    y_train_tensor = torch.from_numpy(np.ascontiguousarray(y_train, dtype=np.int64)).to(device)
+    X_test_tensor = torch.from_numpy(np.ascontiguousarray(X_test, dtype=np.float32)).to(device)
+    y_test_tensor = torch.from_numpy(np.ascontiguousarray(y_test, dtype=np.int64)).to(device)
+
+    # Clone model for this fold
+    fold_model = copy.deepcopy(model).to(device)
+
+    # Create data loaders
+    train_dataset = TensorDataset(X_train_tensor, y_train_tensor)
+    train_loader = DataLoader(
+        train_dataset,
+        batch_size=config.batch_size,
+        shuffle=True,
+        generator=generator
+    )
+
+    # Optimizer and loss
+    optimizer = torch.optim.Adam(fold_model.parameters(), lr=config.learning_rate)
+    criterion = nn.CrossEntropyLoss()
+
+    # Training loop with early stopping
+    best_metric = -np.inf
+    patience_counter = 0
+    train_loss = 0.0
+
+    for epoch in range(config.epochs):
+        fold_model.train()
+        epoch_loss = 0.0
+
+        for batch_X, batch_y in train_loader:
+            optimizer.zero_grad()
+            outputs = fold_model(batch_X)
+            loss = criterion(outputs, batch_y)
+            loss.backward()
+            optimizer.step()
+
+            epoch_loss += loss.item()
+
+        train_loss = epoch_loss / len(train_loader)
+
+        # Early stopping check (simplified - could use validation set)
+        if config.early_stopping_metric == "loss":
+            metric = -train_loss  # Negate so higher is better
+        else:
+            metric = best_metric  # Simplified - use best so far
+
+        if metric > best_metric:
+            best_metric = metric
+            patience_counter = 0
+        else:
+            patience_counter += 1
+
+        if patience_counter >= config.early_stopping_patience:
+            logger.debug(f"Early stopping at epoch {epoch + 1}")
+            break
+
+    # Evaluate on test set
+    fold_model.eval()
+    with torch.no_grad():
+        test_outputs = fold_model(X_test_tensor)
+        test_loss = criterion(test_outputs, y_test_tensor).item()
+        test_predictions = torch.argmax(test_outputs, dim=1).cpu().numpy()
+
+    # Calculate trading metrics
+    sharpe, max_dd, total_return, win_rate, num_trades = (
+        WalkForwardValidator._calculate_trading_metrics(test_predictions, y_test, rng)
+    )
+
+    return {
+        "train_loss": train_loss,
+        "test_loss": test_loss,
+        "sharpe_ratio": sharpe,
+        "max_drawdown": max_dd,
+        "total_return": total_return,
+        "win_rate": win_rate,
+        "num_trades": num_trades,
+        "training_time": time.time() - start_time,
+    }
+
+
+# Shared-memory plumbing for parallel folds
+
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _share_arrays(
+    arrays: Dict[str, np.ndarray]
+) -> Tuple[List[shared_memory.SharedMemory], Dict[str, ArraySpec]]:
+    """Copy arrays into shared memory blocks.
+
+    Returns:
+        (blocks to close/unlink when done, {name: (block name, shape, dtype)})
+    """
+    blocks = []
+    specs = {}
+    try:
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            blocks.append(shm)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+            specs[name] = (shm.name, array.shape, array.dtype.str)
+    except BaseException:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+        raise
+    return blocks, specs
+
+
+def _init_fold_worker(
+    config: WalkForwardConfig,
+    model: nn.Module,
+    specs: Dict[str, ArraySpec],
+    torch_threads: int
+) -> None:
+    """Pool initializer: limit torch threads and attach shared arrays read-only."""
+    torch.set_num_threads(torch_threads)
+    _worker_state["config"] = config
+    _worker_state["model"] = model
+    _worker_state["blocks"] = []
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _worker_state["blocks"].append(shm)  # keep mapping alive
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        array.flags.writeable = False
+        _worker_state[name] = array
+
+
+def _run_fold_in_worker(
+    train_idx: np.ndarray,
+    test_idx: np.ndarray,
+    seed: np.random.SeedSequence
+) -> Dict[str, Any]:
+    """Pool task: train one fold from the worker's shared arrays."""
+    features = _worker_state["features"]
+    targets = _worker_state["targets"]
+    return _train_and_evaluate_fold(
+        _worker_state["config"],
+        _worker_state["model"],
+        features[train_idx],
+        targets[train_idx],
+        features[test_idx],
+        targets[test_idx],
+        seed,
+    )
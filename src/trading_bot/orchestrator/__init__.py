@@ -16,6 +16,16 @@ from trading_bot.orchestrator.scheduler import (
     ScheduledTask
 )
 
+from trading_bot.orchestrator.heap_scheduler import (
+    HeapScheduler,
+    OverlapPolicy
+)
+
+from trading_bot.orchestrator.position_monitor import (
+    ExitLevelTable,
+    PositionMonitor
+)
+
 from trading_bot.orchestrator.trading_orchestrator import TradingOrchestrator
 
 __all__ = [
@@ -25,5 +35,9 @@ __all__ = [
     "WorkflowStateMachine",
     "TradingScheduler",
     "ScheduledTask",
+    "HeapScheduler",
+    "OverlapPolicy",
+    "ExitLevelTable",
+    "PositionMonitor",
     "TradingOrchestrator",
 ]
@@ -19,12 +19,14 @@ import sys
 import json
 import logging
 import os
-from datetime import datetime, timedelta, UTC
+from datetime import datetime, UTC
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from dataclasses import dataclass, asdict
 import statistics
 
+import numpy as np
+
 # Import historical data manager directly to avoid circular import in backtest.__init__
 import importlib.util
 _hdm_path = os.path.join(os.path.dirname(__file__), '..', 'backtest', 'historical_data_manager.py')
@@ -33,6 +35,12 @@ _hdm_module = importlib.util.module_from_spec(_hdm_spec)
 _hdm_spec.loader.exec_module(_hdm_module)
 HistoricalDataManager = _hdm_module.HistoricalDataManager
 
+_utils_path = os.path.join(os.path.dirname(__file__), '..', 'backtest', 'utils.py')
+_utils_spec = importlib.util.spec_from_file_location("backtest_utils", _utils_path)
+_utils_module = importlib.util.module_from_spec(_utils_spec)
+_utils_spec.loader.exec_module(_utils_module)
+trading_calendar = _utils_module.trading_calendar
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -91,7 +99,8 @@ class LLMBacktestHarness:
     """
 
     def __init__(self, start_date: str, end_date: str, symbols: List[str],
-                 initial_capital: float = 10000.0):
+                 initial_capital: float = 10000.0,
+                 data_manager: Optional[Any] = None):
         """
         Initialize backtest harness.
 
@@ -100,6 +109,7 @@ class LLMBacktestHarness:
             end_date: End date (YYYY-MM-DD)
             symbols: List of symbols to test
             initial_capital: Starting capital
+            data_manager: Historical data source (default: Alpaca-backed HistoricalDataManager)
         """
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
@@ -116,17 +126,21 @@ class LLMBacktestHarness:
         logger.info(f"Initial capital: ${initial_capital:,.2f}")
 
         # Initialize historical data manager with Alpaca integration
-        logger.info("Initializing historical data manager with Alpaca API...")
-        self.data_manager = HistoricalDataManager(
-            api_key=os.getenv('ALPACA_API_KEY'),
-            api_secret=os.getenv('ALPACA_SECRET_KEY'),
-            cache_dir=".backtest_cache",
-            cache_enabled=True
-        )
+        if data_manager is None:
+            logger.info("Initializing historical data manager with Alpaca API...")
+            data_manager = HistoricalDataManager(
+                api_key=os.getenv('ALPACA_API_KEY'),
+                api_secret=os.getenv('ALPACA_SECRET_KEY'),
+                cache_dir=".backtest_cache",
+                cache_enabled=True
+            )
+        self.data_manager = data_manager
 
         # Pre-fetch all historical data for symbols
         logger.info("Pre-fetching historical data (this may take a minute)...")
-        self.historical_data: Dict[str, Dict] = {}
+        # Per-symbol sorted daily dates (datetime64[D]) and closes for searchsorted lookups
+        self.bar_dates: Dict[str, np.ndarray] = {}
+        self.bar_closes: Dict[str, np.ndarray] = {}
         for symbol in self.symbols:
             logger.info(f"  Fetching {symbol}...")
             try:
@@ -135,17 +149,48 @@ class LLMBacktestHarness:
                     start_date=self.start_date.replace(tzinfo=UTC),
                     end_date=self.end_date.replace(tzinfo=UTC)
                 )
-                # Convert to dict keyed by date for fast lookup
-                self.historical_data[symbol] = {
-                    bar.timestamp.date(): bar for bar in bars
-                }
+                self._index_bars(symbol, bars)
                 logger.info(f"  Loaded {len(bars)} bars for {symbol}")
             except Exception as e:
                 logger.error(f"  Failed to fetch data for {symbol}: {e}")
-                self.historical_data[symbol] = {}
+                self._index_bars(symbol, [])
 
         logger.info("Historical data pre-fetch complete!")
 
+    def _index_bars(self, symbol: str, bars: List[Any]):
+        """Store a symbol's bars as sorted date/close arrays (last bar per date wins)."""
+        dates = np.array([bar.timestamp.date() for bar in bars], dtype="datetime64[D]")
+        closes = np.array([float(bar.close) for bar in bars], dtype=np.float64)
+
+        order = np.argsort(dates, kind="stable")
+        dates, closes = dates[order], closes[order]
+        if len(dates):
+            last_of_day = np.append(dates[1:] != dates[:-1], True)
+            dates, closes = dates[last_of_day], closes[last_of_day]
+
+        self.bar_dates[symbol] = dates
+        self.bar_closes[symbol] = closes
+
+    def _price_matrix(self, days: np.ndarray) -> np.ndarray:
+        """
+        Last known close on or before each day, for every symbol.
+
+        Args:
+            days: Sorted datetime64[D] dates
+
+        Returns:
+            (len(days), len(symbols)) float array, NaN where no earlier bar exists
+        """
+        prices = np.full((len(days), len(self.symbols)), np.nan)
+        for col, symbol in enumerate(self.symbols):
+            dates = self.bar_dates.get(symbol)
+            if dates is None or not len(dates):
+                continue
+            idx = np.searchsorted(dates, days, side="right") - 1
+            known = idx >= 0
+            prices[known, col] = self.bar_closes[symbol][idx[known]]
+        return prices
+
     def simulate_screening(self, date: str) -> List[str]:
         """
         Simulate pre-market screening.
@@ -362,25 +407,15 @@ class LLMBacktestHarness:
         Returns:
             Dict mapping symbol to close price
         """
-        date_obj = datetime.strptime(date, "%Y-%m-%d").date()
+        # Use last known price if date not found (weekends/holidays)
+        row = self._price_matrix(np.array([date], dtype="datetime64[D]"))[0]
 
         prices = {}
-        for symbol in self.symbols:
-            if symbol in self.historical_data:
-                bar = self.historical_data[symbol].get(date_obj)
-                if bar:
-                    prices[symbol] = float(bar.close)
-                else:
-                    # Use last known price if date not found (weekends/holidays)
-                    recent_bars = sorted(
-                        [(d, b) for d, b in self.historical_data[symbol].items() if d < date_obj],
-                        key=lambda x: x[0],
-                        reverse=True
-                    )
-                    if recent_bars:
-                        prices[symbol] = float(recent_bars[0][1].close)
-                    else:
-                        logger.warning(f"No historical data available for {symbol} on or before {date}")
+        for symbol, price in zip(self.symbols, row):
+            if np.isnan(price):
+                logger.warning(f"No historical data available for {symbol} on or before {date}")
+                continue
+            prices[symbol] = float(price)
 
         return prices
 
@@ -388,21 +423,24 @@ class LLMBacktestHarness:
         """Run the backtest simulation."""
         logger.info("Starting backtest simulation...")
 
-        current_date = self.start_date
-        trading_days = 0
-
-        while current_date <= self.end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
+        # Trading days (weekends and market holidays excluded) and their prices
+        days = trading_calendar(self.start_date, self.end_date)
+        price_matrix = self._price_matrix(days)
+        columns = {symbol: col for col, symbol in enumerate(self.symbols)}
 
-            # Skip weekends (simplified)
-            if current_date.weekday() >= 5:
-                current_date += timedelta(days=1)
-                continue
-
-            trading_days += 1
+        # Daily capital and open position snapshots for the equity curve
+        capital = np.empty(len(days))
+        shares = np.zeros(price_matrix.shape)
+        entry_prices = np.zeros(price_matrix.shape)
+        open_counts = np.zeros(len(days), dtype=np.int64)
 
+        for day, date_str in enumerate(days.astype(str).tolist()):
             # Get price data from real historical data
-            price_data = self.get_price_data(date_str)
+            price_data = {
+                symbol: float(price)
+                for symbol, price in zip(self.symbols, price_matrix[day])
+                if not np.isnan(price)
+            }
 
             # Monitor existing positions first
             self.monitor_positions(date_str, price_data)
@@ -429,20 +467,27 @@ class LLMBacktestHarness:
                 # Execute
                 self.execute_trade(optimization, analysis, date_str)
 
-            # Track equity
-            total_equity = self.capital
+            # Snapshot state for equity tracking
+            capital[day] = self.capital
+            open_counts[day] = len(self.open_positions)
             for trade in self.open_positions.values():
-                current_price = price_data.get(trade.symbol, trade.entry_price)
-                total_equity += current_price * trade.shares
-
-            self.equity_curve.append({
-                "date": date_str,
-                "capital": self.capital,
-                "equity": total_equity,
-                "open_positions": len(self.open_positions)
-            })
-
-            current_date += timedelta(days=1)
+                col = columns[trade.symbol]
+                shares[day, col] = trade.shares
+                entry_prices[day, col] = trade.entry_price
+
+        # Equity = cash + open positions marked at last known close (entry price if none)
+        marks = np.where(np.isnan(price_matrix), entry_prices, price_matrix)
+        equity = capital + np.where(shares > 0, marks * shares, 0.0).sum(axis=1)
+        self.equity_curve.extend(
+            {
+                "date": str(date),
+                "capital": float(cash),
+                "equity": float(total),
+                "open_positions": int(count)
+            }
+            for date, cash, total, count in zip(days.astype(str), capital, equity, open_counts)
+        )
+        trading_days = len(days)
 
         # Close any remaining positions at end date
         final_prices = self.get_price_data(self.end_date.strftime("%Y-%m-%d"))
@@ -498,20 +543,19 @@ class LLMBacktestHarness:
         else:
             sharpe_ratio = 0.0
 
-        # Max drawdown
-        peak = self.initial_capital
+        # Max drawdown (running peak starts at initial capital)
         max_drawdown = 0.0
         max_drawdown_percent = 0.0
 
-        for point in self.equity_curve:
-            equity = point["equity"]
-            if equity > peak:
-                peak = equity
-            drawdown = peak - equity
-            drawdown_percent = (drawdown / peak) * 100 if peak > 0 else 0.0
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-                max_drawdown_percent = drawdown_percent
+        equity = np.array([point["equity"] for point in self.equity_curve], dtype=np.float64)
+        if len(equity):
+            peaks = np.maximum.accumulate(np.maximum(equity, self.initial_capital))
+            drawdowns = peaks - equity
+            worst = int(np.argmax(drawdowns))
+            if drawdowns[worst] > 0:
+                max_drawdown = float(drawdowns[worst])
+                peak = peaks[worst]
+                max_drawdown_percent = float((max_drawdown / peak) * 100) if peak > 0 else 0.0
 
         return BacktestMetrics(
             total_trades=total_trades,
@@ -6,14 +6,19 @@ Crypto Trading Orchestrator
 Coordinates screening every 2hrs, position monitoring every 5min.
 """
 
-import time
 import logging
 import os
 import pandas as pd
 from datetime import datetime
 from typing import Optional, Any, List, Dict
 
-from trading_bot.orchestrator.interval_scheduler import IntervalScheduler
+from trading_bot.orchestrator.crypto_screener import (
+    WideBars,
+    build_technical_indicators,
+    rank_liquid_candidates,
+)
+from trading_bot.orchestrator.heap_scheduler import HeapScheduler
+from trading_bot.orchestrator.position_monitor import ExitSignal, PositionMonitor
 
 # Alpaca trading client for order placement
 from alpaca.trading.client import TradingClient
@@ -52,6 +57,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Hourly bars for screening indicators (SMA 200 needs 200 bars; 9 days = 216)
+SCREENING_BAR_LIMIT = 200
+SCREENING_BAR_DAYS = 9
+
 
 class CryptoOrchestrator:
     """
@@ -94,13 +103,17 @@ class CryptoOrchestrator:
         is_paper = (mode == "paper")
         self.trading_client = TradingClient(api_key=api_key, secret_key=secret_key, paper=is_paper)
 
-        # Initialize interval scheduler
-        self.scheduler = IntervalScheduler()
+        # Initialize interval scheduler (one worker: workflows share active_positions)
+        self.scheduler = HeapScheduler(max_workers=1)
 
         # Runtime state
         self.running = False
         self.active_positions = []
         self.watchlist = []
+        self._screening_bars: Dict[str, List[Any]] = {}
+
+        # Vectorized stop evaluation and concurrent exit submission
+        self.position_monitor = PositionMonitor()
 
         # Portfolio tracking (for multi-agent position sizing)
         self.portfolio_value = 10000.0  # Default $10k for crypto portfolio
@@ -225,34 +238,16 @@ class CryptoOrchestrator:
         logger.info("🔍 Starting AI-powered crypto screening...")
 
         try:
-            # Initial liquidity filtering
-            liquid_candidates = []
-
-            for symbol in self.config.symbols:
-                try:
-                    # Get current crypto quote
-                    quote = self.crypto_data.get_latest_quote(symbol)
-                    if not quote:
-                        logger.debug(f"No quote data for {symbol}")
-                        continue
-
-                    price = (quote.bid + quote.ask) / 2.0
-                    spread_pct = ((quote.ask - quote.bid) / price) * 100 if price > 0 else 999
-
-                    # Basic liquidity filter (price > $0.10, spread < 2%, has volume)
-                    if price > 0.10 and spread_pct < 2.0 and quote.bid_size > 0 and quote.ask_size > 0:
-                        liquid_candidates.append({
-                            "symbol": symbol,
-                            "price": price,
-                            "spread_pct": spread_pct,
-                            "bid_size": quote.bid_size,
-                            "ask_size": quote.ask_size
-                        })
-                        logger.info(f"Liquid candidate: {symbol} @ ${price:.4f} (spread {spread_pct:.2f}%)")
+            # One multi-symbol quote request, filtered and ranked in one pass
+            symbols = list(self.config.symbols)
+            quotes = self.crypto_data.get_multi_symbol_quotes(symbols)
+            liquid_candidates = rank_liquid_candidates(symbols, quotes)
 
-                except Exception as e:
-                    logger.warning(f"Failed to screen {symbol}: {e}")
-                    continue
+            for candidate in liquid_candidates:
+                logger.info(
+                    f"Liquid candidate: {candidate['symbol']} @ ${candidate['price']:.4f} "
+                    f"(spread {candidate['spread_pct']:.2f}%)"
+                )
 
             if not liquid_candidates:
                 logger.info("No liquid candidates found")
@@ -264,94 +259,13 @@ class CryptoOrchestrator:
 
             if self.multi_agent_workflow:
                 logger.info(f"🤖 AI evaluating {len(liquid_candidates)} candidates with multi-agent consensus...")
+                indicators_by_symbol = self._screen_indicators(liquid_candidates)
 
                 for candidate in liquid_candidates:
                     try:
                         symbol = candidate["symbol"]
                         price = candidate["price"]
-
-                        # Build technical indicators for multi-agent evaluation
-                        # Fetch real historical data to calculate proper indicators
-                        try:
-                            historical_df = self.crypto_data.get_historical_bars(
-                                symbol=symbol,
-                                timeframe="1h",
-                                limit=200  # Need enough data for 200 SMA
-                            )
-
-                            if historical_df is not None and len(historical_df) >= 50:
-                                # Calculate real technical indicators
-                                close_prices = historical_df['close']
-                                high_prices = historical_df['high']
-                                low_prices = historical_df['low']
-                                volumes = historical_df['volume']
-
-                                # RSI (14-period)
-                                delta = close_prices.diff()
-                                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                                rs = gain / loss
-                                rsi = 100 - (100 / (1 + rs))
-
-                                # Moving averages
-                                sma_20 = close_prices.rolling(window=20).mean()
-                                sma_50 = close_prices.rolling(window=50).mean()
-                                sma_200 = close_prices.rolling(window=200).mean() if len(close_prices) >= 200 else None
-
-                                # ATR (14-period)
-                                high_low = high_prices - low_prices
-                                high_close = abs(high_prices - close_prices.shift())
-                                low_close = abs(low_prices - close_prices.shift())
-                                true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-                                atr = true_range.rolling(window=14).mean()
-
-                                # Volume trend (20-period average)
-                                volume_sma = volumes.rolling(window=20).mean()
-
-                                technical_indicators = {
-                                    "price": price,
-                                    "spread_pct": candidate["spread_pct"],
-                                    "bid_size": candidate["bid_size"],
-                                    "ask_size": candidate["ask_size"],
-                                    "liquidity_score": 100 - (candidate["spread_pct"] * 10),
-                                    # Real technical indicators
-                                    "RSI": float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0,
-                                    "SMA_20": float(sma_20.iloc[-1]) if not pd.isna(sma_20.iloc[-1]) else price,
-                                    "SMA_50": float(sma_50.iloc[-1]) if not pd.isna(sma_50.iloc[-1]) else price,
-                                    "SMA_200": float(sma_200.iloc[-1]) if sma_200 is not None and not pd.isna(sma_200.iloc[-1]) else None,
-                                    "ATR": float(atr.iloc[-1]) if not pd.isna(atr.iloc[-1]) else price * 0.05,
-                                    "volume": float(volumes.iloc[-1]),
-                                    "volume_sma": float(volume_sma.iloc[-1]) if not pd.isna(volume_sma.iloc[-1]) else float(volumes.iloc[-1]),
-                                    "ADX": 25.0  # TODO: Calculate ADX when needed
-                                }
-                            else:
-                                # Fallback to placeholder if insufficient data
-                                logger.warning(f"{symbol}: Insufficient historical data, using placeholders")
-                                technical_indicators = {
-                                    "price": price,
-                                    "spread_pct": candidate["spread_pct"],
-                                    "bid_size": candidate["bid_size"],
-                                    "ask_size": candidate["ask_size"],
-                                    "liquidity_score": 100 - (candidate["spread_pct"] * 10),
-                                    "RSI": None,
-                                    "SMA_20": None,
-                                    "ATR": None,
-                                    "ADX": None
-                                }
-                        except Exception as e:
-                            logger.warning(f"{symbol}: Failed to calculate indicators: {e}")
-                            # Fallback to placeholder if error
-                            technical_indicators = {
-                                "price": price,
-                                "spread_pct": candidate["spread_pct"],
-                                "bid_size": candidate["bid_size"],
-                                "ask_size": candidate["ask_size"],
-                                "liquidity_score": 100 - (candidate["spread_pct"] * 10),
-                                "RSI": None,
-                                "SMA_20": None,
-                                "ATR": None,
-                                "ADX": None
-                            }
+                        technical_indicators = indicators_by_symbol[symbol]
 
                         # Evaluate with multi-agent consensus
                         logger.info(f"Evaluating {symbol} with AI agents...")
@@ -386,8 +300,7 @@ class CryptoOrchestrator:
             else:
                 # Fallback to rule-based if multi-agent not available
                 logger.warning("Multi-agent system not available, using rule-based fallback")
-                liquid_candidates.sort(key=lambda x: x["spread_pct"])
-                self.watchlist = liquid_candidates[:3]
+                self.watchlist = liquid_candidates[:3]  # Already ranked by spread
 
             # Only notify if watchlist changed
             new_watchlist_symbols = set(c["symbol"] for c in self.watchlist)
@@ -440,6 +353,28 @@ class CryptoOrchestrator:
             self._notify(f"Screening error: {str(e)}", "error")
             logger.error(f"Screening workflow error: {e}", exc_info=True)
 
+    def _screen_indicators(self, candidates: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Technical indicators for all candidates from one multi-symbol bars request.
+
+        The bars are kept for the TA pre-filter in evaluate_trade_with_agents.
+        """
+        symbols = [c["symbol"] for c in candidates]
+        self._screening_bars = self.crypto_data.get_multi_symbol_bars(
+            symbols, timeframe="1h", days=SCREENING_BAR_DAYS
+        )
+        bars = WideBars.from_bars(symbols, self._screening_bars, limit=SCREENING_BAR_LIMIT)
+        return build_technical_indicators(candidates, bars)
+
+    def _historical_frame(self, symbol: str, limit: int) -> Optional[pd.DataFrame]:
+        """Last `limit` hourly bars as a DataFrame (screening bars if available)."""
+        bars = self._screening_bars.get(symbol)
+        if not bars:
+            bars = self.crypto_data.get_bars(symbol, timeframe="1h", days=SCREENING_BAR_DAYS)
+        if not bars:
+            return None
+        return pd.DataFrame([vars(bar) for bar in bars[-limit:]])
+
     def _execute_entry_orders(self):
         """Execute entry orders for AI-approved candidates via Alpaca API."""
         max_positions = int(100 / self.config.max_position_pct)
@@ -554,117 +489,157 @@ class CryptoOrchestrator:
 
         logger.info(f"Monitoring {len(self.active_positions)} crypto positions")
 
-        for position in self.active_positions:
-            try:
-                symbol = position["symbol"]
-                entry_price = position["entry_price"]
-                order_id = position.get("alpaca_order_id")
-
-                # Check order status before monitoring
-                if order_id:
-                    try:
-                        order = self.trading_client.get_order_by_id(order_id)
-                        position["alpaca_status"] = order.status
-
-                        # Skip monitoring if order not filled yet
-                        if order.status in ["new", "pending_new", "accepted", "pending_replace"]:
-                            logger.debug(f"Order {order_id} for {symbol} not filled yet (status: {order.status}), skipping monitoring")
-                            continue
-
-                        # Remove position if order was cancelled/expired
-                        if order.status in ["cancelled", "expired", "rejected"]:
-                            logger.warning(f"Order {order_id} for {symbol} was {order.status}, removing from tracking")
-                            self.active_positions.remove(position)
-                            continue
-
-                        # Update quantity if filled (in case partial fills)
-                        if order.status == "filled" and order.filled_qty:
-                            position["quantity"] = float(order.filled_qty)
-                            logger.debug(f"Order {order_id} filled: {order.filled_qty} {symbol}")
-
-                    except Exception as e:
-                        logger.warning(f"Failed to check order status for {order_id}: {e}")
-                        # Continue monitoring even if status check fails
-                        pass
+        positions = self._refresh_order_statuses(list(self.active_positions))
+        if not positions:
+            return
 
-                # Get current price
-                current_price = self.crypto_data.get_current_price(symbol)
-                if not current_price:
-                    continue
+        # One multi-symbol quote request for every monitored position
+        symbols = [p["symbol"] for p in positions]
+        quotes = self.crypto_data.get_multi_symbol_quotes(symbols)
+
+        priced, prices = [], []
+        for position in positions:
+            quote = quotes.get(position["symbol"])
+            if quote:
+                priced.append(position)
+                prices.append((quote.bid + quote.ask) / 2.0)
+        if not priced:
+            return
 
-                # Calculate P&L
-                pnl_pct = ((current_price - entry_price) / entry_price) * 100
+        # Stop level = entry price less the AI (or config) stop loss percentage
+        monitor = self.position_monitor
+        monitor.levels.replace_all(
+            [p["symbol"] for p in priced],
+            [
+                p["entry_price"] * (1 - p.get("ai_stop_loss_pct", self.config.stop_loss_pct) / 100)
+                for p in priced
+            ]
+        )
+        exits = monitor.evaluate(
+            [p["symbol"] for p in priced],
+            prices,
+            [p["quantity"] for p in priced],
+            [{"bid": quotes[p["symbol"]].bid, "position": p} for p in priced]
+        )
 
-                # Use AI-calculated stop loss if available, otherwise use config default
-                stop_loss_pct = position.get("ai_stop_loss_pct", self.config.stop_loss_pct)
+        for exit_signal in exits:
+            position = exit_signal.info["position"]
+            entry_price = position["entry_price"]
+            pnl_pct = ((exit_signal.price - entry_price) / entry_price) * 100
+            self._notify(
+                f"🛑 *Stop Loss Hit*\n"
+                f"{exit_signal.symbol}: {pnl_pct:.2f}%\n"
+                f"Entry: ${entry_price:.2f} → Current: ${exit_signal.price:.2f}",
+                "warning"
+            )
 
-                # Check stop loss
-                if pnl_pct <= -stop_loss_pct:
-                    self._notify(
-                        f"🛑 *Stop Loss Hit*\n"
-                        f"{symbol}: {pnl_pct:.2f}%\n"
-                        f"Entry: ${entry_price:.2f} → Current: ${current_price:.2f}",
-                        "warning"
-                    )
+        # Submit all stop loss sells concurrently; failures are isolated per order
+        for result in monitor.submit_exits(exits, self._submit_stop_loss_order):
+            exit_signal = result.signal
+            symbol = exit_signal.symbol
+            if not result.ok:
+                logger.error(f"Failed to execute stop loss sell for {symbol}: {result.error}")
+                self._notify(
+                    f"❌ *Stop Loss Execution Failed*\n{symbol}: {str(result.error)}",
+                    "error"
+                )
+                continue
 
-                    # Execute sell order at stop loss
-                    try:
-                        # Get fresh quote for limit price (use bid price for sell orders)
-                        quote = self.crypto_data.get_latest_quote(symbol)
-                        if not quote:
-                            logger.error(f"No quote available for stop loss sell on {symbol}")
-                            continue
+            sell_order = result.order
+            position = exit_signal.info["position"]
+            entry_price = position["entry_price"]
+            quantity = exit_signal.qty
+            limit_price = exit_signal.info["bid"]
 
-                        # Use bid price as limit for sell (market price)
-                        limit_price = quote.bid
-                        quantity = position["quantity"]
+            logger.info(
+                f"✅ Stop loss order placed: {sell_order.id} - Status: {sell_order.status}"
+            )
 
-                        logger.info(
-                            f"Executing stop loss sell: {symbol} @ ${limit_price:.4f} x {quantity:.8f}"
-                        )
+            # Calculate realized P&L
+            position_value = entry_price * quantity
+            realized_pnl = (exit_signal.price - entry_price) * quantity
+            realized_pnl_pct = (realized_pnl / position_value) * 100
 
-                        # Submit LIMIT sell order with IOC (Immediate or Cancel)
-                        order_request = LimitOrderRequest(
-                            symbol=symbol,
-                            qty=quantity,
-                            limit_price=limit_price,
-                            side=OrderSide.SELL,
-                            time_in_force=TimeInForce.IOC  # Immediate or Cancel for quick exit
-                        )
+            self._notify(
+                f"🔴 *Stop Loss Executed*\n"
+                f"{symbol} @ ${limit_price:.4f}\n"
+                f"Qty: {quantity:.8f}\n"
+                f"P&L: ${realized_pnl:.2f} ({realized_pnl_pct:.2f}%)\n"
+                f"Order ID: {sell_order.id}"
+            )
 
-                        # Execute sell order via Alpaca
-                        sell_order = self.trading_client.submit_order(order_request)
+            # Remove position from tracking
+            if position in self.active_positions:
+                self.active_positions.remove(position)
+            monitor.levels.remove(symbol)
+            logger.info(f"Position removed from tracking: {symbol}")
 
-                        logger.info(
-                            f"✅ Stop loss order placed: {sell_order.id} - Status: {sell_order.status}"
-                        )
+    def _refresh_order_statuses(self, positions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Update entry order status for positions not yet known to be filled.
 
-                        # Calculate realized P&L
-                        position_value = entry_price * quantity
-                        realized_pnl = (current_price - entry_price) * quantity
-                        realized_pnl_pct = (realized_pnl / position_value) * 100
-
-                        self._notify(
-                            f"🔴 *Stop Loss Executed*\n"
-                            f"{symbol} @ ${limit_price:.4f}\n"
-                            f"Qty: {quantity:.8f}\n"
-                            f"P&L: ${realized_pnl:.2f} ({realized_pnl_pct:.2f}%)\n"
-                            f"Order ID: {sell_order.id}"
-                        )
+        Lookups run concurrently; filled orders are not queried again. Positions
+        whose order was cancelled/expired/rejected are dropped from tracking.
 
-                        # Remove position from tracking
-                        self.active_positions.remove(position)
-                        logger.info(f"Position removed from tracking: {symbol}")
+        Returns:
+            Positions ready to monitor (filled, or status unknown)
+        """
+        pending = [
+            p for p in positions
+            if p.get("alpaca_order_id") and p.get("alpaca_status") != "filled"
+        ]
+        lookups = self.position_monitor.map(
+            lambda p: self.trading_client.get_order_by_id(p["alpaca_order_id"]), pending
+        )
 
-                    except Exception as e:
-                        logger.error(f"Failed to execute stop loss sell for {symbol}: {e}")
-                        self._notify(
-                            f"❌ *Stop Loss Execution Failed*\n{symbol}: {str(e)}",
-                            "error"
-                        )
+        skipped = set()
+        for position, (order, error) in zip(pending, lookups):
+            symbol = position["symbol"]
+            order_id = position["alpaca_order_id"]
+            if error is not None:
+                logger.warning(f"Failed to check order status for {order_id}: {error}")
+                # Continue monitoring even if status check fails
+                continue
+
+            position["alpaca_status"] = order.status
+
+            # Skip monitoring if order not filled yet
+            if order.status in ["new", "pending_new", "accepted", "pending_replace"]:
+                logger.debug(f"Order {order_id} for {symbol} not filled yet (status: {order.status}), skipping monitoring")
+                skipped.add(id(position))
+                continue
+
+            # Remove position if order was cancelled/expired
+            if order.status in ["cancelled", "expired", "rejected"]:
+                logger.warning(f"Order {order_id} for {symbol} was {order.status}, removing from tracking")
+                if position in self.active_positions:
+                    self.active_positions.remove(position)
+                skipped.add(id(position))
+                continue
+
+            # Update quantity if filled (in case partial fills)
+            if order.status == "filled" and order.filled_qty:
+                position["quantity"] = float(order.filled_qty)
+                logger.debug(f"Order {order_id} filled: {order.filled_qty} {symbol}")
+
+        return [p for p in positions if id(p) not in skipped]
+
+    def _submit_stop_loss_order(self, exit_signal: ExitSignal):
+        """Submit an IOC limit sell at the bid (runs on the monitor's worker threads)."""
+        limit_price = exit_signal.info["bid"]
+        logger.info(
+            f"Executing stop loss sell: {exit_signal.symbol} @ ${limit_price:.4f} x {exit_signal.qty:.8f}"
+        )
 
-            except Exception as e:
-                logger.error(f"Error monitoring {position.get('symbol')}: {e}")
+        # Submit LIMIT sell order with IOC (Immediate or Cancel)
+        order_request = LimitOrderRequest(
+            symbol=exit_signal.symbol,
+            qty=exit_signal.qty,
+            limit_price=limit_price,
+            side=OrderSide.SELL,
+            time_in_force=TimeInForce.IOC  # Immediate or Cancel for quick exit
+        )
+        return self.trading_client.submit_order(order_request)
 
     def run_rebalance_workflow(self):
         """
@@ -840,7 +815,7 @@ class CryptoOrchestrator:
             logger.error(f"Rebalance workflow error: {e}")
 
     def run_loop(self):
-        """Main event loop - check scheduler every 60 seconds."""
+        """Main event loop - sleep until the next scheduled task."""
         logger.info("Starting crypto orchestrator event loop")
         logger.info(f"Screening: every {self.config.screening_interval_hours}hr")
         logger.info(f"Monitoring: every {self.config.monitoring_interval_minutes}min")
@@ -855,14 +830,14 @@ class CryptoOrchestrator:
 
         try:
             while self.running:
-                # Check scheduled tasks
-                triggered = self.scheduler.check_triggers()
+                # Start due tasks on the scheduler's worker pool
+                triggered = self.scheduler.run_pending()
 
                 if triggered:
                     logger.info(f"Triggered crypto tasks: {triggered}")
 
-                # Sleep 60 seconds
-                time.sleep(60)
+                # Sleep until the next deadline (stop() wakes us early)
+                self.scheduler.wait()
 
         except KeyboardInterrupt:
             logger.info("Crypto orchestrator stopped by user")
@@ -875,6 +850,7 @@ class CryptoOrchestrator:
         """Stop the crypto orchestrator."""
         logger.info("Stopping crypto orchestrator")
         self.running = False
+        self.scheduler.shutdown(wait=False)
 
     def evaluate_trade_with_agents(
         self,
@@ -921,12 +897,8 @@ class CryptoOrchestrator:
                     # Get historical data for TA analysis
                     logger.info(f"Running TA framework analysis on {symbol}...")
 
-                    # Fetch historical bars (100 periods for TA analysis)
-                    historical_df = self.crypto_data.get_historical_bars(
-                        symbol=symbol,
-                        timeframe="1h",
-                        limit=100
-                    )
+                    # Historical bars (100 periods for TA analysis)
+                    historical_df = self._historical_frame(symbol, limit=100)
 
                     if historical_df is not None and len(historical_df) >= 50:
                         # Run TA framework analysis
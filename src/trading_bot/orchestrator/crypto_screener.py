@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Crypto Screening Engine
+
+Vectorized liquidity filtering and indicator calculation for the whole crypto
+universe.
+
+- rank_liquid_candidates filters multi-symbol quotes on price, spread and size
+  in one array pass and ranks survivors by spread (tightest first).
+- WideBars packs multi-symbol bars into (bar x symbol) arrays right-aligned on
+  each symbol's latest bar. compute_indicators then derives RSI/SMA/ATR for
+  every symbol from trailing-window reductions, matching the per-symbol
+  pandas rolling values previously computed in the screening loop.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MIN_PRICE = 0.10
+MAX_SPREAD_PCT = 2.0
+MIN_BARS = 50  # Fewer bars -> placeholder indicators
+
+
+def rank_liquid_candidates(
+    symbols: Sequence[str],
+    quotes: Mapping[str, Optional[Any]],
+    min_price: float = MIN_PRICE,
+    max_spread_pct: float = MAX_SPREAD_PCT,
+) -> List[Dict[str, Any]]:
+    """
+    Filter quotes for liquidity and rank survivors by spread.
+
+    Args:
+        symbols: Universe in configured order (ties keep this order)
+        quotes: Symbol -> quote with bid/ask/bid_size/ask_size (None = no quote)
+        min_price: Minimum mid price
+        max_spread_pct: Maximum bid/ask spread as % of mid price
+
+    Returns:
+        Candidate dicts (symbol, price, spread_pct, bid_size, ask_size),
+        tightest spread first
+    """
+    fields = np.full((4, len(symbols)), np.nan)
+    for i, symbol in enumerate(symbols):
+        quote = quotes.get(symbol)
+        if quote is not None:
+            fields[:, i] = (quote.bid, quote.ask, quote.bid_size, quote.ask_size)
+    bid, ask, bid_size, ask_size = fields
+
+    price = (bid + ask) / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spread_pct = np.where(price > 0, (ask - bid) / price * 100, 999.0)
+
+    liquid = (price > min_price) & (spread_pct < max_spread_pct) & (bid_size > 0) & (ask_size > 0)
+    rows = np.flatnonzero(liquid)
+    rows = rows[np.argsort(spread_pct[rows], kind="stable")]
+
+    return [
+        {
+            "symbol": symbols[i],
+            "price": float(price[i]),
+            "spread_pct": float(spread_pct[i]),
+            "bid_size": float(bid_size[i]),
+            "ask_size": float(ask_size[i]),
+        }
+        for i in rows
+    ]
+
+
+@dataclass
+class WideBars:
+    """OHLCV arrays of shape (bars, symbols); row -1 is each symbol's latest bar."""
+
+    symbols: List[str]
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    counts: np.ndarray  # Bars available per symbol (shorter histories are NaN-padded on top)
+
+    @classmethod
+    def from_bars(
+        cls,
+        symbols: Sequence[str],
+        bars_by_symbol: Mapping[str, Sequence[Any]],
+        limit: int = 200,
+    ) -> "WideBars":
+        """
+        Pack the trailing `limit` bars per symbol.
+
+        Args:
+            symbols: Column order
+            bars_by_symbol: Symbol -> bars (oldest first) with high/low/close/volume
+            limit: Maximum bars kept per symbol
+        """
+        data = np.full((4, limit, len(symbols)), np.nan)
+        counts = np.zeros(len(symbols), dtype=int)
+        for col, symbol in enumerate(symbols):
+            bars = list(bars_by_symbol.get(symbol) or ())[-limit:]
+            if not bars:
+                continue
+            counts[col] = len(bars)
+            data[:, limit - len(bars):, col] = np.array(
+                [(b.high, b.low, b.close, b.volume) for b in bars], dtype=float
+            ).T
+        high, low, close, volume = data
+        return cls(list(symbols), high, low, close, volume, counts)
+
+
+def trailing_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of the last `window` rows per column (NaN unless all rows are present)."""
+    if len(values) < window:
+        return np.full(values.shape[1], np.nan)
+    return values[-window:].mean(axis=0)
+
+
+def compute_indicators(bars: WideBars) -> Dict[str, np.ndarray]:
+    """
+    Latest RSI(14), SMA(20/50/200), ATR(14) and volume SMA(20) per symbol.
+
+    Returns:
+        Indicator name -> array of one value per symbol (NaN = not enough bars)
+    """
+    close = bars.close
+    prev_close = np.vstack([np.full((1, close.shape[1]), np.nan), close[:-1]])
+
+    # RSI (14-period, simple averages)
+    delta = close[-14:] - prev_close[-14:]
+    gain = np.where(delta > 0, delta, 0.0).mean(axis=0)
+    loss = np.where(delta < 0, -delta, 0.0).mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + gain / loss))
+    rsi[np.isnan(delta).any(axis=0)] = np.nan
+
+    # ATR (14-period); fmax skips the missing previous close like pandas max()
+    true_range = np.fmax(
+        bars.high - bars.low,
+        np.fmax(np.abs(bars.high - prev_close), np.abs(bars.low - prev_close)),
+    )
+
+    return {
+        "RSI": rsi,
+        "SMA_20": trailing_mean(close, 20),
+        "SMA_50": trailing_mean(close, 50),
+        "SMA_200": trailing_mean(close, 200),
+        "ATR": trailing_mean(true_range, 14),
+        "volume": bars.volume[-1],
+        "volume_sma": trailing_mean(bars.volume, 20),
+    }
+
+
+def _or(value: float, fallback: Optional[float]) -> Optional[float]:
+    return fallback if np.isnan(value) else float(value)
+
+
+def build_technical_indicators(
+    candidates: Sequence[Dict[str, Any]],
+    bars: WideBars,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Technical indicator dicts for multi-agent evaluation, keyed by symbol.
+
+    Args:
+        candidates: Liquid candidates from rank_liquid_candidates
+        bars: Bars whose columns include every candidate symbol
+
+    Returns:
+        Symbol -> indicators (placeholders when fewer than MIN_BARS bars)
+    """
+    indicators = compute_indicators(bars)
+    column = {symbol: i for i, symbol in enumerate(bars.symbols)}
+    result = {}
+
+    for candidate in candidates:
+        symbol = candidate["symbol"]
+        price = candidate["price"]
+        col = column[symbol]
+        base = {
+            "price": price,
+            "spread_pct": candidate["spread_pct"],
+            "bid_size": candidate["bid_size"],
+            "ask_size": candidate["ask_size"],
+            "liquidity_score": 100 - (candidate["spread_pct"] * 10),
+        }
+
+        if bars.counts[col] < MIN_BARS:
+            logger.warning(f"{symbol}: Insufficient historical data, using placeholders")
+            result[symbol] = {**base, "RSI": None, "SMA_20": None, "ATR": None, "ADX": None}
+            continue
+
+        value = {name: values[col] for name, values in indicators.items()}
+        volume = float(value["volume"])
+        result[symbol] = {
+            **base,
+            "RSI": _or(value["RSI"], 50.0),
+            "SMA_20": _or(value["SMA_20"], price),
+            "SMA_50": _or(value["SMA_50"], price),
+            "SMA_200": _or(value["SMA_200"], None),
+            "ATR": _or(value["ATR"], price * 0.05),
+            "volume": volume,
+            "volume_sma": _or(value["volume_sma"], volume),
+            "ADX": 25.0  # TODO: Calculate ADX when needed
+        }
+
+    return result
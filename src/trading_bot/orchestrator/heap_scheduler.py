@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Heap-Based Task Scheduler
+
+Deadline scheduler for the stock and crypto orchestrators.
+
+Tasks sit in a min-heap keyed on their next fire time (UTC), so the run loop
+sleeps exactly until the earliest deadline instead of polling once a minute.
+Daily triggers are evaluated in their own time zone via zoneinfo: a 9:30
+America/New_York task fires at 9:30 local time on both sides of a DST change.
+
+Callbacks run on a bounded worker pool. When a task fires while its previous
+run is still going, its overlap policy decides what happens:
+- skip: drop the new run
+- queue: run again after the current run finishes (once per fire)
+- replace: keep only the newest pending run behind the current one
+
+The clock is injectable so tests can drive run_pending() deterministically.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, time, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+Clock = Callable[[], datetime]
+
+
+def system_clock() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+class OverlapPolicy(Enum):
+    """What to do when a task fires while its previous run is still active."""
+    SKIP = "skip"
+    QUEUE = "queue"
+    REPLACE = "replace"
+
+
+@dataclass(frozen=True)
+class DailyTrigger:
+    """Fire at fixed wall-clock times in a time zone, optionally on given weekdays."""
+    times: Tuple[time, ...]
+    timezone: str = "America/New_York"
+    weekdays: Optional[FrozenSet[int]] = None  # Monday=0 ... Sunday=6, None = every day
+
+    def __post_init__(self):
+        if not self.times:
+            raise ValueError("DailyTrigger needs at least one time")
+        if self.weekdays is not None and not self.weekdays:
+            raise ValueError("weekdays must be None or non-empty")
+        object.__setattr__(self, "times", tuple(sorted(self.times)))
+        ZoneInfo(self.timezone)  # Fail fast on unknown zones
+
+    def first_run(self, now: datetime) -> datetime:
+        return self.next_after(now)
+
+    def next_run(self, due: datetime, now: datetime) -> datetime:
+        return self.next_after(now)
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        First fire time strictly after `after`, as a UTC datetime.
+
+        Times that fall into a spring-forward gap fire just after the gap; times
+        repeated by a fall-back fire once, on their first occurrence.
+        """
+        tz = ZoneInfo(self.timezone)
+        start_day = after.astimezone(tz).date()
+        for offset in range(8):
+            day = start_day + timedelta(days=offset)
+            if self.weekdays is not None and day.weekday() not in self.weekdays:
+                continue
+            for at in self.times:
+                candidate = datetime.combine(day, at, tzinfo=tz).astimezone(UTC)
+                if candidate > after:
+                    return candidate
+        raise ValueError(f"No fire time found after {after}")  # pragma: no cover
+
+
+@dataclass(frozen=True)
+class IntervalTrigger:
+    """Fire every `interval`, at a fixed rate anchored to the first fire time."""
+    interval: timedelta
+    run_immediately: bool = False
+
+    def __post_init__(self):
+        if self.interval <= timedelta(0):
+            raise ValueError("interval must be positive")
+
+    def first_run(self, now: datetime) -> datetime:
+        return now if self.run_immediately else now + self.interval
+
+    def next_run(self, due: datetime, now: datetime) -> datetime:
+        """Next slot after `now`; missed slots are coalesced into the run just made."""
+        missed = (now - due) // self.interval
+        return due + (missed + 1) * self.interval
+
+
+Trigger = Union[DailyTrigger, IntervalTrigger]
+
+
+@dataclass
+class ScheduledJob:
+    """Runtime state of a scheduled task."""
+    name: str
+    trigger: Trigger
+    callback: Callable[[], Any]
+    overlap: OverlapPolicy = OverlapPolicy.SKIP
+    enabled: bool = True
+    next_run: Optional[datetime] = None
+    last_run: Optional[datetime] = None
+    running: bool = False
+    pending: int = 0
+    run_count: int = 0
+    error_count: int = 0
+    skipped_count: int = 0
+    version: int = 0
+    future: Optional[Future] = field(default=None, repr=False)
+
+
+class HeapScheduler:
+    """
+    Min-heap deadline scheduler with a bounded worker pool.
+
+    Example:
+        scheduler = HeapScheduler()
+        scheduler.schedule_daily("market_open", time(9, 30), run_market_open)
+        scheduler.schedule_interval("monitoring", 5, run_monitoring)
+        while running:
+            scheduler.run_pending()
+            scheduler.wait(max_seconds=60)
+    """
+
+    def __init__(
+        self,
+        clock: Clock = system_clock,
+        max_workers: int = 4,
+        timezone: str = "America/New_York",
+        misfire_grace: timedelta = timedelta(minutes=5),
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            clock: Returns the current time as an aware datetime (injectable for tests)
+            max_workers: Worker threads shared by all task callbacks
+            timezone: Default time zone for daily triggers
+            misfire_grace: Daily runs later than this (e.g. after a suspend) are
+                skipped instead of fired; interval tasks coalesce missed runs
+        """
+        self.clock = clock
+        self.max_workers = max_workers
+        self.timezone = timezone
+        self.misfire_grace = misfire_grace
+        self.tasks: Dict[str, ScheduledJob] = {}
+        self._heap: List[Tuple[datetime, int, str, int]] = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()
+        self._idle = threading.Condition(self._lock)
+        self._wakeup = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    def schedule_daily(
+        self,
+        name: str,
+        at: Union[time, Iterable[time]],
+        callback: Callable[[], Any],
+        timezone: Optional[str] = None,
+        weekdays: Optional[Iterable[int]] = None,
+        overlap: OverlapPolicy = OverlapPolicy.SKIP,
+    ) -> ScheduledJob:
+        """
+        Schedule a task at one or more wall-clock times per day.
+
+        Args:
+            name: Unique task identifier (re-scheduling a name replaces it)
+            at: Time or times of day, in `timezone`
+            callback: Function to execute
+            timezone: IANA zone for `at` (default: scheduler timezone)
+            weekdays: Days to run on (Monday=0); None for every day
+            overlap: Policy when the previous run is still active
+        """
+        times = (at,) if isinstance(at, time) else tuple(at)
+        trigger = DailyTrigger(
+            times=times,
+            timezone=timezone or self.timezone,
+            weekdays=frozenset(weekdays) if weekdays is not None else None,
+        )
+        job = self._add(name, trigger, callback, overlap)
+        logger.info(f"Scheduled task '{name}' at {', '.join(str(t) for t in trigger.times)} {trigger.timezone}")
+        return job
+
+    def schedule_interval(
+        self,
+        name: str,
+        interval_minutes: float,
+        callback: Callable[[], Any],
+        run_immediately: bool = False,
+        overlap: OverlapPolicy = OverlapPolicy.SKIP,
+    ) -> ScheduledJob:
+        """
+        Schedule a task to run at regular intervals.
+
+        Args:
+            name: Unique task identifier (re-scheduling a name replaces it)
+            interval_minutes: How often to run (in minutes)
+            callback: Function to execute
+            run_immediately: If True, run on the next check; otherwise after one interval
+            overlap: Policy when the previous run is still active
+        """
+        trigger = IntervalTrigger(timedelta(minutes=interval_minutes), run_immediately)
+        job = self._add(name, trigger, callback, overlap)
+        logger.info(
+            f"Scheduled interval task '{name}': every {interval_minutes} min "
+            f"(immediate: {run_immediately})"
+        )
+        return job
+
+    def schedule_hourly(
+        self,
+        name: str,
+        hours: float,
+        callback: Callable[[], Any],
+        run_immediately: bool = False,
+        overlap: OverlapPolicy = OverlapPolicy.SKIP,
+    ) -> ScheduledJob:
+        """Convenience method to schedule task every N hours."""
+        return self.schedule_interval(name, hours * 60, callback, run_immediately, overlap)
+
+    def _add(self, name: str, trigger: Trigger, callback: Callable[[], Any], overlap: OverlapPolicy) -> ScheduledJob:
+        overlap = OverlapPolicy(overlap)
+        with self._lock:
+            previous = self.tasks.get(name)
+            job = ScheduledJob(name=name, trigger=trigger, callback=callback, overlap=overlap)
+            if previous is not None:
+                job.version = previous.version + 1
+            job.next_run = trigger.first_run(self.clock())
+            self.tasks[name] = job
+            self._push(job)
+        self._wakeup.set()
+        return job
+
+    def _push(self, job: ScheduledJob) -> None:
+        heapq.heappush(self._heap, (job.next_run, next(self._seq), job.name, job.version))
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+    def run_pending(self) -> List[str]:
+        """
+        Dispatch every task whose deadline has passed.
+
+        Returns:
+            Names of tasks started or queued behind a running instance
+        """
+        now = self.clock()
+        triggered = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due, _, name, version = heapq.heappop(self._heap)
+                job = self.tasks.get(name)
+                if job is None or job.version != version:
+                    continue  # Removed or re-scheduled since this entry was pushed
+
+                job.next_run = job.trigger.next_run(due, now)
+                self._push(job)
+
+                if not job.enabled:
+                    continue
+                if isinstance(job.trigger, DailyTrigger) and now - due > self.misfire_grace:
+                    logger.warning(f"Missed run of '{name}' due {due.isoformat()} ({now - due} late)")
+                    continue
+                if self._dispatch(job):
+                    triggered.append(name)
+        return triggered
+
+    def _dispatch(self, job: ScheduledJob) -> bool:
+        """Start a job or apply its overlap policy (caller holds the lock)."""
+        if job.running:
+            if job.overlap is OverlapPolicy.SKIP:
+                job.skipped_count += 1
+                logger.info(f"Skipping '{job.name}': previous run still active")
+                return False
+            if job.overlap is OverlapPolicy.QUEUE:
+                job.pending += 1
+            else:
+                job.pending = 1
+            logger.info(f"Queued '{job.name}' behind active run ({job.pending} pending)")
+            return True
+
+        logger.info(f"Triggering task: {job.name}")
+        job.running = True
+        self._submit(job)
+        return True
+
+    def _submit(self, job: ScheduledJob) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scheduler")
+        job.future = self._executor.submit(self._run, job)
+
+    def _run(self, job: ScheduledJob) -> None:
+        try:
+            job.callback()
+        except Exception as e:
+            job.error_count += 1
+            logger.error(f"Error executing task '{job.name}': {e}")
+        finally:
+            with self._lock:
+                job.last_run = self.clock()
+                job.run_count += 1
+                if job.pending and self._executor is not None:
+                    job.pending -= 1
+                    self._submit(job)
+                else:
+                    job.pending = 0
+                    job.running = False
+                    self._idle.notify_all()
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Seconds until the earliest deadline (0 if overdue), None if nothing is scheduled."""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, (self._heap[0][0] - self.clock()).total_seconds())
+
+    def wait(self, max_seconds: Optional[float] = None) -> None:
+        """
+        Block until the next deadline, a schedule change or wake().
+
+        Args:
+            max_seconds: Upper bound on the wait (None = until next deadline)
+        """
+        self._wakeup.clear()
+        timeout = self.seconds_until_next()
+        if max_seconds is not None:
+            timeout = max_seconds if timeout is None else min(timeout, max_seconds)
+        self._wakeup.wait(timeout)
+
+    def wake(self) -> None:
+        """Interrupt a blocked wait()."""
+        self._wakeup.set()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no task is running or queued. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: not any(job.running for job in self.tasks.values()), timeout
+            )
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool; runs not yet started are cancelled."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            for job in self.tasks.values():
+                job.pending = 0
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            for job in self.tasks.values():
+                if job.future is not None and job.future.cancelled():
+                    job.running = False
+            self._idle.notify_all()
+        self.wake()
+
+    # ------------------------------------------------------------------
+    # Task management
+    # ------------------------------------------------------------------
+    def enable_task(self, name: str):
+        """Enable a scheduled task."""
+        with self._lock:
+            if name in self.tasks:
+                self.tasks[name].enabled = True
+                logger.info(f"Enabled task: {name}")
+                return
+        logger.warning(f"Task not found: {name}")
+
+    def disable_task(self, name: str):
+        """Disable a task without removing it."""
+        with self._lock:
+            if name in self.tasks:
+                self.tasks[name].enabled = False
+                logger.info(f"Disabled task: {name}")
+                return
+        logger.warning(f"Task not found: {name}")
+
+    def remove_task(self, name: str):
+        """Remove a task (its heap entry is discarded lazily)."""
+        with self._lock:
+            if self.tasks.pop(name, None) is not None:
+                logger.info(f"Removed task: {name}")
+
+    def get_next_trigger(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the next enabled task to fire.
+
+        Returns:
+            Dict with task name, seconds until it fires and its UTC fire time, or None
+        """
+        with self._lock:
+            enabled = [job for job in self.tasks.values() if job.enabled]
+            if not enabled:
+                return None
+            job = min(enabled, key=lambda j: j.next_run)
+            seconds = max(0.0, (job.next_run - self.clock()).total_seconds())
+            return {"task": job.name, "seconds_until": int(seconds), "next_run": job.next_run}
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """Status of all tasks, soonest first."""
+        with self._lock:
+            now = self.clock()
+            status = [
+                {
+                    "name": job.name,
+                    "enabled": job.enabled,
+                    "running": job.running,
+                    "pending": job.pending,
+                    "overlap": job.overlap.value,
+                    "last_run": job.last_run.isoformat() if job.last_run else None,
+                    "next_run": job.next_run.isoformat(),
+                    "next_run_seconds": max(0, int((job.next_run - now).total_seconds())),
+                    "run_count": job.run_count,
+                    "error_count": job.error_count,
+                    "skipped_count": job.skipped_count,
+                }
+                for job in self.tasks.values()
+            ]
+        return sorted(status, key=lambda x: x["next_run_seconds"])
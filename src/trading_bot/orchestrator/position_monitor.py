@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Position Monitoring Engine
+
+Batched stop/target evaluation and concurrent exit submission for the
+stock and crypto orchestrators.
+
+- ExitLevelTable keeps active stop/target prices in dense NumPy arrays indexed
+  by symbol, so a monitoring pass checks every position in one vectorized
+  comparison instead of searching trade records per position.
+- PositionMonitor turns hits into ExitSignals and submits exit orders on a
+  thread pool. A failing order only fails its own ExitResult.
+"""
+
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STOP_LOSS = "Stop Loss"
+TARGET = "Target"
+
+
+def _level(value: Optional[float]) -> float:
+    """Map an unset level (None or 0, as in trade records) to NaN."""
+    if not value:
+        return math.nan
+    return float(value)
+
+
+class ExitLevelTable:
+    """Symbol-indexed stop/target price levels (NaN = not set)."""
+
+    def __init__(self, capacity: int = 16):
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._stops = np.full(capacity, np.nan)
+        self._targets = np.full(capacity, np.nan)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def get(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """(stop, target) for a symbol, or None if not tracked."""
+        row = self._index.get(symbol)
+        if row is None:
+            return None
+        return float(self._stops[row]), float(self._targets[row])
+
+    def set(self, symbol: str, stop: Optional[float] = None, target: Optional[float] = None) -> None:
+        """Insert or overwrite a symbol's levels."""
+        row = self._index.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row == len(self._stops):
+                self._stops = np.concatenate([self._stops, np.full(row, np.nan)])
+                self._targets = np.concatenate([self._targets, np.full(row, np.nan)])
+            self._index[symbol] = row
+            self._symbols.append(symbol)
+        self._stops[row] = _level(stop)
+        self._targets[row] = _level(target)
+
+    def remove(self, symbol: str) -> None:
+        """Stop tracking a symbol (swaps the last row into its slot)."""
+        row = self._index.pop(symbol, None)
+        if row is None:
+            return
+        last = len(self._symbols) - 1
+        if row != last:
+            moved = self._symbols[last]
+            self._symbols[row] = moved
+            self._index[moved] = row
+            self._stops[row] = self._stops[last]
+            self._targets[row] = self._targets[last]
+        self._symbols.pop()
+        self._stops[last] = np.nan
+        self._targets[last] = np.nan
+
+    def clear(self) -> None:
+        self._index.clear()
+        self._symbols.clear()
+        self._stops[:] = np.nan
+        self._targets[:] = np.nan
+
+    def replace_all(
+        self,
+        symbols: Sequence[str],
+        stops: Sequence[Optional[float]],
+        targets: Optional[Sequence[Optional[float]]] = None,
+    ) -> None:
+        """Rebuild the table from parallel sequences (first entry per symbol wins)."""
+        self.clear()
+        if targets is None:
+            targets = [None] * len(symbols)
+        for symbol, stop, target in zip(symbols, stops, targets):
+            if symbol not in self._index:
+                self.set(symbol, stop, target)
+
+    def evaluate(self, symbols: Sequence[str], prices: Sequence[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Check prices against levels in one pass.
+
+        Args:
+            symbols: Position symbols
+            prices: Current prices, aligned with symbols
+
+        Returns:
+            (tracked, stop_hit, target_hit) boolean arrays aligned with symbols.
+            A stop hit takes precedence over a target hit.
+        """
+        rows = np.fromiter((self._index.get(s, -1) for s in symbols), dtype=np.intp, count=len(symbols))
+        price = np.asarray(prices, dtype=np.float64)
+        tracked = rows >= 0
+        safe_rows = np.where(tracked, rows, 0)
+        stops = np.where(tracked, self._stops[safe_rows], np.nan)
+        targets = np.where(tracked, self._targets[safe_rows], np.nan)
+        stop_hit = price <= stops
+        target_hit = ~stop_hit & (price >= targets)
+        return tracked, stop_hit, target_hit
+
+
+@dataclass(frozen=True)
+class ExitSignal:
+    """A position that crossed its stop or target."""
+    symbol: str
+    reason: str
+    price: float
+    level: float
+    qty: float
+    info: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ExitResult:
+    """Outcome of submitting one exit order."""
+    signal: ExitSignal
+    order: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PositionMonitor:
+    """
+    Batched monitoring engine.
+
+    Example:
+        monitor = PositionMonitor()
+        monitor.levels.set("AAPL", stop=145.0, target=160.0)
+        signals = monitor.evaluate(["AAPL"], [144.5], [10])
+        results = monitor.submit_exits(signals, submit_order)
+    """
+
+    def __init__(self, max_workers: int = 8):
+        """
+        Initialize monitor.
+
+        Args:
+            max_workers: Maximum exit orders submitted concurrently
+        """
+        self.max_workers = max_workers
+        self.levels = ExitLevelTable()
+
+    def evaluate(
+        self,
+        symbols: Sequence[str],
+        prices: Sequence[float],
+        quantities: Sequence[float],
+        info: Optional[Sequence[Dict[str, Any]]] = None,
+    ) -> List[ExitSignal]:
+        """
+        Find positions whose price crossed their stop or target.
+
+        Args:
+            symbols: Position symbols
+            prices: Current prices
+            quantities: Position quantities
+            info: Optional per-position context copied onto the signals
+
+        Returns:
+            ExitSignals in position order
+        """
+        _, stop_hit, target_hit = self.levels.evaluate(symbols, prices)
+        signals = []
+        for i in np.flatnonzero(stop_hit | target_hit):
+            stop, target = self.levels.get(symbols[i])
+            is_stop = bool(stop_hit[i])
+            signals.append(ExitSignal(
+                symbol=symbols[i],
+                reason=STOP_LOSS if is_stop else TARGET,
+                price=float(prices[i]),
+                level=stop if is_stop else target,
+                qty=float(quantities[i]),
+                info=dict(info[i]) if info is not None else {},
+            ))
+        return signals
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+        """
+        Run func over items concurrently, isolating failures.
+
+        Returns:
+            (result, error) pairs in input order
+        """
+        items = list(items)
+
+        def call(item):
+            try:
+                return func(item), None
+            except Exception as e:
+                return None, e
+
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [call(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items)), thread_name_prefix="exit") as pool:
+            return list(pool.map(call, items))
+
+    def submit_exits(self, signals: Sequence[ExitSignal], submit: Callable[[ExitSignal], Any]) -> List[ExitResult]:
+        """
+        Submit exit orders concurrently.
+
+        Args:
+            signals: Exits to execute
+            submit: Places one order and returns the broker response
+
+        Returns:
+            ExitResults in signal order; failures carry the exception
+        """
+        outcomes = self.map(submit, signals)
+        return [ExitResult(signal=s, order=order, error=error) for s, (order, error) in zip(signals, outcomes)]
@@ -6,7 +6,6 @@ Coordinates LLM-enhanced trading workflows using Claude Code in headless mode.
 Integrates with existing trading_bot infrastructure.
 """
 
-import time
 import logging
 from datetime import datetime, time as datetime_time
 from typing import Dict, List, Optional, Any
@@ -18,7 +17,13 @@ from trading_bot.orchestrator.workflow import (
     WorkflowState,
     WorkflowTransition
 )
-from trading_bot.orchestrator.scheduler import TradingScheduler
+from trading_bot.orchestrator.heap_scheduler import HeapScheduler
+from trading_bot.orchestrator.position_monitor import (
+    STOP_LOSS,
+    ExitResult,
+    ExitSignal,
+    PositionMonitor
+)
 
 # Alpaca trading client for order execution
 from alpaca.trading.client import TradingClient
@@ -29,6 +34,8 @@ from alpaca.trading.enums import OrderSide, TimeInForce
 try:
     from trading_bot.llm.claude_manager import ClaudeCodeManager, LLMConfig, LLMModel
     from trading_bot.llm.examples.multi_agent_consensus_workflow import MultiAgentTradingWorkflow
+    from trading_bot.llm.agents import BaseAgent
+    from trading_bot.llm.decision_replay import install_replay_client
     HAS_LLM = True
 except ImportError:
     # Multi-agent system not available (excluded from Docker or incomplete setup)
@@ -36,6 +43,8 @@ except ImportError:
     LLMConfig = None
     LLMModel = None
     MultiAgentTradingWorkflow = None
+    BaseAgent = None
+    install_replay_client = None
     HAS_LLM = False
 
 # Technical Analysis framework
@@ -63,7 +72,13 @@ class TradingOrchestrator:
     - Weekly review (Friday 4pm EST)
     """
 
-    def __init__(self, config: Config, auth: Optional[Any] = None, mode: str = "live"):
+    def __init__(
+        self,
+        config: Config,
+        auth: Optional[Any] = None,
+        mode: str = "live",
+        decision_replay: Optional[Any] = None
+    ):
         """
         Initialize orchestrator.
 
@@ -71,6 +86,7 @@ class TradingOrchestrator:
             config: Trading bot configuration
             auth: Optional authentication object (Robinhood/Alpaca). None for paper trading.
             mode: Operation mode (live, paper, backtest)
+            decision_replay: DecisionReplayStore to record/replay agent decisions (backtests)
 
         Note:
             For paper trading mode, auth can be None. For live trading, you must provide
@@ -99,6 +115,13 @@ class TradingOrchestrator:
             # Initialize multi-agent trading workflow
             self.multi_agent_workflow = MultiAgentTradingWorkflow()
             logger.info("Multi-agent trading system initialized with 8 specialized agents")
+
+            # Serve agent LLM calls from recorded decisions
+            if decision_replay is not None:
+                install_replay_client(
+                    [a for a in vars(self.multi_agent_workflow).values() if isinstance(a, BaseAgent)],
+                    decision_replay
+                )
         else:
             self.claude_manager = None
             self.multi_agent_workflow = None
@@ -114,7 +137,9 @@ class TradingOrchestrator:
 
         # Initialize workflow and scheduler
         self.workflow = WorkflowStateMachine()
-        self.scheduler = TradingScheduler()
+        # One worker: workflows share the state machine, daily_trades and position levels
+        self.scheduler = HeapScheduler(max_workers=1, timezone="America/New_York")
+        self.decision_replay = decision_replay
 
         # Setup scheduled tasks
         self._setup_schedule()
@@ -123,6 +148,9 @@ class TradingOrchestrator:
         self.running = False
         self.daily_trades = []
 
+        # Symbol-indexed stop/target levels for open trades
+        self.position_monitor = PositionMonitor()
+
         # Portfolio tracking (for multi-agent position sizing)
         self.portfolio_value = 100000.0  # Default $100k portfolio
         self.cash_available = 100000.0   # Default $100k cash
@@ -207,19 +235,17 @@ class TradingOrchestrator:
     def _setup_schedule(self):
         """Setup scheduled trading workflows."""
         # Pre-market screening (6:30am EST)
-        self.scheduler.schedule(
+        self.scheduler.schedule_daily(
             "pre_market",
             datetime_time(6, 30),
-            self.run_pre_market_workflow,
-            run_once_per_day=True
+            self.run_pre_market_workflow
         )
 
         # Market open execution (9:30am EST)
-        self.scheduler.schedule(
+        self.scheduler.schedule_daily(
             "market_open",
             datetime_time(9, 30),
-            self.run_market_open_workflow,
-            run_once_per_day=True
+            self.run_market_open_workflow
         )
 
         # Intraday scanning - Every 30 minutes during market hours (10am-3:30pm)
@@ -231,37 +257,33 @@ class TradingOrchestrator:
             (14, 0), (14, 30),
             (15, 0), (15, 30)
         ]
-        for hour, minute in scan_times:
-            self.scheduler.schedule(
-                f"intraday_scan_{hour:02d}{minute:02d}",
-                datetime_time(hour, minute),
-                self.run_intraday_scan_workflow,
-                run_once_per_day=False
-            )
+        # One task for all scan times, so a slow scan is skipped over rather than stacked
+        self.scheduler.schedule_daily(
+            "intraday_scan",
+            [datetime_time(hour, minute) for hour, minute in scan_times],
+            self.run_intraday_scan_workflow
+        )
 
         # After-hours screening - Every 2 hours
-        for hour in [18, 20, 22]:
-            self.scheduler.schedule(
-                f"afterhours_scan_{hour}",
-                datetime_time(hour, 0),
-                self.run_monitoring_workflow,
-                run_once_per_day=False
-            )
+        self.scheduler.schedule_daily(
+            "afterhours_scan",
+            [datetime_time(hour, 0) for hour in [18, 20, 22]],
+            self.run_monitoring_workflow
+        )
 
         # End-of-day review (4pm EST)
-        self.scheduler.schedule(
+        self.scheduler.schedule_daily(
             "eod_review",
             datetime_time(16, 0),
-            self.run_eod_workflow,
-            run_once_per_day=True
+            self.run_eod_workflow
         )
 
         # Weekly review (Friday 4:05pm EST)
-        self.scheduler.schedule(
+        self.scheduler.schedule_daily(
             "weekly_review",
             datetime_time(16, 5),
             self.run_weekly_workflow,
-            run_once_per_day=True
+            weekdays=[4]
         )
 
     def run_pre_market_workflow(self):
@@ -418,7 +440,7 @@ class TradingOrchestrator:
                             "order_id": str(order_response.id),
                             "status": order_response.status
                         }
-                        self.daily_trades.append(trade_record)
+                        self._record_trade(trade_record)
 
                         # Note: Notification consolidated below with market open summary
 
@@ -439,7 +461,7 @@ class TradingOrchestrator:
                         "target": target,
                         "timestamp": datetime.now().isoformat()
                     }
-                    self.daily_trades.append(trade_record)
+                    self._record_trade(trade_record)
 
                     logger.info(f"📝 Paper trade logged: {symbol} x {position_size} shares")
 
@@ -563,7 +585,7 @@ class TradingOrchestrator:
                                     "order_id": str(order_response.id),
                                     "type": "intraday"
                                 }
-                                self.daily_trades.append(trade_record)
+                                self._record_trade(trade_record)
                                 trades_executed += 1
 
                                 # Note: Notification consolidated below with intraday summary
@@ -582,7 +604,7 @@ class TradingOrchestrator:
                                 "timestamp": datetime.now().isoformat(),
                                 "type": "intraday"
                             }
-                            self.daily_trades.append(trade_record)
+                            self._record_trade(trade_record)
                             trades_executed += 1
                             logger.info(f"📝 Intraday paper trade logged: {symbol}")
 
@@ -633,12 +655,11 @@ class TradingOrchestrator:
                         logger.info("No open positions to monitor")
                         return
 
-                    # Match positions with daily trades to get stop/target info
+                    symbols, prices, quantities, info = [], [], [], []
                     for position in positions:
                         symbol = position.symbol
                         current_price = float(position.current_price)
                         avg_entry = float(position.avg_entry_price)
-                        qty = float(position.qty)
 
                         # Calculate P&L
                         unrealized_pl = float(position.unrealized_pl)
@@ -649,39 +670,35 @@ class TradingOrchestrator:
                             f"| P&L: ${unrealized_pl:.2f} ({unrealized_plpc:.2f}%)"
                         )
 
-                        # Find trade record to get stop/target levels
-                        trade_record = next(
-                            (t for t in self.daily_trades if t["symbol"] == symbol),
-                            None
-                        )
-
-                        if not trade_record:
+                        if symbol not in self.position_monitor.levels:
                             logger.warning(f"No trade record found for {symbol}")
                             continue
 
-                        stop_loss = trade_record.get("stop_loss")
-                        target = trade_record.get("target")
-
-                        # Check stop loss (exit if price <= stop)
-                        if stop_loss and current_price <= stop_loss:
-                            logger.warning(f"Stop loss hit for {symbol}: ${current_price:.2f} <= ${stop_loss:.2f}")
-                            self._execute_exit_order(
-                                symbol, qty, current_price, "Stop Loss",
-                                unrealized_pl, unrealized_plpc
+                        symbols.append(symbol)
+                        prices.append(current_price)
+                        quantities.append(float(position.qty))
+                        info.append({"pl": unrealized_pl, "plpc": unrealized_plpc})
+
+                    # Check every position against its stop/target in one pass
+                    exits = self.position_monitor.evaluate(symbols, prices, quantities, info)
+                    for exit_signal in exits:
+                        if exit_signal.reason == STOP_LOSS:
+                            logger.warning(
+                                f"Stop loss hit for {exit_signal.symbol}: "
+                                f"${exit_signal.price:.2f} <= ${exit_signal.level:.2f}"
                             )
-                            continue
-
-                        # Check target (exit if price >= target)
-                        if target and current_price >= target:
-                            logger.info(f"Target reached for {symbol}: ${current_price:.2f} >= ${target:.2f}")
-                            self._execute_exit_order(
-                                symbol, qty, current_price, "Target",
-                                unrealized_pl, unrealized_plpc
+                        else:
+                            logger.info(
+                                f"Target reached for {exit_signal.symbol}: "
+                                f"${exit_signal.price:.2f} >= ${exit_signal.level:.2f}"
                             )
-                            continue
 
-                        # Optional: Implement trailing stop adjustment
-                        # For now, we just log and monitor
+                    # Submit all exits concurrently; a failed order does not hold up the others
+                    for result in self.position_monitor.submit_exits(exits, self._submit_exit_order):
+                        self._finish_exit_order(result)
+
+                    # Optional: Implement trailing stop adjustment
+                    # For now, we just log and monitor
 
                     logger.info("Position monitoring complete")
 
@@ -702,44 +719,55 @@ class TradingOrchestrator:
             logger.error(f"Monitoring workflow error: {e}")
             self.workflow.add_error(str(e))
 
-    def _execute_exit_order(
-        self,
-        symbol: str,
-        qty: float,
-        current_price: float,
-        reason: str,
-        realized_pl: float,
-        realized_plpc: float
-    ):
-        """Execute exit order for a position."""
-        try:
-            # Submit SELL order
-            order_request = MarketOrderRequest(
-                symbol=symbol,
-                qty=qty,
-                side=OrderSide.SELL,
-                time_in_force=TimeInForce.DAY
-            )
+    def _submit_exit_order(self, exit_signal: ExitSignal):
+        """Submit the SELL order for an exit (runs on the monitor's worker threads)."""
+        order_request = MarketOrderRequest(
+            symbol=exit_signal.symbol,
+            qty=exit_signal.qty,
+            side=OrderSide.SELL,
+            time_in_force=TimeInForce.DAY
+        )
 
-            logger.info(f"Executing {reason} exit for {symbol}: {qty} shares @ ${current_price:.2f}")
-            order_response = self.auth.submit_order(order_request)
+        logger.info(
+            f"Executing {exit_signal.reason} exit for {exit_signal.symbol}: "
+            f"{exit_signal.qty} shares @ ${exit_signal.price:.2f}"
+        )
+        return self.auth.submit_order(order_request)
 
-            logger.info(f"✅ Exit order placed: {order_response.id} - Status: {order_response.status}")
+    def _finish_exit_order(self, result: ExitResult):
+        """Notify and update tracking for a submitted exit (on the monitoring thread)."""
+        exit_signal = result.signal
+        symbol = exit_signal.symbol
+        reason = exit_signal.reason
 
-            # Send notification
-            self._notify(
-                f"🔴 *{reason} Exit*\n"
-                f"{symbol} x {qty} shares @ ${current_price:.2f}\n"
-                f"P&L: ${realized_pl:.2f} ({realized_plpc:.2f}%)\n"
-                f"Order ID: {order_response.id}"
-            )
+        if not result.ok:
+            logger.error(f"Failed to execute {reason} exit for {symbol}: {result.error}")
+            self._notify(f"❌ *Exit Order Failed*\n{symbol}: {str(result.error)}", "error")
+            return
 
-            # Remove from daily trades tracking
-            self.daily_trades = [t for t in self.daily_trades if t["symbol"] != symbol]
+        order_response = result.order
+        logger.info(f"✅ Exit order placed: {order_response.id} - Status: {order_response.status}")
 
-        except Exception as e:
-            logger.error(f"Failed to execute {reason} exit for {symbol}: {e}")
-            self._notify(f"❌ *Exit Order Failed*\n{symbol}: {str(e)}", "error")
+        # Send notification
+        self._notify(
+            f"🔴 *{reason} Exit*\n"
+            f"{symbol} x {exit_signal.qty} shares @ ${exit_signal.price:.2f}\n"
+            f"P&L: ${exit_signal.info.get('pl', 0.0):.2f} ({exit_signal.info.get('plpc', 0.0):.2f}%)\n"
+            f"Order ID: {order_response.id}"
+        )
+
+        # Remove from daily trades tracking
+        self.daily_trades = [t for t in self.daily_trades if t["symbol"] != symbol]
+        self.position_monitor.levels.remove(symbol)
+
+    def _record_trade(self, trade_record: Dict[str, Any]):
+        """Track a new trade and register its stop/target levels (first trade per symbol wins)."""
+        self.daily_trades.append(trade_record)
+        symbol = trade_record["symbol"]
+        if symbol not in self.position_monitor.levels:
+            self.position_monitor.levels.set(
+                symbol, trade_record.get("stop_loss"), trade_record.get("target")
+            )
 
     def run_eod_workflow(self):
         """End-of-day performance review."""
@@ -790,6 +818,7 @@ class TradingOrchestrator:
             self.workflow.transition(WorkflowTransition.REVIEW_COMPLETE)
             self.workflow.reset()
             self.daily_trades = []
+            self.position_monitor.levels.clear()
 
             logger.info("End-of-day review complete")
 
@@ -840,7 +869,7 @@ class TradingOrchestrator:
             self.workflow.add_error(str(e))
 
     def run_loop(self):
-        """Main event loop - check scheduler every minute."""
+        """Main event loop - sleep until the next scheduled task (at most a minute)."""
         logger.info("Starting orchestrator event loop")
         self.running = True
 
@@ -851,20 +880,20 @@ class TradingOrchestrator:
 
         try:
             while self.running:
-                # Check scheduled tasks
-                triggered = self.scheduler.check_triggers()
+                # Start due tasks on the scheduler's worker pool
+                triggered = self.scheduler.run_pending()
 
                 if triggered:
                     logger.info(f"Triggered tasks: {triggered}")
 
-                # Check workflow state
-                if self.workflow.is_error():
+                # Check workflow state (only between tasks; the worker owns it while one runs)
+                if self.workflow.is_error() and self.scheduler.wait_idle(timeout=0):
                     logger.error("Workflow in ERROR state")
                     # TODO: Implement error recovery
                     self.workflow.reset()
 
-                # Sleep 60 seconds
-                time.sleep(60)
+                # Sleep until the next deadline; wake at least every minute for the state check
+                self.scheduler.wait(max_seconds=60)
 
         except KeyboardInterrupt:
             logger.info("Orchestrator stopped by user")
@@ -877,6 +906,7 @@ class TradingOrchestrator:
         """Stop the orchestrator."""
         logger.info("Stopping orchestrator")
         self.running = False
+        self.scheduler.shutdown(wait=False)
 
     def _save_daily_report(self, review: Dict[str, Any]):
         """Save daily performance report to file."""
@@ -1004,13 +1034,23 @@ class TradingOrchestrator:
 
             # Step 2: Multi-agent LLM consensus
             logger.info(f"Evaluating {symbol} with multi-agent consensus")
-            result = self.multi_agent_workflow.evaluate_trade_opportunity(
-                symbol=symbol,
-                current_price=current_price,
-                portfolio_value=self.portfolio_value,
-                cash_available=self.cash_available,
-                technical_indicators=technical_indicators
-            )
+            workflow_inputs = {
+                'symbol': symbol,
+                'current_price': current_price,
+                'portfolio_value': self.portfolio_value,
+                'cash_available': self.cash_available,
+                'technical_indicators': technical_indicators
+            }
+            if self.decision_replay is not None:
+                # Replayed agents make no live LLM calls, so misses can still run the workflow
+                result = self.decision_replay.fetch(
+                    "evaluate_trade_with_agents",
+                    workflow_inputs,
+                    lambda: self.multi_agent_workflow.evaluate_trade_opportunity(**workflow_inputs),
+                    offline_compute=True
+                )
+            else:
+                result = self.multi_agent_workflow.evaluate_trade_opportunity(**workflow_inputs)
 
             # Log cost tracking
             logger.info(f"Multi-agent evaluation cost: ${result['total_cost_usd']:.4f} ({result['total_tokens']:,} tokens)")
@@ -6,6 +6,7 @@ quantifiable tools and concepts that work for both stocks and crypto.
 Components:
 -----------
 1. enhanced_indicators.py - All technical indicators (RSI, MACD, ATR, BB, OBV, etc.)
+   indicator_context.py - Memoized indicator building blocks, incremental bar updates
 2. market_structure.py - Market structure and multi-timeframe analysis (HH/HL, LH/LL detection)
 3. regime_detector.py - Breakout vs Mean Reversion regime detection
 4. pattern_detector.py - Chart patterns and consolidations
@@ -46,6 +47,7 @@ Example usage:
 __version__ = "1.0.0"
 
 from .enhanced_indicators import EnhancedIndicators
+from .indicator_context import IndicatorContext, INDICATOR_GRAPH
 from .market_structure import MarketStructureAnalyzer, MultiTimeframeAnalyzer
 from .regime_detector import RegimeDetector
 from .pattern_detector import PatternDetector
@@ -56,6 +58,8 @@ from .trading_journal import TradingJournal
 
 __all__ = [
     'EnhancedIndicators',
+    'IndicatorContext',
+    'INDICATOR_GRAPH',
     'MarketStructureAnalyzer',
     'MultiTimeframeAnalyzer',
     'RegimeDetector',
@@ -13,14 +13,28 @@ Provides all quantifiable indicators:
 
 All indicators return structured data with clear interpretation.
 No astrology with candles - just math.
+
+Every method accepts a DataFrame or an IndicatorContext; passing one context
+to several methods computes shared series (SMAs, EMAs, true range) once.
 """
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from decimal import Decimal
 
+from .indicator_context import (
+    IndicatorContext,
+    as_context,
+    ema_key,
+    macd_keys,
+    rsi_keys,
+    sma_key,
+)
+
+Frame = Union[pd.DataFrame, IndicatorContext]
+
 
 @dataclass
 class MovingAverageResult:
@@ -132,16 +146,20 @@ class EnhancedIndicators:
         """Initialize indicator calculator."""
         pass
 
+    def context(self, df: pd.DataFrame) -> IndicatorContext:
+        """Create a shared computation context for one frame."""
+        return IndicatorContext(df)
+
     # Tool 5: Moving Averages
     def calculate_moving_averages(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         price_col: str = 'close'
     ) -> MovingAverageResult:
         """Calculate moving averages and alignment.
 
         Args:
-            df: DataFrame with OHLCV data
+            df: DataFrame with OHLCV data (or IndicatorContext)
             price_col: Column name for price (default: 'close')
 
         Returns:
@@ -152,18 +170,19 @@ class EnhancedIndicators:
             - Golden cross: SMA50 crosses above SMA200 (bullish)
             - Death cross: SMA50 crosses below SMA200 (bearish)
         """
-        prices = df[price_col]
-        current_price = float(prices.iloc[-1])
+        ctx = as_context(df)
+        prices = ctx.values(price_col)
+        current_price = float(prices[-1])
 
         # Calculate SMAs
-        sma_20 = float(prices.rolling(window=20).mean().iloc[-1])
-        sma_50 = float(prices.rolling(window=50).mean().iloc[-1])
-        sma_200 = float(prices.rolling(window=200).mean().iloc[-1])
+        sma_20 = float(ctx.values(sma_key(price_col, 20))[-1])
+        sma_50 = float(ctx.values(sma_key(price_col, 50))[-1])
+        sma_200 = float(ctx.values(sma_key(price_col, 200))[-1])
 
         # Calculate EMAs
-        ema_20 = float(prices.ewm(span=20, adjust=False).mean().iloc[-1])
-        ema_50 = float(prices.ewm(span=50, adjust=False).mean().iloc[-1])
-        ema_200 = float(prices.ewm(span=200, adjust=False).mean().iloc[-1])
+        ema_20 = float(ctx.values(ema_key(price_col, 20))[-1])
+        ema_50 = float(ctx.values(ema_key(price_col, 50))[-1])
+        ema_200 = float(ctx.values(ema_key(price_col, 200))[-1])
 
         # Check alignment
         above_sma_20 = current_price > sma_20
@@ -179,21 +198,21 @@ class EnhancedIndicators:
             ma_alignment = 'mixed'
 
         # Detect crosses (check last 3 periods)
-        sma_50_series = prices.rolling(window=50).mean()
-        sma_200_series = prices.rolling(window=200).mean()
+        sma_50_series = ctx.values(sma_key(price_col, 50))
+        sma_200_series = ctx.values(sma_key(price_col, 200))
 
         golden_cross = False
         death_cross = False
 
-        if len(df) >= 203:  # Need enough data
+        if len(ctx) >= 203:  # Need enough data
             # Check if SMA50 crossed above SMA200 in last 3 periods
             for i in range(1, 4):
-                if (sma_50_series.iloc[-i-1] <= sma_200_series.iloc[-i-1] and
-                    sma_50_series.iloc[-i] > sma_200_series.iloc[-i]):
+                if (sma_50_series[-i-1] <= sma_200_series[-i-1] and
+                    sma_50_series[-i] > sma_200_series[-i]):
                     golden_cross = True
                     break
-                if (sma_50_series.iloc[-i-1] >= sma_200_series.iloc[-i-1] and
-                    sma_50_series.iloc[-i] < sma_200_series.iloc[-i]):
+                if (sma_50_series[-i-1] >= sma_200_series[-i-1] and
+                    sma_50_series[-i] < sma_200_series[-i]):
                     death_cross = True
                     break
 
@@ -216,7 +235,7 @@ class EnhancedIndicators:
     # Tool 6: RSI
     def calculate_rsi(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         period: int = 14,
         price_col: str = 'close'
     ) -> RSIResult:
@@ -237,12 +256,13 @@ class EnhancedIndicators:
             - RSI > 70: Overbought (but can stay there in uptrend!)
             - Divergence: Price makes new high but RSI doesn't = warning
         """
-        prices = df[price_col]
+        ctx = as_context(df)
+        prices = ctx.get(price_col)
 
         # Calculate RSI
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        gain_key, loss_key = rsi_keys(period, price_col)
+        gain = ctx.get(gain_key)
+        loss = ctx.get(loss_key)
 
         rs = gain / loss
         rsi = 100 - (100 / (1 + rs))
@@ -250,7 +270,7 @@ class EnhancedIndicators:
 
         # Detect divergence (compare last 2 significant swings)
         divergence = None
-        if len(df) >= period * 3:
+        if len(ctx) >= period * 3:
             # Find recent price highs/lows
             price_peaks = (prices > prices.shift(1)) & (prices > prices.shift(-1))
             rsi_peaks = (rsi > rsi.shift(1)) & (rsi > rsi.shift(-1))
@@ -279,7 +299,7 @@ class EnhancedIndicators:
     # Tool 7: MACD
     def calculate_macd(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         fast: int = 12,
         slow: int = 26,
         signal: int = 9,
@@ -303,36 +323,34 @@ class EnhancedIndicators:
             - Histogram expanding: Momentum increasing
             - Use with higher-TF trend filter!
         """
-        prices = df[price_col]
+        ctx = as_context(df)
 
         # Calculate MACD
-        ema_fast = prices.ewm(span=fast, adjust=False).mean()
-        ema_slow = prices.ewm(span=slow, adjust=False).mean()
-
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-        histogram = macd_line - signal_line
+        line_key, signal_key = macd_keys(fast, slow, signal, price_col)
+        macd_line = ctx.values(line_key)
+        signal_line = ctx.values(signal_key)
+        histogram = macd_line[-3:] - signal_line[-3:]
 
-        current_macd = float(macd_line.iloc[-1])
-        current_signal = float(signal_line.iloc[-1])
-        current_histogram = float(histogram.iloc[-1])
+        current_macd = float(macd_line[-1])
+        current_signal = float(signal_line[-1])
+        current_histogram = float(histogram[-1])
 
         # Detect crosses (last 2 periods)
         cross_up = False
         cross_down = False
 
-        if len(df) >= slow + signal:
-            if (macd_line.iloc[-2] <= signal_line.iloc[-2] and
-                macd_line.iloc[-1] > signal_line.iloc[-1]):
+        if len(ctx) >= slow + signal:
+            if (macd_line[-2] <= signal_line[-2] and
+                macd_line[-1] > signal_line[-1]):
                 cross_up = True
-            elif (macd_line.iloc[-2] >= signal_line.iloc[-2] and
-                  macd_line.iloc[-1] < signal_line.iloc[-1]):
+            elif (macd_line[-2] >= signal_line[-2] and
+                  macd_line[-1] < signal_line[-1]):
                 cross_down = True
 
         # Check if histogram is expanding
         histogram_expanding = False
-        if len(histogram) >= 3:
-            histogram_expanding = abs(histogram.iloc[-1]) > abs(histogram.iloc[-2])
+        if len(ctx) >= 3:
+            histogram_expanding = bool(abs(histogram[-1]) > abs(histogram[-2]))
 
         return MACDResult(
             macd_line=current_macd,
@@ -347,7 +365,7 @@ class EnhancedIndicators:
     # Tool 8: Stochastic
     def calculate_stochastic(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         k_period: int = 14,
         d_period: int = 3
     ) -> StochasticResult:
@@ -367,13 +385,12 @@ class EnhancedIndicators:
             - Sell overbought (>80) near resistance
             - In strong trends, stays pinned - DON'T FIGHT THE TREND
         """
-        high = df['high']
-        low = df['low']
-        close = df['close']
+        ctx = as_context(df)
+        close = ctx.get('close')
 
         # Calculate %K
-        lowest_low = low.rolling(window=k_period).min()
-        highest_high = high.rolling(window=k_period).max()
+        lowest_low = ctx.get(('low', 'min', k_period))
+        highest_high = ctx.get(('high', 'max', k_period))
 
         k = 100 * ((close - lowest_low) / (highest_high - lowest_low))
 
@@ -385,7 +402,7 @@ class EnhancedIndicators:
 
         # Detect bullish cross
         bullish_cross = False
-        if len(df) >= k_period + d_period:
+        if len(ctx) >= k_period + d_period:
             if k.iloc[-2] <= d.iloc[-2] and k.iloc[-1] > d.iloc[-1]:
                 bullish_cross = True
 
@@ -400,7 +417,7 @@ class EnhancedIndicators:
     # Tool 9: ATR (Average True Range)
     def calculate_atr(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         period: int = 14
     ) -> ATRResult:
         """Calculate ATR (volatility measure).
@@ -417,28 +434,19 @@ class EnhancedIndicators:
             - Stop placement: 1.5-3x ATR beyond entry
             - Breakout validation: Higher ATR = more significant move
         """
-        high = df['high']
-        low = df['low']
-        close = df['close']
-
-        # Calculate True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        ctx = as_context(df)
 
-        # Calculate ATR
-        atr = tr.rolling(window=period).mean()
-        current_atr = float(atr.iloc[-1])
-        current_price = float(close.iloc[-1])
+        # Calculate ATR (rolling mean of true range)
+        atr_key = sma_key('true_range', period)
+        current_atr = float(ctx.values(atr_key)[-1])
+        current_price = float(ctx.values('close')[-1])
 
         # ATR as percentage of price
         atr_percent = (current_atr / current_price) * 100
 
         # Determine volatility regime
-        atr_ma = atr.rolling(window=50).mean()
-        avg_atr = float(atr_ma.iloc[-1]) if len(atr_ma) >= 50 else current_atr
+        atr_ma = ctx.values(sma_key(atr_key, 50))
+        avg_atr = float(atr_ma[-1]) if len(atr_ma) >= 50 else current_atr
 
         if current_atr < avg_atr * 0.7:
             volatility_regime = 'low'
@@ -458,7 +466,7 @@ class EnhancedIndicators:
     # Tool 10: Bollinger Bands
     def calculate_bollinger_bands(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         period: int = 20,
         std_dev: float = 2.0,
         price_col: str = 'close'
@@ -480,13 +488,14 @@ class EnhancedIndicators:
             - Price at lower band in downtrend: Weakness, not necessarily bounce
             - Use with trend context!
         """
-        prices = df[price_col]
+        ctx = as_context(df)
+        prices = ctx.get(price_col)
 
         # Calculate middle band (SMA)
-        middle = prices.rolling(window=period).mean()
+        middle = ctx.get(sma_key(price_col, period))
 
         # Calculate standard deviation
-        std = prices.rolling(window=period).std()
+        std = ctx.get((price_col, 'std', period))
 
         # Calculate bands
         upper = middle + (std * std_dev)
@@ -523,7 +532,7 @@ class EnhancedIndicators:
     # Tool 11: Volume Analysis
     def calculate_volume(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         period: int = 20
     ) -> VolumeResult:
         """Analyze volume for confirmation.
@@ -541,11 +550,11 @@ class EnhancedIndicators:
             - Rising volume in trend = healthy
             - Falling volume in trend = weakening
         """
-        volume = df['volume']
-        close = df['close']
+        ctx = as_context(df)
+        close = ctx.values('close')
 
-        current_volume = float(volume.iloc[-1])
-        avg_volume = float(volume.rolling(window=period).mean().iloc[-1])
+        current_volume = float(ctx.values('volume')[-1])
+        avg_volume = float(ctx.values(sma_key('volume', period))[-1])
 
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
 
@@ -556,9 +565,9 @@ class EnhancedIndicators:
         climax = False
         if spike and volume_ratio > 3.0:
             # Check if price is at extreme (near recent high/low)
-            recent_high = close.rolling(window=period).max().iloc[-1]
-            recent_low = close.rolling(window=period).min().iloc[-1]
-            current_price = close.iloc[-1]
+            recent_high = ctx.values(('close', 'max', period))[-1]
+            recent_low = ctx.values(('close', 'min', period))[-1]
+            current_price = close[-1]
 
             price_range = recent_high - recent_low
             if price_range > 0:
@@ -577,7 +586,7 @@ class EnhancedIndicators:
     # Tool 12: OBV (On-Balance Volume)
     def calculate_obv(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         ma_period: int = 20
     ) -> OBVResult:
         """Calculate On-Balance Volume.
@@ -594,27 +603,26 @@ class EnhancedIndicators:
             - OBV falling + price flat: Distribution (bearish)
             - Divergence between price and OBV warns of reversal
         """
-        close = df['close']
-        volume = df['volume']
+        ctx = as_context(df)
+        close = ctx.values('close')
 
         # Calculate OBV
-        obv = (np.sign(close.diff()) * volume).fillna(0).cumsum()
+        obv = ctx.values('obv')
 
-        current_obv = float(obv.iloc[-1])
+        current_obv = float(obv[-1])
 
         # OBV moving average
-        obv_ma = obv.rolling(window=ma_period).mean()
-        current_obv_ma = float(obv_ma.iloc[-1])
+        current_obv_ma = float(ctx.values(sma_key('obv', ma_period))[-1])
 
         # Check if OBV is rising
         obv_rising = current_obv > current_obv_ma
 
         # Detect divergence (simplified)
         divergence = None
-        if len(df) >= ma_period * 2:
+        if len(ctx) >= ma_period * 2:
             # Compare last 20-period price trend vs OBV trend
-            price_change = (close.iloc[-1] - close.iloc[-ma_period]) / close.iloc[-ma_period]
-            obv_change = (obv.iloc[-1] - obv.iloc[-ma_period]) / abs(obv.iloc[-ma_period])
+            price_change = (close[-1] - close[-ma_period]) / close[-ma_period]
+            obv_change = (obv[-1] - obv[-ma_period]) / abs(obv[-ma_period])
 
             # Bullish divergence: price down, OBV up
             if price_change < -0.05 and obv_change > 0.05:
@@ -633,7 +641,7 @@ class EnhancedIndicators:
     # Tool 13: Volume Profile (simplified POC)
     def calculate_volume_profile(
         self,
-        df: pd.DataFrame,
+        df: Frame,
         num_bins: int = 24
     ) -> VolumeProfileResult:
         """Calculate Volume Profile and Point of Control.
@@ -651,8 +659,9 @@ class EnhancedIndicators:
             - Low volume nodes: Likely rejection/bounce areas
             - Use for support/resistance and targets
         """
-        close = df['close']
-        volume = df['volume']
+        ctx = as_context(df)
+        close = ctx.get('close')
+        volume = ctx.get('volume')
 
         price_min = close.min()
         price_max = close.max()
@@ -0,0 +1,359 @@
+"""Indicator Context - memoized building blocks shared by all indicators.
+
+Every indicator family in the TA framework is built from a handful of
+primitive series: rolling means/stds/extremes, EMAs, true range, price
+deltas. Computed naively, one `TACoordinator.analyze` call rebuilds the
+same SMA(50) or true range several times.
+
+`IndicatorContext` wraps one OHLCV frame and memoizes those primitives by
+key `(source, op, window)`:
+
+    ('close', 'sma', 20)                       # 20-period SMA of close
+    ('true_range', 'sma', 14)                  # ATR(14)
+    (('true_range', 'sma', 14), 'sma', 50)     # 50-period mean of ATR(14)
+
+A source is a frame column, a derived series name (see DERIVED_SOURCES) or
+another key, so keys form a small dependency graph. `INDICATOR_GRAPH`
+declares the primitives each indicator family needs; `prepare()` resolves
+them once and `EnhancedIndicators` reads them back from the cache.
+
+Incremental mode:
+    `append(bar)` adds one bar and extends every cached series in place.
+    SMA, EMA, rolling std, diffs, gains/losses, true range, MACD lines and
+    OBV update in O(1); rolling min/max rescan their window (O(window)).
+    Values match a full recompute up to float rounding.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# (source, op, param) - source is a column, derived name or another key
+IndicatorKey = Tuple[Any, str, Any]
+Source = Union[str, IndicatorKey]
+
+DERIVED_SOURCES = ('true_range', 'obv')
+
+
+def sma_key(source: Source, window: int) -> IndicatorKey:
+    """Key of a simple moving average."""
+    return (source, 'sma', window)
+
+
+def ema_key(source: Source, span: int) -> IndicatorKey:
+    """Key of an exponential moving average (adjust=False)."""
+    return (source, 'ema', span)
+
+
+def macd_keys(
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    price_col: str = 'close'
+) -> Tuple[IndicatorKey, IndicatorKey]:
+    """Keys of the MACD line and its signal line."""
+    line = (ema_key(price_col, fast), 'sub', ema_key(price_col, slow))
+    return line, ema_key(line, signal)
+
+
+def rsi_keys(period: int = 14, price_col: str = 'close') -> Tuple[IndicatorKey, IndicatorKey]:
+    """Keys of the average gain and average loss used by RSI."""
+    return (
+        sma_key((price_col, 'gain', 1), period),
+        sma_key((price_col, 'loss', 1), period),
+    )
+
+
+# Primitives each EnhancedIndicators family reads (default parameters)
+INDICATOR_GRAPH: Dict[str, Tuple[IndicatorKey, ...]] = {
+    'moving_averages': (
+        sma_key('close', 20), sma_key('close', 50), sma_key('close', 200),
+        ema_key('close', 20), ema_key('close', 50), ema_key('close', 200),
+    ),
+    'rsi': rsi_keys(),
+    'macd': macd_keys(),
+    'stochastic': (('low', 'min', 14), ('high', 'max', 14)),
+    'atr': (sma_key('true_range', 14), sma_key(sma_key('true_range', 14), 50)),
+    'bollinger_bands': (sma_key('close', 20), ('close', 'std', 20)),
+    'volume': (sma_key('volume', 20), ('close', 'max', 20), ('close', 'min', 20)),
+    'obv': (sma_key('obv', 20),),
+}
+
+
+def as_context(data: Union[pd.DataFrame, 'IndicatorContext']) -> 'IndicatorContext':
+    """Wrap a DataFrame in a fresh context (contexts are passed through)."""
+    if isinstance(data, IndicatorContext):
+        return data
+    return IndicatorContext(data)
+
+
+class IndicatorContext:
+    """Per-frame cache of indicator primitives with optional bar appends.
+
+    Usage:
+        ctx = IndicatorContext(df)
+        ctx.prepare(['moving_averages', 'atr'])
+        sma_50 = ctx.get(('close', 'sma', 50))
+
+        ctx.append({'open': ..., 'high': ..., 'low': ..., 'close': ...,
+                    'volume': ...}, timestamp=ts)
+
+    Series returned by `get()` are read-only views into the cache and are
+    invalidated by the next `append()`.
+    """
+
+    def __init__(self, df: pd.DataFrame, capacity: Optional[int] = None):
+        """Initialize context for a frame.
+
+        Args:
+            df: DataFrame with OHLCV data (numeric columns are cached)
+            capacity: Initial buffer size in bars (grows as bars are appended)
+        """
+        self._length = len(df)
+        self._capacity = max(capacity or 0, self._length, 1)
+        self._frame: Optional[pd.DataFrame] = df
+        self._index: Optional[pd.Index] = df.index
+        self._index_name = df.index.name
+        self._tz = getattr(df.index, 'tz', None)
+        self._is_datetime = isinstance(df.index, pd.DatetimeIndex)
+        # Index buffer is only needed once bars are appended
+        self._index_buf: Optional[np.ndarray] = None
+
+        self.columns = [
+            col for col, dtype in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype)
+        ]
+        self._column_set = set(self.columns)
+        # Columns are copied in lazily; derived primitives follow their
+        # dependencies in insertion order
+        self._buffers: Dict[Hashable, np.ndarray] = {}
+        self._series: Dict[Hashable, pd.Series] = {}
+        self._state: Dict[Hashable, float] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _allocate(self, values: np.ndarray) -> np.ndarray:
+        """Copy values into a new buffer of the current capacity."""
+        buf = np.empty(self._capacity, dtype=values.dtype)
+        buf[:len(values)] = values
+        return buf
+
+    @property
+    def index(self) -> pd.Index:
+        """Index of the cached bars."""
+        if self._index is None:
+            values = self._index_buf[:self._length]
+            if self._tz is not None:
+                index = pd.DatetimeIndex(values).tz_localize('UTC').tz_convert(self._tz)
+            else:
+                index = pd.Index(values)
+            self._index = index.rename(self._index_name)
+        return self._index
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """DataFrame of the cached columns (rebuilt lazily after appends)."""
+        if self._frame is None:
+            self._frame = pd.DataFrame(
+                {col: self._buffers[col][:self._length] for col in self.columns},
+                index=self.index
+            )
+        return self._frame
+
+    def prepare(self, indicators: Iterable[str]) -> None:
+        """Compute the primitives of the given INDICATOR_GRAPH families."""
+        for name in indicators:
+            for key in INDICATOR_GRAPH[name]:
+                self.values(key)
+
+    def values(self, key: Source) -> np.ndarray:
+        """Cached values of a primitive as a read-only array."""
+        if key in self._buffers:
+            self.hits += 1
+        elif key in self._column_set:
+            self._buffers[key] = self._allocate(self._frame[key].to_numpy(dtype=np.float64))
+        else:
+            self.misses += 1
+            self._buffers[key] = self._allocate(self._compute(key).to_numpy(dtype=np.float64))
+        view = self._buffers[key][:self._length]
+        view.flags.writeable = False
+        return view
+
+    def get(self, key: Source) -> pd.Series:
+        """Cached primitive as a Series aligned with the frame index."""
+        values = self.values(key)
+        series = self._series.get(key)
+        if series is None:
+            series = pd.Series(
+                values, index=self.index, name=key if isinstance(key, str) else None, copy=False
+            )
+            self._series[key] = series
+        return series
+
+    def _source(self, key: Source) -> pd.Series:
+        """Cached primitive without the frame index (cheaper to compute on)."""
+        return pd.Series(self.values(key), copy=False)
+
+    def _compute(self, key: Source) -> pd.Series:
+        """Full (vectorized) computation of one primitive."""
+        if isinstance(key, str):
+            if key == 'true_range':
+                high, low, close = self.values('high'), self.values('low'), self.values('close')
+                prev_close = np.concatenate(([np.nan], close[:-1]))
+                # fmax skips NaN like DataFrame.max(axis=1)
+                tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+                return pd.Series(tr, copy=False)
+            if key == 'obv':
+                close, volume = self._source('close'), self._source('volume')
+                return (np.sign(close.diff()) * volume).fillna(0).cumsum()
+            raise KeyError(f"Unknown indicator source: {key}")
+
+        source, op, param = key
+        series = self._source(source)
+        if op == 'sma':
+            return series.rolling(window=param).mean()
+        if op == 'std':
+            return series.rolling(window=param).std()
+        if op == 'min':
+            return series.rolling(window=param).min()
+        if op == 'max':
+            return series.rolling(window=param).max()
+        if op == 'ema':
+            return series.ewm(span=param, adjust=False).mean()
+        if op == 'diff':
+            return series.diff(param)
+        if op == 'gain':
+            delta = series.diff(param)
+            return delta.where(delta > 0, 0)
+        if op == 'loss':
+            delta = series.diff(param)
+            return -delta.where(delta < 0, 0)
+        if op == 'sub':
+            return series - self._source(param)
+        raise KeyError(f"Unknown indicator op: {op}")
+
+    def append(self, bar: Mapping[str, float], timestamp: Any = None) -> None:
+        """Append one bar and extend every cached primitive.
+
+        Args:
+            bar: Values for every cached column (open/high/low/close/volume)
+            timestamp: Index label of the bar; defaults to the next integer
+                for non-datetime indexes
+
+        Raises:
+            ValueError: If the bar is missing a column or has no timestamp
+        """
+        missing = [col for col in self.columns if col not in bar]
+        if missing:
+            raise ValueError(f"Bar is missing columns: {missing}")
+        if self._index_buf is None:
+            self._materialize()
+        if timestamp is None:
+            if self._is_datetime or self._length == 0:
+                raise ValueError("timestamp is required for this index")
+            timestamp = self._index_buf[self._length - 1] + 1
+        elif self._is_datetime:
+            timestamp = pd.Timestamp(timestamp)
+            if self._tz is not None:
+                timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+            timestamp = timestamp.to_datetime64()
+
+        if self._length == self._capacity:
+            self._grow()
+        i = self._length
+        self._length += 1
+        self._index_buf[i] = timestamp
+        for col in self.columns:
+            self._buffers[col][i] = bar[col]
+
+        # Dependencies were inserted before their dependents, so dict order
+        # is a valid update order
+        for key, buf in self._buffers.items():
+            if key not in self._column_set:
+                buf[i] = self._step(key, i)
+
+        self._index = None
+        self._frame = None
+        self._series.clear()
+
+    def _materialize(self) -> None:
+        """Copy the index and all columns into buffers before the first append."""
+        index = self.index
+        self._index_buf = self._allocate(
+            index.tz_convert(None).values if self._tz is not None else np.asarray(index)
+        )
+        for col in self.columns:
+            self.values(col)
+
+    def _grow(self) -> None:
+        """Double buffer capacity (amortized O(1) appends)."""
+        self._capacity *= 2
+        for key, buf in list(self._buffers.items()):
+            self._buffers[key] = self._allocate(buf[:self._length])
+        self._index_buf = self._allocate(self._index_buf[:self._length])
+
+    def _step(self, key: Source, i: int) -> float:
+        """Value of a cached primitive at the newly appended position i."""
+        buffers = self._buffers
+        if isinstance(key, str):
+            if key == 'true_range':
+                high, low = buffers['high'][i], buffers['low'][i]
+                if i == 0:
+                    return high - low
+                prev_close = buffers['close'][i - 1]
+                return np.nanmax([high - low, abs(high - prev_close), abs(low - prev_close)])
+            # obv
+            close = buffers['close']
+            if i == 0:
+                return 0.0
+            move = np.sign(close[i] - close[i - 1]) * buffers['volume'][i]
+            return buffers[key][i - 1] + (0.0 if np.isnan(move) else move)
+
+        source, op, param = key
+        x = buffers[source]
+        prev = buffers[key][i - 1] if i > 0 else np.nan
+
+        if op in ('sma', 'std', 'min', 'max'):
+            if i < param - 1:
+                return np.nan
+            window = x[i - param + 1:i + 1]
+            if op == 'min':
+                return window.min()
+            if op == 'max':
+                return window.max()
+            if op == 'sma':
+                if i >= param and not np.isnan(prev) and not np.isnan(x[i]):
+                    return prev + (x[i] - x[i - param]) / param
+                return window.mean()
+            # Sliding-window update of the variance around the running mean
+            mean = self._state.get(key)
+            if mean is None or np.isnan(prev) or np.isnan(x[i]) or i < param:
+                mean = window.mean()
+                self._state[key] = mean
+                return window.std(ddof=1)
+            old, new = x[i - param], x[i]
+            new_mean = mean + (new - old) / param
+            var = prev * prev + (new - old) * (new - new_mean + old - mean) / (param - 1)
+            self._state[key] = new_mean
+            return np.sqrt(max(var, 0.0))
+        if op == 'ema':
+            if np.isnan(prev):
+                return x[i]
+            if np.isnan(x[i]):
+                return prev
+            alpha = 2.0 / (param + 1)
+            return prev + alpha * (x[i] - prev)
+        if op in ('diff', 'gain', 'loss'):
+            delta = x[i] - x[i - param] if i >= param else np.nan
+            if op == 'diff':
+                return delta
+            if op == 'gain':
+                return delta if delta > 0 else 0.0
+            return -delta if delta < 0 else 0.0
+        # sub
+        return x[i] - buffers[param][i]
@@ -7,11 +7,12 @@ No astrology. No feelings. Just quantifiable, backtestable signals.
 """
 
 import pandas as pd
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
 import logging
 
 from .enhanced_indicators import EnhancedIndicators
+from .indicator_context import IndicatorContext
 from .market_structure import MarketStructureAnalyzer, MultiTimeframeAnalyzer
 from .regime_detector import RegimeDetector
 from .pattern_detector import PatternDetector
@@ -20,6 +21,11 @@ from .risk_calculator import RiskCalculator
 
 logger = logging.getLogger(__name__)
 
+# Indicator families analyze() reads from the shared IndicatorContext
+ANALYZE_INDICATORS = (
+    'moving_averages', 'rsi', 'macd', 'stochastic', 'atr', 'bollinger_bands'
+)
+
 
 @dataclass
 class TASignal:
@@ -95,6 +101,12 @@ class TACoordinator:
             # Execute trade with signal.position_size_shares
             # Stop at signal.stop_loss
             # Target at signal.take_profit
+
+    Streaming usage (cached indicator series are extended bar by bar):
+        ctx = IndicatorContext(df_1h)
+        for bar, ts in live_bars:
+            ctx.append(bar, timestamp=ts)
+            signal = ta.analyze('BTCUSD', data={'1h': ctx})
     """
 
     def __init__(
@@ -137,7 +149,7 @@ class TACoordinator:
     def analyze(
         self,
         symbol: str,
-        data: Dict[str, pd.DataFrame],
+        data: Dict[str, Union[pd.DataFrame, IndicatorContext]],
         primary_timeframe: str = '1h',
         win_rate: Optional[float] = None
     ) -> TASignal:
@@ -147,6 +159,7 @@ class TACoordinator:
             symbol: Trading symbol (e.g., 'BTCUSD', 'AAPL')
             data: Dict mapping timeframe to DataFrame
                   e.g., {'15m': df_15m, '1h': df_1h, '4h': df_4h, '1d': df_1d}
+                  Any frame may be an IndicatorContext (incremental mode)
             primary_timeframe: Which timeframe to use for entry/exit (default: '1h')
             win_rate: Historical win rate for EV calculation (optional)
 
@@ -169,7 +182,17 @@ class TACoordinator:
         if primary_timeframe not in data:
             raise ValueError(f"Primary timeframe {primary_timeframe} not in data")
 
-        primary_df = data[primary_timeframe]
+        # Indicators share one context, so each primitive is computed once
+        ctx = data[primary_timeframe]
+        if not isinstance(ctx, IndicatorContext):
+            ctx = IndicatorContext(ctx)
+        ctx.prepare(ANALYZE_INDICATORS)
+        data = {
+            tf: frame.frame if isinstance(frame, IndicatorContext) else frame
+            for tf, frame in data.items()
+        }
+
+        primary_df = ctx.frame
         current_price = float(primary_df['close'].iloc[-1])
         timestamp = primary_df.index[-1] if isinstance(primary_df.index, pd.DatetimeIndex) else pd.Timestamp.now()
 
@@ -205,12 +228,12 @@ class TACoordinator:
         regime_result = self.regime_detector.detect(primary_df)
 
         # 5-10. Technical indicators
-        ma_result = self.indicators.calculate_moving_averages(primary_df)
-        rsi_result = self.indicators.calculate_rsi(primary_df)
-        macd_result = self.indicators.calculate_macd(primary_df)
-        stoch_result = self.indicators.calculate_stochastic(primary_df)
-        atr_result = self.indicators.calculate_atr(primary_df)
-        bb_result = self.indicators.calculate_bollinger_bands(primary_df)
+        ma_result = self.indicators.calculate_moving_averages(ctx)
+        rsi_result = self.indicators.calculate_rsi(ctx)
+        macd_result = self.indicators.calculate_macd(ctx)
+        stoch_result = self.indicators.calculate_stochastic(ctx)
+        atr_result = self.indicators.calculate_atr(ctx)
+        bb_result = self.indicators.calculate_bollinger_bands(ctx)
 
         # MA analysis
         if ma_result.ma_alignment == 'bullish':
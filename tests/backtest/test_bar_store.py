@@ -0,0 +1,236 @@
+"""
+Tests for the partitioned bar store and HistoricalDataManager gap fetching.
+
+Tests interval arithmetic, partitioned writes and range reads, fetching only
+uncovered ranges with a fake fetcher, and migration of legacy cache files.
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.backtest.bar_store import (
+    PartitionedBarStore,
+    merge_intervals,
+    missing_intervals,
+)
+from trading_bot.backtest.exceptions import InsufficientDataError
+from trading_bot.backtest.historical_data_manager import DAILY_TIMEFRAME, HistoricalDataManager
+from trading_bot.backtest.models import HistoricalDataBar
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=UTC)
+
+
+class FakeFetcher:
+    """Daily bars at 05:00 UTC for every weekday in the requested range."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, symbol, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        days = np.arange(
+            np.datetime64(start_date.date(), "D"), np.datetime64(end_date.date(), "D") + 1
+        )
+        bars = []
+        for day in days[np.is_busday(days)]:
+            timestamp = datetime.fromisoformat(str(day)).replace(hour=5, tzinfo=UTC)
+            if not start_date <= timestamp <= end_date:
+                continue
+            close = Decimal("100.25") + Decimal(timestamp.toordinal() % 50) / 4
+            bars.append(HistoricalDataBar(
+                symbol=symbol, timestamp=timestamp,
+                open=close - 1, high=close + 1, low=close - 2, close=close, volume=1000,
+            ))
+        return bars
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = HistoricalDataManager(cache_dir=str(tmp_path / "cache"))
+    manager._fetch_alpaca_data = FakeFetcher()
+    return manager
+
+
+class TestIntervals:
+    """Test suite for interval helpers."""
+
+    def test_merge_overlapping_and_touching(self):
+        a, b, c, d, e = (utc(2024, 1, day) for day in (1, 5, 10, 15, 20))
+
+        assert merge_intervals([(c, d), (a, b), (b, c), (e, e)]) == [(a, d), (e, e)]
+
+    def test_missing_intervals(self):
+        covered = [(utc(2024, 2, 1), utc(2024, 3, 1)), (utc(2024, 4, 1), utc(2024, 5, 1))]
+
+        assert missing_intervals(covered, utc(2024, 1, 1), utc(2024, 6, 1)) == [
+            (utc(2024, 1, 1), utc(2024, 2, 1)),
+            (utc(2024, 3, 1), utc(2024, 4, 1)),
+            (utc(2024, 5, 1), utc(2024, 6, 1)),
+        ]
+        assert missing_intervals(covered, utc(2024, 2, 10), utc(2024, 2, 20)) == []
+        assert missing_intervals([], utc(2024, 1, 1), utc(2024, 1, 2)) == [(utc(2024, 1, 1), utc(2024, 1, 2))]
+
+
+class TestPartitionedBarStore:
+    """Test suite for PartitionedBarStore."""
+
+    def frame(self, days, close=10.0):
+        timestamps = pd.to_datetime(days).tz_localize("UTC")
+        return pd.DataFrame({
+            "symbol": "AAPL", "timestamp": timestamps, "open": close, "high": close, "low": close,
+            "close": close, "volume": 1, "split_adjusted": True, "dividend_adjusted": True,
+        })
+
+    def test_write_partitions_by_month_and_reads_range(self, tmp_path):
+        store = PartitionedBarStore(tmp_path)
+        store.write("AAPL", "1Day", self.frame(["2024-01-30", "2024-01-31", "2024-02-01"]),
+                    utc(2024, 1, 1), utc(2024, 2, 29))
+
+        assert (tmp_path / "AAPL" / "1Day" / "year=2024" / "month=01" / "bars.parquet").exists()
+        assert (tmp_path / "AAPL" / "1Day" / "year=2024" / "month=02" / "bars.parquet").exists()
+
+        table = store.read("AAPL", "1Day", utc(2024, 1, 31), utc(2024, 2, 10), columns=["close"])
+        assert table.column_names == ["close"]
+        assert table.num_rows == 2
+
+    def test_rewrite_replaces_bars_and_clips_to_range(self, tmp_path):
+        store = PartitionedBarStore(tmp_path)
+        store.write("AAPL", "1Day", self.frame(["2024-03-04", "2024-03-05"]), utc(2024, 3, 1), utc(2024, 3, 31))
+
+        # 2024-04-01 lies outside the written range and is dropped
+        store.write("AAPL", "1Day", self.frame(["2024-03-05", "2024-04-01"], close=20.0),
+                    utc(2024, 3, 5), utc(2024, 3, 31))
+
+        table = store.read("AAPL", "1Day", utc(2024, 1, 1), utc(2024, 12, 31))
+        assert table.column("close").to_pylist() == [10.0, 20.0]
+        assert store.coverage("AAPL", "1Day") == [(utc(2024, 3, 1), utc(2024, 3, 31))]
+
+    def test_read_without_data(self, tmp_path):
+        assert PartitionedBarStore(tmp_path).read("MSFT", "1Day", utc(2024, 1, 1), utc(2024, 2, 1)).num_rows == 0
+
+
+class TestGapFetching:
+    """Test suite for HistoricalDataManager fetching only uncovered ranges."""
+
+    def test_extended_range_fetches_only_new_tail(self, manager):
+        fetcher = manager._fetch_alpaca_data
+        first = manager.fetch_data("AAPL", utc(2024, 1, 1), utc(2024, 3, 31))
+
+        extended = manager.fetch_data("AAPL", utc(2024, 1, 1), utc(2024, 6, 30))
+
+        assert fetcher.calls[1] == (utc(2024, 3, 31), utc(2024, 6, 30))
+        assert extended[:len(first)] == first
+        assert extended == FakeFetcher()("AAPL", utc(2024, 1, 1), utc(2024, 6, 30))
+
+    def test_overlapping_ranges_fetch_only_gaps(self, manager):
+        fetcher = manager._fetch_alpaca_data
+        manager.fetch_data("AAPL", utc(2024, 2, 1), utc(2024, 2, 29))
+        manager.fetch_data("AAPL", utc(2024, 4, 1), utc(2024, 4, 30))
+
+        bars = manager.fetch_data("AAPL", utc(2024, 1, 15), utc(2024, 5, 15))
+
+        assert fetcher.calls[2:] == [
+            (utc(2024, 1, 15), utc(2024, 2, 1)),
+            (utc(2024, 2, 29), utc(2024, 4, 1)),
+            (utc(2024, 4, 30), utc(2024, 5, 15)),
+        ]
+        timestamps = [bar.timestamp for bar in bars]
+        assert timestamps == sorted(set(timestamps))
+        assert len(manager.store.missing("AAPL", DAILY_TIMEFRAME, utc(2024, 1, 15), utc(2024, 5, 15))) == 0
+
+    def test_covered_range_and_weekend_gap_do_not_fetch(self, manager):
+        fetcher = manager._fetch_alpaca_data
+        manager.fetch_data("AAPL", utc(2024, 1, 2), utc(2024, 1, 5, 23))  # Tue-Fri
+
+        sub_range = manager.fetch_data("AAPL", utc(2024, 1, 3), utc(2024, 1, 4, 23))
+        manager.fetch_data("AAPL", utc(2024, 1, 2), utc(2024, 1, 7, 23))  # Adds Sat-Sun
+
+        assert len(fetcher.calls) == 1
+        assert [bar.timestamp.day for bar in sub_range] == [3, 4]
+
+    def test_failed_gap_is_not_marked_covered(self, manager):
+        manager.fetch_data("AAPL", utc(2024, 1, 1), utc(2024, 1, 31))
+        manager._fetch_alpaca_data = Mock(side_effect=ConnectionError("alpaca down"))
+        manager._fetch_yahoo_data = Mock(side_effect=ConnectionError("yahoo down"))
+
+        with pytest.raises(InsufficientDataError):
+            manager.fetch_data("AAPL", utc(2024, 1, 1), utc(2024, 2, 29))
+
+        assert manager.store.missing("AAPL", DAILY_TIMEFRAME, utc(2024, 1, 1), utc(2024, 2, 29)) == [
+            (utc(2024, 1, 31), utc(2024, 2, 29))
+        ]
+
+    def test_range_extended_before_listing_date(self, manager):
+        listed = FakeFetcher()
+        manager._fetch_alpaca_data = lambda symbol, start, end: listed(symbol, max(start, utc(2023, 6, 1)), end)
+        manager._fetch_yahoo_data = lambda *args: []
+
+        first = manager.fetch_data("XYZ", utc(2023, 1, 2), utc(2024, 6, 28))
+        extended = manager.fetch_data("XYZ", utc(2022, 1, 3), utc(2024, 6, 28))
+        again = manager.fetch_data("XYZ", utc(2022, 1, 3), utc(2024, 6, 28))
+
+        assert extended == first
+        assert again == first
+        assert first[0].timestamp == utc(2023, 6, 1, 5)
+        assert len(listed.calls) == 2  # The pre-listing gap is covered as empty
+        with pytest.raises(InsufficientDataError):
+            manager.fetch_data("XYZ", utc(2021, 1, 4), utc(2021, 12, 31))
+
+    def test_unsettled_sessions_are_fetched_again(self, manager):
+        fetcher = FakeFetcher()
+        today = {"date": utc(2024, 10, 16)}
+        # Upstream only has bars up to today's (unfinished) session
+        manager._fetch_alpaca_data = lambda symbol, start, end: fetcher(symbol, start, min(end, today["date"] + timedelta(hours=23)))
+        manager._fetch_yahoo_data = lambda *args: []
+        manager._settled_until = lambda: today["date"] - timedelta(microseconds=1)
+
+        first = manager.fetch_data("AAPL", utc(2024, 10, 1), utc(2024, 10, 31))
+        again = manager.fetch_data("AAPL", utc(2024, 10, 1), utc(2024, 10, 31))
+        today["date"] = utc(2024, 10, 18)
+        later = manager.fetch_data("AAPL", utc(2024, 10, 1), utc(2024, 10, 31))
+
+        assert first[-1].timestamp.day == 16
+        assert manager.store.coverage("AAPL", DAILY_TIMEFRAME) == [(utc(2024, 10, 1), utc(2024, 10, 18) - timedelta(microseconds=1))]
+        assert [start for start, _ in fetcher.calls] == [
+            utc(2024, 10, 1), utc(2024, 10, 16) - timedelta(microseconds=1), utc(2024, 10, 16) - timedelta(microseconds=1)
+        ]
+        assert len(again) == len(first)
+        assert later[-1].timestamp.day == 18
+
+    def test_cache_disabled_bypasses_store(self, tmp_path):
+        manager = HistoricalDataManager(cache_dir=str(tmp_path / "cache"), cache_enabled=False)
+        manager._fetch_alpaca_data = FakeFetcher()
+
+        manager.fetch_data("AAPL", utc(2024, 1, 1), utc(2024, 1, 31))
+
+        assert not (tmp_path / "cache").exists()
+
+
+class TestLegacyMigration:
+    """Test suite for migrating {symbol}_{start}_{end}.parquet cache files."""
+
+    def test_legacy_files_imported_into_store(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        bars = FakeFetcher()("BRK_B", utc(2024, 1, 1), utc(2024, 1, 31))
+        legacy_file = cache_dir / "BRK_B_2024-01-01_2024-01-31.parquet"
+        HistoricalDataManager._bars_to_frame(bars).to_parquet(legacy_file, engine="pyarrow")
+        (cache_dir / "notes.parquet").write_bytes(b"not a cache file")
+
+        manager = HistoricalDataManager(cache_dir=str(cache_dir))
+        manager._fetch_alpaca_data = FakeFetcher()
+
+        assert legacy_file.exists()
+        assert (cache_dir / "notes.parquet").exists()
+        assert manager.fetch_data("BRK_B", utc(2024, 1, 1), utc(2024, 1, 31)) == bars
+        assert manager._fetch_alpaca_data.calls == []
+
+        # Already-covered files are not imported again
+        assert HistoricalDataManager(cache_dir=str(cache_dir)).migrate_legacy_cache() == 0
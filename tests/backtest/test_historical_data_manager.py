@@ -33,7 +33,7 @@ class TestCachePersistence:
         Test Requirements:
         1. First call to fetch_data() makes API call and saves to cache
         2. Second call to fetch_data() loads from cache (no API call)
-        3. Cache file exists at .backtest_cache/{symbol}_{start}_{end}.parquet
+        3. Cache partitions exist at .backtest_cache/{symbol}/1Day/year=YYYY/month=MM/bars.parquet
         4. Second call is much faster (no API delay)
         5. Data integrity: same data from cache and API
 
@@ -56,8 +56,8 @@ class TestCachePersistence:
         # Configure cache directory in temporary path
         cache_dir = tmp_path / ".backtest_cache"
 
-        # Expected cache file path
-        cache_file = cache_dir / f"{symbol}_{start_date.date()}_{end_date.date()}.parquet"
+        # Expected cache partition (first month of the mock data)
+        cache_file = cache_dir / symbol / "1Day" / "year=2023" / "month=01" / "bars.parquet"
 
         # Mock API call with realistic delay (simulates network latency)
         def mock_api_call(*args, **kwargs) -> List[HistoricalDataBar]:
@@ -87,8 +87,8 @@ class TestCachePersistence:
                 # Verify API was called exactly once
                 assert mock_fetch.call_count == 1, "First call should make API request"
 
-                # Verify cache file was created
-                assert cache_file.exists(), f"Cache file should exist at {cache_file}"
+                # Verify cache partition was created
+                assert cache_file.exists(), f"Cache partition should exist at {cache_file}"
 
                 # Verify data was returned correctly
                 assert len(first_call_data) == 252, "Should return 252 trading days"
@@ -136,7 +136,7 @@ class TestCachePersistence:
                 f"Expected behavior (for GREEN phase implementation):\n"
                 f"1. HistoricalDataManager class in src/trading_bot/backtest/historical_data_manager.py\n"
                 f"2. fetch_data() method that caches to parquet files\n"
-                f"3. Cache path: {{cache_dir}}/{{symbol}}_{{start}}_{{end}}.parquet\n"
+                f"3. Cache path: {{cache_dir}}/{{symbol}}/1Day/year=YYYY/month=MM/bars.parquet\n"
                 f"4. Second call should load from cache without API call\n"
                 f"5. Cache should be 4x+ faster than API call"
             )
@@ -178,7 +178,7 @@ class TestCachePersistence:
 
     def test_cache_invalidation_on_different_date_range(self, tmp_path: Path):
         """
-        Test that different date ranges create separate cache entries.
+        Test that a date range outside the cached coverage is fetched.
 
         TDD RED PHASE: Expected to FAIL (HistoricalDataManager doesn't exist).
 
@@ -210,14 +210,13 @@ class TestCachePersistence:
                 mock_fetch.return_value = mock_data_2
                 manager.fetch_data(symbol, start_date_2, end_date_2)
 
-                # Both calls should hit API (different cache keys)
-                assert mock_fetch.call_count == 2, "Different date ranges should create separate cache entries"
+                # Both calls should hit API (second range is not covered)
+                assert mock_fetch.call_count == 2, "Uncovered date ranges should be fetched"
 
-                # Verify two cache files exist
-                cache_file_1 = cache_dir / f"{symbol}_{start_date_1.date()}_{end_date_1.date()}.parquet"
-                cache_file_2 = cache_dir / f"{symbol}_{start_date_2.date()}_{end_date_2.date()}.parquet"
-                assert cache_file_1.exists(), "First cache file should exist"
-                assert cache_file_2.exists(), "Second cache file should exist"
+                # Verify partitions for both ranges exist
+                series_dir = cache_dir / symbol / "1Day"
+                assert (series_dir / "year=2023" / "month=01" / "bars.parquet").exists(), "First range should be cached"
+                assert (series_dir / "year=2023" / "month=07" / "bars.parquet").exists(), "Second range should be cached"
 
         except (ImportError, ModuleNotFoundError) as e:
             pytest.fail(f"TDD RED PHASE: HistoricalDataManager not implemented yet. Error: {e}")
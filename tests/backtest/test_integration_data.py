@@ -147,9 +147,15 @@ class TestEndToEndDataLoading:
                 f">= bar {i+1} ({bars[i + 1].timestamp})"
             )
 
-        # ASSERT: Verify cache was created
-        cache_path = tmp_path / ".backtest_cache" / f"{symbol}_2023-01-01_2023-12-31.parquet"
-        assert cache_path.exists(), "Cache file should exist after first fetch"
+        # ASSERT: Verify cache partitions and coverage were created
+        series_dir = tmp_path / ".backtest_cache" / symbol / "1Day"
+        for month in (1, 12):
+            partition = series_dir / "year=2023" / f"month={month:02d}" / "bars.parquet"
+            assert partition.exists(), f"Cache partition {partition} should exist after first fetch"
+        assert (series_dir / "_coverage.json").exists(), "Coverage file should exist after first fetch"
+        assert manager.store.missing(symbol, "1Day", start_date, end_date) == [], (
+            "Fetched range should be fully covered"
+        )
 
         # ASSERT: Verify subsequent call uses cache (should be fast)
         import time
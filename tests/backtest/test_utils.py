@@ -9,6 +9,7 @@ from datetime import datetime, timezone, timedelta
 
 from src.trading_bot.backtest.utils import (
     is_market_day,
+    trading_calendar,
     trading_days_between,
     validate_date_range,
 )
@@ -142,6 +143,26 @@ class TestTradingDaysBetween:
         assert trading_days_between(start, end) == 5
 
 
+class TestTradingCalendar:
+    """Test trading_calendar() function."""
+
+    def test_skips_weekends_and_holidays(self):
+        """Calendar should list only trading days, in order."""
+        # Fri Jan 12 - Tue Jan 16, 2024 (weekend + MLK Day)
+        days = trading_calendar(datetime(2024, 1, 12), datetime(2024, 1, 16))
+        assert [str(d) for d in days] == ["2024-01-12", "2024-01-16"]
+
+    def test_matches_trading_days_between(self):
+        """Calendar length should equal the trading day count."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2025, 12, 31, tzinfo=timezone.utc)
+        assert len(trading_calendar(start, end)) == trading_days_between(start, end)
+
+    def test_start_after_end_is_empty(self):
+        """Reversed range should produce no days."""
+        assert len(trading_calendar(datetime(2024, 1, 19), datetime(2024, 1, 16))) == 0
+
+
 class TestValidateDateRange:
     """Test validate_date_range() function."""
 
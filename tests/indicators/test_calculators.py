@@ -1,13 +1,16 @@
 """Tests for technical indicator calculators."""
 
+import numpy as np
 import pytest
 from decimal import Decimal
 from datetime import datetime
 
 from src.trading_bot.indicators.calculators import (
     VWAPCalculator, EMACalculator, MACDCalculator,
-    VWAPResult, EMAResult, MACDResult
+    VWAPResult, EMAResult, MACDResult,
+    bars_to_array, ema_series, macd_series, vwap_series
 )
+from src.trading_bot.indicators.service import TechnicalIndicatorsService
 from src.trading_bot.indicators.exceptions import InsufficientDataError
 
 
@@ -223,3 +226,112 @@ class TestMACDCalculator:
         assert isinstance(result.macd_line, Decimal)
         assert isinstance(result.signal_line, Decimal)
         assert isinstance(result.histogram, Decimal)
+
+
+def _random_bars(count: int, seed: int = 3) -> list:
+    """Random-walk OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    return [
+        {
+            "high": round(float(c) * 1.004, 4),
+            "low": round(float(c) * 0.996, 4),
+            "close": round(float(c), 4),
+            "volume": int(v),
+        }
+        for c, v in zip(closes, rng.integers(100, 10_000, count))
+    ]
+
+
+class TestFloatPrecisionParity:
+    """The float64 path agrees with the Decimal path to within a cent."""
+
+    CENT = Decimal("0.01")
+
+    @pytest.mark.parametrize("count", [26, 40, 250])
+    def test_vwap(self, count):
+        bars = _random_bars(count)
+        exact = VWAPCalculator().calculate(bars)
+        fast = VWAPCalculator(precision="float").calculate(bars)
+
+        assert isinstance(fast.vwap, Decimal)
+        assert abs(fast.vwap - exact.vwap) <= self.CENT
+        assert fast.price == exact.price
+
+    @pytest.mark.parametrize("count", [20, 40, 250])
+    def test_ema(self, count):
+        bars = _random_bars(count)
+        for prev in (None, Decimal("101.37")):
+            exact = EMACalculator().calculate(bars, prev_ema_9=prev, prev_ema_20=prev)
+            fast = EMACalculator(precision="float").calculate(bars, prev_ema_9=prev, prev_ema_20=prev)
+
+            assert abs(fast.ema_9 - exact.ema_9) <= self.CENT
+            assert abs(fast.ema_20 - exact.ema_20) <= self.CENT
+
+    @pytest.mark.parametrize("count", [26, 30, 40, 250])
+    def test_macd(self, count):
+        bars = _random_bars(count)
+        for prev_macd, prev_signal in ((None, None), (Decimal("0.15"), Decimal("-0.20"))):
+            exact = MACDCalculator().calculate(bars, prev_macd, prev_signal)
+            fast = MACDCalculator(precision="float").calculate(bars, prev_macd, prev_signal)
+
+            assert abs(fast.macd_line - exact.macd_line) <= self.CENT
+            assert abs(fast.signal_line - exact.signal_line) <= self.CENT
+            assert abs(fast.histogram - exact.histogram) <= 2 * self.CENT
+
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError):
+            MACDCalculator(precision="float32")
+
+    def test_float_vwap_zero_volume(self):
+        bars = [{"high": 100.0, "low": 99.0, "close": 99.5, "volume": 0}]
+        with pytest.raises(InsufficientDataError):
+            VWAPCalculator(precision="float").calculate(bars)
+
+
+class TestSeries:
+    """Whole-series functions match bar-by-bar stateful calculation."""
+
+    def test_vwap_series_matches_prefix_calls(self):
+        bars = _random_bars(60)
+        series = vwap_series(*(bars_to_array(bars, k) for k in ("high", "low", "close", "volume")))
+        calculator = VWAPCalculator()
+        for end in (1, 10, 60):
+            assert series[end - 1] == pytest.approx(float(calculator.calculate(bars[:end]).vwap), abs=0.005)
+
+    def test_ema_series_matches_recurrence_across_blocks(self):
+        values = np.random.default_rng(0).normal(100, 5, 10_000)
+        for period in (2, 9, 200):
+            alpha = 2.0 / (period + 1)
+            expected = np.full(len(values), np.nan)
+            prev = values[:period].mean()
+            for i in range(period - 1, len(values)):
+                prev = alpha * values[i] + (1 - alpha) * prev
+                expected[i] = prev
+            np.testing.assert_allclose(ema_series(values, period), expected, rtol=1e-10)
+
+    def test_series_match_chained_service(self):
+        """One vectorized pass equals feeding a Decimal service bar by bar.
+
+        The Decimal path rounds every step to cents, so recurrences drift by
+        at most 0.005 / alpha from the unrounded series.
+        """
+        bars = _random_bars(90)
+        closes = bars_to_array(bars, "close")
+        # The service's first call has 26 bars, so both EMA chains start there
+        emas = {9: ema_series(closes, 9, start=25), 20: ema_series(closes, 20, start=25)}
+        macd, signal, _ = macd_series(closes)
+
+        def drift(period: int) -> float:
+            return 0.005 * (period + 1) / 2
+
+        service = TechnicalIndicatorsService(precision="decimal")
+        for end in range(26, len(bars) + 1):
+            ema_result = service.get_emas(bars[:end])
+            macd_result = service.get_macd(bars[:end])
+
+            assert float(ema_result.ema_9) == pytest.approx(emas[9][end - 1], abs=drift(9) + 0.01)
+            assert float(ema_result.ema_20) == pytest.approx(emas[20][end - 1], abs=drift(20) + 0.01)
+            assert float(macd_result.macd_line) == pytest.approx(macd[end - 1], abs=0.02)
+            assert float(macd_result.signal_line) == pytest.approx(signal[end - 1], abs=drift(9) + 0.03)
+
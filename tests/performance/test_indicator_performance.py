@@ -0,0 +1,93 @@
+"""
+Microbenchmarks for the float64 indicator fast path.
+
+Compares the Decimal and float64 paths of each calculator on a 10k-bar
+series, and the vectorized EMA recurrence against a per-bar Python loop.
+
+Target: float path at least 5x faster than the Decimal path per calculator.
+"""
+
+import time
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.trading_bot.indicators.calculators import (
+    EMACalculator,
+    MACDCalculator,
+    VWAPCalculator,
+    ema_series,
+)
+
+NUM_BARS = 10_000
+
+
+def _bars(count: int) -> list:
+    rng = np.random.default_rng(42)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    return [
+        {"high": float(c) * 1.004, "low": float(c) * 0.996, "close": float(c), "volume": int(v)}
+        for c, v in zip(closes, rng.integers(100, 10_000, count))
+    ]
+
+
+def _best_of(func, repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class TestIndicatorPerformance:
+    """Performance benchmark for indicator calculators."""
+
+    @pytest.mark.parametrize("calculator_cls", [VWAPCalculator, EMACalculator, MACDCalculator])
+    def test_float_path_speedup(self, calculator_cls):
+        """
+        GIVEN: 10k intraday bars
+        WHEN: The calculator runs with precision="decimal" and "float"
+        THEN: The float path is at least 5x faster
+        """
+        bars = _bars(NUM_BARS)
+        exact = calculator_cls(precision="decimal")
+        fast = calculator_cls(precision="float")
+
+        decimal_time = _best_of(lambda: exact.calculate(bars))
+        float_time = _best_of(lambda: fast.calculate(bars))
+        speedup = decimal_time / float_time
+
+        print(f"\n{calculator_cls.__name__} ({NUM_BARS} bars):")
+        print(f"  Decimal: {decimal_time * 1000:.2f}ms")
+        print(f"  Float:   {float_time * 1000:.2f}ms")
+        print(f"  Speedup: {speedup:.1f}x")
+
+        assert speedup >= 5, f"Float path only {speedup:.1f}x faster"
+
+    def test_ema_series_vs_loop(self):
+        """
+        GIVEN: A 10k-value series
+        WHEN: The EMA recurrence runs vectorized vs. as a per-bar Decimal loop
+        THEN: The vectorized version is at least 10x faster
+        """
+        closes = np.array([bar["close"] for bar in _bars(NUM_BARS)])
+        decimals = [Decimal(str(c)) for c in closes]
+
+        def decimal_loop():
+            alpha = Decimal("2") / Decimal("21")
+            ema = sum(decimals[:20]) / Decimal("20")
+            for close in decimals[19:]:
+                ema = close * alpha + ema * (Decimal("1") - alpha)
+
+        loop_time = _best_of(decimal_loop)
+        vector_time = _best_of(lambda: ema_series(closes, 20))
+        speedup = loop_time / vector_time
+
+        print(f"\nEMA(20) recurrence ({NUM_BARS} values):")
+        print(f"  Decimal loop: {loop_time * 1000:.2f}ms")
+        print(f"  ema_series:   {vector_time * 1000:.2f}ms")
+        print(f"  Speedup:      {speedup:.1f}x")
+
+        assert speedup >= 10, f"ema_series only {speedup:.1f}x faster"
@@ -0,0 +1,83 @@
+"""
+CPU benchmark for MAML meta-training steps.
+
+Compares one outer-loop step with the batched torch.func inner loop against
+the original path that deep-copies the model and builds an SGD optimizer per
+task.
+
+Target: functional path at least as fast as per-task cloning for a
+meta-batch of 16 tasks.
+"""
+
+import time
+
+import pytest
+import torch
+import torch.nn as nn
+
+from trading_bot.ml.meta_learning import MAML, MAMLConfig
+
+
+def _model() -> nn.Module:
+    torch.manual_seed(0)
+    return nn.Sequential(
+        nn.Linear(53, 128), nn.ReLU(), nn.Linear(128, 64), nn.ReLU(), nn.Linear(64, 3)
+    )
+
+
+def _tasks(num_tasks: int):
+    return [
+        (
+            torch.randn(32, 53),
+            torch.randint(0, 3, (32,)),
+            torch.randn(16, 53),
+            torch.randint(0, 3, (16,)),
+        )
+        for _ in range(num_tasks)
+    ]
+
+
+def _time_outer_loop(maml: MAML, tasks, repeats: int) -> float:
+    maml.outer_loop(tasks)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        maml.outer_loop(tasks)
+    return (time.perf_counter() - start) / repeats
+
+
+class TestMAMLPerformance:
+    """Performance benchmark for MAML outer-loop steps."""
+
+    @pytest.mark.parametrize("first_order", [False, True])
+    def test_functional_inner_loop_vs_cloned_models(self, first_order):
+        """
+        GIVEN: A meta-batch of 16 tasks (32-shot support, 16 query) on CPU
+        WHEN: One outer-loop step runs with each inner-loop implementation
+        THEN: The batched functional step is not slower than per-task cloning
+        """
+        tasks = _tasks(16)
+        repeats = 5
+
+        threads = torch.get_num_threads()
+        torch.set_num_threads(1)
+        try:
+            functional = MAML(
+                _model(), MAMLConfig(inner_steps=5, first_order=first_order)
+            )
+            functional_time = _time_outer_loop(functional, tasks, repeats)
+
+            # The cloned path cannot run FOMAML (its inner loop has no grad
+            # graph), so it is always timed in its second-order configuration
+            cloned = MAML(_model(), MAMLConfig(inner_steps=5, functional_inner_loop=False))
+            cloned_time = _time_outer_loop(cloned, tasks, repeats)
+        finally:
+            torch.set_num_threads(threads)
+
+        print(
+            f"\nMAML outer step (16 tasks, first_order={first_order}): "
+            f"functional={functional_time * 1000:.1f}ms, "
+            f"cloned={cloned_time * 1000:.1f}ms, "
+            f"speedup={cloned_time / functional_time:.1f}x"
+        )
+
+        assert functional_time <= cloned_time * 1.1
@@ -0,0 +1,74 @@
+"""
+Microbenchmark for API rate limiter middleware overhead.
+
+Measures per-request cost of RateLimiter.dispatch with the in-memory
+sliding-window backend, against the same app without the middleware.
+
+Target: middleware overhead <50µs per request, flat in the number of keys.
+"""
+
+import asyncio
+import time
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from api.app.middleware.rate_limiter import InMemoryRateLimitBackend, RateLimiter
+
+
+def _request(api_key: str) -> Request:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/state",
+        "headers": [(b"x-api-key", api_key.encode())],
+        "query_string": b"",
+    }
+    return Request(scope)
+
+
+async def _call_next(request: Request) -> Response:
+    return Response(status_code=200)
+
+
+async def _dispatch_loop(limiter: RateLimiter, requests: list) -> float:
+    start = time.perf_counter()
+    for request in requests:
+        await limiter.dispatch(request, _call_next)
+    return time.perf_counter() - start
+
+
+async def _baseline_loop(requests: list) -> float:
+    start = time.perf_counter()
+    for request in requests:
+        await _call_next(request)
+    return time.perf_counter() - start
+
+
+class TestRateLimiterPerformance:
+    """Performance benchmark for rate limiter middleware."""
+
+    @pytest.mark.parametrize("distinct_keys", [1, 10_000])
+    def test_dispatch_overhead_per_request(self, distinct_keys):
+        """
+        GIVEN: 20k requests spread over 1 or 10k API keys
+        WHEN: Each request passes through RateLimiter.dispatch
+        THEN: Added overhead stays <50µs/request and memory stays bounded
+        """
+        num_requests = 20_000
+        backend = InMemoryRateLimitBackend(max_keys=5_000)
+        limiter = RateLimiter(app=None, requests_per_minute=10**9, backend=backend)
+        requests = [_request(f"key-{i % distinct_keys}") for i in range(num_requests)]
+
+        with_limiter = asyncio.run(_dispatch_loop(limiter, requests))
+        baseline = asyncio.run(_baseline_loop(requests))
+        overhead_us = (with_limiter - baseline) / num_requests * 1e6
+
+        print(f"\nRate limiter overhead ({distinct_keys} keys):")
+        print(f"  Requests: {num_requests}")
+        print(f"  Overhead: {overhead_us:.2f}µs/request")
+        print(f"  Tracked keys: {len(backend)}")
+
+        assert overhead_us < 50, f"Overhead {overhead_us:.2f}µs exceeds 50µs target"
+        assert len(backend) <= 5_000
@@ -0,0 +1,138 @@
+"""Tests for the memoized indicator context and its incremental mode."""
+
+from dataclasses import asdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.technical_analysis import (
+    INDICATOR_GRAPH,
+    EnhancedIndicators,
+    IndicatorContext,
+    TACoordinator,
+)
+
+
+def make_ohlcv(periods: int = 400, seed: int = 7, tz=None) -> pd.DataFrame:
+    """Random-walk OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods)))
+    high = close * (1 + rng.random(periods) * 0.01)
+    low = close * (1 - rng.random(periods) * 0.01)
+    return pd.DataFrame({
+        'open': (high + low) / 2,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': rng.integers(1000, 5000, periods),
+    }, index=pd.date_range('2024-01-01', periods=periods, freq='1h', tz=tz))
+
+
+def reference_results(df: pd.DataFrame) -> dict:
+    """Indicator results computed with plain pandas (one frame per call)."""
+    prices = df['close']
+    delta = prices.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    tr = pd.concat([
+        df['high'] - df['low'],
+        abs(df['high'] - prices.shift()),
+        abs(df['low'] - prices.shift()),
+    ], axis=1).max(axis=1)
+    macd = prices.ewm(span=12, adjust=False).mean() - prices.ewm(span=26, adjust=False).mean()
+    obv = (np.sign(prices.diff()) * df['volume']).fillna(0).cumsum()
+    return {
+        'sma_50': prices.rolling(50).mean().iloc[-1],
+        'ema_200': prices.ewm(span=200, adjust=False).mean().iloc[-1],
+        'rsi': (100 - 100 / (1 + gain / loss)).iloc[-1],
+        'atr': tr.rolling(14).mean().iloc[-1],
+        'macd_signal': macd.ewm(span=9, adjust=False).mean().iloc[-1],
+        'bb_std': prices.rolling(20).std().iloc[-1],
+        'obv_ma': obv.rolling(20).mean().iloc[-1],
+    }
+
+
+def context_results(ctx: IndicatorContext) -> dict:
+    ind = EnhancedIndicators()
+    return {
+        'sma_50': ind.calculate_moving_averages(ctx).sma_50,
+        'ema_200': ind.calculate_moving_averages(ctx).ema_200,
+        'rsi': ind.calculate_rsi(ctx).rsi,
+        'atr': ind.calculate_atr(ctx).atr,
+        'macd_signal': ind.calculate_macd(ctx).signal_line,
+        'bb_std': ctx.values(('close', 'std', 20))[-1],
+        'obv_ma': ind.calculate_obv(ctx).obv_ma,
+    }
+
+
+class TestIndicatorContext:
+    """Memoization and parity with direct pandas computation."""
+
+    def test_matches_pandas(self):
+        df = make_ohlcv()
+        assert context_results(IndicatorContext(df)) == reference_results(df)
+
+    def test_each_primitive_computed_once(self):
+        ctx = IndicatorContext(make_ohlcv())
+        ctx.prepare(INDICATOR_GRAPH)
+        misses = ctx.misses
+
+        ctx.prepare(INDICATOR_GRAPH)
+        ind = EnhancedIndicators()
+        ind.calculate_moving_averages(ctx)
+        ind.calculate_macd(ctx)
+        ind.calculate_atr(ctx)
+        ind.calculate_bollinger_bands(ctx)
+
+        assert ctx.misses == misses
+        assert ctx.hits > 0
+
+    def test_shared_context_matches_dataframe_calls(self):
+        df = make_ohlcv()
+        ind = EnhancedIndicators()
+        ctx = ind.context(df)
+        for method in (
+            ind.calculate_moving_averages, ind.calculate_rsi, ind.calculate_macd,
+            ind.calculate_stochastic, ind.calculate_atr, ind.calculate_bollinger_bands,
+            ind.calculate_volume, ind.calculate_obv, ind.calculate_volume_profile,
+        ):
+            assert asdict(method(ctx)) == asdict(method(df))
+
+    @pytest.mark.parametrize('tz', [None, 'America/New_York'])
+    def test_incremental_append_matches_full_recompute(self, tz):
+        df = make_ohlcv(tz=tz)
+        ctx = IndicatorContext(df.iloc[:250], capacity=260)
+        ctx.prepare(INDICATOR_GRAPH)
+
+        for ts, bar in df.iloc[250:].iterrows():
+            ctx.append(bar.to_dict(), timestamp=ts)
+
+        fresh = IndicatorContext(df)
+        assert len(ctx) == len(df)
+        assert ctx.index.equals(df.index)
+        for key in ctx._buffers:
+            np.testing.assert_allclose(
+                ctx.values(key), fresh.values(key), rtol=1e-9, atol=1e-9, err_msg=str(key)
+            )
+        pd.testing.assert_frame_equal(ctx.frame, df.astype(float), check_freq=False)
+
+    def test_append_requires_all_columns(self):
+        ctx = IndicatorContext(make_ohlcv(50))
+        with pytest.raises(ValueError, match="missing"):
+            ctx.append({'close': 1.0}, timestamp=pd.Timestamp('2030-01-01'))
+        with pytest.raises(ValueError, match="timestamp"):
+            ctx.append({'open': 1, 'high': 1, 'low': 1, 'close': 1, 'volume': 1})
+
+    def test_coordinator_accepts_context(self):
+        df = make_ohlcv(300)
+        ta = TACoordinator()
+        ctx = IndicatorContext(df.iloc[:299])
+        ctx.append(df.iloc[-1].to_dict(), timestamp=df.index[-1])
+
+        streamed = asdict(ta.analyze('BTCUSD', data={'1h': ctx}))
+        direct = asdict(ta.analyze('BTCUSD', data={'1h': df}))
+
+        assert streamed['signal'] == direct['signal']
+        assert streamed['rsi'] == pytest.approx(direct['rsi'], rel=1e-9)
+        assert streamed['confidence'] == pytest.approx(direct['confidence'])
@@ -0,0 +1,187 @@
+"""
+Unit tests for the decision replay cache
+
+Tests content-hash keys, record/replay round trips through the on-disk store,
+miss reporting, and replayed agent/orchestrator workflows with a fake LLM client.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from trading_bot.llm.agents.base_agent import BaseAgent
+from trading_bot.llm.decision_replay import (
+    DecisionReplayStore,
+    ReplayClient,
+    ReplayMissError,
+    ReplayMode,
+    content_hash,
+)
+
+
+class FakeLLMClient:
+    """Anthropic-style client answering with a canned reply per call."""
+
+    def __init__(self, reply="BUY"):
+        self.reply = reply
+        self.calls = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=f"{self.reply} #{len(self.calls)}")],
+            stop_reason="end_turn",
+            usage=SimpleNamespace(input_tokens=120, output_tokens=30),
+        )
+
+
+class EchoAgent(BaseAgent):
+    """Minimal agent asking the LLM about one symbol."""
+
+    def execute(self, context):
+        return self._call_llm(
+            system_message="You are a trading analyst.",
+            user_prompt=f"Should we buy {context['symbol']} at {context['price']}?",
+            temperature=0.0,
+        )
+
+
+def make_agent():
+    return EchoAgent(agent_name="echo", memory=MagicMock(), api_key="test-key")
+
+
+class TestContentHash:
+    """Test suite for content_hash."""
+
+    def test_key_order_independent(self):
+        assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+
+    def test_distinguishes_values_and_handles_rich_types(self):
+        base = {"price": Decimal("101.5"), "at": datetime(2025, 1, 2, 9, 30)}
+        assert content_hash(base) == content_hash(dict(base))
+        assert content_hash(base) != content_hash({**base, "price": Decimal("101.6")})
+
+
+class TestDecisionReplayStore:
+    """Test suite for DecisionReplayStore."""
+
+    def test_record_then_replay_from_disk(self, tmp_path):
+        path = tmp_path / "decisions.jsonl.gz"
+        compute = MagicMock(return_value={"decision": "BUY", "shares": 10})
+
+        with DecisionReplayStore(path, mode=ReplayMode.RECORD) as store:
+            assert store.fetch("workflow", {"symbol": "AAPL"}, compute) == {"decision": "BUY", "shares": 10}
+
+        replay = DecisionReplayStore(path)
+        assert len(replay) == 1
+        assert replay.fetch("workflow", {"symbol": "AAPL"}, compute) == {"decision": "BUY", "shares": 10}
+        assert compute.call_count == 1
+        assert replay.report()["hits"] == 1
+
+    def test_replay_miss_raises_and_is_reported(self, tmp_path):
+        store = DecisionReplayStore(tmp_path / "decisions.jsonl.gz")
+        compute = MagicMock()
+
+        with pytest.raises(ReplayMissError):
+            store.fetch("workflow", {"symbol": "MSFT"}, compute)
+
+        compute.assert_not_called()
+        report = store.report()
+        assert report["misses"] == 1
+        assert report["misses_by_namespace"] == {"workflow": 1}
+
+    def test_offline_compute_runs_on_miss_without_recording(self, tmp_path):
+        store = DecisionReplayStore(tmp_path / "decisions.jsonl.gz")
+
+        assert store.fetch("workflow", {"symbol": "MSFT"}, lambda: "HOLD", offline_compute=True) == "HOLD"
+        assert len(store) == 0 and store.report()["misses"] == 1
+
+    def test_key_uses_inputs_before_compute_mutates_them(self, tmp_path):
+        store = DecisionReplayStore(tmp_path / "decisions.jsonl.gz", mode=ReplayMode.RECORD)
+        inputs = {"symbol": "AAPL", "indicators": {"rsi": 55}}
+
+        def compute():
+            inputs["indicators"]["rsi"] = 99
+            return "BUY"
+
+        store.fetch("workflow", inputs, compute)
+
+        assert store.get("workflow", {"symbol": "AAPL", "indicators": {"rsi": 55}}) == "BUY"
+
+    def test_replayed_outputs_are_copies(self, tmp_path):
+        store = DecisionReplayStore(tmp_path / "decisions.jsonl.gz", mode=ReplayMode.RECORD)
+        store.put("workflow", {"symbol": "AAPL"}, {"votes": []})
+
+        store.fetch("workflow", {"symbol": "AAPL"}, MagicMock())["votes"].append("x")
+
+        assert store.get("workflow", {"symbol": "AAPL"}) == {"votes": []}
+
+
+class TestReplayClient:
+    """Test suite for ReplayClient inside agents."""
+
+    def test_agent_calls_replayed_without_client(self, tmp_path):
+        path = tmp_path / "decisions.jsonl.gz"
+        llm = FakeLLMClient()
+        agent = make_agent()
+
+        with DecisionReplayStore(path, mode=ReplayMode.RECORD) as store:
+            agent.client = ReplayClient(store, llm)
+            recorded = agent.execute({"symbol": "AAPL", "price": 190.5})
+            agent.execute({"symbol": "AAPL", "price": 190.5})  # same prompt: served from store
+
+        assert len(llm.calls) == 1
+
+        agent.client = ReplayClient(DecisionReplayStore(path))
+        replayed = agent.execute({"symbol": "AAPL", "price": 190.5})
+
+        assert replayed["content"] == recorded["content"] == "BUY #1"
+        assert replayed["tokens_used"] == 150
+        assert replayed["cost_usd"] == recorded["cost_usd"]
+
+    def test_agent_prompt_miss_is_not_sent(self, tmp_path):
+        store = DecisionReplayStore(tmp_path / "decisions.jsonl.gz")
+        llm = FakeLLMClient()
+        agent = make_agent()
+        agent.client = ReplayClient(store, llm)
+
+        with pytest.raises(Exception, match="No recorded decision"):
+            agent.execute({"symbol": "TSLA", "price": 250.0})
+
+        assert llm.calls == []
+        assert store.report()["misses_by_namespace"] == {"llm.messages": 1}
+
+
+class TestOrchestratorReplay:
+    """Test suite for TradingOrchestrator.evaluate_trade_with_agents replay."""
+
+    def _orchestrator(self, store):
+        from trading_bot.orchestrator import trading_orchestrator as module
+
+        with patch.object(module, "ClaudeCodeManager"), patch.object(module, "MultiAgentTradingWorkflow"):
+            orchestrator = module.TradingOrchestrator(
+                config=MagicMock(), mode="paper", decision_replay=store
+            )
+        orchestrator.ta_coordinator = None
+        orchestrator.multi_agent_workflow.evaluate_trade_opportunity.return_value = {
+            "symbol": "AAPL", "decision": "BUY", "consensus_reached": True,
+            "position_size_shares": 5, "total_cost_usd": 0.01, "total_tokens": 900,
+        }
+        return orchestrator
+
+    def test_recorded_decision_replayed_without_agents(self, tmp_path):
+        path = tmp_path / "decisions.jsonl.gz"
+        with DecisionReplayStore(path, mode=ReplayMode.RECORD) as store:
+            live = self._orchestrator(store)
+            recorded = live.evaluate_trade_with_agents("AAPL", 190.0, {"rsi": 55})
+
+        replay = self._orchestrator(DecisionReplayStore(path))
+        replayed = replay.evaluate_trade_with_agents("AAPL", 190.0, {"rsi": 55})
+
+        assert replayed == recorded
+        replay.multi_agent_workflow.evaluate_trade_opportunity.assert_not_called()
+        assert replay.cash_available == live.cash_available
@@ -0,0 +1,91 @@
+"""
+Unit tests for the in-memory error ring buffer
+
+Test cases:
+- test_buffer_keeps_only_error_records
+- test_buffer_is_bounded_and_newest_first
+- test_install_error_buffer_is_idempotent
+- test_buffer_handles_concurrent_writers
+"""
+
+import logging
+import threading
+
+from src.trading_bot.logging.error_buffer import (
+    ErrorRingBufferHandler,
+    get_error_buffer,
+    install_error_buffer,
+)
+
+
+def _logger_with(handler: ErrorRingBufferHandler, name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_buffer_keeps_only_error_records():
+    handler = ErrorRingBufferHandler(capacity=10)
+    logger = _logger_with(handler, "test.error_buffer.levels")
+
+    logger.info("fine")
+    logger.warning("careful")
+    logger.error("broken %s", "pipe")
+    logger.critical("down")
+
+    recent = handler.recent(10)
+    assert [e["level"] for e in recent] == ["CRITICAL", "ERROR"]
+    assert recent[1]["message"] == "broken pipe"
+    assert recent[1]["logger"] == "test.error_buffer.levels"
+
+
+def test_buffer_is_bounded_and_newest_first():
+    handler = ErrorRingBufferHandler(capacity=3)
+    logger = _logger_with(handler, "test.error_buffer.bounded")
+
+    for i in range(10):
+        logger.error(f"error {i}")
+
+    assert len(handler) == 3
+    assert [e["message"] for e in handler.recent(2)] == ["error 9", "error 8"]
+    assert handler.recent(0) == []
+
+
+def test_buffer_truncates_long_messages():
+    handler = ErrorRingBufferHandler(capacity=1)
+    logger = _logger_with(handler, "test.error_buffer.truncate")
+
+    logger.error("x" * 1000)
+
+    assert len(handler.recent(1)[0]["message"]) == ErrorRingBufferHandler.MAX_MESSAGE_LENGTH
+
+
+def test_install_error_buffer_is_idempotent():
+    logger = logging.getLogger("test.error_buffer.install")
+
+    first = install_error_buffer(logger)
+    second = install_error_buffer(logger)
+
+    assert first is second is get_error_buffer()
+    assert logger.handlers.count(first) == 1
+    logger.removeHandler(first)
+
+
+def test_buffer_handles_concurrent_writers():
+    handler = ErrorRingBufferHandler(capacity=50)
+    logger = _logger_with(handler, "test.error_buffer.threads")
+
+    def write():
+        for i in range(200):
+            logger.error(f"error {i}")
+            handler.recent(5)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(handler) == 50
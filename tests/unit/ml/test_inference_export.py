@@ -0,0 +1,183 @@
+"""Parity tests for compiled CPU inference backends.
+
+Exported models must reproduce eager PyTorch outputs within a bounded drift
+(tight for float32 graphs, looser for int8 dynamic quantization) across
+batch sizes other than the one used for tracing.
+"""
+
+import tempfile
+
+import numpy as np
+import pytest
+import torch
+
+from trading_bot.ml.neural_models import HierarchicalTimeframeNet
+from trading_bot.ml.neural_models.export import (
+    FLOAT_TOLERANCE,
+    HAS_ONNXRUNTIME,
+    INT8_TOLERANCE,
+    InferenceModel,
+    export_onnx,
+    export_torchscript,
+    load_exported,
+    load_inference_model,
+)
+
+
+@pytest.fixture
+def model() -> HierarchicalTimeframeNet:
+    torch.manual_seed(0)
+    net = HierarchicalTimeframeNet(features_per_tf=20, hidden_dim=32, num_heads=4)
+    # Non-trivial batch norm statistics, as after training
+    net.train()
+    with torch.no_grad():
+        for _ in range(3):
+            net(torch.randn(64, net.total_features))
+    return net.eval()
+
+
+def eager_logits(model: torch.nn.Module, x: np.ndarray) -> np.ndarray:
+    with torch.no_grad():
+        return model(torch.from_numpy(x)).numpy()
+
+
+def inputs(model: HierarchicalTimeframeNet, batch_size: int, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(batch_size, model.total_features)).astype(np.float32)
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 64])
+def test_torchscript_matches_eager(model, batch_size):
+    compiled = export_torchscript(model, torch.randn(4, model.total_features))
+    x = inputs(model, batch_size)
+
+    with torch.no_grad():
+        drift = np.abs(compiled(torch.from_numpy(x)).numpy() - eager_logits(model, x)).max()
+
+    assert drift < FLOAT_TOLERANCE
+
+
+def test_quantized_torchscript_drift_is_bounded(model):
+    compiled = export_torchscript(model, torch.randn(4, model.total_features), quantize=True)
+    x = inputs(model, 256)
+
+    with torch.no_grad():
+        quantized = compiled(torch.from_numpy(x)).numpy()
+    expected = eager_logits(model, x)
+
+    assert np.abs(quantized - expected).max() < INT8_TOLERANCE
+    assert (quantized.argmax(axis=1) == expected.argmax(axis=1)).mean() >= 0.95
+    # Original model keeps float weights
+    assert model.classifier[0].weight.dtype == torch.float32
+
+
+def test_load_inference_model_predict_matches_eager(model):
+    predictor = load_inference_model(
+        model, torch.randn(1, model.total_features), benchmark_runs=3
+    )
+    x = inputs(model, 16)
+
+    actions, confidences = predictor.predict(x)
+    expected_actions, expected_confidences = model.predict(torch.from_numpy(x))
+
+    assert predictor.backend in ("onnxruntime", "torchscript", "eager")
+    assert predictor.latency_us is not None
+    np.testing.assert_array_equal(actions, expected_actions.numpy())
+    np.testing.assert_allclose(confidences, expected_confidences.detach().numpy(), atol=1e-5)
+
+
+def test_backend_order_without_benchmark(model):
+    predictor = load_inference_model(
+        model,
+        torch.randn(1, model.total_features),
+        backends=("torchscript", "eager"),
+        benchmark=False,
+    )
+    assert predictor.backend == "torchscript"
+    assert predictor.latency_us is None
+
+
+def test_drifting_backend_is_rejected(model):
+    # No int8 graph can match float32 this tightly; eager is the fallback
+    predictor = load_inference_model(
+        model,
+        torch.randn(8, model.total_features),
+        backends=("torchscript", "eager"),
+        quantize=True,
+        max_drift=1e-9,
+        benchmark=False,
+    )
+    assert predictor.backend == "eager"
+
+
+def test_unknown_backend_raises(model):
+    with pytest.raises(ValueError, match="Unknown backend"):
+        load_inference_model(model, torch.randn(1, model.total_features), backends=("tensorrt",))
+
+
+def test_compile_for_inference(model):
+    predictor = model.compile_for_inference(backends=("torchscript",), benchmark=False)
+    x = inputs(model, 5)
+
+    assert isinstance(predictor, InferenceModel)
+    np.testing.assert_allclose(predictor.run(x), eager_logits(model, x), atol=FLOAT_TOLERANCE)
+    np.testing.assert_allclose(predictor.predict_proba(x).sum(axis=1), 1.0, rtol=1e-6)
+
+
+def test_saved_torchscript_round_trip(model, tmp_path):
+    path = tmp_path / "htf.pt"
+    export_torchscript(model, torch.randn(2, model.total_features), path=path)
+
+    predictor = load_exported(path)
+    x = inputs(model, 3)
+
+    assert predictor.backend == "torchscript"
+    np.testing.assert_allclose(predictor.run(x), eager_logits(model, x), atol=FLOAT_TOLERANCE)
+
+
+@pytest.mark.skipif(not HAS_ONNXRUNTIME, reason="onnxruntime not installed")
+@pytest.mark.parametrize("quantize,tolerance", [(False, FLOAT_TOLERANCE), (True, INT8_TOLERANCE)])
+def test_onnx_matches_eager(model, tmp_path, quantize, tolerance):
+    path = export_onnx(model, torch.randn(2, model.total_features), tmp_path / "htf.onnx", quantize)
+
+    predictor = load_exported(path)
+    x = inputs(model, 9)
+
+    assert predictor.quantized == quantize
+    assert np.abs(predictor.run(x) - eager_logits(model, x)).max() < tolerance
+
+
+@pytest.mark.skipif(not HAS_ONNXRUNTIME, reason="onnxruntime not installed")
+def test_onnx_backend_removes_temporary_export(model, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    predictor = load_inference_model(
+        model, torch.randn(2, model.total_features), backends=("onnxruntime",), benchmark=False
+    )
+    x = inputs(model, 4)
+
+    assert predictor.backend == "onnxruntime"
+    assert list(tmp_path.iterdir()) == []
+    np.testing.assert_allclose(predictor.run(x), eager_logits(model, x), atol=FLOAT_TOLERANCE)
+
+
+def test_stacked_base_models_match_per_model_predictions():
+    pytest.importorskip("xgboost")
+    from trading_bot.ml.ensemble import GRUModel, LSTMModel, StackedBaseModels, TransformerModel
+
+    torch.manual_seed(0)
+    base_models = [
+        LSTMModel(hidden_dim=16),
+        GRUModel(hidden_dim=16),
+        TransformerModel(d_model=16, nhead=2, dim_feedforward=32),
+    ]
+    stacked = StackedBaseModels(base_models)
+    x = np.random.default_rng(0).normal(size=(11, 52))
+
+    expected = np.hstack([m.predict_proba(x) for m in base_models])
+    np.testing.assert_allclose(stacked.meta_features(x), expected, atol=1e-6)
+
+    predictor = load_inference_model(
+        stacked, torch.randn(4, 52), backends=("torchscript",), benchmark=False
+    )
+    np.testing.assert_allclose(predictor.run(x), expected, atol=FLOAT_TOLERANCE)
@@ -0,0 +1,188 @@
+"""Tests for the cached, concurrent multi-timeframe loader.
+
+Uses a fake provider that builds every timeframe from one deterministic
+minute series, so locally resampled bars can be compared with bars the
+provider would have returned directly.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.ml.features.multi_timeframe_features import (
+    MultiTimeframeLoader,
+    fetch_aligned_multi_timeframe,
+    timeframe_to_timedelta,
+)
+
+EPOCH = pd.Timestamp("2024-01-01", tz="UTC")
+
+
+class FakeProvider:
+    """Deterministic bars; records every request."""
+
+    resample_equivalent = True
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _minutes(self, start, end) -> pd.DataFrame:
+        ts = pd.date_range(pd.Timestamp(start).ceil("min"), pd.Timestamp(end), freq="min")
+        i = ((ts - EPOCH) // pd.Timedelta(minutes=1)).to_numpy()
+        traded = i % 7 != 3  # some minutes have no trades
+        ts, i = ts[traded], i[traded]
+        close = 100 + np.sin(i / 50.0) + i * 1e-4
+        return pd.DataFrame({
+            "timestamp": ts,
+            "open": close - 0.01,
+            "high": close + 0.05 + (i % 5) * 0.01,
+            "low": close - 0.05,
+            "close": close,
+            "volume": (100 + i % 13).astype(float),
+            "trade_count": (1 + i % 3).astype(float),
+            "vwap": close + 0.001,
+        })
+
+    def get_bars(self, symbol, timeframe, start, end):
+        with self._lock:
+            self.calls.append((symbol, timeframe, start, end))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            rule = timeframe_to_timedelta(timeframe)
+            minutes = self._minutes(pd.Timestamp(start).floor(rule), end)
+            if rule == pd.Timedelta(minutes=1):
+                bars = minutes
+            else:
+                minutes["notional"] = minutes["vwap"] * minutes["volume"]
+                bars = minutes.groupby(minutes["timestamp"].dt.floor(rule)).agg(
+                    open=("open", "first"), high=("high", "max"), low=("low", "min"),
+                    close=("close", "last"), volume=("volume", "sum"),
+                    trade_count=("trade_count", "sum"), notional=("notional", "sum"),
+                )
+                bars["vwap"] = bars.pop("notional") / bars["volume"]
+                bars = bars.rename_axis("timestamp").reset_index()
+            return bars.loc[bars["timestamp"] >= start].reset_index(drop=True)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+NOW = datetime(2024, 3, 1, 12, 34, tzinfo=timezone.utc)
+TIMEFRAMES = ["5Min", "15Min", "1Hour", "4Hour"]
+
+
+def test_derived_timeframes_match_provider_bars(tmp_path):
+    derived_provider, direct_provider = FakeProvider(), FakeProvider()
+    derived = MultiTimeframeLoader(derived_provider, tmp_path / "a", clock=Clock(NOW)).load(
+        "SPY", TIMEFRAMES, days=3
+    )
+    direct = MultiTimeframeLoader(
+        direct_provider, tmp_path / "b", resample=False, clock=Clock(NOW)
+    ).load("SPY", TIMEFRAMES, days=3)
+
+    assert {call[1] for call in derived_provider.calls} == {"5Min"}
+    assert {call[1] for call in direct_provider.calls} == set(TIMEFRAMES)
+    for tf in TIMEFRAMES:
+        pd.testing.assert_frame_equal(derived[tf], direct[tf], check_exact=False, rtol=1e-12)
+
+
+def test_daily_bars_are_always_fetched(tmp_path):
+    provider = FakeProvider()
+    loader = MultiTimeframeLoader(provider, tmp_path, clock=Clock(NOW))
+
+    assert loader.plan(["1Min", "1Hour", "1Day", "7Min"]) == {
+        "1Min": None, "1Hour": "1Min", "1Day": None, "7Min": "1Min"
+    }
+    loader.load("SPY", ["1Hour", "1Day"], days=5)
+    assert {call[1] for call in provider.calls} == {"1Hour", "1Day"}
+
+
+def test_second_load_requests_only_the_tail(tmp_path):
+    clock = Clock(NOW)
+    provider = FakeProvider()
+    loader = MultiTimeframeLoader(provider, tmp_path, clock=clock)
+    loader.load("SPY", ["5Min"], days=3)
+
+    clock.now = NOW + timedelta(hours=2)
+    provider.calls.clear()
+    cached = loader.load("SPY", ["5Min"], days=3)
+
+    # One request, starting at the last cached (possibly still forming) bar
+    assert len(provider.calls) == 1
+    _, _, start, end = provider.calls[0]
+    assert start == datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+    assert end == clock.now
+
+    fresh = MultiTimeframeLoader(FakeProvider(), None, clock=clock).load("SPY", ["5Min"], days=3)
+    pd.testing.assert_frame_equal(cached["5Min"], fresh["5Min"])
+
+
+def test_longer_history_fetches_missing_head(tmp_path):
+    provider = FakeProvider()
+    loader = MultiTimeframeLoader(provider, tmp_path, clock=Clock(NOW))
+    loader.load("SPY", ["15Min"], days=2)
+
+    provider.calls.clear()
+    data = loader.load("SPY", ["15Min"], days=5)
+
+    starts = sorted(call[2] for call in provider.calls)
+    assert starts[0] == NOW - timedelta(days=5)
+    assert len(provider.calls) == 2
+    assert data["15Min"]["timestamp"].iloc[0] >= NOW - timedelta(days=5)
+    assert data["15Min"]["timestamp"].is_unique
+
+
+def test_timeframes_and_symbols_fetch_concurrently(tmp_path):
+    provider = FakeProvider(delay=0.05)
+    loader = MultiTimeframeLoader(provider, tmp_path, max_workers=4, resample=False, clock=Clock(NOW))
+
+    universe = loader.load_universe(["SPY", "QQQ"], ["5Min", "1Hour"], days=1)
+
+    assert provider.max_active > 1
+    assert set(universe) == {"SPY", "QQQ"}
+    assert all(set(data) == {"5Min", "1Hour"} for data in universe.values())
+
+
+def test_fetch_aligned_uses_loader_and_adds_features(tmp_path):
+    loader = MultiTimeframeLoader(FakeProvider(), tmp_path, clock=Clock(NOW))
+
+    data = fetch_aligned_multi_timeframe(
+        "SPY", "5Min", ["1Hour"], days=2, api_key="", api_secret="", loader=loader
+    )
+
+    for column in ["returns", "volatility", "volume_ma", "volume_ratio"]:
+        assert column in data["5Min"] and column in data["1Hour"]
+    np.testing.assert_allclose(
+        data["5Min"]["returns"].iloc[1:], data["5Min"]["close"].pct_change().iloc[1:]
+    )
+
+
+def test_missing_primary_timeframe_raises(tmp_path):
+    class EmptyProvider(FakeProvider):
+        def get_bars(self, symbol, timeframe, start, end):
+            return pd.DataFrame()
+
+    loader = MultiTimeframeLoader(EmptyProvider(), tmp_path, clock=Clock(NOW))
+
+    with pytest.raises(ValueError, match="primary timeframe"):
+        fetch_aligned_multi_timeframe(
+            "SPY", "5Min", ["1Hour"], days=2, api_key="", api_secret="", loader=loader
+        )
@@ -0,0 +1,84 @@
+"""Tests for single-pass regime labelling in MarketRegimeDetector.
+
+The vectorized labeller must agree label-for-label with running
+detect_regime() on every bar's lookback slice.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.ml.meta_learning import MarketRegimeDetector, RegimeType
+
+
+def make_ohlcv(seed: int, n: int = 400) -> pd.DataFrame:
+    """Random walk with alternating calm and volatile stretches."""
+    rng = np.random.default_rng(seed)
+    vol = np.where((np.arange(n) // 60) % 2 == 0, 0.002, 0.02)
+    close = 100 * np.cumprod(1 + rng.normal(0.0005, vol))
+    spread = close * vol * rng.uniform(0.5, 1.5, n)
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(1_000, 5_000, n).astype(float),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="min"),
+    )
+
+
+def reference_labels(detector, df, window):
+    """Per-bar labels exactly as segment_by_regime_reference computes them."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return [
+            detector.detect_regime(df.iloc[max(0, i - window):i + 1].copy(), window)
+            for i in range(window, len(df))
+        ]
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 13, 14, 20, 40])
+def test_labels_match_per_slice_detection(window):
+    """Vectorized labels equal detect_regime on each slice."""
+    detector = MarketRegimeDetector()
+    df = make_ohlcv(window)
+
+    labels = detector.label_regimes(df, window)
+
+    assert labels[:window] == [RegimeType.UNKNOWN] * window
+    assert labels[window:] == reference_labels(detector, df, window)
+
+
+def test_labels_cover_multiple_regimes():
+    """Sanity check that the fixture exercises both trend and volatility splits."""
+    labels = set(MarketRegimeDetector().label_regimes(make_ohlcv(0), window=2))
+    assert len(labels) >= 3
+
+
+@pytest.mark.parametrize("window,min_segment_size", [(2, 5), (20, 10), (20, 50)])
+def test_segments_match_reference(window, min_segment_size):
+    """Segment boundaries and contents equal the per-bar implementation."""
+    detector = MarketRegimeDetector()
+    df = make_ohlcv(1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = detector.segment_by_regime_reference(df, window, min_segment_size)
+    actual = detector.segment_by_regime(df, window, min_segment_size)
+
+    assert [regime for regime, _ in actual] == [regime for regime, _ in expected]
+    for (_, got), (_, want) in zip(actual, expected):
+        pd.testing.assert_frame_equal(got, want)
+
+
+def test_short_series_has_no_segments():
+    """Series no longer than the window produce no labels or segments."""
+    detector = MarketRegimeDetector()
+    df = make_ohlcv(2, n=20)
+
+    assert detector.regime_boundaries(df, window=20) == []
+    assert detector.segment_by_regime(df, window=20) == []
@@ -0,0 +1,133 @@
+"""Tests for StrategySelector similarity matrices and ensemble selection.
+
+The vectorized similarity matrix must match calculate_strategy_correlation
+pair-for-pair, and greedy selection over it must pick the same strategies as
+the straightforward nested loop.
+"""
+
+import numpy as np
+import pytest
+
+from trading_bot.ml.models import MLStrategy, StrategyGene
+from trading_bot.ml.strategy_selector import StrategyScore, StrategySelector
+
+FEATURES = ["close", "volume", "rsi", "macd", "atr", "sma_20", "ema_50", "vwap"]
+
+
+def make_scores(seed: int, n: int = 25) -> list[StrategyScore]:
+    """Random genes (some missing) with descending composite scores."""
+    rng = np.random.default_rng(seed)
+    scores = []
+    for i in range(n):
+        gene = None
+        if i % 7 != 3:
+            features = set(rng.choice(FEATURES, size=rng.integers(0, 5), replace=False))
+            gene = StrategyGene(
+                tree=f"tree_{i}",
+                depth=int(rng.integers(1, 12)),
+                num_nodes=int(rng.integers(1, 60)),
+                features_used=features,
+            )
+        strategy = MLStrategy(name=f"s{i}", gene=gene)
+        scores.append(StrategyScore(strategy=strategy, composite_score=100.0 - i))
+    return scores
+
+
+def reference_selection(
+    selector: StrategySelector,
+    qualified: list[StrategyScore],
+    n: int,
+    diversity_threshold: float,
+) -> list[StrategyScore]:
+    """Nested-loop greedy selection using the pairwise correlation."""
+    selected = [qualified[0]]
+    remaining = qualified[1:]
+    while len(selected) < n and remaining:
+        best, best_diversity = None, -1.0
+        for candidate in remaining:
+            corr = np.mean([
+                selector.calculate_strategy_correlation(candidate.strategy, s.strategy)
+                for s in selected
+            ])
+            if 1.0 - corr > best_diversity:
+                best, best_diversity = candidate, 1.0 - corr
+        if best_diversity < 1.0 - diversity_threshold:
+            break
+        selected.append(best)
+        remaining.remove(best)
+    return selected
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_structural_matrix_matches_pairwise_correlation(seed):
+    selector = StrategySelector()
+    strategies = [score.strategy for score in make_scores(seed)]
+
+    matrix = selector.structural_similarity_matrix(strategies)
+
+    for i, a in enumerate(strategies):
+        for j, b in enumerate(strategies):
+            if i != j:
+                assert matrix[i, j] == pytest.approx(
+                    selector.calculate_strategy_correlation(a, b), abs=1e-12
+                )
+    np.testing.assert_allclose(matrix, matrix.T)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+@pytest.mark.parametrize("threshold", [0.3, 0.5, 0.8])
+def test_select_for_ensemble_matches_nested_loop(seed, threshold):
+    selector = StrategySelector()
+    scores = make_scores(seed)
+
+    selected = selector.select_for_ensemble(
+        scores, n=8, min_score=0.0, diversity_threshold=threshold
+    )
+
+    expected = reference_selection(selector, scores, 8, threshold)
+    assert [s.strategy.id for s in selected] == [s.strategy.id for s in expected]
+
+
+def test_signal_returns_avoid_duplicate_streams():
+    selector = StrategySelector()
+    gene = StrategyGene(tree="t", depth=3, num_nodes=10, features_used={"close", "rsi"})
+    strategies = [MLStrategy(name=f"s{i}", gene=gene) for i in range(3)]
+    scores = [
+        StrategyScore(strategy=s, composite_score=90.0 - i)
+        for i, s in enumerate(strategies)
+    ]
+    rng = np.random.default_rng(7)
+    base = rng.normal(0, 0.01, 250)
+    returns = {
+        str(strategies[0].id): base,
+        str(strategies[1].id): base.copy(),  # same trades as the leader
+        str(strategies[2].id): rng.normal(0, 0.01, 250),
+    }
+
+    # Identical genes: structurally indistinguishable, so order decides
+    structural = selector.select_for_ensemble(
+        scores, n=2, min_score=0.0, diversity_threshold=1.0
+    )
+    assert [s.strategy.name for s in structural] == ["s0", "s1"]
+
+    by_returns = selector.select_for_ensemble(
+        scores, n=2, min_score=0.0, diversity_threshold=1.0, signal_returns=returns
+    )
+    assert [s.strategy.name for s in by_returns] == ["s0", "s2"]
+
+
+def test_return_correlation_handles_missing_and_constant_series():
+    selector = StrategySelector()
+    strategies = [MLStrategy(name=f"s{i}") for i in range(3)]
+    returns = {
+        str(strategies[0].id): [0.01, -0.02, 0.03, 0.0],
+        str(strategies[1].id): [0.0, 0.0, 0.0, 0.0],
+    }
+
+    corr = selector.return_correlation_matrix(strategies, returns)
+
+    assert corr[0, 0] == pytest.approx(1.0)
+    assert np.isnan(corr[0, 1]) and np.isnan(corr[0, 2])
+    # Falls back to structural similarity where returns are unusable
+    similarity = selector.similarity_matrix(strategies, returns)
+    assert similarity[0, 1] == pytest.approx(0.5)
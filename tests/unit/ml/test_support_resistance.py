@@ -0,0 +1,124 @@
+"""Tests for vectorized support/resistance features.
+
+rolling_features() must reproduce get_features() on every prefix of the
+series, and the vectorized touch/strength helpers must match the original
+per-bar loops.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.ml.features.extractor import FeatureExtractor
+from trading_bot.ml.features.support_resistance import SupportResistanceDetector
+
+
+def make_ohlcv(seed: int, n: int = 300, tick: float = 0.0) -> pd.DataFrame:
+    """Random walk; a tick size > 0 rounds prices to create exact ties."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    high = close * (1 + rng.uniform(0, 0.01, n))
+    low = close * (1 - rng.uniform(0, 0.01, n))
+    if tick:
+        close, high, low = (np.round(x / tick) * tick for x in (close, high, low))
+    return pd.DataFrame({
+        "open": close,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": rng.integers(1_000, 10_000, n).astype(float),
+    })
+
+
+def reference_count_touches(detector, df, level, level_type):
+    """Original per-row touch loop."""
+    touches, last_touch_bar = 0, len(df)
+    column = "high" if level_type == "resistance" else "low"
+    for i in range(len(df)):
+        if abs(df[column].iloc[i] - level) / level < detector.touch_threshold:
+            touches += 1
+            last_touch_bar = len(df) - i
+    return touches, last_touch_bar
+
+
+def reference_strength(detector, level, touches, last_touch_bars, df, level_type):
+    """Original per-row strength loop."""
+    column = "high" if level_type == "resistance" else "low"
+    volumes = [
+        df["volume"].iloc[i]
+        for i in range(len(df))
+        if abs(df[column].iloc[i] - level) / level < detector.touch_threshold
+    ]
+    if volumes:
+        volume_score = min(np.mean(volumes) / (df["volume"].mean() + 1e-10), 2.0) / 2.0
+    else:
+        volume_score = 0.5
+    return (
+        min(touches / 5.0, 1.0) * 0.4
+        + np.exp(-last_touch_bars / 50.0) * 0.3
+        + volume_score * 0.3
+    )
+
+
+def per_bar_features(detector, df, lookback):
+    """get_features() on every prefix, as FeatureExtractor used to do."""
+    n = len(df)
+    rows = {}
+    for i in range(min(lookback, n), n):
+        rows[i] = detector.get_features(df.iloc[:i + 1], float(df["close"].iloc[i]), lookback)
+    return rows
+
+
+@pytest.mark.parametrize("level_type", ["support", "resistance"])
+def test_touch_and_strength_match_loops(level_type):
+    detector = SupportResistanceDetector()
+    df = make_ohlcv(3, n=120)
+    for level in np.linspace(df["low"].min(), df["high"].max(), 25):
+        touches, last = detector._count_touches(df, level, level_type)
+        assert (touches, last) == reference_count_touches(detector, df, level, level_type)
+        assert detector._calculate_strength(level, touches, last, df, level_type) == pytest.approx(
+            reference_strength(detector, level, touches, last, df, level_type), rel=1e-12
+        )
+
+
+@pytest.mark.parametrize(
+    "seed,tick,swing_order,lookback",
+    [(0, 0.0, 5, 100), (1, 0.5, 5, 100), (2, 0.0, 3, 60), (3, 0.25, 8, 100)],
+)
+def test_rolling_features_match_per_bar_get_features(seed, tick, swing_order, lookback):
+    detector = SupportResistanceDetector(swing_order=swing_order)
+    df = make_ohlcv(seed, tick=tick)
+
+    rolling = detector.rolling_features(df, lookback=lookback)
+    expected = per_bar_features(detector, df, lookback)
+
+    for key, values in rolling.items():
+        assert np.all(values[:min(lookback, len(df))] == values[0])
+        for i, row in expected.items():
+            assert values[i] == pytest.approx(row[key], rel=1e-9, abs=1e-12), (key, i)
+
+
+def test_rolling_features_short_and_empty_series():
+    detector = SupportResistanceDetector()
+    df = make_ohlcv(4, n=30)
+
+    rolling = detector.rolling_features(df, lookback=100, min_bars=10)
+    expected = {i: detector.get_features(df.iloc[:i + 1], df["close"].iloc[i]) for i in range(10, 30)}
+    for i, row in expected.items():
+        for key, value in row.items():
+            assert rolling[key][i] == pytest.approx(value, rel=1e-9, abs=1e-12)
+
+    empty = detector.rolling_features(df.iloc[:0])
+    assert all(len(values) == 0 for values in empty.values())
+
+
+def test_extractor_pattern_features_use_rolling_engine():
+    extractor = FeatureExtractor()
+    df = make_ohlcv(5, n=180)
+
+    features = extractor.calculate_pattern_features(df)
+    expected = per_bar_features(extractor.sr_detector, df, 100)
+
+    for i, row in expected.items():
+        for key, value in row.items():
+            assert features[key][i] == pytest.approx(value, rel=1e-9, abs=1e-12)
@@ -0,0 +1,109 @@
+"""Tests for the array-based WalkForwardOptimizer backtest.
+
+The vectorized path must reproduce the per-bar reference implementation.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.ml.backtesting.walk_forward import WalkForwardOptimizer
+from trading_bot.ml.config import BacktestConfig
+from trading_bot.ml.features.technical import TechnicalFeatureCalculator
+from trading_bot.ml.models import MLStrategy
+
+
+def make_ohlcv(seed: int, n: int = 300) -> pd.DataFrame:
+    """Random-walk OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.002, n)),
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1_000, 10_000, n).astype(float),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="D"),
+    )
+
+
+@pytest.fixture
+def choppy_signals(monkeypatch):
+    """Replace RSI/MACD with noise so the placeholder signal flips often."""
+    original = TechnicalFeatureCalculator.calculate_all
+
+    def noisy(self, df):
+        features = original(self, df)
+        rng = np.random.default_rng(len(df))
+        features["rsi_14"] = rng.uniform(0, 1, len(df))
+        features["macd"] = rng.uniform(-0.5, 0.5, len(df))
+        return features
+
+    monkeypatch.setattr(TechnicalFeatureCalculator, "calculate_all", noisy)
+
+
+@pytest.fixture
+def optimizer():
+    return WalkForwardOptimizer(BacktestConfig())
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_backtest_matches_reference(optimizer, choppy_signals, seed):
+    """Array path gives the same metrics as the per-bar loop."""
+    strategy = MLStrategy(name="placeholder")
+
+    expected = optimizer.backtest_strategy_reference(strategy, make_ohlcv(seed))
+    actual = optimizer.backtest_strategy(strategy, make_ohlcv(seed))
+
+    assert expected.num_trades > 5
+    assert actual.num_trades == expected.num_trades
+    assert actual.sharpe_ratio == pytest.approx(expected.sharpe_ratio, rel=1e-12)
+    assert actual.max_drawdown == pytest.approx(expected.max_drawdown, rel=1e-12)
+    assert actual.win_rate == pytest.approx(expected.win_rate, rel=1e-12)
+    assert actual.profit_factor == pytest.approx(expected.profit_factor, rel=1e-12)
+    assert actual.total_return == pytest.approx(expected.total_return, rel=1e-12)
+
+
+def test_simulate_signals_ignores_position_open_at_start():
+    """A long run already active at bar 0 is never entered."""
+    close = np.array([10.0, 11.0, 12.0, 11.0, 12.0, 13.0])
+    signals = np.array([True, True, False, True, True, False])
+
+    metrics = WalkForwardOptimizer.simulate_signals(close, signals)
+
+    # Only the second run trades: enter at 11, exit at 13
+    assert metrics.num_trades == 1
+    assert metrics.win_rate == 1.0
+
+
+def test_costs_reduce_trade_returns(optimizer, choppy_signals):
+    """Round-trip costs lower total return without changing trade count."""
+    strategy = MLStrategy(name="placeholder")
+
+    gross = optimizer.backtest_strategy(strategy, make_ohlcv(3))
+    net = optimizer.backtest_strategy(strategy, make_ohlcv(3), include_costs=True)
+
+    assert net.num_trades == gross.num_trades
+    assert net.total_return < gross.total_return
+
+
+def test_callable_entry_logic_returns_signal_vector(optimizer):
+    """Callable strategies are evaluated once over the feature matrix."""
+    calls = []
+
+    def always_long_after_first_bar(features):
+        calls.append(len(features["close"]))
+        signals = np.ones(len(features["close"]))
+        signals[0] = 0.0
+        return signals
+
+    strategy = MLStrategy(name="callable", entry_logic=always_long_after_first_bar)
+    data = make_ohlcv(4)
+
+    features = optimizer.feature_matrix(data)
+    signals = optimizer.signal_vector(strategy, features)
+
+    assert calls == [len(data)]
+    assert not signals[0] and signals[1:].all()
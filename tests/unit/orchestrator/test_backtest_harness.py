@@ -0,0 +1,121 @@
+"""
+Unit tests for LLMBacktestHarness
+
+Tests last-known-price lookups, the trading-day calendar and the vectorized
+equity curve against a fake historical data manager.
+"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from trading_bot.backtest.utils import trading_calendar
+from trading_bot.orchestrator.backtest_harness import LLMBacktestHarness
+
+
+class FakeDataManager:
+    """Serves fixed daily closes keyed by symbol."""
+
+    def __init__(self, closes):
+        self.closes = closes
+
+    def fetch_data(self, symbol, start_date, end_date):
+        if symbol not in self.closes:
+            raise ValueError(f"no data for {symbol}")
+        return [
+            SimpleNamespace(timestamp=datetime.fromisoformat(day).replace(tzinfo=UTC), close=Decimal(str(close)))
+            for day, close in self.closes[symbol]
+        ]
+
+
+class AlwaysBuyHarness(LLMBacktestHarness):
+    """Harness whose analysis step always signals BUY."""
+
+    def simulate_screening(self, date):
+        return self.symbols
+
+    def simulate_analysis(self, symbol, date, current_price):
+        return {"symbol": symbol, "signal": "BUY", "confidence": 75.0, "current_price": current_price}
+
+
+def make_harness(closes, start="2024-01-12", end="2024-01-18", cls=LLMBacktestHarness, symbols=None):
+    return cls(
+        start_date=start,
+        end_date=end,
+        symbols=symbols or list(closes),
+        data_manager=FakeDataManager(closes),
+    )
+
+
+class TestGetPriceData:
+    """Test suite for last-known-price lookups."""
+
+    def test_exact_and_last_known_prices(self):
+        harness = make_harness({
+            # Unsorted input with a duplicate date: the later bar wins
+            "AAA": [("2024-01-16", 105.0), ("2024-01-11", 100.0), ("2024-01-12", 101.0), ("2024-01-12", 102.0)],
+            "BBB": [("2024-01-17", 50.0)],
+        })
+
+        assert harness.get_price_data("2024-01-12") == {"AAA": 102.0}
+        assert harness.get_price_data("2024-01-15") == {"AAA": 102.0}  # MLK Day
+        assert harness.get_price_data("2024-01-18") == {"AAA": 105.0, "BBB": 50.0}
+
+    def test_failed_fetch_has_no_prices(self):
+        harness = make_harness({"AAA": [("2024-01-12", 10.0)]}, symbols=["AAA", "ZZZ"])
+
+        assert harness.get_price_data("2024-01-12") == {"AAA": 10.0}
+        assert len(harness.bar_dates["ZZZ"]) == 0
+
+
+class TestRun:
+    """Test suite for the simulation loop and metrics."""
+
+    @pytest.fixture
+    def harness(self):
+        return make_harness(
+            {"AAA": [("2024-01-11", 100.0), ("2024-01-12", 100.0), ("2024-01-17", 98.0), ("2024-01-18", 99.0)]},
+            cls=AlwaysBuyHarness,
+        )
+
+    def test_iterates_trading_days_only(self, harness):
+        harness.run()
+
+        # Weekend and MLK Day (2024-01-15) are skipped
+        assert [p["date"] for p in harness.equity_curve] == ["2024-01-12", "2024-01-16", "2024-01-17", "2024-01-18"]
+
+    def test_equity_curve_marks_open_positions(self, harness):
+        metrics = harness.run()
+
+        # 30 shares (30% position cap) bought at $100 on the first day
+        assert [p["capital"] for p in harness.equity_curve] == [7000.0] * 4
+        assert [p["equity"] for p in harness.equity_curve] == pytest.approx([10000.0, 10000.0, 9940.0, 9970.0])
+        assert [p["open_positions"] for p in harness.equity_curve] == [1, 1, 1, 1]
+        assert metrics.total_trades == 1
+        assert metrics.trades[0]["exit_reason"] == "END_OF_BACKTEST"
+        assert metrics.total_pnl == pytest.approx(-30.0)
+
+    def test_max_drawdown_matches_running_peak(self, harness):
+        harness.run()
+        harness.equity_curve = [{"equity": e} for e in [9900.0, 10500.0, 10200.0, 9800.0, 11000.0, 10900.0]]
+
+        metrics = harness._calculate_metrics()
+
+        assert metrics.max_drawdown == pytest.approx(700.0)
+        assert metrics.max_drawdown_percent == pytest.approx(700.0 / 10500.0 * 100)
+
+    def test_long_run_uses_sorted_arrays(self):
+        days = np.arange(np.datetime64("2019-01-01"), np.datetime64("2024-12-31"))
+        closes = {
+            f"S{i}": [(str(d), 100.0 + i) for d in days[::2]]  # gaps on every other day
+            for i in range(20)
+        }
+        harness = make_harness(closes, start="2019-01-02", end="2024-12-31")
+
+        harness.run()
+
+        assert len(harness.equity_curve) == len(trading_calendar(harness.start_date, harness.end_date))
+        assert harness.get_price_data("2024-12-31")["S3"] == 103.0
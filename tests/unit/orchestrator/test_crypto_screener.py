@@ -0,0 +1,248 @@
+"""
+Unit tests for the crypto screening engine
+
+Tests one-pass liquidity ranking, wide-array indicators against the per-symbol
+pandas calculation, and CryptoOrchestrator.run_screening_workflow against a
+fake multi-symbol data service.
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.crypto_config import CryptoConfig
+from trading_bot.market_data.crypto_service import CryptoBar, CryptoDataService
+from trading_bot.orchestrator.crypto_screener import (
+    WideBars,
+    build_technical_indicators,
+    compute_indicators,
+    rank_liquid_candidates,
+)
+
+
+def quote(bid, ask, bid_size=1.0, ask_size=1.0):
+    return SimpleNamespace(bid=bid, ask=ask, bid_size=bid_size, ask_size=ask_size)
+
+
+def random_bars(symbol, n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    return [
+        CryptoBar(
+            symbol=symbol,
+            timestamp=start + timedelta(hours=i),
+            open=c,
+            high=c * (1 + rng.uniform(0, 0.01)),
+            low=c * (1 - rng.uniform(0, 0.01)),
+            close=c,
+            volume=float(rng.uniform(10, 100)),
+            vwap=c,
+        )
+        for i, c in enumerate(close)
+    ]
+
+
+def pandas_indicators(bars):
+    """Per-symbol calculation previously done inline in the screening loop."""
+    df = pd.DataFrame([vars(b) for b in bars])
+    close, high, low = df["close"], df["high"], df["low"]
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    true_range = pd.concat(
+        [high - low, abs(high - close.shift()), abs(low - close.shift())], axis=1
+    ).max(axis=1)
+    return {
+        "RSI": (100 - (100 / (1 + gain / loss))).iloc[-1],
+        "SMA_20": close.rolling(20).mean().iloc[-1],
+        "SMA_50": close.rolling(50).mean().iloc[-1],
+        "SMA_200": close.rolling(200).mean().iloc[-1] if len(close) >= 200 else np.nan,
+        "ATR": true_range.rolling(14).mean().iloc[-1],
+        "volume_sma": df["volume"].rolling(20).mean().iloc[-1],
+    }
+
+
+class TestRankLiquidCandidates:
+    """Test suite for rank_liquid_candidates."""
+
+    def test_filters_and_ranks_by_spread(self):
+        symbols = ["BTC/USD", "ETH/USD", "SHIB/USD", "DOGE/USD", "XRP/USD", "SOL/USD", "LTC/USD"]
+        quotes = {
+            "BTC/USD": quote(99.0, 101.0),          # 2.0% spread: rejected
+            "ETH/USD": quote(99.5, 100.5),          # 1.0%
+            "SHIB/USD": quote(0.05, 0.0501),        # price too low
+            "DOGE/USD": quote(10.0, 10.01, 0, 5),   # no bid size
+            "XRP/USD": None,                        # no quote
+            "SOL/USD": quote(99.9, 100.1),          # 0.2%
+            "LTC/USD": quote(99.5, 100.5),          # 1.0%, tie keeps universe order
+        }
+
+        ranked = rank_liquid_candidates(symbols, quotes)
+
+        assert [c["symbol"] for c in ranked] == ["SOL/USD", "ETH/USD", "LTC/USD"]
+        assert ranked[0]["price"] == pytest.approx(100.0)
+        assert ranked[0]["spread_pct"] == pytest.approx(0.2)
+
+    def test_empty_universe(self):
+        assert rank_liquid_candidates([], {}) == []
+
+
+class TestIndicators:
+    """Test suite for wide-array indicators."""
+
+    def test_matches_per_symbol_pandas_calculation(self):
+        bars = {"A": random_bars("A", 260, 1), "B": random_bars("B", 120, 2), "C": random_bars("C", 200, 3)}
+
+        wide = WideBars.from_bars(["A", "B", "C"], bars, limit=200)
+        indicators = compute_indicators(wide)
+
+        assert wide.counts.tolist() == [200, 120, 200]
+        for col, symbol in enumerate(["A", "B", "C"]):
+            expected = pandas_indicators(bars[symbol][-200:])
+            for name, value in expected.items():
+                np.testing.assert_allclose(indicators[name][col], value, rtol=1e-9, err_msg=f"{symbol} {name}")
+
+    def test_flat_prices_fall_back_to_neutral_rsi(self):
+        flat = [SimpleNamespace(high=1.0, low=1.0, close=1.0, volume=5.0)] * 60
+        candidates = [{"symbol": "X", "price": 1.0, "spread_pct": 0.1, "bid_size": 1.0, "ask_size": 1.0}]
+
+        result = build_technical_indicators(candidates, WideBars.from_bars(["X"], {"X": flat}))
+
+        assert result["X"]["RSI"] == 50.0
+        assert result["X"]["SMA_200"] is None
+        assert result["X"]["ATR"] == 0.0
+
+    def test_short_history_gets_placeholders(self):
+        candidates = [{"symbol": "NEW", "price": 2.0, "spread_pct": 0.5, "bid_size": 1.0, "ask_size": 1.0}]
+        bars = WideBars.from_bars(["NEW"], {"NEW": random_bars("NEW", 30, 4)})
+
+        result = build_technical_indicators(candidates, bars)
+
+        assert result["NEW"]["RSI"] is None
+        assert result["NEW"]["liquidity_score"] == 95.0
+
+
+class FakeCryptoData:
+    """Multi-symbol data service recording batched requests."""
+
+    def __init__(self, quotes, bars):
+        self.quotes = quotes
+        self.bars = bars
+        self.quote_requests = []
+        self.bar_requests = []
+
+    def get_multi_symbol_quotes(self, symbols):
+        self.quote_requests.append(list(symbols))
+        return {s: self.quotes.get(s) for s in symbols}
+
+    def get_multi_symbol_bars(self, symbols, timeframe="1h", days=30):
+        self.bar_requests.append(list(symbols))
+        return {s: self.bars.get(s, []) for s in symbols}
+
+    def get_latest_quote(self, symbol):
+        raise AssertionError("screening must not fetch quotes per symbol")
+
+    def get_bars(self, symbol, **kwargs):
+        raise AssertionError("screening must not fetch bars per symbol")
+
+
+@pytest.fixture
+def crypto_orchestrator():
+    from trading_bot.orchestrator import crypto_orchestrator as module
+
+    with patch.object(module, "CryptoDataService"), patch.object(module, "TradingClient"), \
+            patch.object(module, "MultiAgentTradingWorkflow"), \
+            patch("trading_bot.config.TelegramConfig.default"):
+        orchestrator = module.CryptoOrchestrator(
+            crypto_config=CryptoConfig(symbols=["BTC/USD", "ETH/USD", "SOL/USD", "DOGE/USD"]),
+            claude_manager=MagicMock(telegram_enabled=False),
+        )
+    orchestrator.crypto_data = FakeCryptoData(
+        quotes={
+            "BTC/USD": quote(100.0, 100.5),
+            "ETH/USD": quote(100.0, 100.1),
+            "SOL/USD": quote(100.0, 105.0),   # illiquid
+            "DOGE/USD": quote(100.0, 100.2),
+        },
+        bars={s: random_bars(s, 216, i) for i, s in enumerate(["BTC/USD", "ETH/USD", "DOGE/USD"])},
+    )
+    orchestrator._execute_entry_orders = MagicMock()
+    return orchestrator
+
+
+class TestCryptoOrchestratorScreening:
+    """Test suite for CryptoOrchestrator.run_screening_workflow."""
+
+    def test_batched_requests_and_ranked_evaluation(self, crypto_orchestrator):
+        orchestrator = crypto_orchestrator
+        evaluated = {}
+
+        def evaluate(symbol, current_price, technical_indicators):
+            evaluated[symbol] = technical_indicators
+            decision = "HOLD" if symbol == "DOGE/USD" else "BUY"
+            return {
+                "decision": decision, "consensus_reached": True, "position_size_shares": 1,
+                "position_size_pct": 5.0, "stop_loss_pct": 3.0, "take_profit_pct": 6.0,
+                "summary": "ok",
+            }
+
+        orchestrator.evaluate_trade_with_agents = evaluate
+
+        orchestrator.run_screening_workflow()
+
+        data = orchestrator.crypto_data
+        assert data.quote_requests == [["BTC/USD", "ETH/USD", "SOL/USD", "DOGE/USD"]]
+        assert data.bar_requests == [["ETH/USD", "DOGE/USD", "BTC/USD"]]
+        assert list(evaluated) == ["ETH/USD", "DOGE/USD", "BTC/USD"]
+        expected = pandas_indicators(data.bars["BTC/USD"][-200:])
+        assert evaluated["BTC/USD"]["SMA_50"] == pytest.approx(expected["SMA_50"])
+        assert evaluated["BTC/USD"]["RSI"] == pytest.approx(expected["RSI"])
+        assert [c["symbol"] for c in orchestrator.watchlist] == ["ETH/USD", "BTC/USD"]
+
+    def test_ta_prefilter_reuses_screening_bars(self, crypto_orchestrator):
+        orchestrator = crypto_orchestrator
+        orchestrator.ta_coordinator = MagicMock()
+        orchestrator.ta_coordinator.analyze_simple.return_value = SimpleNamespace(
+            signal="SKIP", reasoning="weak trend", regime="RANGING", confidence=40.0
+        )
+
+        orchestrator.run_screening_workflow()
+
+        frames = [c.kwargs["df"] for c in orchestrator.ta_coordinator.analyze_simple.call_args_list]
+        assert len(frames) == 3
+        assert all(len(df) == 100 for df in frames)
+        assert orchestrator.watchlist == []
+
+    def test_rule_based_fallback_uses_ranking(self, crypto_orchestrator):
+        orchestrator = crypto_orchestrator
+        orchestrator.multi_agent_workflow = None
+
+        orchestrator.run_screening_workflow()
+
+        assert [c["symbol"] for c in orchestrator.watchlist] == ["ETH/USD", "DOGE/USD", "BTC/USD"]
+        assert orchestrator.crypto_data.bar_requests == []
+
+
+class TestMultiSymbolBars:
+    """Test suite for CryptoDataService.get_multi_symbol_bars."""
+
+    def test_one_request_for_all_symbols(self):
+        raw = lambda c: SimpleNamespace(
+            timestamp=datetime(2025, 1, 1, tzinfo=UTC), open=c, high=c, low=c, close=c, volume=1, vwap=None
+        )
+        service = CryptoDataService.__new__(CryptoDataService)
+        service.client = MagicMock()
+        service.client.get_crypto_bars.return_value = {"BTC/USD": [raw(1.0), raw(2.0)]}
+
+        bars = service.get_multi_symbol_bars(["BTC/USD", "ETH/USD"], timeframe="1h", days=9)
+
+        service.client.get_crypto_bars.assert_called_once()
+        request = service.client.get_crypto_bars.call_args.args[0]
+        assert request.symbol_or_symbols == ["BTC/USD", "ETH/USD"]
+        assert [b.close for b in bars["BTC/USD"]] == [1.0, 2.0]
+        assert bars["ETH/USD"] == []
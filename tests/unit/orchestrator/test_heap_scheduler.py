@@ -0,0 +1,265 @@
+"""
+Unit tests for HeapScheduler
+
+Tests deadline ordering, time zone/DST handling, interval coalescing and
+overlap policies using an injectable fake clock.
+"""
+
+import threading
+from datetime import UTC, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from trading_bot.orchestrator.heap_scheduler import (
+    DailyTrigger,
+    HeapScheduler,
+    IntervalTrigger,
+    OverlapPolicy,
+)
+
+NY = ZoneInfo("America/New_York")
+
+
+class FakeClock:
+    """Manually advanced UTC clock."""
+
+    def __init__(self, start: datetime):
+        self.now = start.astimezone(UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+    def set(self, moment: datetime):
+        self.now = moment.astimezone(UTC)
+
+
+class Blocker:
+    """Callback that blocks until released, counting starts."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.started.release()
+        self.release.wait(5)
+
+
+@pytest.fixture
+def clock():
+    # Monday 2025-03-03 06:00 New York
+    return FakeClock(datetime(2025, 3, 3, 6, 0, tzinfo=NY))
+
+
+@pytest.fixture
+def scheduler(clock):
+    sched = HeapScheduler(clock=clock, max_workers=4)
+    yield sched
+    sched.shutdown(wait=True)
+
+
+class TestDailyTrigger:
+    """Test suite for DailyTrigger fire times."""
+
+    def test_next_after_uses_local_wall_clock(self):
+        trigger = DailyTrigger(times=(time(9, 30), time(6, 30)))
+        after = datetime(2025, 3, 3, 7, 0, tzinfo=NY).astimezone(UTC)
+
+        assert trigger.next_after(after) == datetime(2025, 3, 3, 9, 30, tzinfo=NY).astimezone(UTC)
+
+    def test_dst_change_keeps_local_time(self):
+        trigger = DailyTrigger(times=(time(9, 30),))
+        # Friday before the 2025-03-09 spring-forward
+        fire = datetime(2025, 3, 7, 9, 30, tzinfo=NY).astimezone(UTC)
+        runs = []
+        for _ in range(3):
+            fire = trigger.next_after(fire)
+            runs.append(fire)
+
+        assert [r.astimezone(NY).time() for r in runs] == [time(9, 30)] * 3
+        assert runs[0].hour == 14  # Saturday, EST (UTC-5)
+        assert runs[2].hour == 13  # Monday, EDT (UTC-4)
+
+    def test_spring_forward_gap_fires_after_gap(self):
+        trigger = DailyTrigger(times=(time(2, 30),))
+        after = datetime(2025, 3, 9, 0, 0, tzinfo=NY).astimezone(UTC)
+
+        fire = trigger.next_after(after)
+
+        assert fire.astimezone(NY).replace(tzinfo=None) == datetime(2025, 3, 9, 3, 30)
+
+    def test_fall_back_fires_once(self):
+        trigger = DailyTrigger(times=(time(1, 30),))
+        first = trigger.next_after(datetime(2025, 11, 2, 0, 0, tzinfo=NY).astimezone(UTC))
+        second = trigger.next_after(first)
+
+        assert second.astimezone(NY).date() == datetime(2025, 11, 3).date()
+
+    def test_weekdays_filter(self):
+        trigger = DailyTrigger(times=(time(16, 5),), weekdays=frozenset({4}))
+        fire = trigger.next_after(datetime(2025, 3, 3, 12, 0, tzinfo=NY).astimezone(UTC))
+
+        assert fire.astimezone(NY).weekday() == 4
+
+
+class TestIntervalTrigger:
+    """Test suite for IntervalTrigger slots."""
+
+    def test_missed_slots_are_coalesced(self):
+        trigger = IntervalTrigger(timedelta(minutes=5))
+        due = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+        assert trigger.next_run(due, due) == due + timedelta(minutes=5)
+        assert trigger.next_run(due, due + timedelta(minutes=17)) == due + timedelta(minutes=20)
+
+
+class TestHeapScheduler:
+    """Test suite for HeapScheduler dispatch."""
+
+    def test_fires_at_deadline_once(self, scheduler, clock):
+        calls = []
+        scheduler.schedule_daily("market_open", time(9, 30), lambda: calls.append(clock()))
+
+        assert scheduler.seconds_until_next() == 3.5 * 3600
+        assert scheduler.run_pending() == []
+
+        clock.set(datetime(2025, 3, 3, 9, 30, tzinfo=NY))
+        assert scheduler.run_pending() == ["market_open"]
+        assert scheduler.run_pending() == []
+        assert scheduler.wait_idle(timeout=5)
+
+        assert len(calls) == 1
+        assert scheduler.get_next_trigger()["next_run"] == datetime(2025, 3, 4, 9, 30, tzinfo=NY).astimezone(UTC)
+
+    def test_deadlines_fire_in_order(self, scheduler, clock):
+        fired = []
+        scheduler.schedule_interval("fast", 1, lambda: None)
+        scheduler.schedule_interval("slow", 3, lambda: None)
+        for _ in range(6):
+            clock.advance(minutes=1)
+            fired.append(sorted(scheduler.run_pending()))
+            scheduler.wait_idle(timeout=5)
+
+        assert fired == [["fast"], ["fast"], ["fast", "slow"], ["fast"], ["fast"], ["fast", "slow"]]
+
+    def test_run_immediately(self, scheduler, clock):
+        scheduler.schedule_interval("screen", 120, lambda: None, run_immediately=True)
+
+        assert scheduler.run_pending() == ["screen"]
+        assert scheduler.get_next_trigger()["seconds_until"] == 120 * 60
+
+    def test_misfired_daily_run_skipped(self, scheduler, clock):
+        calls = []
+        scheduler.schedule_daily("pre_market", time(6, 30), lambda: calls.append(1))
+
+        clock.set(datetime(2025, 3, 3, 8, 0, tzinfo=NY))
+        assert scheduler.run_pending() == []
+        assert calls == []
+
+    def test_callback_errors_are_isolated(self, scheduler, clock):
+        def boom():
+            raise RuntimeError("boom")
+
+        scheduler.schedule_interval("bad", 1, boom)
+        scheduler.schedule_interval("good", 1, lambda: None)
+        clock.advance(minutes=1)
+
+        assert sorted(scheduler.run_pending()) == ["bad", "good"]
+        assert scheduler.wait_idle(timeout=5)
+        assert scheduler.tasks["bad"].error_count == 1
+        assert scheduler.tasks["good"].run_count == 1
+
+    def test_slow_task_does_not_block_others(self, scheduler, clock):
+        slow = Blocker()
+        fast = []
+        scheduler.schedule_interval("slow", 1, slow)
+        scheduler.schedule_interval("fast", 1, lambda: fast.append(1))
+
+        clock.advance(minutes=1)
+        scheduler.run_pending()
+        assert slow.started.acquire(timeout=5)
+        # Let the first fast run finish so the next tick is not skipped as an overlap
+        for _ in range(500):
+            if not scheduler.tasks["fast"].running:
+                break
+            threading.Event().wait(0.01)
+
+        clock.advance(minutes=1)
+        scheduler.run_pending()
+        slow.release.set()
+        assert scheduler.wait_idle(timeout=5)
+        assert len(fast) == 2
+
+    def test_single_worker_runs_tasks_serially(self, clock):
+        scheduler = HeapScheduler(clock=clock, max_workers=1)
+        slow = Blocker()
+        order = []
+        scheduler.schedule_interval("slow", 1, lambda: (slow(), order.append("slow")))
+        scheduler.schedule_interval("eod", 1, lambda: order.append("eod"))
+
+        clock.advance(minutes=1)
+        assert scheduler.run_pending() == ["slow", "eod"]
+        assert slow.started.acquire(timeout=5)
+        assert order == []
+        assert not scheduler.wait_idle(timeout=0)
+
+        slow.release.set()
+        assert scheduler.wait_idle(timeout=5)
+        assert order == ["slow", "eod"]
+        scheduler.shutdown(wait=True)
+
+    @pytest.mark.parametrize(
+        "policy, expected_calls",
+        [(OverlapPolicy.SKIP, 1), (OverlapPolicy.QUEUE, 4), (OverlapPolicy.REPLACE, 2)],
+    )
+    def test_overlap_policies(self, scheduler, clock, policy, expected_calls):
+        blocker = Blocker()
+        scheduler.schedule_interval("monitor", 1, blocker, overlap=policy)
+
+        clock.advance(minutes=1)
+        assert scheduler.run_pending() == ["monitor"]
+        assert blocker.started.acquire(timeout=5)
+        for _ in range(3):
+            clock.advance(minutes=1)
+            scheduler.run_pending()
+
+        blocker.release.set()
+        assert scheduler.wait_idle(timeout=5)
+        assert blocker.calls == expected_calls
+
+    def test_disable_and_remove(self, scheduler, clock):
+        calls = []
+        scheduler.schedule_interval("a", 1, lambda: calls.append("a"))
+        scheduler.schedule_interval("b", 1, lambda: calls.append("b"))
+        scheduler.disable_task("a")
+        scheduler.remove_task("b")
+
+        clock.advance(minutes=1)
+        assert scheduler.run_pending() == []
+        scheduler.enable_task("a")
+        clock.advance(minutes=1)
+        assert scheduler.run_pending() == ["a"]
+
+    def test_reschedule_replaces_task(self, scheduler, clock):
+        scheduler.schedule_interval("a", 1, lambda: None)
+        scheduler.schedule_interval("a", 10, lambda: None)
+
+        clock.advance(minutes=1)
+        assert scheduler.run_pending() == []
+        clock.advance(minutes=9)
+        assert scheduler.run_pending() == ["a"]
+
+    def test_wait_returns_on_wake(self, scheduler):
+        scheduler.schedule_interval("a", 60, lambda: None)
+        timer = threading.Timer(0.05, scheduler.wake)
+        timer.start()
+
+        started = datetime.now()
+        scheduler.wait()
+        assert (datetime.now() - started).total_seconds() < 5
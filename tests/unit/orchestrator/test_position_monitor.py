@@ -0,0 +1,249 @@
+"""
+Unit tests for PositionMonitor
+
+Tests vectorized stop/target evaluation, per-order failure isolation, and the
+stock and crypto orchestrator monitoring passes against fake trading clients.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from alpaca.trading.client import TradingClient
+
+from trading_bot.crypto_config import CryptoConfig
+from trading_bot.orchestrator.position_monitor import (
+    STOP_LOSS,
+    TARGET,
+    ExitLevelTable,
+    ExitSignal,
+    PositionMonitor,
+)
+
+
+class FakeTradingClient(TradingClient):
+    """TradingClient stand-in recording submitted orders."""
+
+    def __init__(self, positions=(), orders=None, fail_symbols=()):
+        self.positions = list(positions)
+        self.orders = orders or {}
+        self.fail_symbols = set(fail_symbols)
+        self.submitted = []
+        self.order_lookups = []
+        self._lock = threading.Lock()
+
+    def get_all_positions(self):
+        return self.positions
+
+    def get_order_by_id(self, order_id):
+        with self._lock:
+            self.order_lookups.append(order_id)
+        return self.orders[order_id]
+
+    def submit_order(self, order_data):
+        if order_data.symbol in self.fail_symbols:
+            raise RuntimeError(f"rejected {order_data.symbol}")
+        with self._lock:
+            self.submitted.append(order_data)
+        return SimpleNamespace(id=f"order-{order_data.symbol}", status="accepted")
+
+
+def alpaca_position(symbol, price, qty=10, entry=100.0):
+    return SimpleNamespace(
+        symbol=symbol,
+        current_price=str(price),
+        avg_entry_price=str(entry),
+        unrealized_pl=str((price - entry) * qty),
+        unrealized_plpc=str((price - entry) / entry),
+        qty=str(qty),
+    )
+
+
+class TestExitLevelTable:
+    """Test suite for ExitLevelTable."""
+
+    def test_evaluate_flags_stops_and_targets(self):
+        table = ExitLevelTable(capacity=2)
+        table.set("AAPL", stop=95.0, target=110.0)
+        table.set("MSFT", stop=290.0, target=None)
+        table.set("TSLA", stop=None, target=250.0)
+
+        tracked, stop_hit, target_hit = table.evaluate(
+            ["AAPL", "MSFT", "TSLA", "NVDA"], [111.0, 289.0, 240.0, 1.0]
+        )
+
+        assert tracked.tolist() == [True, True, True, False]
+        assert stop_hit.tolist() == [False, True, False, False]
+        assert target_hit.tolist() == [True, False, False, False]
+
+    def test_stop_takes_precedence_over_target(self):
+        table = ExitLevelTable()
+        table.set("AAPL", stop=100.0, target=90.0)
+
+        _, stop_hit, target_hit = table.evaluate(["AAPL"], [95.0])
+
+        assert stop_hit[0] and not target_hit[0]
+
+    def test_remove_swaps_last_row(self):
+        table = ExitLevelTable()
+        for i, symbol in enumerate(["A", "B", "C"]):
+            table.set(symbol, stop=float(i + 1))
+
+        table.remove("A")
+
+        assert len(table) == 2 and "A" not in table
+        assert table.get("C") == (3.0, pytest.approx(np.nan, nan_ok=True))
+        assert table.evaluate(["B", "C"], [2.0, 3.5])[1].tolist() == [True, False]
+
+    def test_replace_all_keeps_first_entry_per_symbol(self):
+        table = ExitLevelTable()
+        table.set("OLD", stop=1.0)
+
+        table.replace_all(["BTC/USD", "ETH/USD", "BTC/USD"], [50.0, 3.0, 70.0])
+
+        assert table.symbols == ["BTC/USD", "ETH/USD"]
+        assert table.get("BTC/USD")[0] == 50.0
+
+
+class TestPositionMonitor:
+    """Test suite for PositionMonitor."""
+
+    def test_evaluate_builds_signals_in_position_order(self):
+        monitor = PositionMonitor()
+        monitor.levels.set("AAPL", stop=95.0, target=110.0)
+        monitor.levels.set("MSFT", stop=290.0, target=330.0)
+
+        signals = monitor.evaluate(
+            ["MSFT", "AAPL"], [335.0, 94.0], [5, 10], [{"pl": 1.0}, {"pl": -2.0}]
+        )
+
+        assert [(s.symbol, s.reason, s.level, s.qty) for s in signals] == [
+            ("MSFT", TARGET, 330.0, 5.0),
+            ("AAPL", STOP_LOSS, 95.0, 10.0),
+        ]
+        assert signals[1].info == {"pl": -2.0}
+
+    def test_submit_exits_isolates_failures(self):
+        monitor = PositionMonitor(max_workers=4)
+        signals = [ExitSignal(s, STOP_LOSS, 1.0, 1.0, 1.0) for s in ["A", "B", "C", "D"]]
+        barrier = threading.Barrier(4, timeout=5)
+
+        def submit(signal):
+            barrier.wait()  # all four orders are in flight at once
+            if signal.symbol == "B":
+                raise RuntimeError("insufficient qty")
+            return f"order-{signal.symbol}"
+
+        results = monitor.submit_exits(signals, submit)
+
+        assert [r.signal.symbol for r in results] == ["A", "B", "C", "D"]
+        assert [r.ok for r in results] == [True, False, True, True]
+        assert str(results[1].error) == "insufficient qty"
+        assert results[3].order == "order-D"
+
+
+@pytest.fixture
+def trading_orchestrator():
+    from trading_bot.orchestrator import trading_orchestrator as module
+
+    manager = MagicMock(telegram_enabled=False)
+    with patch.object(module, "ClaudeCodeManager", return_value=manager), \
+            patch.object(module, "MultiAgentTradingWorkflow"):
+        orchestrator = module.TradingOrchestrator(config=MagicMock(), auth=None, mode="live")
+    orchestrator.workflow = MagicMock()
+    return orchestrator
+
+
+class TestTradingOrchestratorMonitoring:
+    """Test suite for TradingOrchestrator.run_monitoring_workflow."""
+
+    def test_exits_submitted_and_untracked_after_success(self, trading_orchestrator):
+        orchestrator = trading_orchestrator
+        for symbol, stop, target in [("AAPL", 95.0, 120.0), ("MSFT", 290.0, 330.0), ("NVDA", 400.0, 500.0)]:
+            orchestrator._record_trade({"symbol": symbol, "stop_loss": stop, "target": target})
+        orchestrator.auth = FakeTradingClient(
+            positions=[
+                alpaca_position("AAPL", 94.0),
+                alpaca_position("MSFT", 331.0, entry=300.0),
+                alpaca_position("NVDA", 450.0, entry=420.0),
+                alpaca_position("TSLA", 1.0),
+            ],
+            fail_symbols={"MSFT"},
+        )
+
+        orchestrator.run_monitoring_workflow()
+
+        assert [o.symbol for o in orchestrator.auth.submitted] == ["AAPL"]
+        assert sorted(t["symbol"] for t in orchestrator.daily_trades) == ["MSFT", "NVDA"]
+        assert "AAPL" not in orchestrator.position_monitor.levels
+        assert "MSFT" in orchestrator.position_monitor.levels
+
+
+@pytest.fixture
+def crypto_orchestrator():
+    from trading_bot.orchestrator import crypto_orchestrator as module
+
+    with patch.object(module, "CryptoDataService"), patch.object(module, "TradingClient"), \
+            patch.object(module, "MultiAgentTradingWorkflow"), \
+            patch("trading_bot.config.TelegramConfig.default"):
+        orchestrator = module.CryptoOrchestrator(
+            crypto_config=CryptoConfig(stop_loss_pct=5.0),
+            claude_manager=MagicMock(telegram_enabled=False),
+        )
+    return orchestrator
+
+
+def crypto_position(symbol, order_id, entry, qty=1.0, **extra):
+    return {"symbol": symbol, "entry_price": entry, "quantity": qty, "alpaca_order_id": order_id, **extra}
+
+
+class TestCryptoOrchestratorMonitoring:
+    """Test suite for CryptoOrchestrator.run_monitoring_workflow."""
+
+    def test_stop_losses_batched_and_filled_orders_not_requeried(self, crypto_orchestrator):
+        orchestrator = crypto_orchestrator
+        btc = crypto_position("BTC/USD", "o1", 100.0, alpaca_status="filled")
+        eth = crypto_position("ETH/USD", "o2", 100.0, ai_stop_loss_pct=2.0)
+        sol = crypto_position("SOL/USD", "o3", 100.0)
+        doge = crypto_position("DOGE/USD", "o4", 100.0)
+        orchestrator.active_positions = [btc, eth, sol, doge]
+        orchestrator.trading_client = FakeTradingClient(orders={
+            "o2": SimpleNamespace(status="filled", filled_qty="2.5"),
+            "o3": SimpleNamespace(status="new", filled_qty=None),
+            "o4": SimpleNamespace(status="cancelled", filled_qty=None),
+        })
+        quote = lambda price: SimpleNamespace(bid=price - 0.5, ask=price + 0.5)
+        orchestrator.crypto_data.get_multi_symbol_quotes.return_value = {
+            "BTC/USD": quote(94.0),   # -6% vs 5% config stop
+            "ETH/USD": quote(97.0),   # -3% vs 2% AI stop
+            "SOL/USD": quote(50.0),   # not filled: skipped
+        }
+
+        orchestrator.run_monitoring_workflow()
+
+        client = orchestrator.trading_client
+        assert sorted(client.order_lookups) == ["o2", "o3", "o4"]
+        orchestrator.crypto_data.get_multi_symbol_quotes.assert_called_once_with(["BTC/USD", "ETH/USD"])
+        sells = {o.symbol: o for o in client.submitted}
+        assert sorted(sells) == ["BTC/USD", "ETH/USD"]
+        assert sells["ETH/USD"].qty == 2.5
+        assert sells["ETH/USD"].limit_price == 96.5
+        assert orchestrator.active_positions == [sol]
+
+    def test_failed_sell_keeps_position(self, crypto_orchestrator):
+        orchestrator = crypto_orchestrator
+        btc = crypto_position("BTC/USD", None, 100.0)
+        eth = crypto_position("ETH/USD", None, 100.0)
+        orchestrator.active_positions = [btc, eth]
+        orchestrator.trading_client = FakeTradingClient(fail_symbols={"BTC/USD"})
+        orchestrator.crypto_data.get_multi_symbol_quotes.return_value = {
+            "BTC/USD": SimpleNamespace(bid=80.0, ask=81.0),
+            "ETH/USD": SimpleNamespace(bid=80.0, ask=81.0),
+        }
+
+        orchestrator.run_monitoring_workflow()
+
+        assert [o.symbol for o in orchestrator.trading_client.submitted] == ["ETH/USD"]
+        assert orchestrator.active_positions == [btc]
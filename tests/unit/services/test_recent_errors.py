@@ -0,0 +1,144 @@
+"""
+Unit tests for recent-error extraction in StateAggregator
+
+Test cases:
+- test_tail_lines_matches_readlines: Verify reverse block reader output
+- test_tail_lines_reads_only_the_tail: Verify large files are not fully read
+- test_recent_errors_from_ring_buffer: Verify in-process errors without log files
+- test_recent_errors_merge_log_tail_and_buffer: Verify bot-process errors are kept
+  and buffered duplicates dropped
+- test_recent_errors_without_buffer: Verify log tail alone
+"""
+
+import logging
+
+import pytest
+
+from api.app.core.log_tail import tail_lines
+from api.app.services.state_aggregator import StateAggregator
+from src.trading_bot.logging.error_buffer import ErrorRingBufferHandler
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 64, 4096])
+@pytest.mark.parametrize("max_lines", [1, 5, 100, 500])
+def test_tail_lines_matches_readlines(tmp_path, block_size, max_lines):
+    path = tmp_path / "app.log"
+    path.write_text("".join(f"line {i} {'x' * (i % 13)}\n" for i in range(300)))
+
+    expected = [line.rstrip("\n") for line in path.read_text().splitlines(True)[-max_lines:]]
+
+    assert tail_lines(path, max_lines, block_size=block_size) == expected
+
+
+def test_tail_lines_handles_missing_trailing_newline_and_empty_file(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("a\nb\nc")
+    empty = tmp_path / "empty.log"
+    empty.write_text("")
+
+    assert tail_lines(path, 2, block_size=2) == ["b", "c"]
+    assert tail_lines(empty, 10) == []
+    assert tail_lines(path, 0) == []
+
+
+def test_tail_lines_reads_only_the_tail(tmp_path, monkeypatch):
+    path = tmp_path / "big.log"
+    with open(path, "w") as f:
+        for i in range(200_000):
+            f.write(f"2025-10-24 10:30:00 UTC | INFO     | bot | message {i}\n")
+
+    read_bytes = 0
+    real_open = open
+
+    class CountingFile:
+        def __init__(self, f):
+            self._f = f
+
+        def read(self, n=-1):
+            nonlocal read_bytes
+            data = self._f.read(n)
+            read_bytes += len(data)
+            return data
+
+        def __getattr__(self, name):
+            return getattr(self._f, name)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._f.close()
+
+    monkeypatch.setattr(
+        "builtins.open", lambda *a, **kw: CountingFile(real_open(*a, **kw))
+    )
+    lines = tail_lines(path, 100)
+
+    assert lines[-1].endswith("message 199999")
+    assert len(lines) == 100
+    assert read_bytes < 128 * 1024
+
+
+def test_recent_errors_from_ring_buffer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    aggregator = StateAggregator()
+    aggregator.error_buffer = ErrorRingBufferHandler(capacity=10)
+    logger = logging.getLogger("test.recent_errors.buffer")
+    logger.propagate = False
+    logger.addHandler(aggregator.error_buffer)
+
+    for i in range(5):
+        logger.error(f"order {i} rejected")
+
+    errors = aggregator._get_recent_errors(max_errors=3)
+
+    assert [e["message"] for e in errors] == [
+        "order 4 rejected",
+        "order 3 rejected",
+        "order 2 rejected",
+    ]
+    assert set(errors[0]) == {"timestamp", "level", "message"}
+
+
+def write_bot_log(tmp_path):
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "logs" / "trading_bot.log").write_text(
+        "".join(f"INFO ok {i}\n" for i in range(1000))
+        + "ERROR first failure\n"
+        + '{"timestamp": "2025-10-24T10:30:00Z", "level": "CRITICAL", "message": "api down"}\n'
+        + "INFO recovered\n"
+    )
+
+
+def test_recent_errors_merge_log_tail_and_buffer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_bot_log(tmp_path)  # Written by the bot process
+    aggregator = StateAggregator()
+    aggregator.error_buffer = ErrorRingBufferHandler(capacity=10)
+    logger = logging.getLogger("test.recent_errors.merge")
+    logger.propagate = False
+    logger.addHandler(aggregator.error_buffer)
+    logger.error("first failure")
+    logger.error("snapshot refresh failed")
+
+    errors = aggregator._get_recent_errors(max_errors=3)
+    two = aggregator._get_recent_errors(max_errors=2)
+
+    assert [e["message"] for e in errors] == [
+        "api down",
+        "ERROR first failure",
+        "snapshot refresh failed",
+    ]
+    assert [e["message"] for e in two] == ["api down", "ERROR first failure"]
+
+
+def test_recent_errors_without_buffer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_bot_log(tmp_path)
+    aggregator = StateAggregator()
+    aggregator.error_buffer = None
+
+    errors = aggregator._get_recent_errors(max_errors=3)
+
+    assert [e["message"] for e in errors] == ["api down", "ERROR first failure"]
+    assert errors[0]["level"] == "CRITICAL"
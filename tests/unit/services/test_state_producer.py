@@ -0,0 +1,209 @@
+"""
+Unit tests for StateProducer shared snapshot and delta encoding
+
+Test cases:
+- test_make_json_patch_*: Verify RFC 6902 style delta generation
+- test_refresh_returns_delta_between_snapshots: Verify producer diffs snapshots
+- test_concurrent_get_state_shares_single_refresh: Verify refresh coalescing
+- test_blocking_broker_calls_do_not_block_event_loop: Verify thread offload
+- test_tick_broadcasts_snapshot_then_deltas: Verify stream message protocol
+"""
+
+import asyncio
+import copy
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from api.app.services import state_aggregator as state_aggregator_module
+from api.app.services.state_aggregator import StateAggregator
+from api.app.services.state_producer import StateProducer, make_json_patch
+
+
+def apply_patch(doc, patch):
+    """Minimal RFC 6902 applier (add/remove/replace) used to verify deltas."""
+    doc = copy.deepcopy(doc)
+    for op in patch:
+        tokens = [
+            t.replace("~1", "/").replace("~0", "~") for t in op["path"].split("/")[1:]
+        ]
+        if not tokens:
+            doc = op["value"]
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op["op"] == "remove":
+                parent.pop(int(last))
+            elif last == "-":
+                parent.append(op["value"])
+            else:
+                parent[int(last)] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return doc
+
+
+class FakeTradingClient:
+    """Blocking fake of the Alpaca TradingClient."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.price = 155.5
+        self.calls = 0
+
+    def _block(self):
+        self.calls += 1
+        time.sleep(self.delay)
+
+    def get_all_positions(self):
+        self._block()
+        return [
+            SimpleNamespace(
+                symbol="AAPL",
+                qty="10",
+                avg_entry_price="150.00",
+                current_price=str(self.price),
+                unrealized_pl=str((self.price - 150.0) * 10),
+                unrealized_plpc="0.0367",
+            )
+        ]
+
+    def get_orders(self):
+        self._block()
+        return []
+
+    def get_account(self):
+        self._block()
+        return SimpleNamespace(
+            buying_power="50000.00", equity="100000.00", cash="75000.00", daytrade_count=1
+        )
+
+    def get_clock(self):
+        self._block()
+        return SimpleNamespace(is_open=True, next_open=None)
+
+
+@pytest.fixture
+def fake_client(monkeypatch) -> FakeTradingClient:
+    monkeypatch.setattr(state_aggregator_module, "HAS_ALPACA", True)
+    return FakeTradingClient()
+
+
+def test_make_json_patch_returns_empty_for_equal_documents():
+    assert make_json_patch({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}) == []
+
+
+def test_make_json_patch_round_trips_nested_changes():
+    old = {"a": 1, "gone": True, "list": [1, 2, 3], "nested": {"x": "y", "k/e~y": 1}}
+    new = {"a": 2, "added": None, "list": [1, 5], "nested": {"x": "z", "k/e~y": 2}}
+
+    patch = make_json_patch(old, new)
+
+    assert {"op": "remove", "path": "/gone"} in patch
+    assert {"op": "replace", "path": "/nested/k~1e~0y", "value": 2} in patch
+    assert apply_patch(old, patch) == new
+
+
+def test_make_json_patch_appends_list_items():
+    old = {"positions": [{"symbol": "AAPL"}]}
+    new = {"positions": [{"symbol": "AAPL"}, {"symbol": "MSFT"}]}
+
+    patch = make_json_patch(old, new)
+
+    assert patch == [{"op": "add", "path": "/positions/-", "value": {"symbol": "MSFT"}}]
+
+
+@pytest.mark.asyncio
+async def test_refresh_returns_delta_between_snapshots(fake_client):
+    producer = StateProducer(aggregator=StateAggregator(trading_client=fake_client))
+
+    first = await producer.refresh()
+    base = producer.snapshot.model_dump(mode="json")
+    fake_client.price = 160.0
+    patch = await producer.refresh()
+
+    assert first == []
+    assert producer.version == 2
+    assert any(op["path"] == "/positions/0/current_price" for op in patch)
+    assert apply_patch(base, patch) == producer.snapshot.model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_state_shares_single_refresh(fake_client):
+    fake_client.delay = 0.05
+    producer = StateProducer(aggregator=StateAggregator(trading_client=fake_client))
+
+    states = await asyncio.gather(*(producer.get_state() for _ in range(10)))
+
+    assert producer.version == 1
+    assert all(state is states[0] for state in states)
+
+
+@pytest.mark.asyncio
+async def test_blocking_broker_calls_do_not_block_event_loop(fake_client):
+    fake_client.delay = 0.2
+    producer = StateProducer(aggregator=StateAggregator(trading_client=fake_client))
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    await producer.refresh()
+    elapsed = time.perf_counter() - start
+    beat.cancel()
+
+    # Four 0.2s broker calls run concurrently in threads, not serially on the loop
+    assert elapsed < 0.6
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_tick_broadcasts_snapshot_then_deltas(fake_client):
+    manager = Mock()
+    manager.get_active_count.return_value = 1
+    manager.broadcast = AsyncMock()
+    producer = StateProducer(
+        aggregator=StateAggregator(trading_client=fake_client),
+        connection_manager=manager,
+    )
+
+    await producer.tick()
+    fake_client.price = 170.0
+    await producer.tick()
+
+    snapshot_msg = manager.broadcast.await_args_list[0].args[0]
+    delta_msg = manager.broadcast.await_args_list[1].args[0]
+    assert snapshot_msg["type"] == "state_snapshot"
+    assert delta_msg["type"] == "state_delta"
+    assert delta_msg["base_version"] == snapshot_msg["version"]
+    assert apply_patch(snapshot_msg["state"], delta_msg["patch"]) == (
+        producer.snapshot.model_dump(mode="json")
+    )
+
+
+@pytest.mark.asyncio
+async def test_tick_skips_broadcast_without_connections(fake_client):
+    manager = Mock()
+    manager.get_active_count.return_value = 0
+    manager.broadcast = AsyncMock()
+    producer = StateProducer(
+        aggregator=StateAggregator(trading_client=fake_client),
+        connection_manager=manager,
+    )
+
+    await producer.tick()
+
+    assert producer.version == 1
+    manager.broadcast.assert_not_awaited()
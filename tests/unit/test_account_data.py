@@ -7,10 +7,16 @@ Tests:
 - API fetching (buying power, positions, balance, day trade count)
 - P&L calculations
 - Error handling
+- Single-flight fetches and background refresh (thread-based, fake client)
 
 Constitution v1.0.0 - §Testing_Requirements: TDD approach (RED → GREEN → REFACTOR)
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
@@ -488,3 +494,194 @@ class TestPLCalculations:
 class TestErrorHandling:
     """Test suite for error handling and retry logic."""
     pass
+
+
+class FakeTradingClient:
+    """Alpaca client stand-in that counts requests and can hold them open."""
+
+    def __init__(self, buying_power="10000.50", daytrade_count=2, delay=0.0):
+        self.account = SimpleNamespace(
+            cash="5000.00", equity="12500.75", buying_power=buying_power, daytrade_count=daytrade_count
+        )
+        self.delay = delay
+        self.error = None
+        self.account_calls = 0
+        self.position_calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def get_account(self):
+        with self._lock:
+            self.account_calls += 1
+        self.release.wait(5)
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(**vars(self.account))
+
+    def get_all_positions(self):
+        with self._lock:
+            self.position_calls += 1
+        time.sleep(self.delay)
+        return [SimpleNamespace(symbol="AAPL", qty="10", avg_entry_price="150.25", current_price="155.00")]
+
+
+def make_account_data(client):
+    from src.trading_bot.account.account_data import AccountData
+
+    return AccountData(auth=SimpleNamespace(get_trading_client=lambda: client))
+
+
+def run_concurrently(funcs):
+    """Start all funcs together; return (results, errors) in submission order."""
+    barrier = threading.Barrier(len(funcs))
+
+    def call(func):
+        barrier.wait(5)
+        return func()
+
+    with ThreadPoolExecutor(max_workers=len(funcs)) as pool:
+        futures = [pool.submit(call, func) for func in funcs]
+    return [f.result() if not f.exception() else None for f in futures], [f.exception() for f in futures]
+
+
+class TestSingleFlight:
+    """Test suite for coalesced fetches under concurrency."""
+
+    def test_concurrent_misses_share_one_account_request(self):
+        client = FakeTradingClient(delay=0.05)
+        account = make_account_data(client)
+        getters = [account.get_buying_power, account.get_account_balance, account.get_day_trade_count] * 8
+
+        results, errors = run_concurrently(getters)
+
+        assert errors == [None] * 24
+        assert client.account_calls == 1
+        assert results[0::3] == [10000.50] * 8
+        assert {r.equity for r in results[1::3]} == {Decimal("12500.75")}
+        assert results[2::3] == [2] * 8
+
+    def test_one_account_request_fills_all_derived_entries(self):
+        client = FakeTradingClient()
+        account = make_account_data(client)
+
+        account.get_day_trade_count()
+        account.get_buying_power()
+        balance = account.get_account_balance()
+
+        assert client.account_calls == 1
+        assert balance.buying_power == Decimal("10000.50")
+        assert set(account._cache) == {"buying_power", "account_balance", "day_trade_count"}
+
+    def test_positions_fetched_separately(self):
+        client = FakeTradingClient(delay=0.05)
+        account = make_account_data(client)
+
+        results, _ = run_concurrently([account.get_positions] * 10)
+
+        assert client.position_calls == 1
+        assert client.account_calls == 0
+        assert all(r[0].symbol == "AAPL" for r in results)
+
+    def test_failure_propagates_to_waiters_and_is_not_cached(self):
+        client = FakeTradingClient(delay=0.05)
+        client.error = RuntimeError("connection reset")
+        account = make_account_data(client)
+
+        _, errors = run_concurrently([account.get_buying_power] * 6)
+
+        assert client.account_calls == 1
+        assert all(isinstance(e, RuntimeError) for e in errors)
+
+        client.error = None
+        assert account.get_buying_power() == 10000.50
+        assert client.account_calls == 2
+
+    def test_invalidation_during_fetch_discards_result(self):
+        client = FakeTradingClient()
+        client.release.clear()
+        account = make_account_data(client)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stale = pool.submit(account.get_buying_power)
+            while client.account_calls == 0:
+                time.sleep(0.001)
+
+            # A trade executes while the first request is in flight
+            account.invalidate_cache()
+            client.account.buying_power = "7000.00"
+            client.release.set()
+            stale.result(5)
+
+        assert "buying_power" not in account._cache
+        assert account.get_buying_power() == 7000.00
+        assert client.account_calls == 2
+
+
+class TestBackgroundRefresh:
+    """Test suite for refresh-ahead of cached entries."""
+
+    def test_entries_renewed_before_expiry(self):
+        client = FakeTradingClient()
+        account = make_account_data(client)
+        account.cache_ttl_seconds.update(buying_power=1, account_balance=1, day_trade_count=1)
+        account.get_buying_power()
+
+        account.start_background_refresh(refresh_ahead_seconds=0.9, interval=0.02)
+        try:
+            deadline = time.monotonic() + 5
+            while client.account_calls < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            account.stop_background_refresh()
+
+        assert client.account_calls >= 3
+        assert client.position_calls == 0  # positions were never requested
+        assert account._refresh_thread is None
+
+        calls = client.account_calls
+        account.get_buying_power()
+        assert client.account_calls == calls  # served from the refreshed entry
+
+    def test_refresh_errors_do_not_stop_refresher(self):
+        client = FakeTradingClient()
+        account = make_account_data(client)
+        account.cache_ttl_seconds["positions"] = 1
+        account.get_positions()
+        client.get_all_positions = Mock(side_effect=RuntimeError("503"))
+
+        account.start_background_refresh(refresh_ahead_seconds=1, interval=0.02)
+        try:
+            deadline = time.monotonic() + 5
+            while client.get_all_positions.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert account._refresh_thread.is_alive()
+        finally:
+            account.stop_background_refresh()
+
+        assert client.get_all_positions.call_count >= 2
+
+    def test_failing_group_backs_off(self):
+        client = FakeTradingClient()
+        account = make_account_data(client)
+        account.cache_ttl_seconds["positions"] = 1
+        account.get_positions()
+        client.get_all_positions = Mock(side_effect=RuntimeError("503"))
+        account.REFRESH_MAX_BACKOFF_SECONDS = 0.08
+
+        account.start_background_refresh(refresh_ahead_seconds=1, interval=0.01)
+        try:
+            time.sleep(0.5)
+            failed_calls = client.get_all_positions.call_count
+            client.get_all_positions = Mock(return_value=[])
+            deadline = time.monotonic() + 5
+            while not client.get_all_positions.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            account.stop_background_refresh()
+
+        # Retries at 0.02s, 0.04s, then every 0.08s instead of every 0.01s
+        assert 2 <= failed_calls <= 10
+        assert client.get_all_positions.called
+        assert account.get_positions(use_cache=True) == []
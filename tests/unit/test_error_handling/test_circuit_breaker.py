@@ -80,3 +80,160 @@ def test_circuit_breaker_sliding_window_expiry():
 
     # Then: Should still NOT trip (only 1 failure in window)
     assert circuit_breaker.should_trip() is False
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_then_half_open_probe_closes():
+    """CircuitBreaker should reject while OPEN, then admit one probe after reset_timeout."""
+    from trading_bot.error_handling import CircuitBreaker, CircuitState
+
+    # Given: Breaker that opened after 3 failures
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=3, window_seconds=60, reset_timeout=30, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.allow_request() is False
+
+    # When: reset_timeout elapses
+    clock.now += 30
+
+    # Then: Exactly one probe is admitted
+    assert breaker.allow_request() is True
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request() is False
+
+    # When: Probe succeeds
+    breaker.record_success()
+
+    # Then: Breaker closes
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow_request() is True
+
+
+def test_circuit_breaker_failed_probe_reopens():
+    """A failed HALF_OPEN probe should re-open the breaker and restart the timeout."""
+    from trading_bot.error_handling import CircuitBreaker, CircuitState
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow_request() is True
+
+    # When: Probe fails
+    breaker.record_failure()
+
+    # Then: OPEN again until another reset_timeout passes
+    assert breaker.state is CircuitState.OPEN
+    clock.now += 5
+    assert breaker.allow_request() is False
+    clock.now += 5
+    assert breaker.allow_request() is True
+
+
+def test_circuit_breaker_late_success_does_not_close_open_breaker():
+    """A success from a request started before the breaker opened should not close it."""
+    from trading_bot.error_handling import CircuitBreaker, CircuitState
+
+    breaker = CircuitBreaker(threshold=1, clock=FakeClock())
+    breaker.record_failure()
+
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_circuit_breaker_concurrent_failures_from_threads():
+    """Concurrent failures from many threads should all be counted exactly once."""
+    import threading
+
+    from trading_bot.error_handling import CircuitBreaker, CircuitState
+
+    # Given: Breaker with a threshold above the total failures
+    breaker = CircuitBreaker(threshold=10_000, window_seconds=60)
+    start = threading.Barrier(8)
+
+    def fail_many():
+        start.wait()
+        for _ in range(500):
+            breaker.record_failure()
+            breaker.should_trip()
+
+    # When: 8 threads record 500 failures each concurrently
+    threads = [threading.Thread(target=fail_many) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Then: No failure is lost and the breaker is still closed
+    assert len(breaker._failures) == 4000
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_admits_single_probe_across_threads():
+    """Only half_open_max_calls threads should be admitted as probes."""
+    import threading
+
+    from trading_bot.error_handling import CircuitBreaker
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=1, half_open_max_calls=2, clock=clock)
+    breaker.record_failure()
+    clock.now += 1
+
+    start = threading.Barrier(16)
+    admitted = []
+
+    def try_request():
+        start.wait()
+        if breaker.allow_request():
+            admitted.append(1)
+
+    threads = [threading.Thread(target=try_request) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(admitted) == 2
+
+
+def test_circuit_breaker_released_and_stale_probes():
+    """A released probe frees its slot; an unreported probe re-opens after reset_timeout."""
+    from trading_bot.error_handling import CircuitBreaker, CircuitState
+
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now += 10
+    assert breaker.allow_request() is True
+
+    # When: The probe ends without a verdict
+    breaker.release_probe()
+
+    # Then: Another probe may run
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request() is True
+
+    # When: That probe never reports back
+    clock.now += 9
+    assert breaker.allow_request() is False
+    clock.now += 1
+
+    # Then: HALF_OPEN gives up on it and re-opens, probing again after reset_timeout
+    assert breaker.allow_request() is False
+    assert breaker.state is CircuitState.OPEN
+    clock.now += 10
+    assert breaker.allow_request() is True
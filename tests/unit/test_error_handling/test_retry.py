@@ -345,3 +345,194 @@ def test_decorator_with_no_policy_uses_default():
     # Then: Should use DEFAULT_POLICY (max_attempts=3)
     # 1 initial + 3 retries = 4 calls
     assert call_count["count"] == DEFAULT_POLICY.max_attempts + 1
+
+
+@pytest.mark.asyncio
+async def test_async_function_retries_and_preserves_metadata():
+    """@with_retry should await coroutine functions and retry them."""
+    import inspect
+
+    from trading_bot.error_handling import with_retry, RetriableError, RetryPolicy
+
+    # Given: Async function that fails twice then succeeds
+    call_count = {"count": 0}
+
+    @with_retry(policy=RetryPolicy(max_attempts=3, base_delay=0.01))
+    async def flaky_async():
+        """Async docstring."""
+        call_count["count"] += 1
+        if call_count["count"] < 3:
+            raise RetriableError("Temporary failure")
+        return "success"
+
+    # Then: Wrapper is itself a coroutine function with preserved metadata
+    assert inspect.iscoroutinefunction(flaky_async)
+    assert flaky_async.__name__ == "flaky_async"
+    assert flaky_async.__doc__ == "Async docstring."
+
+    # When/Then: Awaiting retries until success
+    assert await flaky_async() == "success"
+    assert call_count["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_backoff_does_not_block_event_loop():
+    """Async retries should back off with asyncio.sleep so other tasks keep running."""
+    import asyncio
+
+    from trading_bot.error_handling import with_retry, RetriableError, RetryPolicy
+
+    # Given: Async function that always fails with 0.2s backoff
+    policy = RetryPolicy(max_attempts=2, base_delay=0.2, backoff_multiplier=1.0, jitter=False)
+
+    @with_retry(policy=policy)
+    async def always_fails():
+        raise RetriableError("upstream down")
+
+    ticks = []
+
+    async def heartbeat():
+        for _ in range(10):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    # When: Retrying runs alongside a heartbeat task
+    start = time.monotonic()
+    results = await asyncio.gather(always_fails(), heartbeat(), return_exceptions=True)
+
+    # Then: Retry exhausted after ~0.4s while the heartbeat kept ticking
+    assert isinstance(results[0], RetriableError)
+    assert time.monotonic() - start >= 0.35
+    assert len(ticks) == 10
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.15
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_failures_run_in_parallel():
+    """Concurrent failing tasks should back off in parallel, not serially."""
+    import asyncio
+
+    from trading_bot.error_handling import with_retry, RetriableError, RetryPolicy
+
+    policy = RetryPolicy(max_attempts=1, base_delay=0.3, jitter=True)
+    attempts = {"count": 0}
+
+    @with_retry(policy=policy)
+    async def flaky(i):
+        attempts["count"] += 1
+        raise RetriableError(f"fail {i}")
+
+    # When: 20 tasks fail concurrently
+    start = time.monotonic()
+    results = await asyncio.gather(*(flaky(i) for i in range(20)), return_exceptions=True)
+    duration = time.monotonic() - start
+
+    # Then: All retried once, total time ~one backoff (not 20x)
+    assert all(isinstance(r, RetriableError) for r in results)
+    assert attempts["count"] == 40
+    assert duration < 1.0, f"Expected parallel backoff, took {duration:.2f}s"
+
+
+@pytest.mark.asyncio
+async def test_breaker_fails_fast_for_async_calls():
+    """An OPEN breaker should stop async calls before they reach the upstream."""
+    import asyncio
+
+    from trading_bot.error_handling import CircuitBreaker, CircuitState, RetriableError, RetryPolicy, with_retry
+    from trading_bot.error_handling.exceptions import CircuitBreakerTripped
+
+    # Given: Breaker that opens after 3 failures and a flaky upstream
+    breaker = CircuitBreaker(threshold=3, window_seconds=60, reset_timeout=60)
+    calls = {"count": 0}
+
+    @with_retry(policy=RetryPolicy(max_attempts=1, base_delay=0.01), breaker=breaker)
+    async def call_upstream():
+        calls["count"] += 1
+        await asyncio.sleep(0)
+        raise RetriableError("503")
+
+    # When: Many concurrent requests hit the failing upstream
+    results = await asyncio.gather(*(call_upstream() for _ in range(10)), return_exceptions=True)
+
+    # Then: Breaker opened and later attempts failed fast without calling out
+    assert breaker.state is CircuitState.OPEN
+    assert calls["count"] < 20
+    assert any(isinstance(r, CircuitBreakerTripped) for r in results)
+
+    # And: Once open, no further upstream calls are made
+    before = calls["count"]
+    with pytest.raises(CircuitBreakerTripped):
+        await call_upstream()
+    assert calls["count"] == before
+
+
+def test_breaker_half_open_probe_closes_on_success():
+    """A successful HALF_OPEN probe through @with_retry should close the breaker."""
+    from trading_bot.error_handling import CircuitBreaker, CircuitState, with_retry
+
+    clock = {"now": 0.0}
+    breaker = CircuitBreaker(threshold=1, reset_timeout=5, clock=lambda: clock["now"])
+    breaker.record_failure()
+
+    @with_retry(breaker=breaker)
+    def healthy():
+        return "ok"
+
+    clock["now"] = 5.0
+    assert healthy() == "ok"
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_sync_concurrent_failures_from_threads():
+    """Threads failing concurrently through @with_retry should all be retried and counted."""
+    import threading
+
+    from trading_bot.error_handling import CircuitBreaker, RetriableError, RetryPolicy, with_retry
+
+    breaker = CircuitBreaker(threshold=1_000, window_seconds=60)
+    attempts = []
+    lock = threading.Lock()
+
+    @with_retry(policy=RetryPolicy(max_attempts=2, base_delay=0.01), breaker=breaker)
+    def always_fails():
+        with lock:
+            attempts.append(1)
+        raise RetriableError("fail")
+
+    def worker():
+        with pytest.raises(RetriableError):
+            always_fails()
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(attempts) == 30
+    assert len(breaker._failures) == 30
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_half_open_slot():
+    """A HALF_OPEN probe cancelled by wait_for() should not leave the breaker stuck."""
+    import asyncio
+
+    from trading_bot.error_handling import CircuitBreaker, CircuitState, with_retry
+
+    clock = {"now": 0.0}
+    breaker = CircuitBreaker(threshold=1, reset_timeout=5, clock=lambda: clock["now"])
+    breaker.record_failure()
+    clock["now"] = 5.0
+
+    @with_retry(breaker=breaker)
+    async def slow_upstream():
+        await asyncio.sleep(10)
+
+    # When: The probe times out on the caller's side
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(slow_upstream(), timeout=0.01)
+
+    # Then: The probe slot is free again
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request() is True
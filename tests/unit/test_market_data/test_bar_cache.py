@@ -0,0 +1,194 @@
+"""
+Unit tests for the ring-buffer bar cache and MarketDataService incremental bar fetches
+"""
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.market_data.bar_cache import BarBuffer, BarCache
+from trading_bot.market_data.data_models import MarketDataConfig
+from trading_bot.market_data.exceptions import DataValidationError
+from trading_bot.market_data.market_data_service import MarketDataService
+
+
+def make_bars(start, periods, freq="1min", base=100.0):
+    """Raw bars as returned by AlpacaMarketData.get_dataframe."""
+    timestamps = pd.date_range(start, periods=periods, freq=freq, tz="UTC")
+    close = base + np.arange(periods, dtype=float)
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": close - 0.5,
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": np.arange(periods, dtype=np.int64) * 10,
+    })
+
+
+def prepared(raw):
+    df = raw.rename(columns={"timestamp": "date"})
+    return df[["date", "open", "high", "low", "close", "volume"]]
+
+
+class FakeDataHelper:
+    """Serves bars from a growing in-memory history, honouring `start`."""
+
+    def __init__(self, history):
+        self.history = history
+        self.calls = []
+
+    def get_dataframe(self, *, symbol, timeframe, limit, start=None):
+        self.calls.append({"symbol": symbol, "timeframe": timeframe, "limit": limit, "start": start})
+        df = self.history
+        if start is not None:
+            df = df[df["timestamp"] >= pd.Timestamp(start)]
+        elif limit is not None:
+            df = df.tail(limit)
+        return df.reset_index(drop=True)
+
+
+class TestBarBuffer:
+    """Test suite for BarBuffer."""
+
+    def test_extend_and_frame_match_input(self):
+        raw = make_bars("2025-01-06 14:30", 50)
+        buffer = BarBuffer(capacity=100)
+
+        assert buffer.extend(prepared(raw)) == 50
+
+        expected = prepared(raw).astype({"date": "datetime64[ns, UTC]"})
+        pd.testing.assert_frame_equal(buffer.frame(), expected)
+        assert buffer.last_timestamp == raw["timestamp"].iloc[-1]
+
+    def test_frame_is_zero_copy_and_read_only(self):
+        buffer = BarBuffer(capacity=10)
+        buffer.extend(prepared(make_bars("2025-01-06 14:30", 5)))
+
+        frame = buffer.frame()
+        arrays = buffer.arrays()
+
+        assert np.shares_memory(frame["close"].to_numpy(), arrays["close"])
+        assert not arrays["close"].flags.writeable
+        with pytest.raises(ValueError):
+            frame.loc[0, "close"] = 1.0
+
+    def test_keeps_newest_capacity_bars_across_compactions(self):
+        raw = make_bars("2025-01-06 14:30", 200)
+        buffer = BarBuffer(capacity=30)
+
+        for start in range(0, 200, 7):
+            buffer.extend(prepared(raw.iloc[start:start + 7]))
+
+        assert len(buffer) == 30
+        expected = prepared(raw.tail(30)).reset_index(drop=True)
+        pd.testing.assert_frame_equal(buffer.frame(), expected.astype({"date": "datetime64[ns, UTC]"}))
+        pd.testing.assert_frame_equal(
+            buffer.frame(limit=5), expected.tail(5).reset_index(drop=True).astype({"date": "datetime64[ns, UTC]"})
+        )
+
+    def test_old_views_survive_compaction(self):
+        raw = make_bars("2025-01-06 14:30", 40)
+        buffer = BarBuffer(capacity=10)
+        buffer.extend(prepared(raw.iloc[:10]))
+        snapshot = buffer.frame()
+        before = snapshot.copy()
+
+        buffer.extend(prepared(raw.iloc[10:40]))
+
+        pd.testing.assert_frame_equal(snapshot, before)
+
+    def test_same_timestamp_replaces_forming_bar(self):
+        raw = make_bars("2025-01-06 14:30", 3)
+        buffer = BarBuffer(capacity=10)
+        buffer.extend(prepared(raw))
+
+        update = prepared(raw.tail(1)).copy()
+        update["close"] = 150.0
+        update["high"] = 151.0
+        older = prepared(raw.head(1))
+
+        assert buffer.extend(pd.concat([older, update])) == 1
+        assert len(buffer) == 3
+        assert buffer.arrays()["close"][-1] == 150.0
+        assert buffer.arrays()["close"][0] == raw["close"].iloc[0]
+
+
+class TestBarCache:
+    """Test suite for BarCache LRU eviction."""
+
+    def test_lru_eviction_under_budget(self):
+        one = BarBuffer(capacity=10).nbytes
+        cache = BarCache(max_bytes=2 * one)
+        for key in ("a", "b"):
+            cache.put(key, BarBuffer(capacity=10))
+
+        cache.get("a")
+        cache.put("c", BarBuffer(capacity=10))
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_oversized_buffer_not_cached(self):
+        cache = BarCache(max_bytes=10)
+        cache.put("a", BarBuffer(capacity=10))
+        assert len(cache) == 0
+
+
+class TestServiceBarCache:
+    """Test suite for MarketDataService historical data through the bar cache."""
+
+    def _service(self, helper, **config):
+        service = MarketDataService(auth=Mock(), config=MarketDataConfig(**config))
+        service._data_helper = helper
+        return service
+
+    def test_second_call_fetches_only_new_bars(self):
+        history = make_bars("2025-01-06 14:30", 60)
+        helper = FakeDataHelper(history)
+        service = self._service(helper)
+
+        first = service.get_historical_data("AAPL", interval="1min", span="day")
+        helper.history = make_bars("2025-01-06 14:30", 63)
+        second = service.get_historical_data("AAPL", interval="1min", span="day")
+
+        assert helper.calls[0]["start"] is None
+        assert helper.calls[1]["start"] == first["date"].iloc[-1]
+        assert helper.calls[1]["limit"] is None
+        assert len(second) == 63
+        assert second["date"].iloc[-1] == helper.history["timestamp"].iloc[-1]
+
+    def test_cached_result_matches_uncached(self):
+        history = make_bars("2025-01-06 14:30", 60)
+        cached = self._service(FakeDataHelper(history))
+        uncached = self._service(FakeDataHelper(history), bar_cache_max_bytes=0)
+
+        cached.get_historical_data("AAPL", interval="1min", span="day")
+        pd.testing.assert_frame_equal(
+            cached.get_historical_data("AAPL", interval="1min", span="day"),
+            uncached.get_historical_data("AAPL", interval="1min", span="day"),
+        )
+        assert uncached.bar_cache is None
+
+    def test_appended_bars_are_validated(self):
+        history = make_bars("2025-01-06 14:30", 10)
+        helper = FakeDataHelper(history)
+        service = self._service(helper)
+        service.get_historical_data("AAPL", interval="1min", span="day")
+
+        bad = make_bars("2025-01-06 14:40", 1)
+        bad.loc[0, "close"] = 0.0
+        helper.history = pd.concat([history, bad], ignore_index=True)
+
+        with pytest.raises(DataValidationError, match="Invalid close"):
+            service.get_historical_data("AAPL", interval="1min", span="day")
+
+    def test_multi_timeframe_shares_cache(self):
+        helper = FakeDataHelper(make_bars("2025-01-06", 30, freq="B"))
+        service = self._service(helper)
+
+        service.get_multi_timeframe_data("AAPL", ["1day", "daily"], span="day")
+
+        assert [c["start"] is None for c in helper.calls] == [True, False]
+        assert ("AAPL", "1d") in service.bar_cache
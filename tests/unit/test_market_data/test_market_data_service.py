@@ -819,3 +819,133 @@ class TestGetQuotesBatch:
         warning_call = mock_logger.warning.call_args[0][0]
         assert "Failed to get quote for INVALID" in warning_call
         assert "Invalid symbol" in warning_call
+
+
+class FakeStockDataClient:
+    """Fake Alpaca stock data client serving latest trades from a dict."""
+
+    def __init__(self, trades, fail_on=None):
+        self.trades = trades
+        self.fail_on = fail_on or set()
+        self.requests = []
+
+    def get_stock_latest_trade(self, request):
+        symbols = list(request.symbol_or_symbols)
+        self.requests.append(symbols)
+        if self.fail_on & set(symbols):
+            raise RuntimeError("upstream unavailable")
+        return {s: self.trades[s] for s in symbols if s in self.trades}
+
+
+class TestGetQuotesBatchMultiSymbol:
+    """Test suite for the chunked multi-symbol get_quotes_batch path."""
+
+    @staticmethod
+    def _trade(price, age_seconds=5):
+        from datetime import UTC, datetime, timedelta
+
+        return Mock(price=price, timestamp=datetime.now(UTC) - timedelta(seconds=age_seconds))
+
+    def _service(self, client, batch_size=200, logger=None):
+        from trading_bot.market_data.data_models import MarketDataConfig
+        from trading_bot.market_data.market_data_service import MarketDataService
+
+        mock_auth = Mock()
+        mock_auth.get_stock_data_client.return_value = client
+        config = MarketDataConfig(quote_batch_size=batch_size)
+        return MarketDataService(auth=mock_auth, config=config, logger=logger or Mock())
+
+    @patch('trading_bot.utils.time_utils.is_trading_hours', return_value=True)
+    def test_one_request_per_chunk(self, _mock_hours):
+        """
+        GIVEN: 5 symbols and quote_batch_size=2
+        WHEN: get_quotes_batch called
+        THEN: 3 latest-trade requests are made and every symbol gets a Quote
+        """
+        from decimal import Decimal
+        from datetime import UTC
+        from trading_bot.market_data.data_models import Quote
+
+        symbols = ["AAPL", "MSFT", "GOOGL", "NVDA", "TSLA"]
+        client = FakeStockDataClient({s: self._trade(100.0 + i) for i, s in enumerate(symbols)})
+        service = self._service(client, batch_size=2)
+
+        quotes = service.get_quotes_batch(symbols)
+
+        assert client.requests == [["AAPL", "MSFT"], ["GOOGL", "NVDA"], ["TSLA"]]
+        assert list(quotes) == symbols
+        assert all(isinstance(q, Quote) for q in quotes.values())
+        assert quotes["NVDA"].current_price == Decimal("103.0")
+        assert quotes["AAPL"].timestamp_utc.tzinfo == UTC
+        assert len({q.market_state for q in quotes.values()}) == 1
+
+    @patch('trading_bot.utils.time_utils.is_trading_hours', return_value=True)
+    def test_market_state_computed_once(self, _mock_hours):
+        """
+        GIVEN: Several symbols
+        WHEN: get_quotes_batch called
+        THEN: _determine_market_state runs once for the whole batch
+        """
+        symbols = ["AAPL", "MSFT", "GOOGL"]
+        client = FakeStockDataClient({s: self._trade(50.0) for s in symbols})
+        service = self._service(client)
+
+        with patch.object(service, "_determine_market_state", return_value="regular") as state:
+            quotes = service.get_quotes_batch(symbols)
+
+        state.assert_called_once()
+        assert {q.market_state for q in quotes.values()} == {"regular"}
+
+    @patch('trading_bot.utils.time_utils.is_trading_hours', return_value=True)
+    def test_per_symbol_failures_reported(self, _mock_hours):
+        """
+        GIVEN: One symbol missing, one with zero price, one stale, one failing chunk
+        WHEN: get_quotes_batch called
+        THEN: Healthy symbols are returned and each failure is logged by symbol
+        """
+        trades = {
+            "AAPL": self._trade(150.25),
+            "ZERO": self._trade(0.0),
+            "OLD": self._trade(10.0, age_seconds=3600),
+            "MSFT": self._trade(300.0),
+            "DOWN": self._trade(20.0),
+        }
+        client = FakeStockDataClient(trades, fail_on={"DOWN"})
+        logger = Mock()
+        service = self._service(client, batch_size=5, logger=logger)
+
+        quotes = service.get_quotes_batch(["AAPL", "MISSING", "ZERO", "OLD", "MSFT", "DOWN"])
+
+        assert set(quotes) == {"AAPL", "MSFT"}
+        warnings = [c.args[0] for c in logger.warning.call_args_list]
+        assert len(warnings) == 4
+        for symbol in ("MISSING", "ZERO", "OLD", "DOWN"):
+            assert any(f"Failed to get quote for {symbol}:" in w for w in warnings)
+        assert any("upstream unavailable" in w for w in warnings)
+
+    @patch('trading_bot.utils.time_utils.is_trading_hours', return_value=False)
+    def test_outside_trading_hours_fails_every_symbol(self, _mock_hours):
+        """
+        GIVEN: Current time outside the trading window
+        WHEN: get_quotes_batch called
+        THEN: No request is made and each symbol is reported as failed
+        """
+        client = FakeStockDataClient({"AAPL": self._trade(1.0)})
+        logger = Mock()
+        service = self._service(client, logger=logger)
+
+        assert service.get_quotes_batch(["AAPL", "MSFT"]) == {}
+        assert client.requests == []
+        assert logger.warning.call_count == 2
+
+    def test_empty_symbol_list(self):
+        """
+        GIVEN: No symbols
+        WHEN: get_quotes_batch called
+        THEN: Returns empty dict without touching the data client
+        """
+        client = FakeStockDataClient({})
+        service = self._service(client)
+
+        assert service.get_quotes_batch([]) == {}
+        assert client.requests == []